@@ -68,3 +68,24 @@ backend.gameHandler.addEnvironment(
   'GAME_SESSIONS_TABLE_NAME',
   backend.data.resources.tables["GameSession"].tableName
 );
+
+/**
+ * Optional warm-up schedule
+ * 
+ * With WARMUP_SCHEDULE_MINUTES set at deploy time, an EventBridge rule
+ * invokes the game handler at that rate. The handler treats the Scheduled
+ * Event as a warm-up ping: it plays a synthetic game in memory and opens
+ * the DynamoDB connection pool without reading or writing sessions, which
+ * keeps a container warm between players.
+ */
+const warmupMinutes = Number(process.env.WARMUP_SCHEDULE_MINUTES || 0);
+if (warmupMinutes > 0) {
+  const { Duration } = await import('aws-cdk-lib');
+  const { Rule, Schedule } = await import('aws-cdk-lib/aws-events');
+  const { LambdaFunction } = await import('aws-cdk-lib/aws-events-targets');
+
+  new Rule(Stack.of(backend.gameHandler.resources.lambda), 'GameHandlerWarmup', {
+    schedule: Schedule.rate(Duration.minutes(warmupMinutes)),
+    targets: [new LambdaFunction(backend.gameHandler.resources.lambda)],
+  });
+}
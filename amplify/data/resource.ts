@@ -63,25 +63,47 @@ const schema = a.schema({
    * 
    * This custom query invokes the game handler Lambda function to process
    * player commands and return the updated game state.
+   * 
+   * Pass either a single `command` or an ordered `commands` batch. A batch
+   * runs against one loaded session and is saved once; `onFailure` is
+   * "stop" (default) to skip the rest after a failed command, or
+   * "continue". `messages` holds one entry per command that ran.
+   * 
+   * `commandId` is an optional client-generated ID for the request. If a
+   * request with the same ID was already executed and saved, the stored
+   * response is returned without running the commands again, so clients
+   * can retry on timeouts.
+   * 
+   * Delta mode: send `lastViewHash` (the `viewHash` of the last response
+   * the client rendered, or "" on the first call) and `description_spooky`,
+   * `exits`, `objects` and `inventory` are returned only when they changed;
+   * null means "unchanged, keep yours". Without `lastViewHash` every field
+   * is returned and `viewHash` is null.
    */
   processCommand: a
     .query()
     .arguments({
       sessionId: a.string().required(),
-      command: a.string().required(),
+      command: a.string(),
+      commands: a.string().array(),
+      onFailure: a.string(),
+      commandId: a.string(),
+      lastViewHash: a.string(),
     })
     .returns(
       a.customType({
         room: a.string().required(),
-        description_spooky: a.string().required(),
-        exits: a.string().array().required(),
-        objects: a.string().array().required(),
-        inventory: a.string().array().required(),
+        description_spooky: a.string(),
+        exits: a.string().array(),
+        objects: a.string().array(),
+        inventory: a.string().array(),
         sanity: a.integer().required(),
         score: a.integer().required(),
         moves: a.integer().required(),
         lampBattery: a.integer().required(),
         message: a.string().required(),
+        messages: a.string().array(),
+        viewHash: a.string(),
       })
     )
     .authorization((allow) => [allow.guest()])
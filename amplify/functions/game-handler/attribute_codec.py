@@ -0,0 +1,370 @@
+"""
+DynamoDB Attribute Value Codec for West of Haunted House
+
+Converts session items to and from the low-level DynamoDB attribute value
+format ({'S': ...}, {'N': ...}, {'M': {...}}) for DynamoDBSessionStore.
+
+ItemCodec generates Python source for an item encoder and decoder from a
+dataclass's field types (GameState) once, and compiles it, so typed fields
+are converted inline without inspecting their values: an int field is
+always {'N': str(value)}, a list of room IDs always an L of S values.
+Only free-form values (flag values, object state values, disambiguation
+context) and attributes that are not fields (sessionId, the packed state,
+journal and save slot items) go through encode_value/decode_value, which
+pick the attribute type per value.
+
+Lists are always written as L, never as string sets: DynamoDB string sets
+are unordered and cannot hold duplicates or be empty, so an inventory
+stored as SS could come back reordered. Items written as SS by older
+versions still decode.
+"""
+
+import typing
+from dataclasses import fields
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple, Union
+
+
+def _number(text: str) -> Union[int, float]:
+    """Decode an N value to int, or float if it has a fraction."""
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def encode_value(value: Any) -> Dict[str, Any]:
+    """
+    Encode a value of any supported type as a DynamoDB attribute value.
+    
+    Args:
+        value: None, str, bytes, bool, int, float, list, tuple or dict;
+            anything else is stored as its str()
+    
+    Returns:
+        DynamoDB attribute value
+    """
+    kind = type(value)
+    if kind is str:
+        return {'S': value}
+    if kind is bool:
+        return {'BOOL': value}
+    if kind is int or kind is float:
+        return {'N': str(value)}
+    if kind is dict:
+        return {'M': encode_map(value)}
+    if kind is list or kind is tuple:
+        return {'L': [encode_value(element) for element in value]}
+    if value is None:
+        return {'NULL': True}
+    if kind is bytes:
+        return {'B': value}
+    # Subclasses of the supported types
+    if isinstance(value, str):
+        return {'S': str(value)}
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return {'N': str(value)}
+    return {'S': str(value)}
+
+
+def encode_map(item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Encode a dict's values as DynamoDB attribute values.
+    
+    None values are dropped rather than stored as NULL.
+    
+    Args:
+        item: Dict to encode
+    
+    Returns:
+        Dict of DynamoDB attribute values
+    """
+    # Flag and object state values are mostly bools, ints and strings;
+    # convert those inline rather than with a call per value
+    return {
+        key: {'BOOL': value} if (kind := type(value)) is bool
+        else {'S': value} if kind is str
+        else {'N': str(value)} if kind is int
+        else encode_value(value)
+        for key, value in item.items() if value is not None
+    }
+
+
+def decode_value(value: Dict[str, Any]) -> Any:
+    """
+    Decode a DynamoDB attribute value of any type.
+    
+    Args:
+        value: DynamoDB attribute value
+    
+    Returns:
+        Python value; SS sets decode to lists, unknown types to None
+    """
+    if 'S' in value:
+        return value['S']
+    if 'N' in value:
+        return _number(value['N'])
+    if 'BOOL' in value:
+        return value['BOOL']
+    if 'M' in value:
+        return decode_map(value['M'])
+    if 'L' in value:
+        return [decode_value(element) for element in value['L']]
+    if 'B' in value:
+        return value['B']
+    if 'SS' in value:
+        return list(value['SS'])
+    return None
+
+
+def decode_map(item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Decode a dict of DynamoDB attribute values.
+    
+    Args:
+        item: Dict of DynamoDB attribute values
+    
+    Returns:
+        Dict of Python values
+    """
+    return {
+        key: value['BOOL'] if 'BOOL' in value
+        else value['S'] if 'S' in value
+        else decode_value(value)
+        for key, value in item.items()
+    }
+
+
+# Names the generated code may refer to
+_NAMESPACE = {
+    '_encode_value': encode_value,
+    '_encode_map': encode_map,
+    '_decode_value': decode_value,
+    '_decode_map': decode_map,
+}
+
+# Source templates for types converted without looking at the value; {v}
+# is the expression holding the value
+_SCALAR_ENCODE = {
+    str: "{{'S': {v}}}",
+    bool: "{{'BOOL': {v}}}",
+    int: "{{'N': str({v})}}",
+    float: "{{'N': str({v})}}",
+    bytes: "{{'B': {v}}}",
+}
+_SCALAR_DECODE = {
+    str: "{v}['S']",
+    bool: "{v}['BOOL']",
+    int: "int({v}['N'])",
+    float: "float({v}['N'])",
+    bytes: "{v}['B']",
+}
+
+
+def _unwrap_optional(hint: Any) -> Tuple[Any, bool]:
+    """Split Optional[X] into (X, True); other hints come back as (hint, False)."""
+    if typing.get_origin(hint) is Union:
+        types = [arg for arg in typing.get_args(hint) if arg is not type(None)]
+        if len(types) == 1:
+            return types[0], True
+    return hint, False
+
+
+def _map_value_hint(hint: Any) -> Optional[Any]:
+    """Get the value type of Dict[str, X] (or Optional of one), else None."""
+    hint, _ = _unwrap_optional(hint)
+    if typing.get_origin(hint) is dict and typing.get_args(hint)[:1] == (str,):
+        return typing.get_args(hint)[1]
+    return None
+
+
+def _encode_source(hint: Any, v: str, depth: int = 0) -> str:
+    """
+    Generate an expression encoding the (non-None) value of expression v.
+    
+    Args:
+        hint: Type hint of the value
+        v: Source expression holding the value
+        depth: Nesting level, to keep comprehension variables apart
+    
+    Returns:
+        Python expression source
+    """
+    hint, optional = _unwrap_optional(hint)
+    if optional:
+        inner = _encode_source(hint, v, depth)
+        return f"({{'NULL': True}} if {v} is None else {inner})"
+    if hint in _SCALAR_ENCODE:
+        return _SCALAR_ENCODE[hint].format(v=v)
+    
+    origin = typing.get_origin(hint)
+    args = typing.get_args(hint)
+    element, key, entry = f"e{depth}", f"k{depth}", f"x{depth}"
+    if origin in (list, set, frozenset) and args:
+        # Sets are written sorted so equal sets encode identically
+        source = v if origin is list else f"sorted({v})"
+        return f"{{'L': [{_encode_source(args[0], element, depth + 1)} for {element} in {source}]}}"
+    if origin is dict and args[:1] == (str,):
+        if args[1] is Any:
+            return f"{{'M': _encode_map({v})}}"
+        inner = _encode_source(args[1], entry, depth + 1)
+        return f"{{'M': {{{key}: {inner} for {key}, {entry} in {v}.items() if {entry} is not None}}}}"
+    return f"_encode_value({v})"
+
+
+def _decode_source(hint: Any, v: str, depth: int = 0) -> str:
+    """
+    Generate an expression decoding the attribute value of expression v.
+    
+    Args:
+        hint: Type hint of the value
+        v: Source expression holding the DynamoDB attribute value
+        depth: Nesting level, to keep comprehension variables apart
+    
+    Returns:
+        Python expression source
+    """
+    hint, optional = _unwrap_optional(hint)
+    if optional:
+        return f"(None if 'NULL' in {v} else {_decode_source(hint, v, depth)})"
+    if hint in _SCALAR_DECODE:
+        return _SCALAR_DECODE[hint].format(v=v)
+    
+    origin = typing.get_origin(hint)
+    args = typing.get_args(hint)
+    element, key, entry = f"e{depth}", f"k{depth}", f"x{depth}"
+    if origin in (list, set, frozenset) and args:
+        items = f"[{_decode_source(args[0], element, depth + 1)} for {element} in {v}['L']]"
+        if args[0] is str:
+            # String lists written as SS by older versions
+            return f"({items} if 'L' in {v} else list({v}['SS']))"
+        return items
+    if origin is dict and args[:1] == (str,):
+        if args[1] is Any:
+            return f"_decode_map({v}['M'])"
+        inner = _decode_source(args[1], entry, depth + 1)
+        return f"{{{key}: {inner} for {key}, {entry} in {v}['M'].items()}}"
+    return f"_decode_value({v})"
+
+
+def _compile(source: str, name: str, **names: Any) -> Callable:
+    """Compile generated function source and return the function."""
+    namespace = {**_NAMESPACE, **names}
+    exec(compile(source, f"<attribute_codec {name}>", 'exec'), namespace)
+    return namespace[name]
+
+
+class FieldCodec(NamedTuple):
+    """Compiled encoder and decoder for one attribute type."""
+    
+    encode: Callable[[Any], Dict[str, Any]]
+    decode: Callable[[Dict[str, Any]], Any]
+    
+    # Codec of a map's values, for updates of single entries; None for
+    # types that are not maps with a known value type
+    values: Optional['FieldCodec'] = None
+
+
+DYNAMIC_CODEC = FieldCodec(encode_value, decode_value)
+
+
+def compile_codec(hint: Any) -> FieldCodec:
+    """
+    Build the codec for a type hint.
+    
+    Args:
+        hint: Type hint, e.g. int, List[str] or Dict[str, Dict[str, Any]]
+    
+    Returns:
+        FieldCodec specialized to the type; DYNAMIC_CODEC for Any and
+        unions of several types
+    """
+    encode = _encode_source(hint, 'value')
+    if encode == "_encode_value(value)":
+        return DYNAMIC_CODEC
+    value_hint = _map_value_hint(hint)
+    return FieldCodec(
+        _compile(f"def encode(value):\n    return {encode}\n", 'encode'),
+        _compile(f"def decode(value):\n    return {_decode_source(hint, 'value')}\n", 'decode'),
+        compile_codec(value_hint) if value_hint is not None else None
+    )
+
+
+class ItemCodec:
+    """
+    Item encoder/decoder compiled from a dataclass's field types.
+    
+    Attributes named like a field use the field's type; any other
+    attribute is converted dynamically.
+    
+    Attributes:
+        encode_item: Function converting an item (attribute names mapped
+            to Python values, None values dropped) for PutItem
+        decode_item: Function converting an item read from DynamoDB back
+            to Python values
+        fields: FieldCodec of each field, by name
+    """
+    
+    def __init__(self, schema: type):
+        """
+        Generate and compile the converters for a dataclass's fields.
+        
+        Args:
+            schema: Dataclass whose fields items are made of, e.g. GameState
+        """
+        hints = typing.get_type_hints(schema)
+        # Fields declared with metadata {'persisted': False} are never stored
+        names = [field.name for field in fields(schema) if field.metadata.get('persisted', True)]
+        self.fields: Dict[str, FieldCodec] = {name: compile_codec(hints[name]) for name in names}
+        
+        encode_lines = ["def encode_item(item):", "    encoded = {}", "    get = item.get"]
+        decode_lines = ["def decode_item(item):", "    decoded = {}", "    get = item.get"]
+        for name in names:
+            encode_lines += [
+                f"    value = get({name!r})",
+                "    if value is not None:",
+                f"        encoded[{name!r}] = {_encode_source(hints[name], 'value')}",
+            ]
+            # Attributes stored with another type than the field declares
+            # (e.g. by an older version) are decoded dynamically instead
+            decode_lines += [
+                f"    value = get({name!r})",
+                "    if value is not None:",
+                "        try:",
+                f"            decoded[{name!r}] = {_decode_source(hints[name], 'value')}",
+                "        except (KeyError, TypeError, ValueError):",
+                f"            decoded[{name!r}] = _decode_value(value)",
+            ]
+        encode_lines += [
+            "    for key in item.keys() - FIELD_NAMES:",
+            "        value = item[key]",
+            "        if value is not None:",
+            "            encoded[key] = _encode_value(value)",
+            "    return encoded",
+        ]
+        decode_lines += [
+            "    for key in item.keys() - FIELD_NAMES:",
+            "        decoded[key] = _decode_value(item[key])",
+            "    return decoded",
+        ]
+        field_names = frozenset(names)
+        self.encode_item = _compile("\n".join(encode_lines) + "\n", 'encode_item', FIELD_NAMES=field_names)
+        self.decode_item = _compile("\n".join(decode_lines) + "\n", 'decode_item', FIELD_NAMES=field_names)
+    
+    def encode_path(self, path: Tuple[str, ...], value: Any) -> Optional[Dict[str, Any]]:
+        """
+        Encode the new value of an attribute path for UpdateItem.
+        
+        Args:
+            path: Attribute path, e.g. ('sanity',) or ('flags', 'lamp_on')
+            value: New value, exactly as a full put would store it
+        
+        Returns:
+            DynamoDB attribute value, or None if value is None (the path is
+            to be removed)
+        """
+        if value is None:
+            return None
+        codec = self.fields.get(path[0], DYNAMIC_CODEC)
+        for _ in path[1:]:
+            codec = codec.values or DYNAMIC_CODEC
+        return codec.encode(value)
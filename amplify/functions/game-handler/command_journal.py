@@ -0,0 +1,244 @@
+"""
+Command Journal for West of Haunted House
+
+Event-sourced session persistence. Instead of updating the session item on
+every save, SessionManager appends one small journal item per save holding
+the commands executed since the previous save, the RNG seed each ran with
+and the resulting field changes. The session item itself is a snapshot,
+rewritten only every snapshot_every saves, once the journal since the last
+snapshot outgrows max_bytes, or when its TTL is due for a refresh.
+
+Loading reads the snapshot and applies the recorded changes of the journal
+tail. Commands are not re-executed: handlers also change the world objects
+shared by every session in the process, so re-running them would leak one
+session's replay into the others. The recorded commands and seeds are kept
+for debugging; seeding the RNG makes a turn reproducible offline.
+
+Journal items live in the session store next to the snapshot, keyed
+'<session_id>#journal#<version>'. The version is the session version the
+save produced, so a journal item that already exists means another writer
+saved that version first.
+"""
+
+import json
+import random
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from .state_codec import pack
+except ImportError:
+    # For testing when imported directly
+    from state_codec import pack
+
+
+# Seeds for journaled commands; a private generator so reseeding the global
+# one before each command does not make the next seed predictable
+_seed_source = random.Random()
+
+
+def journal_key(session_id: str, version: int) -> str:
+    """
+    Build the store key of a session's journal item.
+    
+    Args:
+        session_id: The session identifier
+        version: Session version the journaled save produced
+    
+    Returns:
+        Store key; zero-padded so keys sort in version order
+    """
+    return f"{session_id}#journal#{version:010d}"
+
+
+def seed_command(state, command_text: str) -> int:
+    """
+    Seed the global RNG for one command and record it on the state.
+    
+    Call right before GameEngine.execute_command, so the journaled command
+    can be reproduced with the same random outcomes when debugging.
+    
+    Args:
+        state: GameState the command runs against
+        command_text: Raw command string
+    
+    Returns:
+        The seed used
+    """
+    seed = _seed_source.getrandbits(32)
+    random.seed(seed)
+    state.record_command(command_text, seed)
+    return seed
+
+
+def encode_changes(changes: Dict[Tuple[str, ...], Any], skip: Tuple[str, ...] = ()) -> str:
+    """
+    Encode GameState.get_changes output as canonical JSON.
+    
+    Equal changes always encode to the same string: paths are sorted,
+    map keys are sorted and rooms_visited is sorted.
+    
+    Args:
+        changes: Changed field paths mapped to their new values
+        skip: Top-level fields to leave out
+    
+    Returns:
+        JSON array of [path, value] pairs
+    """
+    pairs = []
+    for path, value in changes.items():
+        if path[0] in skip:
+            continue
+        if path == ('rooms_visited',):
+            value = sorted(value)
+        pairs.append([list(path), value])
+    pairs.sort(key=lambda pair: pair[0])
+    return json.dumps(pairs, sort_keys=True, separators=(',', ':'))
+
+
+def decode_changes(encoded: str) -> Dict[Tuple[str, ...], Any]:
+    """
+    Decode changes written by encode_changes.
+    
+    Args:
+        encoded: JSON array of [path, value] pairs
+    
+    Returns:
+        Changed field paths mapped to their new values
+    """
+    return {tuple(path): value for path, value in json.loads(encoded)}
+
+
+@dataclass
+class JournalCursor:
+    """Where a loaded or saved state stands relative to its snapshot."""
+    
+    # Version of the session item (snapshot) in the store
+    snapshot_version: int
+    
+    # TTL stamped on the snapshot, which journal appends do not extend
+    snapshot_expires: Optional[int] = None
+    
+    # Encoded size of the journal items written since the snapshot
+    journal_bytes: int = 0
+
+
+class CommandJournal:
+    """
+    Builds, reads and replays journal items for SessionManager.
+    
+    The handler creates the journal and passes it to
+    SessionManager(journal=...).
+    """
+    
+    DEFAULT_SNAPSHOT_EVERY = 20
+    DEFAULT_MAX_BYTES = 16 * 1024
+    
+    # Fields every journal item carries itself instead of in its changes
+    RECORD_FIELDS = ('version', 'last_accessed', 'expires')
+    
+    def __init__(self, snapshot_every: int = DEFAULT_SNAPSHOT_EVERY, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the journal.
+        
+        Args:
+            snapshot_every: Saves between snapshots of the whole state
+            max_bytes: Journal size since the last snapshot above which
+                the next save also writes a snapshot
+        """
+        self.snapshot_every = max(1, snapshot_every)
+        self.max_bytes = max_bytes
+    
+    def make_record(self, state, changes: Dict[Tuple[str, ...], Any]) -> Dict[str, Any]:
+        """
+        Build the journal item for a save.
+        
+        Args:
+            state: GameState being saved, with its new version and TTL
+            changes: GameState.get_changes output for the save
+        
+        Returns:
+            Journal item
+        """
+        return {
+            'version': state.version,
+            'last_accessed': state.last_accessed,
+            'expires': state.expires,
+            'commands': [{'text': text, 'seed': seed} for text, seed in state.command_log],
+            'changes': encode_changes(changes, skip=self.RECORD_FIELDS),
+        }
+    
+    def record_size(self, record: Dict[str, Any]) -> int:
+        """Get the encoded size of a journal item in bytes."""
+        return len(pack(record))
+    
+    def snapshot_due(self, state, cursor: JournalCursor, ttl_refresh_seconds: int) -> bool:
+        """
+        Check whether a save should also rewrite the snapshot.
+        
+        Args:
+            state: GameState being saved
+            cursor: The state's JournalCursor, including this save's item
+            ttl_refresh_seconds: Minimum seconds between TTL refreshes
+        
+        Returns:
+            True after snapshot_every journaled saves, once the journal
+            exceeds max_bytes, or when the snapshot's TTL needs extending
+        """
+        if state.version - cursor.snapshot_version >= self.snapshot_every:
+            return True
+        if cursor.journal_bytes > self.max_bytes:
+            return True
+        if cursor.snapshot_expires is None or state.expires is None:
+            return True
+        return state.expires - cursor.snapshot_expires >= ttl_refresh_seconds
+    
+    def load_tail(self, store, session_id: str, snapshot_version: int) -> List[Dict[str, Any]]:
+        """
+        Read the journal items saved after a snapshot.
+        
+        Items are read snapshot_every keys at a time with
+        SessionStore.batch_get, until the first missing version.
+        
+        Args:
+            store: SessionStore holding the session
+            session_id: The session identifier
+            snapshot_version: Version of the snapshot
+        
+        Returns:
+            Journal items in version order
+        """
+        records = []
+        version = snapshot_version + 1
+        while True:
+            keys = [journal_key(session_id, version + offset) for offset in range(self.snapshot_every)]
+            found = store.batch_get(keys)
+            for key in keys:
+                if key not in found:
+                    return records
+                records.append(found[key])
+            version += self.snapshot_every
+    
+    def replay(self, state, records: List[Dict[str, Any]]) -> int:
+        """
+        Apply journaled saves on top of a snapshot.
+        
+        Each item's recorded changes are applied as they were saved; the
+        commands are not run again, so replay leaves the world objects and
+        save slots alone.
+        
+        Args:
+            state: GameState loaded from the snapshot, marked clean
+            records: Journal items from load_tail
+        
+        Returns:
+            Encoded size of the replayed journal items in bytes
+        """
+        journal_bytes = 0
+        for record in records:
+            state.apply_changes(decode_changes(record['changes']))
+            for name in self.RECORD_FIELDS:
+                setattr(state, name, record.get(name))
+            state.mark_clean()
+            journal_bytes += self.record_size(record)
+        return journal_bytes
@@ -5,18 +5,24 @@ Core game logic for processing commands and managing game state.
 Handles movement, object interactions, and game mechanics.
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
+from dataclasses import dataclass, field, replace
+from typing import Callable, Dict, List, Any, Optional
 
 try:
     from .state_manager import GameState
     from .world_loader import WorldData, Room
     from .command_parser import ParsedCommand
+    from .save_slots import SaveSlots, SaveUnavailableError
+    from .session_store import InMemorySessionStore
+    from .request_log import logger
 except ImportError:
     # For testing when imported directly
     from state_manager import GameState
     from world_loader import WorldData, Room
     from command_parser import ParsedCommand
+    from save_slots import SaveSlots, SaveUnavailableError
+    from session_store import InMemorySessionStore
+    from request_log import logger
 
 
 @dataclass
@@ -33,6 +39,169 @@ class ActionResult:
     souls_awarded: int = 0
 
 
+@dataclass(frozen=True)
+class CommandSpec:
+    """
+    Dispatch metadata for one verb in COMMAND_REGISTRY.
+    
+    execute_command uses these flags to decide which pre-dispatch steps a
+    verb needs before calling its handler.
+    
+    Attributes:
+        handler: Called as handler(engine, command, state)
+        needs_object: Only dispatch when the command names an object
+        takes_object: The handler accepts an optional object
+        needs_target: Only dispatch when the command names a target
+        takes_target: The handler accepts an optional target
+        target_prompt: Question asked when a needed target is missing,
+            formatted with the object's display name
+        when: Extra routing condition on the parsed command
+        mutates_state: The command can change GameState. The handler skips
+            the change check before saving a turn of read-only commands,
+            so only verbs without objects can be read-only: resolving an
+            object can store a disambiguation prompt on the state.
+        takes_turn: The handler advances the turn counter when it succeeds
+            (GameEngine.advance_turn does nothing for other verbs)
+        checks_syntax: The verb has usage rules in _validate_command_syntax
+    """
+    handler: Callable[['GameEngine', ParsedCommand, GameState], ActionResult]
+    needs_object: bool = False
+    takes_object: bool = False
+    needs_target: bool = False
+    takes_target: bool = False
+    target_prompt: Optional[str] = None
+    when: Optional[Callable[[ParsedCommand], bool]] = None
+    mutates_state: bool = True
+    takes_turn: bool = False
+    checks_syntax: bool = False
+    
+    def __post_init__(self):
+        if not self.mutates_state and (self.uses_object or self.uses_target or self.takes_turn):
+            raise ValueError("Read-only commands cannot use objects or take turns")
+    
+    @property
+    def uses_object(self) -> bool:
+        """Whether the handler receives the command's object."""
+        return self.needs_object or self.takes_object
+    
+    @property
+    def uses_target(self) -> bool:
+        """Whether the handler receives the command's target."""
+        return self.needs_target or self.takes_target
+    
+    def accepts(self, command: ParsedCommand) -> bool:
+        """Whether this spec's routing conditions hold for a command."""
+        if self.needs_object and not command.object:
+            return False
+        return self.when is None or self.when(command)
+
+
+# Commands that require an object
+OBJECT_REQUIRED_VERBS = frozenset({
+    'TAKE', 'DROP', 'EXAMINE', 'OPEN', 'CLOSE', 'READ', 'LOCK', 'UNLOCK',
+    'TURN', 'PUSH', 'PULL', 'TIE', 'UNTIE', 'FILL', 'POUR', 'BURN', 'CUT',
+    'DIG', 'INFLATE', 'DEFLATE', 'WAVE', 'RUB', 'SHAKE', 'SQUEEZE',
+    'ATTACK', 'THROW', 'GIVE', 'TELL', 'ASK', 'WAKE', 'KISS', 'BOARD',
+    'ENTER', 'CLIMB'
+})
+
+
+class ObjectScope:
+    """
+    Objects within the player's reach, computed once per command.
+    
+    Captures the room items, inventory and global items for the current
+    room together with every container among them: whether it is open or
+    transparent and what it holds. Resolvers and handlers share one scope
+    through GameEngine.object_scope until the game state changes.
+    """
+    
+    def __init__(
+        self,
+        state: GameState,
+        room_items: List[str],
+        global_items: List[str],
+        containers: List[tuple],
+        local_container_count: int
+    ):
+        """
+        Args:
+            state: The game state the scope was built from
+            room_items: Object IDs in the current room
+            global_items: The current room's global object IDs
+            containers: (container_id, is_open, is_transparent, contents)
+                tuples for containers in the room, inventory and global
+                items, in that order
+            local_container_count: How many of the containers are in the
+                room or inventory rather than global items
+        """
+        self.state = state
+        self.revision = state.revision
+        self.room_id = state.current_room
+        self.inventory = tuple(state.inventory)
+        self.room_items = list(room_items)
+        self.local_items = self.room_items + list(self.inventory)
+        self.global_items = list(global_items)
+        self.containers = containers
+        self._local_container_count = local_container_count
+        self._available = {}
+        self._accessible = None
+    
+    def is_current(self, state: GameState) -> bool:
+        """Whether the scope still matches the given state."""
+        return (
+            state is self.state
+            and state.revision == self.revision
+            and state.current_room == self.room_id
+            and tuple(state.inventory) == self.inventory
+        )
+    
+    def available_objects(self, include_globals: bool = False) -> List[str]:
+        """
+        Get object IDs the player can refer to, in resolution priority order.
+        
+        Args:
+            include_globals: Also include the room's global items and the
+                contents of open global containers
+            
+        Returns:
+            Room items, inventory, optionally global items, then the
+            contents of open containers. Treat the result as read-only.
+        """
+        available = self._available.get(include_globals)
+        if available is None:
+            containers = self.containers if include_globals else self.containers[:self._local_container_count]
+            available = list(self.local_items)
+            if include_globals:
+                available.extend(self.global_items)
+            for _, is_open, _, contents in containers:
+                if is_open:
+                    available.extend(contents)
+            self._available[include_globals] = available
+        return available
+    
+    def is_accessible(self, object_id: str) -> bool:
+        """Whether an object is in reach, directly or in an open container."""
+        if self._accessible is None:
+            self._accessible = frozenset(self.available_objects(include_globals=True))
+        return object_id in self._accessible
+    
+    def find_container(self, object_id: str) -> Optional[str]:
+        """
+        Find the open or transparent container holding an object.
+        
+        Args:
+            object_id: The object identifier
+            
+        Returns:
+            The first container in scope holding the object, or None
+        """
+        for container_id, is_open, is_transparent, contents in self.containers:
+            if (is_open or is_transparent) and object_id in contents:
+                return container_id
+        return None
+
+
 class GameEngine:
     """
     Core game engine that processes commands and manages game state.
@@ -52,6 +221,124 @@ class GameEngine:
             world_data: Loaded world data containing rooms, objects, and flags
         """
         self.world = world_data
+        self._scope: Optional[ObjectScope] = None
+        # CommandSpec of the command execute_command is running
+        self._spec: Optional[CommandSpec] = None
+        
+        # Where SAVE/RESTORE keep snapshots; the handler replaces this with
+        # slots in the session store so saves outlive the container
+        self.save_slots = SaveSlots(InMemorySessionStore())
+    
+    def object_scope(self, state: GameState) -> ObjectScope:
+        """
+        Get the objects within the player's reach.
+        
+        The scope is built once and reused by every resolver and handler
+        for the command until the state is mutated; execute_command also
+        drops it after each handler runs, since handlers may change world
+        object state directly.
+        
+        Args:
+            state: Current game state
+            
+        Returns:
+            ObjectScope for the current room and inventory
+            
+        Raises:
+            ValueError: If the current room does not exist
+        """
+        scope = self._scope
+        if scope is not None and scope.is_current(state):
+            return scope
+        
+        current_room = self.world.get_room(state.current_room)
+        room_items = self.room_items(current_room, state)
+        local_items = list(room_items) + list(state.inventory)
+        
+        containers = []
+        local_container_count = 0
+        for index, container_id in enumerate(local_items + list(current_room.global_items)):
+            try:
+                container = self.world.get_object(container_id)
+                if container.type == 'container':
+                    # Check GameState first, then fall back to World data
+                    is_open = state.get_object_state(container_id, 'is_open', container.state.get('is_open', False))
+                    is_transparent = state.get_object_state(container_id, 'is_transparent', container.state.get('is_transparent', False))
+                    contents = state.get_object_state(container_id, 'contents', container.state.get('contents', []))
+                    containers.append((container_id, is_open, is_transparent, tuple(contents)))
+                    if index < len(local_items):
+                        local_container_count += 1
+            except (ValueError, AttributeError, TypeError):
+                continue
+        
+        scope = ObjectScope(state, room_items, current_room.global_items, containers, local_container_count)
+        self._scope = scope
+        return scope
+    
+    def invalidate_object_scope(self) -> None:
+        """Drop the cached scope so the next lookup rebuilds it."""
+        self._scope = None
+    
+    def advance_turn(self, state: GameState) -> None:
+        """
+        Advance the turn counter, if the command being executed takes a turn.
+        
+        Handlers call this where their turn passes, before the effects that
+        follow it (lamp drain, timed events). COMMAND_REGISTRY decides
+        which verbs take a turn, so a handler reached through a verb that
+        does not take one leaves the counter alone. Handlers called
+        directly, outside execute_command, always advance it.
+        
+        Args:
+            state: Current game state
+        """
+        if self._spec is None or self._spec.takes_turn:
+            state.increment_turn()
+    
+    def room_items(self, room: Room, state: GameState) -> List[str]:
+        """
+        Get a room's contents for this session.
+        
+        Rooms are shared world data cached across warm invocations, so the
+        pristine items are merged with the session's overlay instead of
+        being mutated. Treat the result as read-only.
+        
+        Args:
+            room: The room
+            state: Current game state
+            
+        Returns:
+            List of object IDs currently in the room
+        """
+        return state.get_room_items(room.id, room.items)
+    
+    def add_room_item(self, room: Room, object_id: str, state: GameState) -> bool:
+        """
+        Place an object in a room for this session only.
+        
+        Args:
+            room: The room
+            object_id: The object identifier to add
+            state: Current game state
+            
+        Returns:
+            True if added, False if already present
+        """
+        return state.add_room_item(room.id, room.items, object_id)
+    
+    def remove_room_item(self, room: Room, object_id: str, state: GameState) -> bool:
+        """
+        Remove an object from a room for this session only.
+        
+        Args:
+            room: The room
+            object_id: The object identifier to remove
+            state: Current game state
+            
+        Returns:
+            True if removed, False if not present
+        """
+        return state.remove_room_item(room.id, room.items, object_id)
     
     def resolve_object_name(self, name: str, state: GameState) -> Optional[str]:
         """
@@ -67,23 +354,8 @@ class GameEngine:
             Object ID if found, None otherwise
         """
         try:
-            current_room = self.world.get_room(state.current_room)
-            # Include global items in available objects
-            available_objects = list(current_room.items) + list(state.inventory) + list(current_room.global_items)
-            
-            # Add objects from open containers in room, inventory, and global items
-            for container_id in list(current_room.items) + list(state.inventory) + list(current_room.global_items):
-                try:
-                    container = self.world.get_object(container_id)
-                    if container.type == 'container':
-                        # Check GameState first, then fall back to World data
-                        is_open = state.get_object_state(container_id, 'is_open', container.state.get('is_open', False))
-                        if is_open:
-                            contents = state.get_object_state(container_id, 'contents', container.state.get('contents', []))
-                            available_objects.extend(contents)
-                except (ValueError, AttributeError):
-                    continue
-            
+            # Room, inventory and global items, plus open containers' contents
+            available_objects = self.object_scope(state).available_objects(include_globals=True)
             return self.world.find_object_by_name(name, available_objects)
         except Exception:
             return None
@@ -101,21 +373,7 @@ class GameEngine:
         """
         matches = []
         try:
-            current_room = self.world.get_room(state.current_room)
-            available_objects = list(current_room.items) + list(state.inventory)
-            
-            # Add objects from open containers in room and inventory
-            for container_id in list(current_room.items) + list(state.inventory):
-                try:
-                    container = self.world.get_object(container_id)
-                    if container.type == 'container':
-                        # Check GameState first, then fall back to World data
-                        is_open = state.get_object_state(container_id, 'is_open', container.state.get('is_open', False))
-                        if is_open:
-                            contents = state.get_object_state(container_id, 'contents', container.state.get('contents', []))
-                            available_objects.extend(contents)
-                except (ValueError, AttributeError):
-                    continue
+            available_objects = self.object_scope(state).available_objects()
             
             for obj_id in available_objects:
                 try:
@@ -151,21 +409,8 @@ class GameEngine:
 
         # First try direct ID match (case-insensitive)
         try:
-            current_room = self.world.get_room(state.current_room)
-            available_objects = list(current_room.items) + list(state.inventory)
-            
-            # Add objects from open containers in room and inventory
-            for container_id in list(current_room.items) + list(state.inventory):
-                try:
-                    container = self.world.get_object(container_id)
-                    if container.type == 'container':
-                        # Check GameState first, then fall back to World data
-                        is_open = state.get_object_state(container_id, 'is_open', container.state.get('is_open', False))
-                        if is_open:
-                            contents = state.get_object_state(container_id, 'contents', container.state.get('contents', []))
-                            available_objects.extend(contents)
-                except (ValueError, AttributeError):
-                    continue
+            # Room items and inventory, plus open containers' contents
+            available_objects = self.object_scope(state).available_objects()
 
             # Check if it's a direct object ID
             for obj_id in available_objects:
@@ -194,27 +439,7 @@ class GameEngine:
             True if accessible, False otherwise
         """
         try:
-            current_room = self.world.get_room(state.current_room)
-            
-            # 1. Check direct presence
-            if object_id in current_room.items or object_id in state.inventory or object_id in current_room.global_items:
-                return True
-            
-            # 2. Check inside containers
-            for container_id in list(current_room.items) + list(state.inventory) + list(current_room.global_items):
-                try:
-                    container = self.world.get_object(container_id)
-                    if container.type == 'container':
-                        # Check GameState first, then fall back to World data
-                        is_open = state.get_object_state(container_id, 'is_open', container.state.get('is_open', False))
-                        if is_open:
-                            contents = state.get_object_state(container_id, 'contents', container.state.get('contents', []))
-                            if object_id in contents:
-                                return True
-                except (ValueError, AttributeError):
-                    continue
-            
-            return False
+            return self.object_scope(state).is_accessible(object_id)
         except Exception:
             return False
 
@@ -236,16 +461,18 @@ class GameEngine:
             return self.get_darkness_description(state.current_room)
 
         # Get room description with objects
+        current_room_obj = self.world.get_room(state.current_room)
+        room_items = self.room_items(current_room_obj, state)
         description = self.world.get_room_description(
             state.current_room,
             state.sanity,
-            include_objects=True
+            include_objects=True,
+            room_items=room_items
         )
 
         # Add contents of open/transparent containers in the room
-        current_room_obj = self.world.get_room(state.current_room)
         # Check both items and global items
-        for item_id in list(current_room_obj.items) + list(current_room_obj.global_items):
+        for item_id in list(room_items) + list(current_room_obj.global_items):
             try:
                 item = self.world.get_object(item_id)
                 if item.type == "container":
@@ -503,13 +730,13 @@ class GameEngine:
             
         Requirements: 11.5
         """
-        current_room = self.world.get_room(state.current_room)
+        room_items = self.object_scope(state).room_items
         
         # Handle 'all' or 'everything'
         if object_spec.lower() in ['all', 'everything']:
             # Return all takeable objects in room
             objects = []
-            for obj_id in current_room.items:
+            for obj_id in room_items:
                 try:
                     obj = self.world.get_object(obj_id)
                     if obj.state.get('is_takeable', True):
@@ -524,7 +751,7 @@ class GameEngine:
             if len(parts) == 2:
                 excluded = parts[1].strip()
                 objects = []
-                for obj_id in current_room.items:
+                for obj_id in room_items:
                     try:
                         obj = self.world.get_object(obj_id)
                         if obj.state.get('is_takeable', True):
@@ -625,7 +852,7 @@ class GameEngine:
 
             # Check if object is directly in room, inventory, or global items
             current_room = self.world.get_room(state.current_room)
-            is_direct_id = (object_id in current_room.items or 
+            is_direct_id = (object_id in self.room_items(current_room, state) or 
                             object_id in state.inventory or 
                             object_id in current_room.global_items)
             
@@ -704,7 +931,12 @@ class GameEngine:
             if not is_lit:
                 description = self.get_darkness_description(entry_destination)
             else:
-                description = self.world.get_room_description(entry_destination, state.sanity, include_objects=True)
+                description = self.world.get_room_description(
+                    entry_destination,
+                    state.sanity,
+                    include_objects=True,
+                    room_items=self.room_items(target_room, state)
+                )
             
             # Apply room effects
             sanity_change = 0
@@ -720,7 +952,7 @@ class GameEngine:
                     notifications.append("You feel a sense of calm returning...")
             
             # Increment turn counter
-            state.increment_turn()
+            self.advance_turn(state)
             
             # Apply lamp battery drain
             lamp_notifications = self.apply_lamp_battery_drain(state)
@@ -795,7 +1027,7 @@ class GameEngine:
             # For now, we'll treat EXIT as equivalent to moving OUT
             
             # Check if object exists in current room
-            if object_id not in current_room.items:
+            if object_id not in self.room_items(current_room, state):
                 display_name = self._get_object_names(object_id)
                 return ActionResult(
                     success=False,
@@ -826,7 +1058,12 @@ class GameEngine:
             if not is_lit:
                 description = self.get_darkness_description(exit_destination)
             else:
-                description = self.world.get_room_description(exit_destination, state.sanity, include_objects=True)
+                description = self.world.get_room_description(
+                    exit_destination,
+                    state.sanity,
+                    include_objects=True,
+                    room_items=self.room_items(target_room, state)
+                )
             
             # Apply room effects
             sanity_change = 0
@@ -842,7 +1079,7 @@ class GameEngine:
                     notifications.append("You feel a sense of calm returning...")
             
             # Increment turn counter
-            state.increment_turn()
+            self.advance_turn(state)
             
             # Apply lamp battery drain
             lamp_notifications = self.apply_lamp_battery_drain(state)
@@ -917,7 +1154,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
             
             # Check if vehicle is in current room or inventory
-            vehicle_in_room = vehicle_id in current_room.items
+            vehicle_in_room = vehicle_id in self.room_items(current_room, state)
             vehicle_in_inventory = vehicle_id in state.inventory
             
             if not vehicle_in_room and not vehicle_in_inventory:
@@ -952,9 +1189,9 @@ class GameEngine:
                 
                 if has_sharp:
                     # Puncture logic: Swap inflated_boat to punctured_boat
-                    if vehicle_id in current_room.items:
-                        current_room.items.remove(vehicle_id)
-                        current_room.items.append("punctured_boat")
+                    if vehicle_id in self.room_items(current_room, state):
+                        self.remove_room_item(current_room, vehicle_id, state)
+                        self.add_room_item(current_room, "punctured_boat", state)
                         
                     return ActionResult(
                         success=False,
@@ -1115,7 +1352,7 @@ class GameEngine:
             # If an object is specified, validate it exists and is climbable
             if object_id:
                 # Check if object is in current room, global items, or inventory
-                if object_id not in current_room.items and object_id not in current_room.global_items and object_id not in state.inventory:
+                if object_id not in self.room_items(current_room, state) and object_id not in current_room.global_items and object_id not in state.inventory:
                     # Check if it's mentioned in the room description (scenery)
                     try:
                         game_object = self.world.get_object(object_id)
@@ -1190,7 +1427,7 @@ class GameEngine:
                     notifications.append("You feel a sense of calm returning...")
             
             # Increment turn counter
-            state.increment_turn()
+            self.advance_turn(state)
             
             # Apply lamp battery drain
             lamp_notifications = self.apply_lamp_battery_drain(state)
@@ -1330,9 +1567,9 @@ class GameEngine:
             if state.current_vehicle:
                 # Check if vehicle needs water and target is land?
                 # For now, we assume simple movement where the vehicle follows the player
-                if state.current_vehicle in current_room.items:
-                     current_room.items.remove(state.current_vehicle)
-                     target_room.items.append(state.current_vehicle)
+                if state.current_vehicle in self.room_items(current_room, state):
+                     self.remove_room_item(current_room, state.current_vehicle, state)
+                     self.add_room_item(target_room, state.current_vehicle, state)
                 # Note: If vehicle was in inventory (e.g. magic), it stays there, but boarding usually puts it in room.
             
             # Move player to new room
@@ -1377,7 +1614,7 @@ class GameEngine:
                     notifications.append("You feel a sense of calm returning...")
             
             # Increment turn counter
-            state.increment_turn()
+            self.advance_turn(state)
             
             # Apply lamp battery drain
             lamp_notifications = self.apply_lamp_battery_drain(state)
@@ -1491,7 +1728,7 @@ class GameEngine:
                 elif sanity_change > 0:
                     notifications.append("The familiar surroundings offer small comfort.")
 
-            state.increment_turn()
+            self.advance_turn(state)
 
             return ActionResult(
                 success=True,
@@ -1550,7 +1787,7 @@ class GameEngine:
         state.set_flag('is_sitting', False)
         state.set_flag('is_lying', False)
 
-        state.increment_turn()
+        self.advance_turn(state)
 
         message = "You rise to your feet, brushing imaginary dust from your clothes."
 
@@ -1613,7 +1850,7 @@ class GameEngine:
                 return self._handle_missing_object(object_id, state, "FOLLOW")
 
             # Check if target is in current room
-            if object_id not in current_room.items:
+            if object_id not in self.room_items(current_room, state):
                 return ActionResult(
                     success=False,
                     message=f"The {target.name.lower()} is not here to follow.",
@@ -1699,7 +1936,7 @@ class GameEngine:
                 )
 
             # For now, swimming is just for flavor
-            state.increment_turn()
+            self.advance_turn(state)
 
             messages = [
                 "You swim through the cold, dark water, feeling unseen things brush against you.",
@@ -1755,7 +1992,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
 
             # Increment turn counter
-            state.increment_turn()
+            self.advance_turn(state)
 
             # Check for timed events in the current room
             notifications = []
@@ -1791,9 +2028,9 @@ class GameEngine:
             message = random.choice(wait_messages)
 
             # Check for any objects that might change while waiting
-            if current_room.items:
+            if self.room_items(current_room, state):
                 interactive_objects = [
-                    item for item in current_room.items
+                    item for item in self.room_items(current_room, state)
                     if self.world.get_object(item).state.get('changes_while_waiting', False)
                 ]
 
@@ -1849,7 +2086,7 @@ class GameEngine:
             
             # Check if object is in current room
             # Check if object is in current room or global items
-            if object_id not in current_room.items and object_id not in current_room.global_items:
+            if object_id not in self.room_items(current_room, state) and object_id not in current_room.global_items:
                 # Check if already in inventory
                 if object_id in state.inventory:
                     return ActionResult(
@@ -1858,22 +2095,7 @@ class GameEngine:
                     )
                 
                 # Check if object is in an open container in the room or inventory
-                found_in_container = None
-                for item_id in list(current_room.items) + list(state.inventory) + list(current_room.global_items):
-                    try:
-                        item = self.world.get_object(item_id)
-                        if item.type == "container":
-                            # Check GameState first, then fall back to World data
-                            is_open = state.get_object_state(item_id, 'is_open', item.state.get('is_open', False))
-                            is_transparent = state.get_object_state(item_id, 'is_transparent', item.state.get('is_transparent', False))
-                            
-                            if is_open or is_transparent:
-                                contents = state.get_object_state(item_id, 'contents', item.state.get('contents', []))
-                                if object_id in contents:
-                                    found_in_container = item_id
-                                    break
-                    except:
-                        continue
+                found_in_container = self.object_scope(state).find_container(object_id)
                 
                 if found_in_container:
                     # Delegate to handle_take_from_container
@@ -1945,7 +2167,7 @@ class GameEngine:
             state.add_to_inventory(object_id)
             
             # Remove from room
-            current_room.items.remove(object_id)
+            self.remove_room_item(current_room, object_id, state)
             
             # Apply sanity effects
             if sanity_change != 0:
@@ -1953,9 +2175,9 @@ class GameEngine:
                 if sanity_change < 0:
                     notifications.append("Touching it fills you with dread...")
 
-            # Score points for taking treasure
-            if game_object.is_treasure and not game_object.state.get('is_scored_take', False):
-                game_object.state['is_scored_take'] = True
+            # Score points for taking treasure, once per game
+            if game_object.is_treasure and not state.get_object_state(object_id, 'is_scored_take', False):
+                state.set_object_state(object_id, 'is_scored_take', True)
                 take_points = game_object.state.get('take_value', 0)
                 if take_points > 0:
                     state.score += take_points
@@ -2054,7 +2276,7 @@ class GameEngine:
             
             # Add to current room
             current_room = self.world.get_room(state.current_room)
-            current_room.items.append(object_id)
+            self.add_room_item(current_room, object_id, state)
             
             # Apply sanity effects
             if sanity_change != 0:
@@ -2149,7 +2371,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
             
             # Check if object is in current room, inventory, or global items
-            object_in_room = object_id in current_room.items
+            object_in_room = object_id in self.room_items(current_room, state)
             object_in_global = object_id in current_room.global_items
             object_in_inventory = object_id in state.inventory
             
@@ -2225,7 +2447,7 @@ class GameEngine:
                     break
             
             if not matching_interaction:
-                print(f"DEBUG: No matching interaction for {verb} on {object_id}")
+                logger.debug("No matching interaction for %s on %s", verb, object_id)
                 # No matching interaction found
                 return ActionResult(
                     success=False,
@@ -2476,7 +2698,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
             
             # Check if container is in current room or inventory
-            container_in_room = container_id in current_room.items
+            container_in_room = container_id in self.room_items(current_room, state)
             container_in_inventory = container_id in state.inventory
             
             if not container_in_room and not container_in_inventory:
@@ -2636,7 +2858,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
             
             # Check if container is in current room or inventory
-            container_in_room = container_id in current_room.items
+            container_in_room = container_id in self.room_items(current_room, state)
             container_in_inventory = container_id in state.inventory
             
             if not container_in_room and not container_in_inventory:
@@ -2766,7 +2988,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
             
             # Check if container is in current room or inventory
-            container_in_room = container_id in current_room.items
+            container_in_room = container_id in self.room_items(current_room, state)
             container_in_inventory = container_id in state.inventory
             
             if not container_in_room and not container_in_inventory:
@@ -3070,7 +3292,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
             
             # Check if object is in current room or inventory
-            object_in_room = object_id in current_room.items
+            object_in_room = object_id in self.room_items(current_room, state)
             object_in_inventory = object_id in state.inventory
             
             if not object_in_room and not object_in_inventory:
@@ -3183,7 +3405,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
             
             # Check if object is in current room or inventory
-            object_in_room = object_id in current_room.items
+            object_in_room = object_id in self.room_items(current_room, state)
             object_in_inventory = object_id in state.inventory
             
             if not object_in_room and not object_in_inventory:
@@ -3321,7 +3543,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
             
             # Check if object is in current room or inventory
-            object_in_room = object_id in current_room.items
+            object_in_room = object_id in self.room_items(current_room, state)
             object_in_inventory = object_id in state.inventory
             
             if not object_in_room and not object_in_inventory:
@@ -3433,7 +3655,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
             
             # Check if object is in current room
-            if object_id not in current_room.items:
+            if object_id not in self.room_items(current_room, state):
                 display_name = self._get_object_names(object_id)
                 return ActionResult(
                     success=False,
@@ -3477,8 +3699,8 @@ class GameEngine:
             
             if reveals_items:
                 for item_id in reveals_items:
-                    if item_id not in current_room.items:
-                        current_room.items.append(item_id)
+                    if item_id not in self.room_items(current_room, state):
+                        self.add_room_item(current_room, item_id, state)
                         try:
                             revealed_obj = self.world.get_object(item_id)
                             notifications.append(f"Pushing the {game_object.name} reveals {revealed_obj.name_spooky}!")
@@ -3544,7 +3766,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
             
             # Check if object is in current room
-            if object_id not in current_room.items:
+            if object_id not in self.room_items(current_room, state):
                 display_name = self._get_object_names(object_id)
                 return ActionResult(
                     success=False,
@@ -3583,8 +3805,8 @@ class GameEngine:
             
             if reveals_items:
                 for item_id in reveals_items:
-                    if item_id not in current_room.items:
-                        current_room.items.append(item_id)
+                    if item_id not in self.room_items(current_room, state):
+                        self.add_room_item(current_room, item_id, state)
                         try:
                             revealed_obj = self.world.get_object(item_id)
                             notifications.append(f"Pulling the {game_object.name} reveals {revealed_obj.name_spooky}!")
@@ -3660,7 +3882,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
             
             # Check if target is in current room or inventory
-            target_in_room = target_id in current_room.items
+            target_in_room = target_id in self.room_items(current_room, state)
             target_in_inventory = target_id in state.inventory
             
             if not target_in_room and not target_in_inventory:
@@ -3795,7 +4017,7 @@ class GameEngine:
             # Check if rope object is in inventory or current room
             current_room = self.world.get_room(state.current_room)
             
-            object_in_room = object_id in current_room.items
+            object_in_room = object_id in self.room_items(current_room, state)
             object_in_inventory = object_id in state.inventory
             
             if not object_in_room and not object_in_inventory:
@@ -3915,7 +4137,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
             
             # Check if container is in inventory or current room
-            container_in_room = container_id in current_room.items
+            container_in_room = container_id in self.room_items(current_room, state)
             container_in_inventory = container_id in state.inventory
             
             if not container_in_room and not container_in_inventory:
@@ -3926,7 +4148,7 @@ class GameEngine:
                 )
             
             # Check if source is in current room or inventory
-            source_in_room = source_id in current_room.items
+            source_in_room = source_id in self.room_items(current_room, state)
             source_in_inventory = source_id in state.inventory
             
             if not source_in_room and not source_in_inventory:
@@ -4046,7 +4268,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
             
             # Check if container is in inventory or current room
-            container_in_room = container_id in current_room.items
+            container_in_room = container_id in self.room_items(current_room, state)
             container_in_inventory = container_id in state.inventory
             
             if not container_in_room and not container_in_inventory:
@@ -4086,7 +4308,7 @@ class GameEngine:
             # Handle pouring into another container
             if target_id:
                 # Check if target is in current room or inventory
-                target_in_room = target_id in current_room.items
+                target_in_room = target_id in self.room_items(current_room, state)
                 target_in_inventory = target_id in state.inventory
                 
                 if not target_in_room and not target_in_inventory:
@@ -4196,7 +4418,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
             
             # Check if object is in current room or inventory
-            object_in_room = object_id in current_room.items
+            object_in_room = object_id in self.room_items(current_room, state)
             object_in_inventory = object_id in state.inventory
             
             if not object_in_room and not object_in_inventory:
@@ -4220,8 +4442,8 @@ class GameEngine:
             # If there are items to reveal
             if reveals_under:
                 for item_id in reveals_under:
-                    if item_id not in current_room.items:
-                        current_room.items.append(item_id)
+                    if item_id not in self.room_items(current_room, state):
+                        self.add_room_item(current_room, item_id, state)
                         try:
                             revealed_obj = self.world.get_object(item_id)
                             notifications.append(f"You discover {revealed_obj.name_spooky} hidden beneath!")
@@ -4314,7 +4536,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
             
             # Check if container is in current room or inventory
-            container_in_room = container_id in current_room.items
+            container_in_room = container_id in self.room_items(current_room, state)
             container_in_inventory = container_id in state.inventory
             
             if not container_in_room and not container_in_inventory:
@@ -4427,7 +4649,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
             
             # Check if object is in current room or inventory
-            object_in_room = object_id in current_room.items
+            object_in_room = object_id in self.room_items(current_room, state)
             object_in_inventory = object_id in state.inventory
             
             if not object_in_room and not object_in_inventory:
@@ -4451,8 +4673,8 @@ class GameEngine:
             # If there are items to reveal
             if reveals_behind:
                 for item_id in reveals_behind:
-                    if item_id not in current_room.items:
-                        current_room.items.append(item_id)
+                    if item_id not in self.room_items(current_room, state):
+                        self.add_room_item(current_room, item_id, state)
                         try:
                             revealed_obj = self.world.get_object(item_id)
                             notifications.append(f"You discover {revealed_obj.name_spooky} concealed behind it!")
@@ -4545,7 +4767,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
             
             # Check if object is in current room or inventory
-            object_in_room = object_id in current_room.items
+            object_in_room = object_id in self.room_items(current_room, state)
             object_in_inventory = object_id in state.inventory
             
             if not object_in_room and not object_in_inventory:
@@ -4569,8 +4791,8 @@ class GameEngine:
             # If there are items to reveal through searching
             if search_reveals:
                 for item_id in search_reveals:
-                    if item_id not in current_room.items:
-                        current_room.items.append(item_id)
+                    if item_id not in self.room_items(current_room, state):
+                        self.add_room_item(current_room, item_id, state)
                         try:
                             revealed_obj = self.world.get_object(item_id)
                             notifications.append(f"Your search reveals {revealed_obj.name_spooky}!")
@@ -4817,7 +5039,7 @@ class GameEngine:
             
             # Listening to a specific object
             # Check if object is in current room or inventory
-            object_in_room = object_id in current_room.items
+            object_in_room = object_id in self.room_items(current_room, state)
             object_in_inventory = object_id in state.inventory
             
             if not object_in_room and not object_in_inventory:
@@ -5007,7 +5229,7 @@ class GameEngine:
             
             # Smelling a specific object
             # Check if object is in current room or inventory
-            object_in_room = object_id in current_room.items
+            object_in_room = object_id in self.room_items(current_room, state)
             object_in_inventory = object_id in state.inventory
             
             if not object_in_room and not object_in_inventory:
@@ -5152,7 +5374,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
             
             # Check if object exists and is accessible
-            if object_id not in current_room.items and object_id not in state.inventory:
+            if object_id not in self.room_items(current_room, state) and object_id not in state.inventory:
                 display_name = self._get_object_names(object_id)
                 return ActionResult(
                     success=False,
@@ -5173,7 +5395,7 @@ class GameEngine:
             # If fire source specified, validate it
             if fire_source_id:
                 # Check if fire source is in inventory or room
-                if fire_source_id not in state.inventory and fire_source_id not in current_room.items:
+                if fire_source_id not in state.inventory and fire_source_id not in self.room_items(current_room, state):
                     fire_source_name = self._get_object_names(fire_source_id)
                     return ActionResult(
                         success=False,
@@ -5202,8 +5424,8 @@ class GameEngine:
             notifications = []
             
             # Remove object from room or inventory
-            if object_id in current_room.items:
-                current_room.items.remove(object_id)
+            if object_id in self.room_items(current_room, state):
+                self.remove_room_item(current_room, object_id, state)
             if object_id in state.inventory:
                 state.remove_from_inventory(object_id)
             
@@ -5280,7 +5502,7 @@ class GameEngine:
         try:
             current_room = self.world.get_room(state.current_room)
             
-            if object_id not in current_room.items and object_id not in state.inventory:
+            if object_id not in self.room_items(current_room, state) and object_id not in state.inventory:
                 display_name = self._get_object_names(object_id)
                 return ActionResult(
                     success=False,
@@ -5297,7 +5519,7 @@ class GameEngine:
                 )
             
             if tool_id:
-                if tool_id not in state.inventory and tool_id not in current_room.items:
+                if tool_id not in state.inventory and tool_id not in self.room_items(current_room, state):
                     tool_name = self._get_object_names(tool_id)
                     return ActionResult(
                         success=False,
@@ -5419,7 +5641,7 @@ class GameEngine:
                 )
             
             # Digging at specific object
-            if location_id not in current_room.items:
+            if location_id not in self.room_items(current_room, state):
                 display_name = self._get_object_names(location_id)
                 return ActionResult(
                     success=False,
@@ -5523,7 +5745,7 @@ class GameEngine:
                 return self._handle_missing_object(object_id, state, "DESTROY")
 
             # Check if object is in current room or inventory
-            object_in_room = object_id in current_room.items
+            object_in_room = object_id in self.room_items(current_room, state)
             object_in_inventory = object_id in state.inventory
 
             if not object_in_room and not object_in_inventory:
@@ -5559,12 +5781,12 @@ class GameEngine:
 
             # Remove from room or inventory
             if object_in_room:
-                current_room.items.remove(object_id)
+                self.remove_room_item(current_room, object_id, state)
             if object_in_inventory:
                 state.inventory.remove(object_id)
 
             # Increment turn counter
-            state.increment_turn()
+            self.advance_turn(state)
 
             # Generate thematic destruction message
             if state.sanity < 30:
@@ -5652,20 +5874,20 @@ class GameEngine:
                      return ActionResult(success=False, message="You don't have enough lung power to inflate it yourself.")
                 
                 # Check accessibility
-                if object_id not in current_room.items and object_id not in state.inventory:
+                if object_id not in self.room_items(current_room, state) and object_id not in state.inventory:
                      display_name = self._get_object_names(object_id)
                      return ActionResult(success=False, message=f"You don't see any {display_name} here.")
                      
                 # Swap logic
-                if object_id in current_room.items:
-                    current_room.items.remove(object_id)
+                if object_id in self.room_items(current_room, state):
+                    self.remove_room_item(current_room, object_id, state)
                 elif object_id in state.inventory:
                     state.inventory.remove(object_id)
                 
-                current_room.items.append("inflated_boat")
+                self.add_room_item(current_room, "inflated_boat", state)
                 return ActionResult(success=True, message="You inflate the boat. It expands into a large, seaworthy craft.")
 
-            if object_id not in current_room.items and object_id not in state.inventory:
+            if object_id not in self.room_items(current_room, state) and object_id not in state.inventory:
                 display_name = self._get_object_names(object_id)
                 return ActionResult(success=False, message=f"You don't see any {display_name} here.")
             
@@ -5716,12 +5938,12 @@ class GameEngine:
                      return ActionResult(success=False, message="You can't deflate the boat while you're in it.")
                  
                  # Swap back to inflatable_boat
-                 if object_id in current_room.items:
-                     current_room.items.remove(object_id)
-                     current_room.items.append("inflatable_boat")
+                 if object_id in self.room_items(current_room, state):
+                     self.remove_room_item(current_room, object_id, state)
+                     self.add_room_item(current_room, "inflatable_boat", state)
                      return ActionResult(success=True, message="You deflate the boat, turning it back into a pile of plastic.")
             
-            if object_id not in current_room.items and object_id not in state.inventory:
+            if object_id not in self.room_items(current_room, state) and object_id not in state.inventory:
                 display_name = self._get_object_names(object_id)
                 return ActionResult(success=False, message=f"You don't see any {display_name} here.")
             
@@ -5767,9 +5989,9 @@ class GameEngine:
                 return ActionResult(success=False, message="You don't have anything to patch it with.")
             
             # Swap punctured -> inflated
-            if object_id in current_room.items:
-                current_room.items.remove(object_id)
-                current_room.items.append("inflated_boat") # Or inflatable_boat? Usually Fix -> Inflated? Or Fix -> Inflatable?
+            if object_id in self.room_items(current_room, state):
+                self.remove_room_item(current_room, object_id, state)
+                self.add_room_item(current_room, "inflated_boat", state) # Or inflatable_boat? Usually Fix -> Inflated? Or Fix -> Inflatable?
                 # Zork I: Fix -> Inflated Boat (if using gunk on Punctured Boat?)
                 # Wait, usually Puncture -> Deflates (Pile).
                 # But here we have "punctured_boat" object.
@@ -5791,9 +6013,9 @@ class GameEngine:
         if state.current_room == "dam_base":
              state.move_to_room("river_1")
              # Move vehicle
-             if "inflated_boat" in current_room.items:
-                 current_room.items.remove("inflated_boat")
-                 self.world.get_room("river_1").items.append("inflated_boat")
+             if "inflated_boat" in self.room_items(current_room, state):
+                 self.remove_room_item(current_room, "inflated_boat", state)
+                 self.add_room_item(self.world.get_room("river_1"), "inflated_boat", state)
              
              launch_msg = "The boat launches into the Frigid River. The current takes you downstream."
              
@@ -5845,7 +6067,7 @@ class GameEngine:
         """Handle rubbing/touching an object."""
         try:
             current_room = self.world.get_room(state.current_room)
-            if object_id not in current_room.items and object_id not in state.inventory:
+            if object_id not in self.room_items(current_room, state) and object_id not in state.inventory:
                 display_name = self._get_object_names(object_id)
                 return ActionResult(success=False, message=f"You don't see any {display_name} here.")
             
@@ -5875,7 +6097,7 @@ class GameEngine:
         """Handle shaking an object."""
         try:
             current_room = self.world.get_room(state.current_room)
-            if object_id not in current_room.items and object_id not in state.inventory:
+            if object_id not in self.room_items(current_room, state) and object_id not in state.inventory:
                 display_name = self._get_object_names(object_id)
                 return ActionResult(success=False, message=f"You don't see any {display_name} here.")
             
@@ -5905,7 +6127,7 @@ class GameEngine:
         """Handle squeezing an object."""
         try:
             current_room = self.world.get_room(state.current_room)
-            if object_id not in current_room.items and object_id not in state.inventory:
+            if object_id not in self.room_items(current_room, state) and object_id not in state.inventory:
                 display_name = self._get_object_names(object_id)
                 return ActionResult(success=False, message=f"You don't see any {display_name} here.")
             
@@ -6032,7 +6254,7 @@ class GameEngine:
         try:
             # Check if target is in room or inventory
             current_room = self.world.get_room(state.current_room)
-            target_in_room = target in current_room.items
+            target_in_room = target in self.room_items(current_room, state)
             target_in_inventory = target in state.inventory
 
             if not target_in_room and not target_in_inventory:
@@ -6279,7 +6501,7 @@ class GameEngine:
                 continue
 
         # Search room
-        for item_id in current_room.items:
+        for item_id in self.room_items(current_room, state):
             try:
                 item = self.world.get_object(item_id)
                 if search_target_lower in item.id.lower() or search_target_lower in item.name.lower():
@@ -6288,7 +6510,7 @@ class GameEngine:
                 continue
 
         # Search containers in room
-        for item_id in current_room.items:
+        for item_id in self.room_items(current_room, state):
             try:
                 item = self.world.get_object(item_id)
                 if item.type == "container" and item.state.get('open', False):
@@ -6345,7 +6567,7 @@ class GameEngine:
         if not count_target:
             # General inventory count
             inventory_count = len(state.inventory)
-            room_item_count = len(current_room.items)
+            room_item_count = len(self.room_items(current_room, state))
 
             return ActionResult(
                 success=True,
@@ -6371,7 +6593,7 @@ class GameEngine:
                 continue
 
         # Count in room
-        for item_id in current_room.items:
+        for item_id in self.room_items(current_room, state):
             try:
                 item = self.world.get_object(item_id)
                 if (count_target_lower in item.id.lower() or
@@ -6385,7 +6607,7 @@ class GameEngine:
         # Special case: count treasures
         if count_target_lower in ["treasure", "treasures", "valuable", "valuables"]:
             treasure_count = 0
-            for item_id in state.inventory + current_room.items:
+            for item_id in state.inventory + self.room_items(current_room, state):
                 try:
                     item = self.world.get_object(item_id)
                     if item.state.get('treasure', False):
@@ -6494,8 +6716,8 @@ class GameEngine:
             f"Inventory: {len(state.inventory)} items\n"
             f"- Objects: {', '.join(state.inventory) if state.inventory else 'None'}\n\n"
 
-            f"Room Contents: {len(current_room.items)} items\n"
-            f"- Objects: {', '.join(current_room.items) if current_room.items else 'None'}\n\n"
+            f"Room Contents: {len(self.room_items(current_room, state))} items\n"
+            f"- Objects: {', '.join(self.room_items(current_room, state)) if self.room_items(current_room, state) else 'None'}\n\n"
 
             f"Game Flags:\n"
         )
@@ -6746,7 +6968,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
 
             # Check if object is in room or inventory
-            object_in_room = object_id in current_room.items
+            object_in_room = object_id in self.room_items(current_room, state)
             object_in_inventory = object_id in state.inventory
 
             if not object_in_room and not object_in_inventory:
@@ -6863,7 +7085,7 @@ class GameEngine:
         # Try to cross an object
         try:
             # Check if object is in room
-            if object_id not in current_room.items:
+            if object_id not in self.room_items(current_room, state):
                 display_name = self._get_object_names(object_id)
                 return ActionResult(
                     success=False,
@@ -7015,7 +7237,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
 
             # Check if object is in room or inventory
-            object_in_room = object_id in current_room.items
+            object_in_room = object_id in self.room_items(current_room, state)
             object_in_inventory = object_id in state.inventory
 
             if not object_in_room and not object_in_inventory:
@@ -7219,7 +7441,7 @@ class GameEngine:
         try:
             # Check if object is in room or inventory
             current_room = self.world.get_room(state.current_room)
-            object_in_room = object_id in current_room.items
+            object_in_room = object_id in self.room_items(current_room, state)
             object_in_inventory = object_id in state.inventory
 
             if not object_in_room and not object_in_inventory:
@@ -7309,7 +7531,7 @@ class GameEngine:
         # Check if there are supernatural entities present
         has_spirits = any(
             obj.type in ['spirit', 'ghost', 'undead'] or obj.state.get('supernatural', False)
-            for obj_id in current_room.items
+            for obj_id in self.room_items(current_room, state)
             for obj in [self.world.get_object(obj_id)]
             if hasattr(self.world, 'get_object')
         )
@@ -7502,7 +7724,7 @@ class GameEngine:
 
             # Check if target is in room
             current_room = self.world.get_room(state.current_room)
-            target_in_room = target in current_room.items
+            target_in_room = target in self.room_items(current_room, state)
 
             if not target_in_room:
                 target_display_name = self._get_object_names(target)
@@ -7571,7 +7793,7 @@ class GameEngine:
 
         # Check if there are creatures that might respond to STAY
         creatures_here = [
-            obj_id for obj_id in current_room.items
+            obj_id for obj_id in self.room_items(current_room, state)
             if hasattr(self.world, 'get_object') and
             self.world.get_object(obj_id).type in ['creature', 'person']
         ]
@@ -7622,7 +7844,7 @@ class GameEngine:
         try:
             # Check if object is in room or inventory
             current_room = self.world.get_room(state.current_room)
-            object_in_room = object_id in current_room.items
+            object_in_room = object_id in self.room_items(current_room, state)
             object_in_inventory = object_id in state.inventory
 
             if not object_in_room and not object_in_inventory:
@@ -7725,7 +7947,7 @@ class GameEngine:
         try:
             # Check if object is in room
             current_room = self.world.get_room(state.current_room)
-            object_in_room = object_id in current_room.items
+            object_in_room = object_id in self.room_items(current_room, state)
 
             if not object_in_room:
                 display_name = self._get_object_names(object_id)
@@ -7814,7 +8036,7 @@ class GameEngine:
         try:
             # Check if object is in room or inventory
             current_room = self.world.get_room(state.current_room)
-            object_in_room = object_id in current_room.items
+            object_in_room = object_id in self.room_items(current_room, state)
             object_in_inventory = object_id in state.inventory
 
             if not object_in_room and not object_in_inventory:
@@ -8127,7 +8349,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
             
             # Check if target is in current room
-            if target_id not in current_room.items:
+            if target_id not in self.room_items(current_room, state):
                 display_name = self._get_object_names(target_id)
                 return ActionResult(
                     success=False,
@@ -8237,8 +8459,8 @@ class GameEngine:
                 # Check if creature drops items
                 drops_items = target.state.get('drops_items', [])
                 for item_id in drops_items:
-                    if item_id not in current_room.items:
-                        current_room.items.append(item_id)
+                    if item_id not in self.room_items(current_room, state):
+                        self.add_room_item(current_room, item_id, state)
                 
                 # Apply sanity effects
                 state.sanity = max(0, min(100, state.sanity + sanity_change))
@@ -8356,7 +8578,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
             
             # Check if target is in current room
-            if target_id not in current_room.items:
+            if target_id not in self.room_items(current_room, state):
                 target_display_name = self._get_object_names(target_id)
                 return ActionResult(
                     success=False,
@@ -8380,7 +8602,7 @@ class GameEngine:
             state.remove_from_inventory(object_id)
             
             # Add to current room (object lands here)
-            current_room.items.append(object_id)
+            self.add_room_item(current_room, object_id, state)
             
             notifications = []
             sanity_change = 0
@@ -8404,13 +8626,13 @@ class GameEngine:
                 if new_health <= 0:
                     target.state['is_alive'] = False
                     target.state['is_dead'] = True
-                    current_room.items.remove(target_id)
+                    self.remove_room_item(current_room, target_id, state)
                     
                     # Check if creature drops items
                     drops_items = target.state.get('drops_items', [])
                     for item_id in drops_items:
-                        if item_id not in current_room.items:
-                            current_room.items.append(item_id)
+                        if item_id not in self.room_items(current_room, state):
+                            self.add_room_item(current_room, item_id, state)
                     
                     throw_message = f"You hurl the {object_name} at the {creature_name}!\n\n"
                     throw_message += f"The {creature_name} is struck down and collapses!"
@@ -8502,7 +8724,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
             
             # Check if NPC is in current room
-            if npc_id not in current_room.items:
+            if npc_id not in self.room_items(current_room, state):
                 display_name = self._get_object_names(npc_id)
                 return ActionResult(
                     success=False,
@@ -8567,7 +8789,7 @@ class GameEngine:
                 
                 if 'npc_leaves' in reaction and reaction['npc_leaves']:
                     # NPC leaves the room
-                    current_room.items.remove(npc_id)
+                    self.remove_room_item(current_room, npc_id, state)
                     notifications.append(f"The {npc_name} departs, satisfied.")
             else:
                 # Default reaction
@@ -8631,7 +8853,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
             
             # Check if NPC is in current room
-            if npc_id not in current_room.items:
+            if npc_id not in self.room_items(current_room, state):
                 display_name = self._get_object_names(npc_id)
                 return ActionResult(
                     success=False,
@@ -8737,7 +8959,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
             
             # Check if creature is in current room
-            if creature_id not in current_room.items:
+            if creature_id not in self.room_items(current_room, state):
                 display_name = self._get_object_names(creature_id)
                 return ActionResult(
                     success=False,
@@ -8851,7 +9073,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
             
             # Check if NPC is in current room
-            if npc_id not in current_room.items:
+            if npc_id not in self.room_items(current_room, state):
                 display_name = self._get_object_names(npc_id)
                 return ActionResult(
                     success=False,
@@ -8919,9 +9141,10 @@ class GameEngine:
         """
         Handle saving the current game state.
         
-        Serializes current game state to JSON and stores in DynamoDB with
-        unique save ID. Includes timestamp and session info. Returns success
-        message with save ID.
+        Snapshots the game state into a new slot of self.save_slots,
+        queued on state.pending_saves for the handler to write once the
+        session is saved, and records its ID in the last_save_id flag.
+        Returns success message with save ID.
         
         Args:
             state: Current game state
@@ -8932,20 +9155,13 @@ class GameEngine:
         Requirements: 7.1
         """
         try:
-            # Generate a unique save ID
-            import uuid
-            save_id = str(uuid.uuid4())[:8]  # Use first 8 chars for readability
-            
-            # Create a save key in the flags
-            save_key = f"save_{save_id}"
-            
-            # Store the save ID in the state flags for reference
-            state.set_flag(save_key, True)
+            # The save ID is a hash of the saved content, so a journaled
+            # SAVE replays to the same ID
+            pending = self.save_slots.prepare(state)
+            save_id = pending.save_id
+            state.pending_saves.append(pending)
             state.set_flag('last_save_id', save_id)
             
-            # The actual saving to DynamoDB happens in the Lambda handler
-            # This method just marks the state as ready to save
-            
             return ActionResult(
                 success=True,
                 message=f"Game saved successfully. Your save ID is: {save_id}\n\nYou can restore this game later using the RESTORE command.",
@@ -8968,9 +9184,10 @@ class GameEngine:
         """
         Handle restoring a previously saved game state.
         
-        Loads game state from DynamoDB by save ID, deserializes JSON to
-        GameState object, validates save data integrity, and returns success
-        message.
+        Loads the snapshot saved under save ID from self.save_slots and
+        replaces the live game state with it, keeping the session's own
+        ID, timestamps and version. The last_save_id flag names the
+        restored save.
         
         Args:
             save_id: The save ID to restore
@@ -8982,18 +9199,12 @@ class GameEngine:
         Requirements: 7.2
         """
         try:
-            # Check if save ID exists in flags
-            save_key = f"save_{save_id}"
-            save_exists = state.get_flag(save_key, False)
-            
-            if not save_exists:
+            if not self.save_slots.restore(state, save_id):
                 return ActionResult(
                     success=False,
                     message=f"Save ID '{save_id}' not found. Please check the ID and try again."
                 )
-            
-            # The actual restoration from DynamoDB happens in the Lambda handler
-            # This method just validates the save ID
+            state.set_flag('last_save_id', save_id)
             
             return ActionResult(
                 success=True,
@@ -9006,12 +9217,51 @@ class GameEngine:
                 }
             )
             
+        except SaveUnavailableError:
+            return ActionResult(
+                success=False,
+                message=f"Save ID '{save_id}' is no longer available; it may have expired."
+            )
         except Exception as e:
             return ActionResult(
                 success=False,
                 message=f"Failed to restore game: {str(e)}"
             )
     
+    def handle_list_saves(
+        self,
+        state: GameState
+    ) -> ActionResult:
+        """
+        Handle RESTORE without a save ID by listing the player's saves.
+        
+        Reads only the slots' metadata, not the snapshots, and lists saves
+        made this turn that are not written yet first.
+        
+        Args:
+            state: Current game state
+            
+        Returns:
+            ActionResult listing save IDs, newest first
+        """
+        pending = [save.metadata for save in reversed(state.pending_saves)]
+        pending_ids = {save['save_id'] for save in pending}
+        saves = pending + [
+            save for save in self.save_slots.list_saves(state.session_id) if save['save_id'] not in pending_ids
+        ]
+        if not saves:
+            return ActionResult(
+                success=False,
+                message="Please specify a save ID to restore. Example: RESTORE abc123"
+            )
+        
+        lines = ["Please specify a save ID to restore. Your saved games:"]
+        for save in saves:
+            room = self.world.rooms.get(save['current_room'])
+            room_name = room.name if room is not None else save['current_room']
+            lines.append(f"  {save['save_id']} - {room_name}, score {save['score']}, {save['moves']} moves")
+        return ActionResult(success=False, message="\n".join(lines))
+    
     def handle_restart(
         self,
         state: GameState
@@ -9066,6 +9316,9 @@ class GameEngine:
             # Clear object states (reset containers, etc.)
             state.object_states.clear()
             
+            # Restore every room to its pristine contents
+            state.room_items_overlay.clear()
+            
             # Move to starting room
             state.move_to_room(starting_room)
             
@@ -9406,7 +9659,7 @@ class GameEngine:
         # Get current room information
         try:
             current_room = self.world.get_room(state.current_room)
-            room_items = current_room.items
+            room_items = self.room_items(current_room, state)
             inventory_items = state.inventory
         except Exception:
             room_items = []
@@ -9644,15 +9897,6 @@ class GameEngine:
         """
         verb = command.verb
 
-        # Commands that require an object
-        object_required_verbs = {
-            'TAKE', 'DROP', 'EXAMINE', 'OPEN', 'CLOSE', 'READ', 'LOCK', 'UNLOCK',
-            'TURN', 'PUSH', 'PULL', 'TIE', 'UNTIE', 'FILL', 'POUR', 'BURN', 'CUT',
-            'DIG', 'INFLATE', 'DEFLATE', 'WAVE', 'RUB', 'SHAKE', 'SQUEEZE',
-            'ATTACK', 'THROW', 'GIVE', 'TELL', 'ASK', 'WAKE', 'KISS', 'BOARD',
-            'ENTER', 'CLIMB'
-        }
-
         # Commands that can accept optional object
         object_optional_verbs = {
             'LOOK', 'SEARCH', 'LISTEN', 'SMELL', 'ECHO'
@@ -9668,7 +9912,7 @@ class GameEngine:
         }
 
         # Check if verb requires an object but none provided
-        if verb in object_required_verbs and not command.object and not command.objects:
+        if verb in OBJECT_REQUIRED_VERBS and not command.object and not command.objects:
             return self._handle_missing_parameter(
                 verb.lower(),
                 f"an object to {verb.lower()}",
@@ -9759,7 +10003,7 @@ class GameEngine:
 
             # Check if object is in inventory
             if object_id not in state.inventory:
-                if object_id in current_room.items:
+                if object_id in self.room_items(current_room, state):
                     display_name = self._get_object_names(object_id)
                     return ActionResult(
                         success=False,
@@ -10015,7 +10259,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
 
             # Check if object is in inventory or current room
-            object_in_room = object_id in current_room.items
+            object_in_room = object_id in self.room_items(current_room, state)
             object_in_inventory = object_id in state.inventory
 
             if not object_in_room and not object_in_inventory:
@@ -10195,7 +10439,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
 
             # Check if object is in inventory or current room
-            object_in_room = object_id in current_room.items
+            object_in_room = object_id in self.room_items(current_room, state)
             object_in_inventory = object_id in state.inventory
 
             if not object_in_room and not object_in_inventory:
@@ -10402,7 +10646,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
 
             # Check if object is in current room or inventory
-            object_in_room = object_id in current_room.items
+            object_in_room = object_id in self.room_items(current_room, state)
             object_in_inventory = object_id in state.inventory
 
             if not object_in_room and not object_in_inventory:
@@ -10525,8 +10769,8 @@ class GameEngine:
             reveals_under = game_object.state.get('reveals_under_when_moved', [])
             if reveals_under:
                 for item_id in reveals_under:
-                    if item_id not in current_room.items:
-                        current_room.items.append(item_id)
+                    if item_id not in self.room_items(current_room, state):
+                        self.add_room_item(current_room, item_id, state)
                         try:
                             revealed_obj = self.world.get_object(item_id)
                             notifications.append(f"Moving the {game_object.name} reveals {revealed_obj.name_spooky}!")
@@ -10590,7 +10834,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
 
             # Check if object is in current room or inventory
-            object_in_room = object_id in current_room.items
+            object_in_room = object_id in self.room_items(current_room, state)
             object_in_inventory = object_id in state.inventory
 
             if not object_in_room and not object_in_inventory:
@@ -10656,8 +10900,8 @@ class GameEngine:
             reveals_when_raised = game_object.state.get('reveals_when_raised', [])
             if reveals_when_raised:
                 for item_id in reveals_when_raised:
-                    if item_id not in current_room.items:
-                        current_room.items.append(item_id)
+                    if item_id not in self.room_items(current_room, state):
+                        self.add_room_item(current_room, item_id, state)
                         try:
                             revealed_obj = self.world.get_object(item_id)
                             notifications.append(f"Raising the {game_object.name} reveals {revealed_obj.name_spooky}!")
@@ -10713,7 +10957,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
 
             # Check if object is in current room or inventory
-            object_in_room = object_id in current_room.items
+            object_in_room = object_id in self.room_items(current_room, state)
             object_in_inventory = object_id in state.inventory
 
             if not object_in_room and not object_in_inventory:
@@ -10817,7 +11061,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
 
             # Check if object is in current room or inventory
-            object_in_room = object_id in current_room.items
+            object_in_room = object_id in self.room_items(current_room, state)
             object_in_inventory = object_id in state.inventory
 
             if not object_in_room and not object_in_inventory:
@@ -10853,7 +11097,7 @@ class GameEngine:
             # Handle sliding under another object
             if target_id:
                 # Check if target exists and is in room
-                if target_id not in current_room.items:
+                if target_id not in self.room_items(current_room, state):
                     target_name = self._get_object_names(target_id)
                     return ActionResult(
                         success=False,
@@ -10891,8 +11135,8 @@ class GameEngine:
                 reveals_under_target = target_object.state.get('reveals_under', [])
                 if reveals_under_target:
                     for item_id in reveals_under_target:
-                        if item_id not in current_room.items:
-                            current_room.items.append(item_id)
+                        if item_id not in self.room_items(current_room, state):
+                            self.add_room_item(current_room, item_id, state)
                             try:
                                 revealed_obj = self.world.get_object(item_id)
                                 notifications.append(f"Sliding the {game_object.name} under the {target_object.name} reveals {revealed_obj.name_spooky}!")
@@ -10968,7 +11212,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
 
             # Check if object is in current room or inventory
-            object_in_room = object_id in current_room.items
+            object_in_room = object_id in self.room_items(current_room, state)
             object_in_inventory = object_id in state.inventory
 
             if not object_in_room and not object_in_inventory:
@@ -11031,8 +11275,8 @@ class GameEngine:
             reveals_when_sprung = game_object.state.get('reveals_when_sprung', [])
             if reveals_when_sprung:
                 for item_id in reveals_when_sprung:
-                    if item_id not in current_room.items:
-                        current_room.items.append(item_id)
+                    if item_id not in self.room_items(current_room, state):
+                        self.add_room_item(current_room, item_id, state)
                         try:
                             revealed_obj = self.world.get_object(item_id)
                             notifications.append(f"The {game_object.name} springs, revealing {revealed_obj.name_spooky}!")
@@ -11090,7 +11334,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
 
             # Check if object is in current room or inventory
-            object_in_room = object_id in current_room.items
+            object_in_room = object_id in self.room_items(current_room, state)
             object_in_inventory = object_id in state.inventory
 
             if not object_in_room and not object_in_inventory:
@@ -11153,7 +11397,7 @@ class GameEngine:
             hatched_contents = game_object.state.get('hatched_contents', [])
             if hatched_contents:
                 for item_id in hatched_contents:
-                    current_room.items.append(item_id)
+                    self.add_room_item(current_room, item_id, state)
                     try:
                         hatched_obj = self.world.get_object(item_id)
                         notifications.append(f"From the {game_object.name} emerges {hatched_obj.name_spooky}!")
@@ -11212,7 +11456,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
 
             # Check if object is in current room or inventory
-            object_in_room = object_id in current_room.items
+            object_in_room = object_id in self.room_items(current_room, state)
             object_in_inventory = object_id in state.inventory
 
             if not object_in_room and not object_in_inventory:
@@ -11250,7 +11494,7 @@ class GameEngine:
                 )
 
             # Check if target exists and is accessible
-            target_in_room = target_id in current_room.items
+            target_in_room = target_id in self.room_items(current_room, state)
             target_in_inventory = target_id in state.inventory
 
             if not target_in_room and not target_in_inventory:
@@ -11300,8 +11544,8 @@ class GameEngine:
                     reveals_when_applied = target_object.state.get('reveals_when_applied', [])
                     if reveals_when_applied:
                         for item_id in reveals_when_applied:
-                            if item_id not in current_room.items:
-                                current_room.items.append(item_id)
+                            if item_id not in self.room_items(current_room, state):
+                                self.add_room_item(current_room, item_id, state)
                                 try:
                                     revealed_obj = self.world.get_object(item_id)
                                     notifications.append(f"The application reveals {revealed_obj.name_spooky}!")
@@ -11353,7 +11597,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
 
             # Check if object is in current room or inventory
-            object_in_room = object_id in current_room.items
+            object_in_room = object_id in self.room_items(current_room, state)
             object_in_inventory = object_id in state.inventory
 
             if not object_in_room and not object_in_inventory:
@@ -11419,8 +11663,8 @@ class GameEngine:
             reveals_when_brushed = game_object.state.get('reveals_when_brushed', [])
             if reveals_when_brushed:
                 for item_id in reveals_when_brushed:
-                    if item_id not in current_room.items:
-                        current_room.items.append(item_id)
+                    if item_id not in self.room_items(current_room, state):
+                        self.add_room_item(current_room, item_id, state)
                         try:
                             revealed_obj = self.world.get_object(item_id)
                             notifications.append(f"Brushing the {game_object.name} reveals {revealed_obj.name_spooky}!")
@@ -11506,7 +11750,7 @@ class GameEngine:
             notifications = []
 
             # Check for NPCs in room that might respond
-            for item_id in current_room.items:
+            for item_id in self.room_items(current_room, state):
                 game_object = self.world.get_object(item_id)
                 is_npc = game_object.state.get('is_npc', False)
                 is_creature = game_object.state.get('is_creature', False)
@@ -11546,8 +11790,8 @@ class GameEngine:
                             notifications.append(f"Something in the room responds to your words!")
                         elif trigger['action'] == 'reveal':
                             for item_id in trigger['reveals']:
-                                if item_id not in current_room.items:
-                                    current_room.items.append(item_id)
+                                if item_id not in self.room_items(current_room, state):
+                                    self.add_room_item(current_room, item_id, state)
                                     try:
                                         revealed_obj = self.world.get_object(item_id)
                                         notifications.append(f"Your words reveal {revealed_obj.name_spooky}!")
@@ -11622,7 +11866,7 @@ class GameEngine:
             notifications = []
 
             # Check for NPCs that might hear whispers
-            for item_id in current_room.items:
+            for item_id in self.room_items(current_room, state):
                 game_object = self.world.get_object(item_id)
                 is_npc = game_object.state.get('is_npc', False)
 
@@ -11748,8 +11992,8 @@ class GameEngine:
                 if reward:
                     if reward.get('item'):
                         item_id = reward['item']
-                        if item_id not in current_room.items:
-                            current_room.items.append(item_id)
+                        if item_id not in self.room_items(current_room, state):
+                            self.add_room_item(current_room, item_id, state)
                             try:
                                 reward_obj = self.world.get_object(item_id)
                                 notifications.append(f"As a reward, you receive {reward_obj.name_spooky}!")
@@ -11889,7 +12133,7 @@ class GameEngine:
 
             # Verify target exists if required
             if requires_target and target_id:
-                target_in_room = target_id in current_room.items
+                target_in_room = target_id in self.room_items(current_room, state)
                 target_in_inventory = target_id in state.inventory
 
                 if not target_in_room and not target_in_inventory:
@@ -11901,7 +12145,7 @@ class GameEngine:
 
             # Verify instrument exists if required
             if requires_instrument and instrument_id:
-                instrument_in_room = instrument_id in current_room.items
+                instrument_in_room = instrument_id in self.room_items(current_room, state)
                 instrument_in_inventory = instrument_id in state.inventory
 
                 if not instrument_in_room and not instrument_in_inventory:
@@ -11942,8 +12186,8 @@ class GameEngine:
                     notifications.append(f"The spell reveals hidden truths!")
                     reveals = spell_data.get('reveals', [])
                     for item_id in reveals:
-                        if item_id not in current_room.items:
-                            current_room.items.append(item_id)
+                        if item_id not in self.room_items(current_room, state):
+                            self.add_room_item(current_room, item_id, state)
                             try:
                                 revealed_obj = self.world.get_object(item_id)
                                 notifications.append(f"You see {revealed_obj.name_spooky}!")
@@ -12013,7 +12257,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
 
             # Check if object is in current room or inventory
-            object_in_room = object_id in current_room.items
+            object_in_room = object_id in self.room_items(current_room, state)
             object_in_inventory = object_id in state.inventory
 
             if not object_in_room and not object_in_inventory:
@@ -12130,7 +12374,7 @@ class GameEngine:
             current_room = self.world.get_room(state.current_room)
 
             # Check if object is in current room or inventory
-            object_in_room = object_id in current_room.items
+            object_in_room = object_id in self.room_items(current_room, state)
             object_in_inventory = object_id in state.inventory
 
             if not object_in_room and not object_in_inventory:
@@ -12240,7 +12484,7 @@ class GameEngine:
                 return self._exorcise_room(state)
 
             # Check if target is in current room or inventory
-            object_in_room = object_id in current_room.items
+            object_in_room = object_id in self.room_items(current_room, state)
             object_in_inventory = object_id in state.inventory
 
             if not object_in_room and not object_in_inventory:
@@ -12607,8 +12851,8 @@ class GameEngine:
                 current_room = self.world.get_room(state.current_room)
 
                 # Suggest visible objects
-                if current_room.items and verb_lower in ['take', 'examine', 'open']:
-                    visible_items = current_room.items[:3]  # Limit to 3
+                if self.room_items(current_room, state) and verb_lower in ['take', 'examine', 'open']:
+                    visible_items = self.room_items(current_room, state)[:3]  # Limit to 3
                     visible_names = [self._get_object_names(item_id) for item_id in visible_items]
                     message += f"\n\nYou can see: {', '.join(visible_names)}"
 
@@ -12711,6 +12955,19 @@ class GameEngine:
             message=prompt
         )
     
+    def command_spec(self, verb: str) -> CommandSpec:
+        """
+        Get the dispatch metadata for a verb.
+        
+        Args:
+            verb: The command verb
+            
+        Returns:
+            The registered CommandSpec, or the catch-all spec for verbs
+            that are recognized by the parser but have no handler
+        """
+        return COMMAND_REGISTRY.get(verb, UNREGISTERED_COMMAND)
+    
     def execute_command(
         self,
         command: ParsedCommand,
@@ -12719,7 +12976,11 @@ class GameEngine:
         """
         Execute a parsed command and update game state.
         
-        Routes commands to appropriate handlers based on verb type.
+        Looks the verb up in COMMAND_REGISTRY and runs only the pre-dispatch
+        steps its metadata calls for: object expansion, disambiguation,
+        resolution and prerequisites for verbs that use an object, syntax
+        validation for verbs with usage rules, and target resolution for
+        verbs that use a target.
         
         Args:
             command: Parsed command from CommandParser
@@ -12728,572 +12989,527 @@ class GameEngine:
         Returns:
             ActionResult with outcome of command execution
         """
-        # Handle multi-object commands
-        if command.objects and len(command.objects) > 1:
-            return self.handle_multi_object_command(
-                command.verb,
-                command.objects,
-                state,
-                command.target
-            )
+        spec = self.command_spec(command.verb)
         
-        # Expand 'all' or 'everything' specifiers
-        if command.object and command.object.lower() in ['all', 'everything']:
-            objects = self.expand_multi_object(command.object, state)
-            if len(objects) > 1:
+        if spec.uses_object:
+            # Handle multi-object commands
+            if command.objects and len(command.objects) > 1:
                 return self.handle_multi_object_command(
                     command.verb,
-                    objects,
+                    command.objects,
                     state,
                     command.target
                 )
-            elif len(objects) == 1:
-                command.object = objects[0]
-            else:
-                return ActionResult(
-                    success=False,
-                    message="There's nothing here to do that with."
-                )
-        
-        # Check for disambiguation needs
-        disambiguation_result = self.check_disambiguation(command, state)
-        if disambiguation_result:
-            return disambiguation_result
+            
+            # Expand 'all' or 'everything' specifiers
+            if command.object and command.object.lower() in ['all', 'everything']:
+                objects = self.expand_multi_object(command.object, state)
+                if len(objects) > 1:
+                    return self.handle_multi_object_command(
+                        command.verb,
+                        objects,
+                        state,
+                        command.target
+                    )
+                elif len(objects) == 1:
+                    command.object = objects[0]
+                else:
+                    return ActionResult(
+                        success=False,
+                        message="There's nothing here to do that with."
+                    )
+            
+            # Check for disambiguation needs
+            disambiguation_result = self.check_disambiguation(command, state)
+            if disambiguation_result:
+                return disambiguation_result
         
         # Validate command syntax and provide usage guidance
-        syntax_validation = self._validate_command_syntax(command, state)
-        if syntax_validation:
-            return syntax_validation
-
+        if spec.checks_syntax:
+            syntax_validation = self._validate_command_syntax(command, state)
+            if syntax_validation:
+                return syntax_validation
+        
         # Validate objects exist and provide enhanced missing object messages
-        if command.object and self._should_validate_object(command.verb):
+        if spec.uses_object and command.object and self._should_validate_object(command.verb):
             resolved_object = self.resolve_object_name(command.object, state)
             if not resolved_object:
                 return self._handle_missing_object(command.object, state, command.verb)
             # Update command object with resolved ID
             command.object = resolved_object
-
+        
         # Resolve target if present
-        if command.target and command.verb not in ["SAY", "YELL", "ECHO"]:
+        if spec.uses_target and command.target:
             resolved_target = self.resolve_object_name(command.target, state)
             if resolved_target:
                 command.target = resolved_target
-
-
-        # Check prerequisites
-        prerequisite_result = self.check_prerequisites(command.verb, command.object, state)
-        if prerequisite_result:
-            return prerequisite_result
-        
-        # Handle climb commands
-        if command.verb == "CLIMB" and command.direction:
-            return self.handle_climb(command.direction, command.object, state)
-        
-        # Handle enter commands
-        if command.verb == "ENTER":
-            return self.handle_enter(command.object, state)
-        
-        # Handle exit commands
-        if command.verb == "EXIT":
-            return self.handle_exit(command.object, state)
-        
-        # Handle board commands
-        if command.verb == "BOARD" and command.object:
-            return self.handle_board(command.object, state)
-        
-        # Handle disembark commands (also GET OUT)
-        if command.verb in ["DISEMBARK", "GET_OUT"]:
-            return self.handle_disembark(command.object, state)
-
-        # Handle BACK command (go back the way we came)
-        if command.verb == "BACK":
-            return self.handle_back(state)
-
-        # Handle STAND command (stand up from sitting/lying)
-        if command.verb == "STAND":
-            return self.handle_stand(command.object, state)
-
-        # Handle FOLLOW command (follow creature/character)
-        if command.verb == "FOLLOW":
-            return self.handle_follow(command.object, state)
-
-        # Handle SWIM command
-        if command.verb == "SWIM":
-            return self.handle_swim(state)
-
-        # Handle WAIT command (wait and observe)
-        if command.verb == "WAIT":
-            return self.handle_wait(state)
-
-        # Handle LOOK command (look around current room)
-        if command.verb == "LOOK" and not command.object:
-            return self.handle_look(state)
-
-        # Handle INVENTORY command
-        if command.verb in ["INVENTORY", "I"]:
-            return self.handle_inventory(state)
-
-        # Handle movement commands
-        if command.verb == "GO" and command.direction:
-            return self.handle_movement(command.direction, state)
-        
-        # Handle examine commands
-        if command.verb == "EXAMINE" and command.object:
-            # Check if examining a container
-            try:
-                obj = self.world.get_object(command.object)
-                if obj.type == "container":
-                    return self.handle_examine_container(command.object, state)
-            except ValueError:
-                pass
-            return self.handle_examine(command.object, state)
-        
-        # Handle take commands
-        if command.verb == "TAKE" and command.object:
-            # Check if taking from a container (format: "take object from container")
-            if command.preposition == "FROM" and command.target:
-                return self.handle_take_from_container(command.object, command.target, state)
-            return self.handle_take(command.object, state)
-        
-        # Handle drop commands
-        if command.verb == "DROP" and command.object:
-            return self.handle_drop(command.object, state)
-        
-        # Handle put commands (format: "put object in container")
-        if command.verb == "PUT" and command.object and command.target:
-            # Check if target is trophy case for treasure scoring
-            if command.target == "trophy_case":
-                return self.handle_place_treasure(command.object, command.target, state)
-            return self.handle_put(command.object, command.target, state)
-        
-        # Handle lock commands (format: "lock object with key")
-        if command.verb == "LOCK" and command.object:
-            if not command.target:
-                display_name = self._get_object_names(command.object)
-                return ActionResult(
-                    success=False,
-                    message=f"What do you want to lock the {display_name} with?"
-                )
-            return self.handle_lock(command.object, command.target, state)
-        
-        # Handle unlock commands (format: "unlock object with key")
-        if command.verb == "UNLOCK" and command.object:
-            if not command.target:
-                display_name = self._get_object_names(command.object)
-                return ActionResult(
-                    success=False,
-                    message=f"What do you want to unlock the {display_name} with?"
-                )
-            return self.handle_unlock(command.object, command.target, state)
-        
-        # Handle turn commands
-        if command.verb == "TURN" and command.object:
-            return self.handle_turn(command.object, state)
-        
-        # Handle push commands
-        if command.verb == "PUSH" and command.object:
-            return self.handle_push(command.object, state)
-        
-        # Handle pull commands
-        if command.verb == "PULL" and command.object:
-            return self.handle_pull(command.object, state)
-        
-        # Handle tie commands (format: "tie object to target")
-        if command.verb == "TIE" and command.object:
-            if not command.target:
-                display_name = self._get_object_names(command.object)
-                return ActionResult(
-                    success=False,
-                    message=f"What do you want to tie the {display_name} to?"
-                )
-            return self.handle_tie(command.object, command.target, state)
-        
-        # Handle untie commands
-        if command.verb == "UNTIE" and command.object:
-            return self.handle_untie(command.object, state)
-        
-        # Handle fill commands (format: "fill object from source")
-        if command.verb == "FILL" and command.object:
-            if not command.target:
-                display_name = self._get_object_names(command.object)
-                return ActionResult(
-                    success=False,
-                    message=f"What do you want to fill the {display_name} from?"
-                )
-            return self.handle_fill(command.object, command.target, state)
-        
-        # Handle pour commands (format: "pour object" or "pour object into target")
-        if command.verb == "POUR" and command.object:
-            # Target is optional for pour (can pour onto ground)
-            return self.handle_pour(command.object, command.target, state)
-        
-        # Handle read commands
-        if command.verb == "READ" and command.object:
-            return self.handle_read(command.object, state)
-
-        # Handle destroy commands (format: "destroy object", "break object", "smash object")
-        if command.verb == "DESTROY" and command.object:
-            return self.handle_destroy(command.object, state)
-
-        # Handle eat commands (format: "eat object", "consume object", "devour object")
-        if command.verb == "EAT" and command.object:
-            return self.handle_eat(command.object, state)
-
-        # Handle drink commands (format: "drink object", "quaff object", "swallow object")
-        if command.verb == "DRINK" and command.object:
-            return self.handle_drink(command.object, state)
-
-        # Handle wear commands (format: "wear object", "put on object", "don object")
-        if command.verb == "WEAR" and command.object:
-            return self.handle_wear(command.object, state)
-
-        # Handle remove commands (format: "remove object", "take off object", "doff object")
-        if command.verb == "REMOVE" and command.object:
-            return self.handle_remove(command.object, state)
-
-        # Handle move commands (object repositioning, separate from player movement)
-        if command.verb == "MOVE" and command.object:
-            return self.handle_move(command.object, state)
-
-        # Handle raise/lower commands
-        if command.verb == "RAISE" and command.object:
-            return self.handle_raise(command.object, state)
-
-        if command.verb == "LOWER" and command.object:
-            return self.handle_lower(command.object, state)
-
-        # Handle slide commands
-        if command.verb == "SLIDE" and command.object:
-            return self.handle_slide(command.object, command.target, state)
-
-        # Handle special object manipulation commands
-        if command.verb == "SPRING" and command.object:
-            return self.handle_spring(command.object, state)
-
-        if command.verb == "HATCH" and command.object:
-            return self.handle_hatch(command.object, state)
-
-        if command.verb == "APPLY" and command.object:
-            return self.handle_apply(command.object, command.target, state)
-
-        if command.verb == "BRUSH" and command.object:
-            return self.handle_brush(command.object, state)
-
-        # Handle object interaction commands (OPEN, CLOSE)
-        if command.verb in ["OPEN", "CLOSE"] and command.object:
-            return self.handle_object_interaction(command.verb, command.object, state)
-        
-        # Handle lamp commands (LIGHT, TURN ON)
-        if command.verb in ["LIGHT", "TURN_ON"] and command.object == "lamp":
-            return self.handle_lamp_on(state)
-        
-        # Handle lamp off commands (EXTINGUISH, TURN OFF)
-        if command.verb in ["EXTINGUISH", "TURN_OFF"] and command.object == "lamp":
-            return self.handle_lamp_off(state)
-        
-        # Handle look under commands
-        if command.verb == "LOOK_UNDER" and command.object:
-            return self.handle_look_under(command.object, state)
-        
-        # Handle look behind commands
-        if command.verb == "LOOK_BEHIND" and command.object:
-            return self.handle_look_behind(command.object, state)
-        
-        # Handle look inside commands
-        if command.verb == "LOOK_INSIDE" and command.object:
-            return self.handle_look_inside(command.object, state)
-        
-        # Handle search commands
-        if command.verb == "SEARCH" and command.object:
-            return self.handle_search(command.object, state)
-        
-        # Handle listen commands (can listen to object or room)
-        if command.verb == "LISTEN":
-            return self.handle_listen(command.object, state)
-        
-        # Handle smell commands (can smell object or room)
-        if command.verb == "SMELL":
-            return self.handle_smell(command.object, state)
-        
-        # Handle burn commands (format: "burn object" or "burn object with fire_source")
-        if command.verb == "BURN" and command.object:
-            # Target is the fire source (if specified with WITH preposition)
-            return self.handle_burn(command.object, command.target, state)
-        
-        # Handle cut commands (format: "cut object" or "cut object with tool")
-        if command.verb == "CUT" and command.object:
-            return self.handle_cut(command.object, command.target, state)
-        
-        # Handle dig commands (format: "dig" or "dig object" or "dig with tool")
-        if command.verb == "DIG":
-            return self.handle_dig(command.object, command.target, state)
-        
-        # Handle inflate commands
-        if command.verb == "INFLATE" and command.object:
-            return self.handle_inflate(command.object, state)
         
-        # Handle deflate commands
-        if command.verb == "DEFLATE" and command.object:
-            return self.handle_deflate(command.object, state)
-
-        # Handle launch commands
-        if command.verb == "LAUNCH":
-             return self.handle_launch(state)
-
-        # Handle fix commands
-        if command.verb == "FIX" and command.object:
-             return self.handle_fix(command.object, state)
-        
-        # Handle wave commands
-        if command.verb == "WAVE" and command.object:
-            return self.handle_wave(command.object, state)
-        
-        # Handle rub commands
-        if command.verb == "RUB" and command.object:
-            return self.handle_rub(command.object, state)
-        
-        # Handle shake commands
-        if command.verb == "SHAKE" and command.object:
-            return self.handle_shake(command.object, state)
-        
-        # Handle squeeze commands
-        if command.verb == "SQUEEZE" and command.object:
-            return self.handle_squeeze(command.object, state)
-        
-        # Handle attack commands (format: "attack creature" or "attack creature with weapon")
-        if command.verb in ["ATTACK", "KILL"] and command.object:
-            # Target is the weapon (if specified with WITH preposition)
-            return self.handle_attack(command.object, command.target, state)
+        # Check prerequisites
+        if spec.uses_object and command.object:
+            prerequisite_result = self.check_prerequisites(command.verb, command.object, state)
+            if prerequisite_result:
+                return prerequisite_result
         
-        # Handle throw commands (format: "throw object at target")
-        if command.verb == "THROW" and command.object:
-            if not command.target:
-                display_name = self._get_object_names(command.object)
-                return ActionResult(
-                    success=False,
-                    message=f"What do you want to throw the {display_name} at?"
-                )
-            return self.handle_throw(command.object, command.target, state)
+        if not spec.accepts(command):
+            return self._handle_unimplemented_command(command, state)
         
-        # Handle give commands (format: "give object to npc")
-        if command.verb == "GIVE" and command.object:
-            if not command.target:
+        if spec.needs_target and not command.target:
+            if spec.target_prompt:
                 display_name = self._get_object_names(command.object)
                 return ActionResult(
                     success=False,
-                    message=f"Who do you want to give the {display_name} to?"
+                    message=spec.target_prompt.format(display_name)
                 )
-            return self.handle_give(command.object, command.target, state)
+            return self._handle_unimplemented_command(command, state)
         
-        # Handle tell/ask commands (format: "tell npc about topic" or "ask npc about topic")
-        if command.verb in ["TELL", "ASK"] and command.object:
-            # Target is the topic (optional)
-            return self.handle_tell(command.object, command.target, state)
-
-        # Handle communication commands
-        if command.verb == "SAY":
-            return self.handle_say(command.object, state)
-
-        if command.verb == "WHISPER":
-            return self.handle_whisper(command.object, state)
-
-        if command.verb == "ANSWER":
-            return self.handle_answer(command.object, state)
-
-        # Handle wake commands
-        if command.verb == "WAKE" and command.object:
-            return self.handle_wake(command.object, state)
-
-        # Handle kiss commands
-        if command.verb == "KISS" and command.object:
-            return self.handle_kiss(command.object, state)
-
-        # Handle magic system commands
-        if command.verb == "CAST" and command.object:
-            return self.handle_cast(command.object, command.target, command.instrument, state)
-
-        if command.verb == "INCANT":
-            return self.handle_cast(command.object, command.target, command.instrument, state)
-
-        if command.verb == "CHANT" or command.verb == "INCANT":
-            return self.handle_cast(command.object, command.target, command.instrument, state)
-
-        # Handle enchant/disenchant commands
-        if command.verb == "ENCHANT" and command.object:
-            return self.handle_enchant(command.object, state)
-
-        if command.verb == "DISENCHANT":
-            return self.handle_disenchant(command.object, state)
-
-        # Handle exorcise commands
-        if command.verb == "EXORCISE" and command.object:
-            return self.handle_exorcise(command.object, command.target, state)
-
-        if command.verb in ["EXORCISE OUT", "EXORCISE AWAY"] and command.object:
-            return self.handle_exorcise(command.object, command.verb, state)
-
-        # Handle special and easter egg commands
-        if command.verb == "FROBOZZ":
-            return self.handle_frobozz(state)
-
-        if command.verb == "ZORK":
-            return self.handle_zork(state)
-
-        if command.verb == "BLAST":
-            return self.handle_blast(command.object, state)
-
-        if command.verb == "WISH":
-            return self.handle_wish(command.object, state)
-
-        if command.verb == "WIN":
-            return self.handle_win(state)
-        
-        # Handle easter egg commands
-        if command.verb == "XYZZY":
-            return self.handle_xyzzy(state)
-        
-        if command.verb == "PLUGH":
-            return self.handle_plugh(state)
-        
-        if command.verb == "HELLO":
-            return self.handle_hello(state)
-        
-        if command.verb == "PRAY":
-            return self.handle_pray(state)
-        
-        if command.verb == "JUMP":
-            return self.handle_jump(state)
-        
-        if command.verb == "YELL":
-            return self.handle_yell(state)
-        
-        if command.verb == "ECHO":
-            return self.handle_echo(command.object, state)
-        
-        # Handle profanity/curse words
-        if command.verb == "CURSE":
-            return self.handle_curse(state)
-
-        # Handle utility and information commands
-        if command.verb in ["FIND", "SEARCH FOR"] and command.object:
-            return self.handle_find(command.object, state)
-
-        if command.verb == "COUNT":
-            return self.handle_count(command.object, state)
-
-        if command.verb == "VERSION":
-            return self.handle_version(state)
-
-        if command.verb == "DIAGNOSE":
-            return self.handle_diagnose(state)
-
-        if command.verb == "SCRIPT":
-            return self.handle_script(state)
-
-        if command.verb == "UNSCRIPT":
-            return self.handle_unscript(state)
-
-        # Handle remaining utility and special commands
-        if command.verb == "TREASURE":
-            return self.handle_treasure(state)
-
-        if command.verb == "BUG":
-            return self.handle_bug(command.object, state)
-
-        if command.verb == "RING" and command.object:
-            return self.handle_ring(command.object, state)
-
-        if command.verb == "CROSS":
-            return self.handle_cross(command.object, state)
-
-        if command.verb == "BREATHE":
-            return self.handle_breathe(state)
-
-        if command.verb == "ACTIVATE" and command.object:
-            return self.handle_activate(command.object, state)
-
-        # Handle final utility commands
-        if command.verb == "COMMAND":
-            return self.handle_command(command.object, state)
-
-        if command.verb == "CHOMP" and command.object:
-            return self.handle_chomp(command.object, state)
-
-        if command.verb == "CHOMP":
-            return self.handle_chomp(None, state)
-
-        if command.verb == "REPENT":
-            return self.handle_repent(state)
-
-        if command.verb == "SKIP":
-            return self.handle_skip(state)
-
-        if command.verb == "SPAY":
-            return self.handle_spay(state)
-
-        if command.verb == "SPIN":
-            return self.handle_spin(state)
-
-        # Handle atmospheric and action commands
-        if command.verb == "SPRAY" and command.object:
-            return self.handle_spray(command.object, command.target, state)
-
-        if command.verb == "STAY":
-            return self.handle_stay(state)
-
-        if command.verb == "WIND" and command.object:
-            return self.handle_wind(command.object, state)
-
-        if command.verb == "windup" and command.object:
-            return self.handle_wind(command.object, state)
-
-        if command.verb == "BLOW OUT" and command.object:
-            return self.handle_blow_out(command.object, state)
-
-        if command.verb == "BLOW UP" and command.object:
-            return self.handle_blow_up(command.object, state)
-
-        # Handle SEND FOR command
-        if command.verb == "SEND FOR" and command.object:
-            return self.handle_send_for(command.object, state)
-
-        # Handle save command
-        if command.verb == "SAVE":
-            return self.handle_save(state)
-        
-        # Handle restore command (format: "restore save_id")
-        if command.verb == "RESTORE":
-            if not command.object:
-                return ActionResult(
-                    success=False,
-                    message="Please specify a save ID to restore. Example: RESTORE abc123"
-                )
-            return self.handle_restore(command.object, state)
-        
-        # Handle restart command
-        if command.verb == "RESTART":
-            return self.handle_restart(state)
-        
-        # Handle score command
-        if command.verb == "SCORE":
-            return self.handle_score(state)
-        
-        # Handle verbose command
-        if command.verb == "VERBOSE":
-            return self.handle_verbose(state)
-        
-        # Handle brief command
-        if command.verb == "BRIEF":
-            return self.handle_brief(state)
-        
-        # Handle superbrief command
-        if command.verb == "SUPERBRIEF":
-            return self.handle_superbrief(state)
-        
-        # Handle unknown commands
-        if command.verb == "UNKNOWN":
-            return self._handle_unknown_command(command, state)
-        
-        # Placeholder for other command types (to be implemented in future tasks)
-        return self._handle_unimplemented_command(command, state)
-
+        outer_spec, self._spec = self._spec, spec
+        try:
+            return spec.handler(self, command, state)
+        finally:
+            self._spec = outer_spec
+            # Handlers can change world object state directly, which the
+            # scope cannot detect, so the next command starts fresh
+            self.invalidate_object_scope()
+    
+    def _dispatch_examine(self, command: ParsedCommand, state: GameState) -> ActionResult:
+        """Route EXAMINE to the container view for containers."""
+        try:
+            obj = self.world.get_object(command.object)
+            if obj.type == "container":
+                return self.handle_examine_container(command.object, state)
+        except ValueError:
+            pass
+        return self.handle_examine(command.object, state)
+    
+    def _dispatch_take(self, command: ParsedCommand, state: GameState) -> ActionResult:
+        """Route TAKE, including "take object from container"."""
+        if command.preposition == "FROM" and command.target:
+            return self.handle_take_from_container(command.object, command.target, state)
+        return self.handle_take(command.object, state)
+    
+    def _dispatch_put(self, command: ParsedCommand, state: GameState) -> ActionResult:
+        """Route PUT, scoring treasures placed in the trophy case."""
+        if command.target == "trophy_case":
+            return self.handle_place_treasure(command.object, command.target, state)
+        return self.handle_put(command.object, command.target, state)
+    
+    def _dispatch_restore(self, command: ParsedCommand, state: GameState) -> ActionResult:
+        """Route RESTORE, which needs a save ID; without one, list the saves."""
+        if not command.object:
+            return self.handle_list_saves(state)
+        return self.handle_restore(command.object, state)
+
+
+# Verbs with usage rules in GameEngine._validate_command_syntax
+SYNTAX_CHECKED_VERBS = OBJECT_REQUIRED_VERBS | {'GO', 'LOOK'}
+
+
+def _has_direction(command: ParsedCommand) -> bool:
+    return bool(command.direction)
+
+
+def _is_lamp(command: ParsedCommand) -> bool:
+    return command.object == "lamp"
+
+
+# Dispatch table: (verbs, spec). Order mirrors the original if-chain.
+_COMMAND_TABLE = [
+    # Movement and position
+    (("CLIMB",), CommandSpec(
+        lambda self, c, s: self.handle_climb(c.direction, c.object, s),
+        takes_object=True, when=_has_direction, takes_turn=True)),
+    (("ENTER",), CommandSpec(
+        lambda self, c, s: self.handle_enter(c.object, s),
+        takes_object=True, takes_turn=True)),
+    (("EXIT",), CommandSpec(
+        lambda self, c, s: self.handle_exit(c.object, s),
+        takes_object=True, takes_turn=True)),
+    (("BOARD",), CommandSpec(
+        lambda self, c, s: self.handle_board(c.object, s),
+        needs_object=True)),
+    (("DISEMBARK", "GET_OUT"), CommandSpec(
+        lambda self, c, s: self.handle_disembark(c.object, s),
+        takes_object=True)),
+    (("BACK",), CommandSpec(
+        lambda self, c, s: self.handle_back(s),
+        takes_turn=True)),
+    (("STAND",), CommandSpec(
+        lambda self, c, s: self.handle_stand(c.object, s),
+        takes_object=True, takes_turn=True)),
+    (("FOLLOW",), CommandSpec(
+        lambda self, c, s: self.handle_follow(c.object, s),
+        takes_object=True, takes_turn=True)),
+    (("SWIM",), CommandSpec(
+        lambda self, c, s: self.handle_swim(s),
+        takes_turn=True)),
+    (("WAIT",), CommandSpec(
+        lambda self, c, s: self.handle_wait(s),
+        takes_turn=True)),
+    (("LOOK",), CommandSpec(
+        lambda self, c, s: self.handle_look(s),
+        when=lambda c: not c.object, mutates_state=False)),
+    (("INVENTORY", "I"), CommandSpec(
+        lambda self, c, s: self.handle_inventory(s),
+        mutates_state=False)),
+    (("GO",), CommandSpec(
+        lambda self, c, s: self.handle_movement(c.direction, s),
+        when=_has_direction, takes_turn=True)),
+
+    # Object manipulation
+    (("EXAMINE",), CommandSpec(
+        lambda self, c, s: self._dispatch_examine(c, s),
+        needs_object=True)),
+    (("TAKE",), CommandSpec(
+        lambda self, c, s: self._dispatch_take(c, s),
+        needs_object=True, takes_target=True)),
+    (("DROP",), CommandSpec(
+        lambda self, c, s: self.handle_drop(c.object, s),
+        needs_object=True)),
+    (("PUT",), CommandSpec(
+        lambda self, c, s: self._dispatch_put(c, s),
+        needs_object=True, needs_target=True)),
+    (("LOCK",), CommandSpec(
+        lambda self, c, s: self.handle_lock(c.object, c.target, s),
+        needs_object=True, needs_target=True,
+        target_prompt="What do you want to lock the {} with?")),
+    (("UNLOCK",), CommandSpec(
+        lambda self, c, s: self.handle_unlock(c.object, c.target, s),
+        needs_object=True, needs_target=True,
+        target_prompt="What do you want to unlock the {} with?")),
+    (("TURN",), CommandSpec(
+        lambda self, c, s: self.handle_turn(c.object, s),
+        needs_object=True)),
+    (("PUSH",), CommandSpec(
+        lambda self, c, s: self.handle_push(c.object, s),
+        needs_object=True)),
+    (("PULL",), CommandSpec(
+        lambda self, c, s: self.handle_pull(c.object, s),
+        needs_object=True)),
+    (("TIE",), CommandSpec(
+        lambda self, c, s: self.handle_tie(c.object, c.target, s),
+        needs_object=True, needs_target=True,
+        target_prompt="What do you want to tie the {} to?")),
+    (("UNTIE",), CommandSpec(
+        lambda self, c, s: self.handle_untie(c.object, s),
+        needs_object=True)),
+    (("FILL",), CommandSpec(
+        lambda self, c, s: self.handle_fill(c.object, c.target, s),
+        needs_object=True, needs_target=True,
+        target_prompt="What do you want to fill the {} from?")),
+    (("POUR",), CommandSpec(
+        lambda self, c, s: self.handle_pour(c.object, c.target, s),
+        needs_object=True, takes_target=True)),
+    (("READ",), CommandSpec(
+        lambda self, c, s: self.handle_read(c.object, s),
+        needs_object=True)),
+    (("DESTROY",), CommandSpec(
+        lambda self, c, s: self.handle_destroy(c.object, s),
+        needs_object=True, takes_turn=True)),
+    (("EAT",), CommandSpec(
+        lambda self, c, s: self.handle_eat(c.object, s),
+        needs_object=True)),
+    (("DRINK",), CommandSpec(
+        lambda self, c, s: self.handle_drink(c.object, s),
+        needs_object=True)),
+    (("WEAR",), CommandSpec(
+        lambda self, c, s: self.handle_wear(c.object, s),
+        needs_object=True)),
+    (("REMOVE",), CommandSpec(
+        lambda self, c, s: self.handle_remove(c.object, s),
+        needs_object=True)),
+    (("MOVE",), CommandSpec(
+        lambda self, c, s: self.handle_move(c.object, s),
+        needs_object=True)),
+    (("RAISE",), CommandSpec(
+        lambda self, c, s: self.handle_raise(c.object, s),
+        needs_object=True)),
+    (("LOWER",), CommandSpec(
+        lambda self, c, s: self.handle_lower(c.object, s),
+        needs_object=True)),
+    (("SLIDE",), CommandSpec(
+        lambda self, c, s: self.handle_slide(c.object, c.target, s),
+        needs_object=True, takes_target=True)),
+    (("SPRING",), CommandSpec(
+        lambda self, c, s: self.handle_spring(c.object, s),
+        needs_object=True)),
+    (("HATCH",), CommandSpec(
+        lambda self, c, s: self.handle_hatch(c.object, s),
+        needs_object=True)),
+    (("APPLY",), CommandSpec(
+        lambda self, c, s: self.handle_apply(c.object, c.target, s),
+        needs_object=True, takes_target=True)),
+    (("BRUSH",), CommandSpec(
+        lambda self, c, s: self.handle_brush(c.object, s),
+        needs_object=True)),
+    (("OPEN", "CLOSE"), CommandSpec(
+        lambda self, c, s: self.handle_object_interaction(c.verb, c.object, s),
+        needs_object=True)),
+    (("LIGHT", "TURN_ON"), CommandSpec(
+        lambda self, c, s: self.handle_lamp_on(s),
+        needs_object=True, when=_is_lamp)),
+    (("EXTINGUISH", "TURN_OFF"), CommandSpec(
+        lambda self, c, s: self.handle_lamp_off(s),
+        needs_object=True, when=_is_lamp)),
+
+    # Observation
+    (("LOOK_UNDER",), CommandSpec(
+        lambda self, c, s: self.handle_look_under(c.object, s),
+        needs_object=True)),
+    (("LOOK_BEHIND",), CommandSpec(
+        lambda self, c, s: self.handle_look_behind(c.object, s),
+        needs_object=True)),
+    (("LOOK_INSIDE",), CommandSpec(
+        lambda self, c, s: self.handle_look_inside(c.object, s),
+        needs_object=True)),
+    (("SEARCH",), CommandSpec(
+        lambda self, c, s: self.handle_search(c.object, s),
+        needs_object=True)),
+    (("LISTEN",), CommandSpec(
+        lambda self, c, s: self.handle_listen(c.object, s),
+        takes_object=True)),
+    (("SMELL",), CommandSpec(
+        lambda self, c, s: self.handle_smell(c.object, s),
+        takes_object=True)),
+
+    # Tools and actions
+    (("BURN",), CommandSpec(
+        lambda self, c, s: self.handle_burn(c.object, c.target, s),
+        needs_object=True, takes_target=True)),
+    (("CUT",), CommandSpec(
+        lambda self, c, s: self.handle_cut(c.object, c.target, s),
+        needs_object=True, takes_target=True)),
+    (("DIG",), CommandSpec(
+        lambda self, c, s: self.handle_dig(c.object, c.target, s),
+        takes_object=True, takes_target=True)),
+    (("INFLATE",), CommandSpec(
+        lambda self, c, s: self.handle_inflate(c.object, s),
+        needs_object=True)),
+    (("DEFLATE",), CommandSpec(
+        lambda self, c, s: self.handle_deflate(c.object, s),
+        needs_object=True)),
+    (("LAUNCH",), CommandSpec(
+        lambda self, c, s: self.handle_launch(s))),
+    (("FIX",), CommandSpec(
+        lambda self, c, s: self.handle_fix(c.object, s),
+        needs_object=True)),
+    (("WAVE",), CommandSpec(
+        lambda self, c, s: self.handle_wave(c.object, s),
+        needs_object=True)),
+    (("RUB",), CommandSpec(
+        lambda self, c, s: self.handle_rub(c.object, s),
+        needs_object=True)),
+    (("SHAKE",), CommandSpec(
+        lambda self, c, s: self.handle_shake(c.object, s),
+        needs_object=True)),
+    (("SQUEEZE",), CommandSpec(
+        lambda self, c, s: self.handle_squeeze(c.object, s),
+        needs_object=True)),
+    (("ATTACK", "KILL"), CommandSpec(
+        lambda self, c, s: self.handle_attack(c.object, c.target, s),
+        needs_object=True, takes_target=True)),
+    (("THROW",), CommandSpec(
+        lambda self, c, s: self.handle_throw(c.object, c.target, s),
+        needs_object=True, needs_target=True,
+        target_prompt="What do you want to throw the {} at?")),
+    (("GIVE",), CommandSpec(
+        lambda self, c, s: self.handle_give(c.object, c.target, s),
+        needs_object=True, needs_target=True,
+        target_prompt="Who do you want to give the {} to?")),
+
+    # Communication
+    (("TELL", "ASK"), CommandSpec(
+        lambda self, c, s: self.handle_tell(c.object, c.target, s),
+        needs_object=True, takes_target=True)),
+    (("SAY",), CommandSpec(
+        lambda self, c, s: self.handle_say(c.object, s),
+        takes_object=True)),
+    (("WHISPER",), CommandSpec(
+        lambda self, c, s: self.handle_whisper(c.object, s),
+        takes_object=True)),
+    (("ANSWER",), CommandSpec(
+        lambda self, c, s: self.handle_answer(c.object, s),
+        takes_object=True)),
+    (("WAKE",), CommandSpec(
+        lambda self, c, s: self.handle_wake(c.object, s),
+        needs_object=True)),
+    (("KISS",), CommandSpec(
+        lambda self, c, s: self.handle_kiss(c.object, s),
+        needs_object=True)),
+
+    # Magic
+    (("CAST",), CommandSpec(
+        lambda self, c, s: self.handle_cast(c.object, c.target, c.instrument, s),
+        needs_object=True, takes_target=True)),
+    (("INCANT", "CHANT"), CommandSpec(
+        lambda self, c, s: self.handle_cast(c.object, c.target, c.instrument, s),
+        takes_object=True, takes_target=True)),
+    (("ENCHANT",), CommandSpec(
+        lambda self, c, s: self.handle_enchant(c.object, s),
+        needs_object=True)),
+    (("DISENCHANT",), CommandSpec(
+        lambda self, c, s: self.handle_disenchant(c.object, s),
+        takes_object=True)),
+    (("EXORCISE",), CommandSpec(
+        lambda self, c, s: self.handle_exorcise(c.object, c.target, s),
+        needs_object=True, takes_target=True)),
+    (("EXORCISE OUT", "EXORCISE AWAY"), CommandSpec(
+        lambda self, c, s: self.handle_exorcise(c.object, c.verb, s),
+        needs_object=True)),
+
+    # Special and easter egg commands
+    (("FROBOZZ",), CommandSpec(
+        lambda self, c, s: self.handle_frobozz(s),
+        mutates_state=False)),
+    (("ZORK",), CommandSpec(
+        lambda self, c, s: self.handle_zork(s),
+        mutates_state=False)),
+    (("BLAST",), CommandSpec(
+        lambda self, c, s: self.handle_blast(c.object, s),
+        takes_object=True)),
+    (("WISH",), CommandSpec(
+        lambda self, c, s: self.handle_wish(c.object, s),
+        takes_object=True)),
+    (("WIN",), CommandSpec(
+        lambda self, c, s: self.handle_win(s),
+        mutates_state=False)),
+    (("XYZZY",), CommandSpec(
+        lambda self, c, s: self.handle_xyzzy(s),
+        mutates_state=False)),
+    (("PLUGH",), CommandSpec(
+        lambda self, c, s: self.handle_plugh(s),
+        mutates_state=False)),
+    (("HELLO",), CommandSpec(
+        lambda self, c, s: self.handle_hello(s),
+        mutates_state=False)),
+    (("PRAY",), CommandSpec(
+        lambda self, c, s: self.handle_pray(s),
+        mutates_state=False)),
+    (("JUMP",), CommandSpec(
+        lambda self, c, s: self.handle_jump(s),
+        mutates_state=False)),
+    (("YELL",), CommandSpec(
+        lambda self, c, s: self.handle_yell(s),
+        mutates_state=False)),
+    (("ECHO",), CommandSpec(
+        lambda self, c, s: self.handle_echo(c.object, s),
+        takes_object=True)),
+    (("CURSE",), CommandSpec(
+        lambda self, c, s: self.handle_curse(s),
+        mutates_state=False)),
+
+    # Utility and information commands
+    (("FIND", "SEARCH FOR"), CommandSpec(
+        lambda self, c, s: self.handle_find(c.object, s),
+        needs_object=True)),
+    (("COUNT",), CommandSpec(
+        lambda self, c, s: self.handle_count(c.object, s),
+        takes_object=True)),
+    (("VERSION",), CommandSpec(
+        lambda self, c, s: self.handle_version(s),
+        mutates_state=False)),
+    (("DIAGNOSE",), CommandSpec(
+        lambda self, c, s: self.handle_diagnose(s),
+        mutates_state=False)),
+    (("SCRIPT",), CommandSpec(
+        lambda self, c, s: self.handle_script(s))),
+    (("UNSCRIPT",), CommandSpec(
+        lambda self, c, s: self.handle_unscript(s))),
+    (("TREASURE",), CommandSpec(
+        lambda self, c, s: self.handle_treasure(s),
+        mutates_state=False)),
+    (("BUG",), CommandSpec(
+        lambda self, c, s: self.handle_bug(c.object, s),
+        takes_object=True)),
+    (("RING",), CommandSpec(
+        lambda self, c, s: self.handle_ring(c.object, s),
+        needs_object=True)),
+    (("CROSS",), CommandSpec(
+        lambda self, c, s: self.handle_cross(c.object, s),
+        takes_object=True)),
+    (("BREATHE",), CommandSpec(
+        lambda self, c, s: self.handle_breathe(s),
+        mutates_state=False)),
+    (("ACTIVATE",), CommandSpec(
+        lambda self, c, s: self.handle_activate(c.object, s),
+        needs_object=True)),
+    (("COMMAND",), CommandSpec(
+        lambda self, c, s: self.handle_command(c.object, s),
+        takes_object=True)),
+    (("CHOMP",), CommandSpec(
+        lambda self, c, s: self.handle_chomp(c.object or None, s),
+        takes_object=True)),
+    (("REPENT",), CommandSpec(
+        lambda self, c, s: self.handle_repent(s),
+        mutates_state=False)),
+    (("SKIP",), CommandSpec(
+        lambda self, c, s: self.handle_skip(s),
+        mutates_state=False)),
+    (("SPAY",), CommandSpec(
+        lambda self, c, s: self.handle_spay(s),
+        mutates_state=False)),
+    (("SPIN",), CommandSpec(
+        lambda self, c, s: self.handle_spin(s),
+        mutates_state=False)),
+    (("SPRAY",), CommandSpec(
+        lambda self, c, s: self.handle_spray(c.object, c.target, s),
+        needs_object=True, takes_target=True)),
+    (("STAY",), CommandSpec(
+        lambda self, c, s: self.handle_stay(s),
+        mutates_state=False)),
+    (("WIND", "windup"), CommandSpec(
+        lambda self, c, s: self.handle_wind(c.object, s),
+        needs_object=True)),
+    (("BLOW OUT",), CommandSpec(
+        lambda self, c, s: self.handle_blow_out(c.object, s),
+        needs_object=True)),
+    (("BLOW UP",), CommandSpec(
+        lambda self, c, s: self.handle_blow_up(c.object, s),
+        needs_object=True)),
+    (("SEND FOR",), CommandSpec(
+        lambda self, c, s: self.handle_send_for(c.object, s),
+        needs_object=True)),
+
+    # Session commands
+    (("SAVE",), CommandSpec(
+        lambda self, c, s: self.handle_save(s))),
+    (("RESTORE",), CommandSpec(
+        lambda self, c, s: self._dispatch_restore(c, s),
+        takes_object=True)),
+    (("RESTART",), CommandSpec(
+        lambda self, c, s: self.handle_restart(s))),
+    (("SCORE",), CommandSpec(
+        lambda self, c, s: self.handle_score(s),
+        mutates_state=False)),
+    (("VERBOSE",), CommandSpec(
+        lambda self, c, s: self.handle_verbose(s))),
+    (("BRIEF",), CommandSpec(
+        lambda self, c, s: self.handle_brief(s))),
+    (("SUPERBRIEF",), CommandSpec(
+        lambda self, c, s: self.handle_superbrief(s))),
+
+    # The parser puts the unrecognized words in the object slot, and
+    # resolving them gives "I don't know what 'x' is" for unknown nouns.
+    (("UNKNOWN",), CommandSpec(
+        lambda self, c, s: self._handle_unknown_command(c, s),
+        takes_object=True)),
+]
+
+
+def _build_command_registry() -> Dict[str, CommandSpec]:
+    """Expand the dispatch table into a verb-keyed registry."""
+    registry = {}
+    for verbs, spec in _COMMAND_TABLE:
+        for verb in verbs:
+            registry[verb] = replace(spec, checks_syntax=verb in SYNTAX_CHECKED_VERBS)
+    return registry
+
+
+COMMAND_REGISTRY: Dict[str, CommandSpec] = _build_command_registry()
+
+# Verbs the parser recognizes but no handler implements yet. They still get
+# the full pre-dispatch pipeline so missing objects are reported first.
+UNREGISTERED_COMMAND = CommandSpec(
+    lambda self, c, s: self._handle_unimplemented_command(c, s),
+    takes_object=True,
+    takes_target=True
+)
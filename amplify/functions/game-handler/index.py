@@ -5,10 +5,12 @@ This handler is specifically designed for AppSync GraphQL resolvers.
 It processes the processCommand query and returns game state.
 """
 
+import hashlib
 import json
 import os
 import sys
-import traceback
+import random
+import time
 import boto3
 from typing import Dict, Any
 
@@ -16,12 +18,70 @@ from typing import Dict, Any
 sys.path.insert(0, os.path.dirname(__file__))
 
 from game_engine import GameEngine, ActionResult
-from state_manager import GameState, SessionManager
+from state_manager import GameState, SessionManager, SessionCache, SessionConflictError, StateDefaults
+from session_store import DynamoDBSessionStore, InMemorySessionStore, SQLiteSessionStore
+from command_journal import CommandJournal, seed_command
+from save_slots import SaveSlots
+from request_metrics import PhaseTimer
+from request_log import logger
+from view_cache import ViewCache
 from command_parser import CommandParser
 from world_loader import WorldData
 
 
+# Batch execution limits and failure policies
+MAX_BATCH_COMMANDS = 50
+BATCH_FAILURE_POLICIES = ('stop', 'continue')
+
+# Optimistic concurrency: a save that loses a race with another container
+# reloads the session and re-runs the commands, backing off with full jitter
+MAX_CONFLICT_RETRIES = 3
+CONFLICT_BACKOFF_SECONDS = 0.02
+METRICS_NAMESPACE = 'WestOfHauntedHouse'
+
+# Client command IDs make retries idempotent: the response to a command
+# that was already executed and saved is returned from the session
+MAX_COMMAND_ID_LENGTH = 128
+MAX_VIEW_HASH_LENGTH = 128
+
+# Per-phase request latency, emitted as one EMF record per invocation;
+# set PHASE_METRICS=off to disable
+PHASE_METRICS_ENABLED = os.environ.get('PHASE_METRICS', 'on').lower() not in ('0', 'false', 'off', 'no')
+NO_TIMER = PhaseTimer(enabled=False)
+
+# Load the world and create the session store during Lambda init, which
+# runs with boosted CPU, instead of in the first request of each container.
+# On by default inside Lambda; EAGER_INIT=off defers it to the first request
+EAGER_INIT = os.environ.get(
+    'EAGER_INIT', 'on' if 'AWS_LAMBDA_FUNCTION_NAME' in os.environ else 'off'
+).lower() not in ('0', 'false', 'off', 'no')
+
+# Warm-up pings ({"warmup": true}, or an EventBridge schedule invoking the
+# function directly) run these commands on a synthetic in-memory game and
+# open the session store's connections, so rarely used code is compiled and
+# cached before players need it; no stored session is read or written.
+# Some handlers (e.g. take, read, drop) still update the shared world
+# objects, which every session on the container sees, so only commands
+# whose effects stay in the throwaway GameState belong here
+WARMUP_COMMANDS = (
+    "look", "open mailbox", "examine mailbox", "examine leaflet", "north",
+    "east", "open window", "west", "examine table", "inventory", "look",
+)
+WARMUP_SESSION_ID = '__warmup__'
+
+# processCommand fields derived from world data rather than copied from
+# the state; built only when the query selects them, and memoized per room
+# and the state they depend on for the life of the container
+VIEW_FIELDS = ('description_spooky', 'exits', 'objects', 'inventory')
+view_cache = ViewCache()
+
+# Delta mode: a client that sends the viewHash of the view it last rendered
+# as lastViewHash gets only the VIEW_FIELDS that changed since. The hash is
+# a short digest per field, so nothing about the view is stored server-side
+VIEW_HASH_VERSION = 'v1'
+
 # Initialize global objects for Lambda warm starts
+cold_start = True
 world_data = None
 game_engine = None
 command_parser = None
@@ -36,21 +96,437 @@ def initialize_game_components():
         data_dir = os.path.join(os.path.dirname(__file__), 'data')
         world_data = WorldData()
         world_data.load_from_json(data_dir)
-        print(f"Loaded world data from {data_dir}")
+        logger.info("Loaded world data from %s", data_dir)
     
     if game_engine is None:
         game_engine = GameEngine(world_data)
-        print("Initialized game engine")
+        logger.info("Initialized game engine")
     
     if command_parser is None:
         command_parser = CommandParser()
-        print("Initialized command parser")
+        logger.info("Initialized command parser")
     
     if session_manager is None:
-        dynamodb_client = boto3.client('dynamodb')
         table_name = os.environ.get('GAME_SESSIONS_TABLE_NAME', 'GameSessions')
-        session_manager = SessionManager(dynamodb_client, table_name)
-        print(f"Initialized session manager with table: {table_name}")
+        store_kind = os.environ.get('SESSION_STORE', 'dynamodb').lower()
+        if store_kind == 'sqlite':
+            sqlite_path = os.environ.get('SESSION_SQLITE_PATH', SQLiteSessionStore.DEFAULT_PATH)
+            session_store = SQLiteSessionStore(sqlite_path)
+            store_description = f"SQLite database: {sqlite_path}"
+        elif store_kind == 'memory':
+            session_store = InMemorySessionStore()
+            store_description = "in-memory store"
+        else:
+            session_store = DynamoDBSessionStore(boto3.client('dynamodb'), table_name)
+            store_description = f"table: {table_name}"
+        # SAVE/RESTORE snapshots live next to the sessions
+        game_engine.save_slots = SaveSlots(session_store)
+        ttl_refresh_seconds = int(os.environ.get(
+            'SESSION_TTL_REFRESH_SECONDS', SessionManager.DEFAULT_TTL_REFRESH_SECONDS
+        ))
+        session_cache = SessionCache(
+            max_size=int(os.environ.get('SESSION_CACHE_SIZE', SessionCache.DEFAULT_MAX_SIZE)),
+            ttl_seconds=float(os.environ.get('SESSION_CACHE_TTL_SECONDS', SessionCache.DEFAULT_TTL_SECONDS))
+        )
+        compact_state = os.environ.get('SESSION_COMPACT_STATE', '').lower() in ('1', 'true', 'yes')
+        journal = None
+        if os.environ.get('SESSION_JOURNAL', '').lower() in ('1', 'true', 'yes'):
+            journal = CommandJournal(
+                snapshot_every=int(os.environ.get('SESSION_SNAPSHOT_EVERY', CommandJournal.DEFAULT_SNAPSHOT_EVERY)),
+                max_bytes=int(os.environ.get('SESSION_JOURNAL_MAX_BYTES', CommandJournal.DEFAULT_MAX_BYTES))
+            )
+        session_manager = SessionManager(
+            ttl_refresh_seconds=ttl_refresh_seconds,
+            cache=session_cache,
+            compact_state=compact_state,
+            defaults=StateDefaults.from_world(world_data),
+            store=session_store,
+            journal=journal
+        )
+        logger.info("Initialized session manager with %s", store_description)
+
+
+def execute_commands(command_texts, state, on_failure='stop', timer=NO_TIMER):
+    """
+    Run commands in order against one game state.
+    
+    Args:
+        command_texts: Ordered list of raw command strings
+        state: GameState to execute against
+        on_failure: 'stop' to skip the remaining commands after the first
+            failed one, 'continue' to run them all
+        timer: PhaseTimer for the Parse and Execute phases
+        
+    Returns:
+        Tuple of the ActionResults for the commands that ran and whether
+        all of those commands are read-only (CommandSpec.mutates_state)
+    """
+    results = []
+    read_only = True
+    for command_text in command_texts:
+        if session_manager.journal is not None:
+            # Fix the RNG so the journal can replay the command exactly
+            seed_command(state, command_text)
+        with timer.phase('Parse'):
+            parsed_command = command_parser.parse(command_text)
+        with timer.phase('Execute'):
+            result = game_engine.execute_command(parsed_command, state)
+        timer.record_verb(parsed_command.verb)
+        read_only = read_only and not game_engine.command_spec(parsed_command.verb).mutates_state
+        results.append(result)
+        if not result.success and on_failure == 'stop':
+            break
+    return results, read_only
+
+
+def run_session_commands(
+    session_id, command_texts, on_failure, request_id, command_id=None, timer=NO_TIMER, selection=None,
+    last_view_hash=None
+):
+    """
+    Load or create a session, run commands against it and save it.
+    
+    When the save fails because another container saved the session
+    first, the session is reloaded and the commands re-executed, up to
+    MAX_CONFLICT_RETRIES times with jittered exponential backoff. The
+    world object states are put back after each lost race, so a retry
+    does not see what the lost attempt changed in the shared world.
+    
+    With a command_id, a session that already holds a response for it
+    (a retried delivery) is answered with that response without running
+    the commands or writing. Otherwise the turn's messages are stored with
+    the session whenever the turn is saved; the rest of the response is
+    rebuilt from the saved state on a retry. A turn that is not saved
+    changed nothing, so running it again on a retry is harmless.
+    
+    Args:
+        session_id: The session identifier
+        command_texts: Ordered list of raw command strings
+        on_failure: Batch failure policy passed to execute_commands
+        request_id: Lambda request ID for log lines
+        command_id: Optional client command ID
+        timer: PhaseTimer for the request's phases
+        selection: Selected response fields, or None for all
+        last_view_hash: viewHash the client last rendered, for a delta
+            response; None for a full response
+        
+    Returns:
+        AppSync response dict
+        
+    Raises:
+        SessionConflictError: If every retry lost a race
+    """
+    conflicts = 0
+    try:
+        while True:
+            # Load or create session
+            with timer.phase('LoadSession'):
+                state = session_manager.load_session(session_id)
+            if state is None:
+                # Create new session
+                state = GameState.create_new_game(starting_room="west_of_house")
+                # Set session_id after creation
+                state.session_id = session_id
+                state.defaults = session_manager.defaults
+                logger.info("Created new session %s", session_id)
+            else:
+                # Ensure session_id is set for loaded sessions
+                state.session_id = session_id
+                if command_id:
+                    cached = state.get_command_response(command_id)
+                    if cached is not None:
+                        logger.info("Command %s already executed, returning its response", command_id)
+                        response = build_messages_response(state, stored_messages(cached), selection)
+                        if last_view_hash is not None:
+                            apply_view_delta(response, state, last_view_hash)
+                        return response
+            
+            # Parse and execute commands, then persist once
+            world_states = world_data.snapshot_object_states()
+            results, read_only = execute_commands(command_texts, state, on_failure, timer)
+            with timer.phase('BuildResponse'):
+                response = build_response(state, results, selection)
+                if last_view_hash is not None:
+                    apply_view_delta(response, state, last_view_hash)
+            
+            try:
+                # Save updated state, skipping the write for read-only commands
+                if session_manager.needs_save(state, read_only):
+                    if command_id:
+                        state.remember_command_response(
+                            command_id, json.dumps(response['messages'], separators=(',', ':'))
+                        )
+                    with timer.phase('SaveSession'):
+                        session_manager.save_session(state)
+                # Save slots are written only once the turn is committed,
+                # so a conflict retry or journal replay writes none
+                if state.pending_saves:
+                    game_engine.save_slots.write_pending(state)
+                return response
+            except SessionConflictError:
+                # The lost attempt's turn never happened
+                world_data.restore_object_states(world_states)
+                conflicts += 1
+                if conflicts > MAX_CONFLICT_RETRIES:
+                    raise
+                logger.warning("Session %s modified concurrently, retry %d", session_id, conflicts)
+                time.sleep(random.uniform(0, CONFLICT_BACKOFF_SECONDS * 2 ** (conflicts - 1)))
+    finally:
+        if conflicts:
+            emit_conflict_metrics(conflicts, min(conflicts, MAX_CONFLICT_RETRIES))
+
+
+def selected_fields(event):
+    """
+    Get the top-level processCommand fields an AppSync query selected.
+    
+    Args:
+        event: AppSync resolver event
+        
+    Returns:
+        Set of field names, or None when the event has no selection set
+        (e.g. a direct invocation) and every field is wanted
+    """
+    selection_set = (event.get('info') or {}).get('selectionSetList')
+    if not selection_set:
+        return None
+    return {field.split('/', 1)[0] for field in selection_set}
+
+
+def build_response(state, results, selection=None):
+    """
+    Build the AppSync response for a turn.
+    
+    Fields copied from the state are always included; VIEW_FIELDS, which
+    are derived from world data, only when the query selected them.
+    
+    Args:
+        state: GameState after the commands ran
+        results: ActionResults of the commands that ran
+        selection: Field names from selected_fields, or None for all
+        
+    Returns:
+        processCommand response dict
+    """
+    return build_messages_response(state, [r.message or "" for r in results], selection)
+
+
+def build_messages_response(state, messages, selection=None):
+    """
+    Build the AppSync response for a turn from its command messages.
+    
+    Args:
+        state: GameState after the commands ran
+        messages: Message of each command that ran, in order
+        selection: Field names from selected_fields, or None for all
+        
+    Returns:
+        processCommand response dict
+    """
+    # Return AppSync response
+    # Ensure room is not null for GraphQL schema compliance
+    response = {
+        "room": state.current_room or "west_of_house",
+        "sanity": state.sanity,
+        "score": state.score,
+        "moves": state.moves,
+        "lampBattery": state.lamp_battery,
+        "message": messages[-1] if messages else "",
+        "messages": list(messages)
+    }
+    response.update(build_view(state, selection))
+    return response
+
+
+def stored_messages(cached):
+    """
+    Decode the command messages remembered for a client command ID.
+    
+    Sessions saved before only the messages were stored hold the whole
+    serialized response; its messages are used.
+    
+    Args:
+        cached: Value from GameState.get_command_response
+        
+    Returns:
+        List of command messages
+    """
+    stored = json.loads(cached)
+    if isinstance(stored, dict):
+        return stored.get('messages') or [stored.get('message', '')]
+    return stored
+
+
+def build_view(state, selection=None):
+    """
+    Build the selected response fields that are derived from world data.
+    
+    Each field is memoized in view_cache under the room and the state
+    values it depends on, so a turn that leaves them unchanged (or another
+    player in the same situation) reuses the earlier result.
+    
+    Args:
+        state: GameState to describe
+        selection: Field names to build, or None for all VIEW_FIELDS
+        
+    Returns:
+        Dict of the built fields
+    """
+    fields = VIEW_FIELDS if selection is None else [name for name in VIEW_FIELDS if name in selection]
+    if not fields:
+        return {}
+    
+    view = {}
+    room_id = state.current_room
+    sanity = state.sanity
+    if 'description_spooky' in fields:
+        view['description_spooky'] = view_cache.get(
+            world_data, ('description', room_id, sanity),
+            lambda: world_data.get_room_description(room_id, sanity) or ""
+        )
+    if 'exits' in fields or 'objects' in fields:
+        room = world_data.get_room(room_id)
+        if 'exits' in fields:
+            view['exits'] = list(view_cache.get(
+                world_data, ('exits', room_id),
+                lambda: tuple(room.exits.keys()) if room else ()
+            ))
+        if 'objects' in fields:
+            items = tuple(state.get_room_items(room.id, room.items))
+            # Per-item visibility overrides in the state change the list too
+            visibility = tuple(state.get_object_state(item_id, 'is_visible', None) for item_id in items)
+            view['objects'] = list(view_cache.get(
+                world_data, ('objects', room.id, items, visibility),
+                lambda: visible_object_names(state, items)
+            ))
+    if 'inventory' in fields:
+        inventory = tuple(state.inventory)
+        view['inventory'] = list(view_cache.get(
+            world_data, ('inventory', inventory),
+            lambda: inventory_names(inventory)
+        ))
+    return view
+
+
+def view_hash(view):
+    """
+    Build the hash token of a view.
+    
+    Args:
+        view: Dict holding every VIEW_FIELDS value
+        
+    Returns:
+        VIEW_HASH_VERSION and a digest per VIEW_FIELDS entry, dot-separated
+    """
+    digests = [
+        hashlib.blake2b(json.dumps(view[name]).encode(), digest_size=6).hexdigest()
+        for name in VIEW_FIELDS
+    ]
+    return '.'.join([VIEW_HASH_VERSION] + digests)
+
+
+def apply_view_delta(response, state, last_view_hash):
+    """
+    Turn a response into a delta against the client's last rendered view.
+    
+    Adds the current view's viewHash and drops the view fields whose digest
+    matches last_view_hash; the client keeps its copies of those. An empty,
+    malformed or other-version last_view_hash leaves every field in.
+    
+    Args:
+        response: processCommand response dict, modified in place
+        state: GameState the response describes
+        last_view_hash: viewHash of the client's last rendered view
+        
+    Returns:
+        The response
+    """
+    current = view_hash(build_view(state))
+    response['viewHash'] = current
+    known = last_view_hash.split('.')
+    if known[0] == VIEW_HASH_VERSION and len(known) == len(VIEW_FIELDS) + 1:
+        for name, digest, last_digest in zip(VIEW_FIELDS, current.split('.')[1:], known[1:]):
+            if digest == last_digest:
+                response.pop(name, None)
+    return response
+
+
+def visible_object_names(state, item_ids):
+    """Display names of the visible objects among a room's items."""
+    names = []
+    for item_id in item_ids:
+        try:
+            obj = world_data.get_object(item_id)
+        except ValueError:
+            continue
+        # Check visibility using GameState, fall back to object state
+        if state.get_object_state(item_id, 'is_visible', obj.state.get('is_visible', True)):
+            names.append(obj.name_spooky or obj.name)
+    return tuple(names)
+
+
+def inventory_names(item_ids):
+    """Display names of inventory items, falling back to their IDs."""
+    names = []
+    for item_id in item_ids:
+        try:
+            obj = world_data.get_object(item_id)
+            names.append(obj.name_spooky or obj.name)
+        except ValueError:
+            names.append(item_id)
+    return tuple(names)
+
+
+def is_warmup_event(event):
+    """Check whether an invocation is a warm-up ping rather than a resolver call."""
+    return isinstance(event, dict) and (
+        event.get('warmup') is True or event.get('detail-type') == 'Scheduled Event'
+    )
+
+
+def warm_up():
+    """
+    Exercise the request path without touching stored sessions.
+    
+    Runs WARMUP_COMMANDS against a new game that is never saved, builds its
+    response, then lets the session store open its connections.
+    
+    Returns:
+        Warm-up response with the number of commands run
+    """
+    state = GameState.create_new_game(starting_room="west_of_house")
+    state.session_id = WARMUP_SESSION_ID
+    state.defaults = session_manager.defaults
+    results, _ = execute_commands(list(WARMUP_COMMANDS), state, on_failure='continue')
+    build_response(state, results)
+    session_manager.store.warm_up()
+    logger.info("Warmed up with %d command(s)", len(results))
+    return {"warmup": True, "commands": len(results)}
+
+
+def emit_conflict_metrics(conflicts, retries):
+    """
+    Log session write conflict counts in CloudWatch Embedded Metric Format.
+    
+    Args:
+        conflicts: Conditional save failures during this invocation
+        retries: Times the commands were re-executed
+    """
+    logger.metric({
+        "_aws": {
+            "Timestamp": int(time.time() * 1000),
+            "CloudWatchMetrics": [{
+                "Namespace": METRICS_NAMESPACE,
+                "Dimensions": [[]],
+                "Metrics": [
+                    {"Name": "SessionWriteConflicts", "Unit": "Count"},
+                    {"Name": "SessionWriteRetries", "Unit": "Count"}
+                ]
+            }]
+        },
+        "SessionWriteConflicts": conflicts,
+        "SessionWriteRetries": retries
+    })
 
 
 def handler(event, context):
@@ -61,93 +537,84 @@ def handler(event, context):
     {
         "arguments": {
             "sessionId": "...",
-            "command": "..."
+            "command": "...",
+            "commands": ["...", "..."],   # optional batch, replaces command
+            "onFailure": "stop",          # or "continue" (batch only)
+            "commandId": "...",           # optional, makes retries idempotent
+            "lastViewHash": "..."         # optional, returns only changed view fields
         },
         "identity": {...},
         ...
     }
     """
+    global cold_start
     request_id = getattr(context, 'aws_request_id', 'unknown') if context else 'unknown'
+    warmup = is_warmup_event(event)
+    # Warm-ups stay out of the latency metrics
+    timer = PhaseTimer(enabled=PHASE_METRICS_ENABLED and not warmup)
+    was_cold_start, cold_start = cold_start, False
+    success = False
+    logger.start(request_id)
     
     try:
-        print(f"[{request_id}] AppSync event: {json.dumps(event)}")
+        # Full events only for sampled requests, minus identity and headers
+        logger.debug("AppSync event", event=event)
         
-        # Initialize components
-        initialize_game_components()
+        if warmup:
+            initialize_game_components()
+            response = warm_up()
+            success = True
+            return response
         
         # Extract arguments
         arguments = event.get('arguments', {})
         session_id = arguments.get('sessionId')
         command_text = arguments.get('command')
+        commands = arguments.get('commands')
+        on_failure = arguments.get('onFailure') or 'stop'
+        command_id = arguments.get('commandId')
+        last_view_hash = arguments.get('lastViewHash')
         
-        if not session_id or not command_text:
+        if not session_id or not (command_text or commands):
             raise ValueError("Missing sessionId or command")
+        if commands and not (isinstance(commands, list) and all(isinstance(text, str) for text in commands)):
+            raise ValueError("commands must be a list of strings")
+        if on_failure not in BATCH_FAILURE_POLICIES:
+            raise ValueError(f"Invalid onFailure policy: {on_failure}")
+        if command_id is not None and len(command_id) > MAX_COMMAND_ID_LENGTH:
+            raise ValueError(f"commandId too long (max {MAX_COMMAND_ID_LENGTH} characters)")
+        if last_view_hash is not None and len(last_view_hash) > MAX_VIEW_HASH_LENGTH:
+            raise ValueError(f"lastViewHash too long (max {MAX_VIEW_HASH_LENGTH} characters)")
         
-        print(f"[{request_id}] Processing command '{command_text}' for session {session_id}")
-        
-        # Load or create session
-        state = session_manager.load_session(session_id)
-        if state is None:
-            # Create new session
-            state = GameState.create_new_game(starting_room="west_of_house")
-            # Set session_id after creation
-            state.session_id = session_id
-            session_manager.save_session(state)
-            print(f"[{request_id}] Created new session {session_id}")
-        else:
-            # Ensure session_id is set for loaded sessions
-            state.session_id = session_id
-        
-        # Parse and execute command
-        parsed_command = command_parser.parse(command_text)
-        result = game_engine.execute_command(parsed_command, state)
+        command_texts = list(commands) if commands else [command_text]
+        if len(command_texts) > MAX_BATCH_COMMANDS:
+            raise ValueError(f"Too many commands in batch (max {MAX_BATCH_COMMANDS})")
         
-        # Save updated state
-        session_manager.save_session(state)
+        # Initialize whatever module-level init skipped (EAGER_INIT off)
+        with timer.phase('Init'):
+            initialize_game_components()
         
-        # Get current room info
-        room = world_data.get_room(state.current_room)
-        description = world_data.get_room_description(state.current_room, state.sanity)
+        logger.info("Processing %d command(s) for session %s", len(command_texts), session_id)
+        logger.debug("Commands", commands=command_texts)
         
-        # Get visible objects
-        objects_visible = []
-        for item_id in room.items:
-            try:
-                obj = world_data.get_object(item_id)
-                # Check visibility using GameState, fall back to object state
-                is_visible = state.get_object_state(item_id, 'is_visible', obj.state.get('is_visible', True))
-                if is_visible:
-                    objects_visible.append(obj.name_spooky or obj.name)
-            except:
-                pass
-        
-        # Get inventory display names
-        inventory_display = []
-        for item_id in state.inventory:
-            try:
-                obj = world_data.get_object(item_id)
-                inventory_display.append(obj.name_spooky or obj.name)
-            except:
-                inventory_display.append(item_id)
-        
-        # Return AppSync response
-        # Ensure room is not null for GraphQL schema compliance
-        room_id = state.current_room or "west_of_house"
-
-        return {
-            "room": room_id,
-            "description_spooky": description or "",
-            "exits": list(room.exits.keys()) if room else [],
-            "objects": objects_visible,
-            "inventory": inventory_display,
-            "sanity": state.sanity,
-            "score": state.score,
-            "moves": state.moves,
-            "lampBattery": state.lamp_battery,
-            "message": result.message or ""
-        }
+        response = run_session_commands(
+            session_id, command_texts, on_failure, request_id, command_id, timer, selected_fields(event),
+            last_view_hash
+        )
+        success = True
+        return response
         
     except Exception as e:
-        print(f"[{request_id}] ERROR: {str(e)}")
-        print(traceback.format_exc())
+        logger.error("Request failed: %s", e, exc_info=True)
         raise
+    finally:
+        timer.emit(METRICS_NAMESPACE, was_cold_start, success, request_id)
+        logger.flush()
+
+
+if EAGER_INIT:
+    try:
+        initialize_game_components()
+    except Exception as e:
+        # The first request retries whatever did not initialize
+        logger.error("Eager initialization failed: %s", e, exc_info=True)
@@ -0,0 +1,194 @@
+"""
+Request Logging for West of Haunted House
+
+A small structured logger for the Lambda handler and the game modules.
+Each log line is one JSON object (level, message, request ID and any
+extra fields), so CloudWatch Logs Insights can filter on fields.
+
+- Levels: DEBUG, INFO, WARNING and ERROR; lines below the configured
+  level (LOG_LEVEL, default INFO) cost one comparison.
+- Sampling: a LOG_SAMPLE_RATE fraction of requests (default 0) log at
+  DEBUG, so full detail is available for a few requests without paying
+  for it on all of them.
+- Lazy formatting: messages take %-style arguments, formatted only when
+  the line is written.
+- Redaction: extra fields are scrubbed of identity, header and credential
+  keys before they are serialized.
+- Buffering: during a request (between start and flush) lines are
+  collected and written to stdout in one write per invocation. Outside a
+  request (scripts, tests) they are written immediately.
+
+Modules log through the shared instance:
+    
+    from request_log import logger
+    logger.info("Created new session %s", session_id)
+"""
+
+import json
+import os
+import random
+import sys
+import traceback
+from typing import Any, Dict, List, Optional
+
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+
+LEVEL_NAMES = {DEBUG: 'DEBUG', INFO: 'INFO', WARNING: 'WARNING', ERROR: 'ERROR'}
+LEVELS = {name: level for level, name in LEVEL_NAMES.items()}
+
+# Keys whose values never reach the logs: AppSync identity (Cognito/IAM
+# principal, source IP), request headers and anything credential-like
+REDACTED_KEYS = frozenset({
+    'identity', 'headers', 'authorization', 'cookie', 'cookies',
+    'sourceIp', 'claims', 'x-api-key', 'token', 'password',
+})
+REDACTED = '[REDACTED]'
+
+# Sampling decisions; private so seeding the global RNG for journaled
+# commands does not make them predictable
+_sampler = random.Random()
+
+
+def redact(value: Any) -> Any:
+    """
+    Copy a value with the values of REDACTED_KEYS replaced.
+    
+    Args:
+        value: Value to scrub; dicts and lists are walked recursively
+    
+    Returns:
+        Scrubbed copy
+    """
+    if isinstance(value, dict):
+        return {
+            key: REDACTED if isinstance(key, str) and key.lower() in _REDACTED_LOWER else redact(inner)
+            for key, inner in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [redact(inner) for inner in value]
+    return value
+
+
+_REDACTED_LOWER = frozenset(key.lower() for key in REDACTED_KEYS)
+
+
+class RequestLogger:
+    """Leveled, sampled, per-request buffered JSON logger."""
+    
+    def __init__(self, level: int = INFO, sample_rate: float = 0.0):
+        """
+        Initialize the logger.
+        
+        Args:
+            level: Minimum level written outside sampled requests
+            sample_rate: Fraction of requests logged at DEBUG
+        """
+        self.base_level = level
+        self.level = level
+        self.sample_rate = sample_rate
+        self.request_id: Optional[str] = None
+        self.sampled = False
+        self._buffer: Optional[List[str]] = None
+    
+    @classmethod
+    def from_env(cls) -> 'RequestLogger':
+        """Create a logger configured by LOG_LEVEL and LOG_SAMPLE_RATE."""
+        level = LEVELS.get(os.environ.get('LOG_LEVEL', 'INFO').upper(), INFO)
+        return cls(level, float(os.environ.get('LOG_SAMPLE_RATE', '0') or 0))
+    
+    def start(self, request_id: str) -> None:
+        """
+        Begin buffering lines for a request and decide whether it is sampled.
+        
+        Args:
+            request_id: Lambda request ID added to every line
+        """
+        self.request_id = str(request_id)
+        self.sampled = self.sample_rate > 0 and _sampler.random() < self.sample_rate
+        self.level = DEBUG if self.sampled else self.base_level
+        self._buffer = []
+    
+    def flush(self) -> None:
+        """Write the request's buffered lines in one write and stop buffering."""
+        buffer = self._buffer
+        self._buffer = None
+        self.request_id = None
+        self.sampled = False
+        self.level = self.base_level
+        if buffer:
+            sys.stdout.write('\n'.join(buffer) + '\n')
+    
+    def is_enabled_for(self, level: int) -> bool:
+        """Check whether lines at a level are written, e.g. before costly work."""
+        return level >= self.level
+    
+    def debug(self, message: str, *args: Any, **fields: Any) -> None:
+        """Log at DEBUG; see log for arguments."""
+        if DEBUG >= self.level:
+            self.log(DEBUG, message, *args, **fields)
+    
+    def info(self, message: str, *args: Any, **fields: Any) -> None:
+        """Log at INFO; see log for arguments."""
+        if INFO >= self.level:
+            self.log(INFO, message, *args, **fields)
+    
+    def warning(self, message: str, *args: Any, **fields: Any) -> None:
+        """Log at WARNING; see log for arguments."""
+        if WARNING >= self.level:
+            self.log(WARNING, message, *args, **fields)
+    
+    def error(self, message: str, *args: Any, exc_info: bool = False, **fields: Any) -> None:
+        """
+        Log at ERROR; see log for arguments.
+        
+        Args:
+            exc_info: Also log the traceback of the exception being handled
+        """
+        if exc_info:
+            fields['traceback'] = traceback.format_exc()
+        self.log(ERROR, message, *args, **fields)
+    
+    def log(self, level: int, message: str, *args: Any, **fields: Any) -> None:
+        """
+        Write a line if the level is enabled.
+        
+        Args:
+            level: DEBUG, INFO, WARNING or ERROR
+            message: Message, with %-style placeholders for args
+            *args: Values formatted into the message, only if written
+            **fields: Extra JSON fields, redacted before serialization
+        """
+        if level < self.level:
+            return
+        record: Dict[str, Any] = {
+            'level': LEVEL_NAMES.get(level, str(level)),
+            'message': message % args if args else message,
+        }
+        if self.request_id is not None:
+            record['requestId'] = self.request_id
+        if fields:
+            record.update(redact(fields))
+        self._write(json.dumps(record, default=str))
+    
+    def metric(self, record: Dict[str, Any]) -> None:
+        """
+        Write a CloudWatch Embedded Metric Format record, at any level.
+        
+        Args:
+            record: EMF record; written as its own line
+        """
+        self._write(json.dumps(record))
+    
+    def _write(self, line: str) -> None:
+        if self._buffer is not None:
+            self._buffer.append(line)
+        else:
+            sys.stdout.write(line + '\n')
+
+
+# Shared logger for the handler and game modules
+logger = RequestLogger.from_env()
@@ -0,0 +1,167 @@
+"""
+Request Phase Metrics for West of Haunted House
+
+Times the phases of one processCommand invocation (component init, session
+load, command parsing, command execution, response building and session
+save) and emits them as a single CloudWatch Embedded Metric Format (EMF)
+log record, so CloudWatch turns the log line into metrics without any
+API calls from the Lambda.
+
+The record carries two metric directives:
+- every phase's milliseconds, with ColdStart and Success dimensions
+- the execution milliseconds alone, with a Verb dimension (the command's
+  verb, or BATCH when several commands ran)
+
+Timing costs two perf_counter() calls per phase. A disabled PhaseTimer
+hands out one shared no-op context manager and emits nothing.
+"""
+
+import time
+from typing import Dict, List
+
+try:
+    from .request_log import logger
+except ImportError:
+    # For testing when imported directly
+    from request_log import logger
+
+
+# Phases in the order a request runs them, as timed by the handler
+PHASES = ('Init', 'LoadSession', 'Parse', 'Execute', 'BuildResponse', 'SaveSession')
+
+
+class _Phase:
+    """Context manager adding its elapsed time to one phase of a timer."""
+    
+    __slots__ = ('durations', 'name', 'start')
+    
+    def __init__(self, durations: Dict[str, float], name: str):
+        self.durations = durations
+        self.name = name
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        self.durations[self.name] = self.durations.get(self.name, 0.0) + elapsed
+        return False
+
+
+class _NoPhase:
+    """Context manager doing nothing, for disabled timers."""
+    
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NO_PHASE = _NoPhase()
+
+
+class PhaseTimer:
+    """
+    Accumulates wall time per phase for one invocation.
+    
+    Phases that run more than once (e.g. LoadSession after a save
+    conflict, or Parse/Execute in a batch) add up.
+    """
+    
+    def __init__(self, enabled: bool = True):
+        """
+        Start timing an invocation.
+        
+        Args:
+            enabled: False to time and emit nothing
+        """
+        self.enabled = enabled
+        self.durations: Dict[str, float] = {}
+        self.verbs: List[str] = []
+        self.start = time.perf_counter()
+    
+    def phase(self, name: str):
+        """
+        Time a block as one of PHASES.
+        
+        Args:
+            name: Phase name
+        
+        Returns:
+            Context manager timing the block
+        """
+        if not self.enabled:
+            return _NO_PHASE
+        return _Phase(self.durations, name)
+    
+    def record_verb(self, verb) -> None:
+        """
+        Note the verb of an executed command.
+        
+        Args:
+            verb: ParsedCommand.verb; None for unrecognized commands
+        """
+        if self.enabled:
+            self.verbs.append(verb if isinstance(verb, str) else 'UNKNOWN')
+    
+    def record(self, namespace: str, cold_start: bool, success: bool, request_id: str) -> Dict:
+        """
+        Build the EMF record for the invocation.
+        
+        Args:
+            namespace: CloudWatch metric namespace
+            cold_start: Whether this invocation initialized the container
+            success: Whether the invocation returned a response
+            request_id: Lambda request ID, kept as a searchable property
+        
+        Returns:
+            EMF log record
+        """
+        timings = {
+            f"{name}Ms": round(self.durations[name] * 1000, 3)
+            for name in PHASES if name in self.durations
+        }
+        timings['TotalMs'] = round((time.perf_counter() - self.start) * 1000, 3)
+        verb = self.verbs[0] if len(self.verbs) == 1 else ('BATCH' if self.verbs else 'NONE')
+        
+        directives = [{
+            "Namespace": namespace,
+            "Dimensions": [["ColdStart", "Success"]],
+            "Metrics": [{"Name": name, "Unit": "Milliseconds"} for name in timings],
+        }]
+        if 'ExecuteMs' in timings:
+            directives.append({
+                "Namespace": namespace,
+                "Dimensions": [["Verb"]],
+                "Metrics": [{"Name": "ExecuteMs", "Unit": "Milliseconds"}],
+            })
+        
+        return {
+            "_aws": {
+                "Timestamp": int(time.time() * 1000),
+                "CloudWatchMetrics": directives,
+            },
+            "ColdStart": "true" if cold_start else "false",
+            "Success": "true" if success else "false",
+            "Verb": verb,
+            "Verbs": self.verbs,
+            "RequestId": str(request_id),
+            **timings,
+        }
+    
+    def emit(self, namespace: str, cold_start: bool, success: bool, request_id: str) -> None:
+        """
+        Log the EMF record for the invocation, unless disabled.
+        
+        Args:
+            namespace: CloudWatch metric namespace
+            cold_start: Whether this invocation initialized the container
+            success: Whether the invocation returned a response
+            request_id: Lambda request ID, kept as a searchable property
+        """
+        if self.enabled:
+            logger.metric(self.record(namespace, cold_start, success, request_id))
@@ -7,6 +7,36 @@ import { Code, Function, Runtime, Architecture } from 'aws-cdk-lib/aws-lambda';
 
 const functionDir = path.dirname(fileURLToPath(import.meta.url));
 
+/**
+ * Python version of the Lambda runtime below; the handler modules use its
+ * syntax, and bytecode is only reused by the same version
+ */
+const LAMBDA_PYTHON_VERSION = '3.12';
+
+/**
+ * Version ("major.minor") of a Python interpreter, or undefined if it cannot run
+ */
+function pythonVersion(python: string): string | undefined {
+  try {
+    return execSync(`${python} -c "import sys; print('%d.%d' % sys.version_info[:2])"`, {
+      stdio: ['ignore', 'pipe', 'ignore'],
+    })
+      .toString()
+      .trim();
+  } catch {
+    return undefined;
+  }
+}
+
+/**
+ * Interpreter for the bundling steps: python3.12 when available (the
+ * backend build puts one first on PATH), otherwise plain python3
+ */
+function buildPython(): string {
+  const candidate = `python${LAMBDA_PYTHON_VERSION}`;
+  return pythonVersion(candidate) === LAMBDA_PYTHON_VERSION ? candidate : 'python3';
+}
+
 /**
  * West of Haunted House Game Handler Lambda Function
  * 
@@ -74,9 +104,12 @@ export const gameHandler = defineFunction(
           image: DockerImage.fromRegistry('dummy'),
           local: {
             tryBundle(outputDir: string) {
+              const python = buildPython();
+              const version = pythonVersion(python);
+
               // Install Python dependencies for ARM64 architecture
               execSync(
-                `python3 -m pip install -r ${path.join(functionDir, 'requirements.txt')} -t ${outputDir} --platform manylinux2014_aarch64 --only-binary=:all:`,
+                `${python} -m pip install -r ${path.join(functionDir, 'requirements.txt')} -t ${outputDir} --platform manylinux2014_aarch64 --only-binary=:all:`,
                 { stdio: 'inherit' }
               );
 
@@ -84,6 +117,30 @@ export const gameHandler = defineFunction(
               execSync(`cp -r ${functionDir}/*.py ${outputDir}/`, { stdio: 'inherit' });
               execSync(`cp -r ${functionDir}/data ${outputDir}/`, { stdio: 'inherit' });
 
+              // Compile the JSON world data into a binary snapshot so cold
+              // starts skip JSON parsing (falls back to JSON if stale)
+              execSync(
+                `${python} ${path.join(functionDir, '../../../scripts/build_world_snapshot.py')} --data-dir ${path.join(outputDir, 'data')}`,
+                { stdio: 'inherit' }
+              );
+
+              // Precompile the handler modules: /var/task is read-only, so
+              // otherwise every cold start compiles them again. Hash-based
+              // pycs stay valid whatever file times the asset keeps. Another
+              // Python version cannot compile the handler and its pycs would
+              // be ignored by the runtime, so skip the step then
+              if (version === LAMBDA_PYTHON_VERSION) {
+                execSync(
+                  `${python} -m compileall -q -l --invalidation-mode unchecked-hash ${outputDir}`,
+                  { stdio: 'inherit' }
+                );
+              } else {
+                console.warn(
+                  `Skipping bytecode precompilation: build Python is ${version ?? 'unknown'}, ` +
+                    `Lambda runs ${LAMBDA_PYTHON_VERSION}; cold starts will compile the handler modules`
+                );
+              }
+
               return true;
             },
           },
@@ -96,6 +153,62 @@ export const gameHandler = defineFunction(
        * GAME_SESSIONS_TABLE_NAME: DynamoDB table name for game sessions
        * This will be set dynamically in backend.ts after table creation
        * 
+       * SESSION_TTL_REFRESH_SECONDS (optional, default 300): minimum time
+       * between writes that only extend the TTL of a session whose game
+       * state did not change (read-only commands are otherwise not saved)
+       * 
+       * SESSION_CACHE_SIZE (optional, default 256): number of sessions a
+       * warm container keeps deserialized between invocations; 0 disables
+       * the cache. A cached session is reused only after a version-only
+       * read confirms no other container has saved it since.
+       * 
+       * SESSION_CACHE_TTL_SECONDS (optional, default 300): how long a
+       * cached session may be reused before it is read in full again
+       * 
+       * SESSION_COMPACT_STATE (optional, default off): set to "true" to
+       * store flags, object states, visited rooms and inventory as one
+       * zlib-compressed binary attribute (state_codec.py). Items in either
+       * layout load regardless of this setting and are converted to the
+       * configured layout on their next save.
+       * 
+       * SESSION_STORE (optional, default "dynamodb"): session storage
+       * backend (session_store.py). "sqlite" keeps sessions in a local
+       * SQLite database in WAL mode and "memory" in a per-container dict;
+       * both are meant for local load tests, CI and self-hosted
+       * deployments, not for Lambda, where containers do not share /tmp.
+       * 
+       * SESSION_SQLITE_PATH (optional, default /tmp/game_sessions.db):
+       * database file used when SESSION_STORE is "sqlite"
+       * 
+       * SESSION_JOURNAL (optional, default off): set to "true" to save
+       * each turn as a small journal item (commands, RNG seeds, changes)
+       * and rewrite the whole session only as a periodic snapshot
+       * (command_journal.py). Loads apply the journal tail's recorded
+       * changes.
+       * 
+       * SESSION_SNAPSHOT_EVERY (optional, default 20): journaled saves
+       * between snapshots
+       * 
+       * SESSION_JOURNAL_MAX_BYTES (optional, default 16384): journal size
+       * since the last snapshot above which the next save snapshots
+       * 
+       * PHASE_METRICS (optional, default on): set to "off" to stop
+       * emitting the per-invocation latency record (request_metrics.py):
+       * init, session load, parse, execute, response building and save
+       * times in CloudWatch Embedded Metric Format, by cold start and
+       * success, plus execute time by verb
+       * 
+       * EAGER_INIT (optional, default on in Lambda): load the world data
+       * and create the session store at module import, during Lambda init,
+       * instead of in the first request; "off" defers it to the request
+       * 
+       * LOG_LEVEL (optional, default INFO): DEBUG, INFO, WARNING or ERROR;
+       * log lines are JSON, buffered and written once per invocation
+       * (request_log.py), with identity and header fields redacted
+       * 
+       * LOG_SAMPLE_RATE (optional, default 0): fraction of requests logged
+       * at DEBUG, including the redacted AppSync event
+       * 
        * Requirements: 22.7
        */
       environment: {
@@ -124,12 +237,21 @@ export const gameHandler = defineFunction(
  * - command_parser.py
  * - game_engine.py
  * - state_manager.py
+ * - state_codec.py
+ * - attribute_codec.py
+ * - session_store.py
+ * - command_journal.py
+ * - save_slots.py
+ * - request_metrics.py
+ * - request_log.py
+ * - view_cache.py
  * - sanity_system.py
  * - world_loader.py
  * - requirements.txt
  * - data/rooms_haunted.json
  * - data/objects_haunted.json
  * - data/flags_haunted.json
+ * - data/world_haunted.snapshot (generated by scripts/build_world_snapshot.py)
  * 
  * All files are now located in amplify/functions/game-handler/ for Gen 2 deployment.
  * 
@@ -0,0 +1,324 @@
+"""
+Save Slots for West of Haunted House
+
+Stores the games players SAVE as content-addressed snapshots next to their
+sessions, so RESTORE can bring back the exact state later, even after the
+session itself expired and was recreated under the same ID.
+
+Each save writes up to three kinds of items in the session store:
+- blob items, keyed '<session_id>#blob#<digest>', each holding one packed
+  sub-structure of the state: the flags map, one object's state, one
+  room's contents overlay or the visited rooms. The digest is a hash of
+  the packed value, so a sub-structure unchanged since an earlier save is
+  stored once and shared by every save that references it.
+- a manifest item per save, keyed '<session_id>#save#<save_id>', holding
+  the remaining scalar fields and the digests of the blobs.
+- one index item per session, keyed '<session_id>#saves', listing the
+  saves' metadata (ID, time, room, score, moves). Listing saves reads only
+  this item.
+
+SAVE only prepares these items (PendingSave) and queues them on the game
+state; the handler writes them after the session save commits, so a command
+re-run after a conflict or replayed from the journal writes nothing.
+"""
+
+import hashlib
+import time
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from typing import Any, Dict, List, Optional
+
+try:
+    from .session_store import SessionConflictError
+    from .state_codec import pack, unpack
+    from .state_manager import GameState, PERSISTED_FIELDS
+except ImportError:
+    # For testing when imported directly
+    from session_store import SessionConflictError
+    from state_codec import pack, unpack
+    from state_manager import GameState, PERSISTED_FIELDS
+
+
+# Fields shared across saves through blobs: whole-value blobs, and maps
+# split into one blob per entry
+WHOLE_BLOB_FIELDS = ('flags', 'rooms_visited')
+PER_ENTRY_BLOB_FIELDS = ('object_states', 'room_items_overlay')
+
+# Fields that belong to the session, not the saved game
+SESSION_FIELDS = ('session_id', 'created_at', 'last_accessed', 'expires', 'version', 'command_responses')
+
+
+def _canonical(value: Any) -> Any:
+    """Sort map keys (recursively) so equal values pack to equal bytes."""
+    if isinstance(value, dict):
+        return {key: _canonical(value[key]) for key in sorted(value)}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    return value
+
+
+def _blob(value: Any):
+    """Pack a value and return (digest, packed bytes)."""
+    data = pack(_canonical(value))
+    return hashlib.sha256(data).hexdigest()[:32], data
+
+
+class SaveUnavailableError(Exception):
+    """Raised when a save's manifest exists but some of its blobs expired."""
+    
+    def __init__(self, save_id: str, missing: int):
+        super().__init__(f"Save {save_id} is missing {missing} blob(s)")
+        self.save_id = save_id
+
+
+@dataclass
+class PendingSave:
+    """The items of a save prepared by SaveSlots.prepare, not yet written."""
+    session_id: str
+    save_id: str
+    metadata: Dict[str, Any]
+    manifest: Dict[str, Any]
+    blobs: Dict[str, bytes]
+    expires: int
+
+
+class SaveSlots:
+    """
+    Save slots kept in a SessionStore.
+    
+    GameEngine.handle_save prepares saves and handle_restore restores
+    them; the handler shares the session store with the engine and writes
+    the prepared saves with write_pending, so saves persist with the
+    sessions.
+    """
+    
+    # Saves listed per session; older ones drop out of the index and
+    # expire with their TTL
+    MAX_SAVES = 20
+    
+    # Saves outlive their session so a returning player can restore
+    DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+    
+    def __init__(self, store, ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        """
+        Initialize save slots.
+        
+        Args:
+            store: SessionStore holding the save items
+            ttl_seconds: Lifetime of a save after it is written
+        """
+        self.store = store
+        self.ttl_seconds = ttl_seconds
+    
+    def save(self, state: GameState, save_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Snapshot a game state into a new save slot right away.
+        
+        Args:
+            state: GameState to save
+            save_id: New save's identifier (default: derived from the
+                saved content, see prepare)
+        
+        Returns:
+            The save's metadata, as listed by list_saves
+        """
+        pending = self.prepare(state, save_id)
+        self.write(pending)
+        return pending.metadata
+    
+    def prepare(self, state: GameState, save_id: Optional[str] = None) -> PendingSave:
+        """
+        Snapshot a game state into save items without writing them.
+        
+        Without a save_id, the ID is derived from a hash of the saved
+        content, so replaying a SAVE of the same state yields the same ID.
+        
+        Args:
+            state: GameState to save
+            save_id: New save's identifier
+        
+        Returns:
+            PendingSave to pass to write
+        """
+        session_id = state.session_id
+        expires = int(time.time()) + self.ttl_seconds
+        data = state.to_dict()
+        for name in SESSION_FIELDS:
+            data.pop(name)
+        data['rooms_visited'] = sorted(data['rooms_visited'])
+        
+        blobs = {}
+        manifest = {}
+        for name in WHOLE_BLOB_FIELDS:
+            digest, blob = _blob(data.pop(name))
+            blobs[digest] = blob
+            manifest[name] = digest
+        for name in PER_ENTRY_BLOB_FIELDS:
+            manifest[name] = {}
+            for key, value in data.pop(name).items():
+                digest, blob = _blob(value)
+                blobs[digest] = blob
+                manifest[name][key] = digest
+        packed_fields = pack(_canonical(data))
+        if save_id is None:
+            save_id = hashlib.sha256(packed_fields + pack(_canonical(manifest))).hexdigest()[:8]
+        
+        metadata = {
+            'save_id': save_id,
+            'saved_at': datetime.now(UTC).isoformat(),
+            'current_room': state.current_room,
+            'score': state.score,
+            'moves': state.moves,
+        }
+        item = {**metadata, 'fields': packed_fields, 'blobs': manifest, 'expires': expires}
+        return PendingSave(session_id, save_id, metadata, item, blobs, expires)
+    
+    def write(self, pending: PendingSave) -> None:
+        """
+        Write a prepared save's blobs, manifest and index entry.
+        
+        Args:
+            pending: PendingSave from prepare
+        """
+        self._write_blobs(pending.session_id, pending.blobs, pending.expires)
+        self.store.save(self._save_key(pending.session_id, pending.save_id), pending.manifest)
+        self._add_to_index(pending.session_id, pending.metadata, pending.expires)
+    
+    def write_pending(self, state: GameState) -> None:
+        """
+        Write the saves queued on a state, once its session save committed.
+        
+        Args:
+            state: GameState whose pending_saves to write and clear
+        """
+        for pending in state.pending_saves:
+            self.write(pending)
+        state.pending_saves.clear()
+    
+    def restore(self, state: GameState, save_id: str) -> bool:
+        """
+        Replace a live game state with a saved one.
+        
+        Session fields (ID, creation time, TTL, version, cached command
+        responses) keep their live values, so the restored game is saved
+        like any other change. Saves still pending on the state are found
+        too.
+        
+        Args:
+            state: GameState to overwrite
+            save_id: Save to restore
+        
+        Returns:
+            True if restored, False if no such save exists
+        
+        Raises:
+            SaveUnavailableError: If the save is listed but its snapshot
+                can no longer be read in full
+        """
+        session_id = state.session_id
+        pending = next((save for save in state.pending_saves if save.save_id == save_id), None)
+        if pending is not None:
+            manifest = pending.manifest
+            blobs = {digest: unpack(data) for digest, data in pending.blobs.items()}
+        else:
+            manifest = self.store.load(self._save_key(session_id, save_id))
+            if manifest is None:
+                return False
+            keys = [self._blob_key(session_id, digest) for digest in self._digests(manifest['blobs'])]
+            blobs = {
+                key.rsplit('#', 1)[1]: unpack(item['data']) for key, item in self.store.batch_get(keys).items()
+            }
+        
+        digests = manifest['blobs']
+        missing = [digest for digest in self._digests(digests) if digest not in blobs]
+        if missing:
+            raise SaveUnavailableError(save_id, len(missing))
+        
+        def blob(digest):
+            return blobs[digest]
+        
+        data = unpack(manifest['fields'])
+        for name in WHOLE_BLOB_FIELDS:
+            data[name] = blob(digests[name])
+        for name in PER_ENTRY_BLOB_FIELDS:
+            data[name] = {key: blob(digest) for key, digest in digests.get(name, {}).items()}
+        
+        saved = GameState.from_dict({**data, 'session_id': session_id})
+        for name in PERSISTED_FIELDS:
+            if name not in SESSION_FIELDS:
+                setattr(state, name, getattr(saved, name))
+        state._touch()
+        return True
+    
+    def list_saves(self, session_id: str) -> List[Dict[str, Any]]:
+        """
+        List a session's saves, newest first, from the index item alone.
+        
+        Args:
+            session_id: The session identifier
+        
+        Returns:
+            Save metadata dicts (save_id, saved_at, current_room, score,
+            moves)
+        """
+        index = self.store.load(self._index_key(session_id))
+        if index is None:
+            return []
+        return list(reversed(index.get('saves', [])))
+    
+    def _write_blobs(self, session_id: str, blobs: Dict[str, bytes], expires: int) -> None:
+        """
+        Store the blobs not already stored by an earlier save.
+        
+        A stored blob's TTL is raised (never lowered) to the new save's, so
+        a blob outlives every save that references it.
+        """
+        keys = {self._blob_key(session_id, digest): blob for digest, blob in blobs.items()}
+        stored = self.store.batch_get(keys)
+        for key, blob in keys.items():
+            item = stored.get(key)
+            if item is not None and item.get('expires', 0) >= expires:
+                continue
+            if item is None or not self.store.raise_expiry(key, expires):
+                self.store.save(key, {'data': blob, 'expires': expires})
+    
+    def _add_to_index(self, session_id: str, metadata: Dict[str, Any], expires: int, attempts: int = 3) -> None:
+        """Append a save to the session's index, retrying concurrent updates."""
+        key = self._index_key(session_id)
+        for attempt in range(attempts):
+            index = self.store.load(key)
+            version = index.get('version', 0) if index is not None else None
+            saves = index.get('saves', []) if index is not None else []
+            if any(save['save_id'] == metadata['save_id'] for save in saves):
+                # Already listed, e.g. by a journal replay of the same SAVE
+                return
+            saves = [*saves, metadata][-self.MAX_SAVES:]
+            try:
+                self.store.save_conditional(
+                    key,
+                    {'version': (version or 0) + 1, 'saves': saves, 'expires': expires},
+                    version
+                )
+                return
+            except SessionConflictError:
+                if attempt == attempts - 1:
+                    raise
+    
+    @staticmethod
+    def _digests(manifest: Dict[str, Any]) -> List[str]:
+        digests = [manifest[name] for name in WHOLE_BLOB_FIELDS]
+        for name in PER_ENTRY_BLOB_FIELDS:
+            digests.extend(manifest.get(name, {}).values())
+        return digests
+    
+    @staticmethod
+    def _save_key(session_id: str, save_id: str) -> str:
+        return f"{session_id}#save#{save_id}"
+    
+    @staticmethod
+    def _index_key(session_id: str) -> str:
+        return f"{session_id}#saves"
+    
+    @staticmethod
+    def _blob_key(session_id: str, digest: str) -> str:
+        return f"{session_id}#blob#{digest}"
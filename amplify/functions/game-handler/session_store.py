@@ -0,0 +1,747 @@
+"""
+Session Storage Backends for West of Haunted House
+
+SessionManager turns game states into plain session items (dicts of str,
+int, float, bool, bytes, list and dict values keyed by attribute name)
+and hands them to a SessionStore. Stores only persist items; they know
+nothing about GameState.
+
+Three backends are provided:
+- DynamoDBSessionStore: the production table, through the low-level
+  boto3 client API
+- InMemorySessionStore: a dict, for tests and single-process load tests
+- SQLiteSessionStore: a local database file in WAL mode, for CI and
+  self-hosted deployments without AWS
+
+Every item carries an integer 'version' attribute that conditional writes
+compare against. Items written before versioning have none and match
+version 0.
+
+The command journal and save slots share the table, under keys of the
+form '<session_id>#...'. Session IDs never contain '#', so scan() uses
+that to yield session items only.
+"""
+
+import copy
+import json
+import sqlite3
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+try:
+    from .attribute_codec import ItemCodec
+    from .state_codec import pack, unpack
+except ImportError:
+    # For testing when imported directly
+    from attribute_codec import ItemCodec
+    from state_codec import pack, unpack
+
+
+class SessionConflictError(Exception):
+    """Raised when a session was saved by another writer since it was loaded."""
+    
+    def __init__(self, session_id: str):
+        super().__init__(f"Session {session_id} was modified concurrently")
+        self.session_id = session_id
+
+
+def _stored_version(item: Optional[Dict[str, Any]]) -> Optional[int]:
+    """Get an item's version, 0 if it has none, or None if there is no item."""
+    if item is None:
+        return None
+    return int(item.get('version') or 0)
+
+
+def _is_session_key(key: str) -> bool:
+    """Check whether a key names a session item rather than a journal or save item."""
+    return '#' not in key
+
+
+def _version_matches(item: Optional[Dict[str, Any]], expected_version: Optional[int]) -> bool:
+    """Check the conditional-save rule: no item, or one at expected_version."""
+    if item is None:
+        return True
+    return expected_version is not None and _stored_version(item) == expected_version
+
+
+def _copy_item(value: Any) -> Any:
+    """
+    Copy an item the way DynamoDB stores it.
+    
+    Map entries set to None are dropped, as DynamoDB never stores them, so
+    every backend reads back the same item.
+    """
+    if isinstance(value, dict):
+        return {key: _copy_item(item) for key, item in value.items() if item is not None}
+    if isinstance(value, (list, tuple)):
+        return [_copy_item(item) for item in value]
+    return value
+
+
+def apply_changes(item: Dict[str, Any], changes: Dict[Tuple[str, ...], Any]) -> None:
+    """
+    Apply changed attribute paths to an item in place.
+    
+    Args:
+        item: Session item to modify
+        changes: Attribute paths (tuples of map keys) mapped to their new
+            values; None removes the attribute
+    """
+    for path, value in changes.items():
+        parent = item
+        for key in path[:-1]:
+            parent = parent.setdefault(key, {})
+        if value is None:
+            parent.pop(path[-1], None)
+        else:
+            parent[path[-1]] = _copy_item(value)
+
+
+class SessionStore:
+    """
+    Interface for session item storage.
+    
+    Subclasses implement load, save, save_conditional, delete and scan.
+    load_version, update, raise_expiry and batch_get fall back to load,
+    save and save_conditional, and are overridden where the backend can do better;
+    warm_up does nothing unless the backend has connections to open.
+    """
+    
+    def load(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Read a session item.
+        
+        Args:
+            session_id: The session identifier
+        
+        Returns:
+            The item, or None if no session is stored
+        """
+        raise NotImplementedError
+    
+    def load_version(self, session_id: str) -> Optional[int]:
+        """
+        Read only the version of a stored session, with strong consistency.
+        
+        Args:
+            session_id: The session identifier
+        
+        Returns:
+            The stored version (0 for items written before versioning),
+            or None if no session is stored
+        """
+        return _stored_version(self.load(session_id))
+    
+    def save(self, session_id: str, item: Dict[str, Any]) -> None:
+        """
+        Write a whole session item unconditionally.
+        
+        Args:
+            session_id: The session identifier
+            item: Item to store, including its 'version'
+        """
+        raise NotImplementedError
+    
+    def save_conditional(
+        self,
+        session_id: str,
+        item: Dict[str, Any],
+        expected_version: Optional[int] = None
+    ) -> None:
+        """
+        Write a whole session item if no other writer got there first.
+        
+        The write succeeds when no session is stored or, if
+        expected_version is given, when the stored one is at that version.
+        
+        Args:
+            session_id: The session identifier
+            item: Item to store, including its new 'version'
+            expected_version: Version the state was loaded at, or None for
+                a new session that must not exist yet
+        
+        Raises:
+            SessionConflictError: If the condition fails
+        """
+        raise NotImplementedError
+    
+    def update(
+        self,
+        session_id: str,
+        changes: Dict[Tuple[str, ...], Any],
+        expected_version: int
+    ) -> bool:
+        """
+        Write only changed attributes of a session stored at expected_version.
+        
+        Args:
+            session_id: The session identifier
+            changes: Attribute paths mapped to their new values; None
+                removes the attribute
+            expected_version: Version the stored item must still have
+        
+        Returns:
+            True if updated, False if the session no longer exists or was
+            saved by another writer, and must be written in full
+        """
+        item = self.load(session_id)
+        if item is None or _stored_version(item) != expected_version:
+            return False
+        apply_changes(item, changes)
+        try:
+            self.save_conditional(session_id, item, expected_version)
+        except SessionConflictError:
+            return False
+        return True
+    
+    def raise_expiry(self, session_id: str, expires: int) -> bool:
+        """
+        Raise a stored item's 'expires' to at least a time, never lowering it.
+        
+        Args:
+            session_id: The item's key
+            expires: Unix time the item must live until at least
+        
+        Returns:
+            True if the item is stored (with the raised or a later expiry),
+            False if it no longer exists
+        """
+        item = self.load(session_id)
+        if item is None:
+            return False
+        if item.get('expires', 0) < expires:
+            item['expires'] = expires
+            self.save(session_id, item)
+        return True
+    
+    def delete(self, session_id: str) -> None:
+        """
+        Delete a session item; deleting a missing session is not an error.
+        
+        Args:
+            session_id: The session identifier
+        """
+        raise NotImplementedError
+    
+    def batch_get(self, session_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Read several session items.
+        
+        Args:
+            session_ids: Session identifiers; duplicates are read once
+        
+        Returns:
+            Dict of session ID to item, without the sessions not stored
+        """
+        items = {}
+        for session_id in dict.fromkeys(session_ids):
+            item = self.load(session_id)
+            if item is not None:
+                items[session_id] = item
+        return items
+    
+    def warm_up(self) -> None:
+        """
+        Open connections and build what the first real request would need,
+        without reading or writing any stored session.
+        
+        No-op by default.
+        """
+    
+    def scan(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every stored session item, in no particular order.
+        
+        Journal, save slot and blob items are skipped.
+        
+        Yields:
+            Session items
+        """
+        raise NotImplementedError
+
+
+class InMemorySessionStore(SessionStore):
+    """Session items held in a dict; nothing survives the process."""
+    
+    def __init__(self):
+        self.items = {}
+    
+    def load(self, session_id: str) -> Optional[Dict[str, Any]]:
+        item = self.items.get(session_id)
+        return copy.deepcopy(item) if item is not None else None
+    
+    def load_version(self, session_id: str) -> Optional[int]:
+        return _stored_version(self.items.get(session_id))
+    
+    def save(self, session_id: str, item: Dict[str, Any]) -> None:
+        self.items[session_id] = _copy_item(item)
+    
+    def save_conditional(
+        self,
+        session_id: str,
+        item: Dict[str, Any],
+        expected_version: Optional[int] = None
+    ) -> None:
+        if not _version_matches(self.items.get(session_id), expected_version):
+            raise SessionConflictError(session_id)
+        self.items[session_id] = _copy_item(item)
+    
+    def update(
+        self,
+        session_id: str,
+        changes: Dict[Tuple[str, ...], Any],
+        expected_version: int
+    ) -> bool:
+        item = self.items.get(session_id)
+        if item is None or _stored_version(item) != expected_version:
+            return False
+        apply_changes(item, changes)
+        return True
+    
+    def raise_expiry(self, session_id: str, expires: int) -> bool:
+        item = self.items.get(session_id)
+        if item is None:
+            return False
+        item['expires'] = max(item.get('expires', 0), expires)
+        return True
+    
+    def delete(self, session_id: str) -> None:
+        self.items.pop(session_id, None)
+    
+    def scan(self) -> Iterator[Dict[str, Any]]:
+        for key, item in list(self.items.items()):
+            if _is_session_key(key):
+                yield copy.deepcopy(item)
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    Session items in a local SQLite database.
+    
+    The database runs in WAL mode, so readers never block the writer and
+    commits append to the log instead of rewriting pages. Items are stored
+    with the state_codec MessagePack encoding next to their version, which
+    conditional writes compare in SQL. All statements are fixed strings
+    with bound parameters, so sqlite3 compiles each once per connection
+    and reuses the prepared statement.
+    """
+    
+    SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS sessions ('
+        'session_id TEXT PRIMARY KEY, version INTEGER NOT NULL, item BLOB NOT NULL'
+        ') WITHOUT ROWID'
+    )
+    
+    SELECT_ITEM = 'SELECT item FROM sessions WHERE session_id = ?'
+    SELECT_VERSION = 'SELECT version FROM sessions WHERE session_id = ?'
+    SELECT_MANY = 'SELECT session_id, item FROM sessions WHERE session_id IN (SELECT value FROM json_each(?))'
+    SELECT_ALL = "SELECT item FROM sessions WHERE instr(session_id, '#') = 0"
+    UPSERT = 'INSERT OR REPLACE INTO sessions (session_id, version, item) VALUES (?, ?, ?)'
+    INSERT_NEW = 'INSERT OR IGNORE INTO sessions (session_id, version, item) VALUES (?, ?, ?)'
+    UPSERT_AT_VERSION = (
+        'INSERT INTO sessions (session_id, version, item) VALUES (?, ?, ?) '
+        'ON CONFLICT (session_id) DO UPDATE SET version = excluded.version, item = excluded.item '
+        'WHERE sessions.version = ?'
+    )
+    UPDATE_AT_VERSION = 'UPDATE sessions SET version = ?, item = ? WHERE session_id = ? AND version = ?'
+    DELETE = 'DELETE FROM sessions WHERE session_id = ?'
+    
+    # Lambda and most containers only allow writes under /tmp
+    DEFAULT_PATH = '/tmp/game_sessions.db'
+    
+    def __init__(self, path: str = ':memory:'):
+        """
+        Open (and create if needed) a session database.
+        
+        Args:
+            path: Database file path, or ':memory:' for a private
+                in-memory database (which cannot use WAL)
+        """
+        self.path = path
+        # Autocommit; multi-statement writes open their own transaction
+        self._connection = sqlite3.connect(path, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        # In WAL mode NORMAL only syncs at checkpoints and stays durable
+        # across application crashes
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.execute(self.SCHEMA)
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+    
+    @contextmanager
+    def _transaction(self):
+        """Run statements in one write transaction, rolled back on error."""
+        self._connection.execute('BEGIN IMMEDIATE')
+        try:
+            yield
+        except BaseException:
+            self._connection.execute('ROLLBACK')
+            raise
+        self._connection.execute('COMMIT')
+    
+    def load(self, session_id: str) -> Optional[Dict[str, Any]]:
+        row = self._connection.execute(self.SELECT_ITEM, (session_id,)).fetchone()
+        return unpack(row[0]) if row is not None else None
+    
+    def load_version(self, session_id: str) -> Optional[int]:
+        row = self._connection.execute(self.SELECT_VERSION, (session_id,)).fetchone()
+        return row[0] if row is not None else None
+    
+    def save(self, session_id: str, item: Dict[str, Any]) -> None:
+        self._connection.execute(self.UPSERT, self._row(session_id, item))
+    
+    def save_conditional(
+        self,
+        session_id: str,
+        item: Dict[str, Any],
+        expected_version: Optional[int] = None
+    ) -> None:
+        if expected_version is None:
+            cursor = self._connection.execute(self.INSERT_NEW, self._row(session_id, item))
+        else:
+            cursor = self._connection.execute(
+                self.UPSERT_AT_VERSION, self._row(session_id, item) + (expected_version,)
+            )
+        if cursor.rowcount == 0:
+            raise SessionConflictError(session_id)
+    
+    def update(
+        self,
+        session_id: str,
+        changes: Dict[Tuple[str, ...], Any],
+        expected_version: int
+    ) -> bool:
+        with self._transaction():
+            item = self.load(session_id)
+            if item is None or _stored_version(item) != expected_version:
+                return False
+            apply_changes(item, changes)
+            self._connection.execute(self.UPDATE_AT_VERSION, (
+                _stored_version(item), pack(item), session_id, expected_version
+            ))
+        return True
+    
+    def raise_expiry(self, session_id: str, expires: int) -> bool:
+        with self._transaction():
+            return super().raise_expiry(session_id, expires)
+    
+    def delete(self, session_id: str) -> None:
+        self._connection.execute(self.DELETE, (session_id,))
+    
+    def batch_get(self, session_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        # One statement for any number of IDs: they are bound as a JSON array
+        rows = self._connection.execute(self.SELECT_MANY, (json.dumps(list(session_ids)),))
+        return {session_id: unpack(item) for session_id, item in rows}
+    
+    def scan(self) -> Iterator[Dict[str, Any]]:
+        for (item,) in self._connection.execute(self.SELECT_ALL):
+            yield unpack(item)
+    
+    @staticmethod
+    def _row(session_id: str, item: Dict[str, Any]) -> Tuple[str, int, bytes]:
+        item = _copy_item(item)
+        return session_id, _stored_version(item), pack(item)
+
+
+def _is_conditional_check_failure(error: Exception) -> bool:
+    """Check whether a botocore error is a failed ConditionExpression."""
+    error_code = getattr(error, 'response', {}).get('Error', {}).get('Code')
+    return error_code == 'ConditionalCheckFailedException'
+
+
+class DynamoDBSessionStore(SessionStore):
+    """
+    Session items in a DynamoDB table keyed by sessionId.
+    
+    Uses the low-level boto3 client API; items are converted to and from
+    DynamoDB's attribute value format by an attribute_codec.ItemCodec
+    compiled from GameState's fields.
+    """
+    
+    # BatchGetItem reads at most this many keys per request
+    BATCH_GET_LIMIT = 100
+    
+    # Key read by warm_up; never written, so the read finds nothing
+    WARMUP_KEY = '__warmup__'
+    
+    # ItemCodec for GameState, shared by all stores; built on first use
+    # because state_manager imports this module
+    _codec = None
+    
+    def __init__(self, dynamodb_client, table_name: str):
+        """
+        Initialize the store.
+        
+        Args:
+            dynamodb_client: boto3 DynamoDB client
+            table_name: Name of the DynamoDB table for sessions
+        """
+        self.dynamodb = dynamodb_client
+        self.table_name = table_name
+    
+    @property
+    def codec(self) -> ItemCodec:
+        """The attribute value codec compiled from GameState's fields."""
+        if DynamoDBSessionStore._codec is None:
+            try:
+                from .state_manager import GameState
+            except ImportError:
+                from state_manager import GameState
+            DynamoDBSessionStore._codec = ItemCodec(GameState)
+        return DynamoDBSessionStore._codec
+    
+    def _key(self, session_id: str) -> Dict[str, Any]:
+        return {'sessionId': {'S': session_id}}
+    
+    def load(self, session_id: str) -> Optional[Dict[str, Any]]:
+        response = self.dynamodb.get_item(TableName=self.table_name, Key=self._key(session_id))
+        if 'Item' not in response:
+            return None
+        return self._deserialize_item(response['Item'])
+    
+    def load_version(self, session_id: str) -> Optional[int]:
+        response = self.dynamodb.get_item(
+            TableName=self.table_name,
+            Key=self._key(session_id),
+            ProjectionExpression='#v',
+            ExpressionAttributeNames={'#v': 'version'},
+            ConsistentRead=True
+        )
+        if 'Item' not in response:
+            return None
+        return int(response['Item'].get('version', {}).get('N', 0))
+    
+    def save(self, session_id: str, item: Dict[str, Any]) -> None:
+        self._put_item(session_id, item, None)
+    
+    def save_conditional(
+        self,
+        session_id: str,
+        item: Dict[str, Any],
+        expected_version: Optional[int] = None
+    ) -> None:
+        if expected_version is None:
+            condition = ('attribute_not_exists(sessionId)', {}, {})
+        else:
+            expression, names, values = self._version_condition(expected_version)
+            condition = (f"attribute_not_exists(sessionId) OR {expression}", names, values)
+        self._put_item(session_id, item, condition)
+    
+    def _put_item(
+        self,
+        session_id: str,
+        item: Dict[str, Any],
+        condition: Optional[Tuple[str, Dict[str, str], Dict[str, Any]]]
+    ) -> None:
+        """
+        Write a whole item with PutItem.
+        
+        Args:
+            session_id: The session identifier
+            item: Item to store
+            condition: Optional (ConditionExpression, names, values) the
+                stored item must satisfy
+        
+        Raises:
+            SessionConflictError: If the condition fails
+        """
+        request = {
+            'TableName': self.table_name,
+            'Item': self._serialize_item({**item, 'sessionId': session_id}),
+        }
+        if condition is not None:
+            expression, names, values = condition
+            request['ConditionExpression'] = expression
+            if names:
+                request['ExpressionAttributeNames'] = names
+            if values:
+                request['ExpressionAttributeValues'] = values
+        
+        try:
+            self.dynamodb.put_item(**request)
+        except Exception as e:
+            if _is_conditional_check_failure(e):
+                raise SessionConflictError(session_id)
+            raise
+    
+    def update(
+        self,
+        session_id: str,
+        changes: Dict[Tuple[str, ...], Any],
+        expected_version: int
+    ) -> bool:
+        if not changes:
+            return True
+        
+        update_expression, names, values = self._build_update_expression(changes)
+        condition, condition_names, condition_values = self._version_condition(expected_version)
+        request = {
+            'TableName': self.table_name,
+            'Key': self._key(session_id),
+            'UpdateExpression': update_expression,
+            'ConditionExpression': f"attribute_exists(sessionId) AND {condition}",
+            'ExpressionAttributeNames': {**names, **condition_names},
+        }
+        values = {**values, **condition_values}
+        if values:
+            request['ExpressionAttributeValues'] = values
+        
+        try:
+            self.dynamodb.update_item(**request)
+        except Exception as e:
+            if _is_conditional_check_failure(e):
+                return False
+            raise
+        return True
+    
+    def raise_expiry(self, session_id: str, expires: int) -> bool:
+        try:
+            self.dynamodb.update_item(
+                TableName=self.table_name,
+                Key=self._key(session_id),
+                UpdateExpression='SET #expires = :expires',
+                ConditionExpression=(
+                    'attribute_exists(sessionId) AND (attribute_not_exists(#expires) OR #expires < :expires)'
+                ),
+                ExpressionAttributeNames={'#expires': 'expires'},
+                ExpressionAttributeValues={':expires': {'N': str(expires)}}
+            )
+        except Exception as e:
+            if not _is_conditional_check_failure(e):
+                raise
+            # Either the item is gone or it already lives long enough
+            return self.load_version(session_id) is not None
+        return True
+    
+    def delete(self, session_id: str) -> None:
+        self.dynamodb.delete_item(TableName=self.table_name, Key=self._key(session_id))
+    
+    def batch_get(self, session_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        keys = [self._key(session_id) for session_id in dict.fromkeys(session_ids)]
+        items = {}
+        for start in range(0, len(keys), self.BATCH_GET_LIMIT):
+            request = {self.table_name: {'Keys': keys[start:start + self.BATCH_GET_LIMIT]}}
+            # Throttled keys come back unprocessed and are requested again
+            while request:
+                response = self.dynamodb.batch_get_item(RequestItems=request)
+                for raw in response.get('Responses', {}).get(self.table_name, []):
+                    item = self._deserialize_item(raw)
+                    items[item['sessionId']] = item
+                request = response.get('UnprocessedKeys')
+        return items
+    
+    def warm_up(self) -> None:
+        # Build the codec and open the client's HTTPS connection pool with
+        # a key-only read of a key no session uses
+        self.codec
+        self.dynamodb.get_item(
+            TableName=self.table_name,
+            Key=self._key(self.WARMUP_KEY),
+            ProjectionExpression='sessionId'
+        )
+    
+    def scan(self) -> Iterator[Dict[str, Any]]:
+        request = {'TableName': self.table_name}
+        while True:
+            response = self.dynamodb.scan(**request)
+            for raw in response.get('Items', []):
+                if _is_session_key(raw['sessionId']['S']):
+                    yield self._deserialize_item(raw)
+            if 'LastEvaluatedKey' not in response:
+                return
+            request['ExclusiveStartKey'] = response['LastEvaluatedKey']
+    
+    def _version_condition(self, expected_version: int) -> Tuple[str, Dict[str, str], Dict[str, Any]]:
+        """
+        Build a condition matching an item stored at expected_version.
+        
+        Items written before versioning have no version attribute and
+        match version 0.
+        
+        Args:
+            expected_version: Version the state was loaded at
+        
+        Returns:
+            Tuple of (ConditionExpression, ExpressionAttributeNames,
+            ExpressionAttributeValues)
+        """
+        if expected_version:
+            return '#ver = :expected', {'#ver': 'version'}, {':expected': {'N': str(expected_version)}}
+        return 'attribute_not_exists(#ver)', {'#ver': 'version'}, {}
+    
+    def _build_update_expression(
+        self,
+        changes: Dict[Tuple[str, ...], Any]
+    ) -> Tuple[str, Dict[str, str], Dict[str, Any]]:
+        """
+        Build an UpdateItem SET/REMOVE expression for changed paths.
+        
+        Every path segment goes through ExpressionAttributeNames, so flag
+        and object IDs never collide with reserved words. Values are
+        serialized exactly as a full put would store them; None removes
+        the attribute.
+        
+        Args:
+            changes: Attribute paths mapped to their new values
+        
+        Returns:
+            Tuple of (UpdateExpression, ExpressionAttributeNames,
+            ExpressionAttributeValues)
+        """
+        names = {}
+        aliases = {}
+        values = {}
+        set_clauses = []
+        remove_clauses = []
+        
+        for path, value in changes.items():
+            segments = []
+            for part in path:
+                alias = aliases.get(part)
+                if alias is None:
+                    alias = f"#n{len(aliases)}"
+                    aliases[part] = alias
+                    names[alias] = part
+                segments.append(alias)
+            attribute_path = '.'.join(segments)
+            
+            serialized = self.codec.encode_path(path, value)
+            if serialized is None:
+                remove_clauses.append(attribute_path)
+            else:
+                placeholder = f":v{len(values)}"
+                values[placeholder] = serialized
+                set_clauses.append(f"{attribute_path} = {placeholder}")
+        
+        clauses = []
+        if set_clauses:
+            clauses.append("SET " + ", ".join(set_clauses))
+        if remove_clauses:
+            clauses.append("REMOVE " + ", ".join(remove_clauses))
+        return " ".join(clauses), names, values
+    
+    def _serialize_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Serialize Python dictionary to DynamoDB format.
+        
+        Args:
+            item: Python dictionary to serialize
+        
+        Returns:
+            DynamoDB-formatted dictionary
+        """
+        return self.codec.encode_item(item)
+    
+    def _deserialize_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Deserialize DynamoDB item to Python dictionary.
+        
+        Args:
+            item: DynamoDB-formatted item
+        
+        Returns:
+            Python dictionary
+        """
+        return self.codec.decode_item(item)
@@ -0,0 +1,228 @@
+"""
+Compact Session Storage Codec for West of Haunted House
+
+Packs the bulkiest parts of a game state (flags, object states, visited
+rooms and inventory) into one zlib-compressed binary attribute instead of
+nested DynamoDB maps with a type-tagged attribute per key.
+
+The payload is encoded with a subset of MessagePack (nil, bool, int,
+float, str, bin, array, map), so any MessagePack library can read it. Blobs
+start with a one-byte format version; decode_state rejects versions it
+does not know.
+"""
+
+import struct
+import zlib
+from typing import Any, Dict
+
+
+# DynamoDB attribute holding the packed blob
+PACKED_STATE_ATTRIBUTE = 'packedState'
+
+# GameState fields stored in the packed blob instead of their own attributes
+PACKED_FIELDS = ('flags', 'object_states', 'rooms_visited', 'inventory')
+
+STATE_CODEC_FORMAT_VERSION = 1
+
+# Level 6 is zlib's default; higher levels gain a few bytes at twice the CPU
+COMPRESSION_LEVEL = 6
+
+
+def encode_state(fields: Dict[str, Any]) -> bytes:
+    """
+    Pack a game state's PACKED_FIELDS into a versioned, compressed blob.
+    
+    Args:
+        fields: Stored values of PACKED_FIELDS, keyed by field name
+    
+    Returns:
+        Format version byte followed by the zlib-compressed payload
+    """
+    payload = {name: fields[name] for name in PACKED_FIELDS}
+    payload['rooms_visited'] = sorted(payload['rooms_visited'])
+    return bytes([STATE_CODEC_FORMAT_VERSION]) + zlib.compress(pack(payload), COMPRESSION_LEVEL)
+
+
+def decode_state(blob: bytes) -> Dict[str, Any]:
+    """
+    Unpack a blob written by encode_state.
+    
+    Args:
+        blob: Packed state attribute value
+    
+    Returns:
+        Dict of PACKED_FIELDS values, with rooms_visited as a list
+    
+    Raises:
+        ValueError: If the blob is empty or uses an unknown format version
+    """
+    if not blob:
+        raise ValueError("Empty packed state")
+    version = blob[0]
+    if version != STATE_CODEC_FORMAT_VERSION:
+        raise ValueError(f"Unsupported packed state format version: {version}")
+    return unpack(zlib.decompress(blob[1:]))
+
+
+def pack(value: Any) -> bytes:
+    """
+    Encode a value with the MessagePack subset used for session state.
+    
+    Args:
+        value: None, bool, int, float, str, bytes, list/tuple/set or dict
+            with string keys, nested arbitrarily
+    
+    Returns:
+        Encoded bytes
+    
+    Raises:
+        TypeError: If the value contains an unsupported type
+    """
+    out = bytearray()
+    _pack_into(out, value)
+    return bytes(out)
+
+
+def _pack_into(out: bytearray, value: Any) -> None:
+    if value is None:
+        out.append(0xc0)
+    elif value is True:
+        out.append(0xc3)
+    elif value is False:
+        out.append(0xc2)
+    elif isinstance(value, int):
+        if 0 <= value < 0x80 or -32 <= value < 0:
+            out += struct.pack('>b', value) if value < 0 else bytes([value])
+        else:
+            out += b'\xd3' + struct.pack('>q', value)
+    elif isinstance(value, float):
+        out += b'\xcb' + struct.pack('>d', value)
+    elif isinstance(value, str):
+        data = value.encode('utf-8')
+        _pack_header(out, len(data), 0xa0, 32, b'\xd9', b'\xda', b'\xdb')
+        out += data
+    elif isinstance(value, bytes):
+        _pack_header(out, len(value), 0, 0, b'\xc4', b'\xc5', b'\xc6')
+        out += value
+    elif isinstance(value, (list, tuple, set)):
+        _pack_header(out, len(value), 0x90, 16, None, b'\xdc', b'\xdd')
+        for item in value:
+            _pack_into(out, item)
+    elif isinstance(value, dict):
+        _pack_header(out, len(value), 0x80, 16, None, b'\xde', b'\xdf')
+        for key, item in value.items():
+            _pack_into(out, key)
+            _pack_into(out, item)
+    else:
+        raise TypeError(f"Cannot pack {type(value).__name__}")
+
+
+def _pack_header(out: bytearray, length: int, fix_base: int, fix_limit: int,
+                 marker8, marker16: bytes, marker32: bytes) -> None:
+    """Write a str/array/map length header in its smallest form."""
+    if length < fix_limit:
+        out.append(fix_base | length)
+    elif marker8 is not None and length < 0x100:
+        out += marker8 + bytes([length])
+    elif length < 0x10000:
+        out += marker16 + struct.pack('>H', length)
+    else:
+        out += marker32 + struct.pack('>I', length)
+
+
+def unpack(data: bytes) -> Any:
+    """
+    Decode bytes written by pack.
+    
+    Args:
+        data: Encoded bytes
+    
+    Returns:
+        Decoded value; arrays come back as lists
+    
+    Raises:
+        ValueError: If the data is truncated, has trailing bytes or uses an
+            unsupported type
+    """
+    try:
+        value, offset = _unpack_from(data, 0)
+    except (IndexError, struct.error):
+        raise ValueError("Truncated packed data")
+    if offset != len(data):
+        raise ValueError("Trailing bytes after packed data")
+    return value
+
+
+def _unpack_from(data: bytes, offset: int):
+    """Decode one value at offset; return (value, next offset)."""
+    marker = data[offset]
+    offset += 1
+    if marker < 0x80:
+        return marker, offset
+    if marker >= 0xe0:
+        return marker - 0x100, offset
+    if 0xa0 <= marker <= 0xbf:
+        return _unpack_str(data, offset, marker & 0x1f)
+    if 0x90 <= marker <= 0x9f:
+        return _unpack_array(data, offset, marker & 0x0f)
+    if 0x80 <= marker <= 0x8f:
+        return _unpack_map(data, offset, marker & 0x0f)
+    if marker == 0xc0:
+        return None, offset
+    if marker == 0xc2:
+        return False, offset
+    if marker == 0xc3:
+        return True, offset
+    if marker == 0xd3:
+        return struct.unpack_from('>q', data, offset)[0], offset + 8
+    if marker == 0xcb:
+        return struct.unpack_from('>d', data, offset)[0], offset + 8
+    if marker == 0xd9:
+        return _unpack_str(data, offset + 1, data[offset])
+    if marker == 0xc4:
+        return _unpack_bin(data, offset + 1, data[offset])
+    if marker in (0xc5, 0xda, 0xdc, 0xde):
+        length = struct.unpack_from('>H', data, offset)[0]
+        offset += 2
+    elif marker in (0xc6, 0xdb, 0xdd, 0xdf):
+        length = struct.unpack_from('>I', data, offset)[0]
+        offset += 4
+    else:
+        raise ValueError(f"Unsupported packed type marker: 0x{marker:02x}")
+    if marker in (0xc5, 0xc6):
+        return _unpack_bin(data, offset, length)
+    if marker in (0xda, 0xdb):
+        return _unpack_str(data, offset, length)
+    if marker in (0xdc, 0xdd):
+        return _unpack_array(data, offset, length)
+    return _unpack_map(data, offset, length)
+
+
+def _unpack_str(data: bytes, offset: int, length: int):
+    end = offset + length
+    if end > len(data):
+        raise ValueError("Truncated packed data")
+    return data[offset:end].decode('utf-8'), end
+
+
+def _unpack_bin(data: bytes, offset: int, length: int):
+    end = offset + length
+    if end > len(data):
+        raise ValueError("Truncated packed data")
+    return bytes(data[offset:end]), end
+
+
+def _unpack_array(data: bytes, offset: int, length: int):
+    items = []
+    for _ in range(length):
+        item, offset = _unpack_from(data, offset)
+        items.append(item)
+    return items, offset
+
+
+def _unpack_map(data: bytes, offset: int, length: int):
+    result = {}
+    for _ in range(length):
+        key, offset = _unpack_from(data, offset)
+        result[key], offset = _unpack_from(data, offset)
+    return result, offset
@@ -6,12 +6,46 @@ and statistics. It provides serialization/deserialization for DynamoDB storage
 and state manipulation methods.
 """
 
+import copy
 import json
+import sys
+import time
 import uuid
-from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Set, Union, Any, Optional
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields
+from typing import Dict, List, Set, Tuple, Union, Any, Optional
 from datetime import datetime, timedelta, UTC
 
+try:
+    from .command_journal import JournalCursor, journal_key
+    from .request_log import logger
+    from .session_store import DynamoDBSessionStore, SessionConflictError, SessionStore
+    from .state_codec import PACKED_FIELDS, PACKED_STATE_ATTRIBUTE, decode_state, encode_state
+except ImportError:
+    # For testing when imported directly
+    from command_journal import JournalCursor, journal_key
+    from request_log import logger
+    from session_store import DynamoDBSessionStore, SessionConflictError, SessionStore
+    from state_codec import PACKED_FIELDS, PACKED_STATE_ATTRIBUTE, decode_state, encode_state
+
+
+def _transient(default: Any = None, default_factory: Optional[Any] = None):
+    """
+    Declare a per-instance GameState attribute that is never persisted.
+    
+    It is left out of __init__, repr, equality and to_dict, and the stores
+    skip it (see is_persisted).
+    """
+    options = dict(init=False, repr=False, compare=False, metadata={'persisted': False})
+    if default_factory is not None:
+        return field(default_factory=default_factory, **options)
+    return field(default=default, **options)
+
+
+def is_persisted(dataclass_field) -> bool:
+    """Whether a dataclass field is stored, i.e. not declared with _transient."""
+    return dataclass_field.metadata.get('persisted', True)
+
 
 @dataclass
 class GameState:
@@ -39,6 +73,11 @@ class GameState:
     # Rooms visited tracking
     rooms_visited: Set[str] = field(default_factory=set)
     
+    # Room contents overlay: per-room deltas from the pristine world data,
+    # e.g. {'kitchen': {'added': ['lamp'], 'removed': ['sack']}}.
+    # Rooms whose contents never changed are not stored.
+    room_items_overlay: Dict[str, Dict[str, List[str]]] = field(default_factory=dict)
+    
     # Turn counter
     turn_count: int = 0
     
@@ -60,11 +99,64 @@ class GameState:
     # Disambiguation context
     disambiguation_context: Optional[Dict[str, Any]] = None  # Tracks ambiguous commands
     
+    # Responses to the last few client command IDs, so a retried command
+    # is answered without running again:
+    # {command_id: {'seq': 3, 'response': '<JSON list of the turn's messages>'}}
+    command_responses: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    
     # Session metadata
     created_at: Optional[str] = None
     last_accessed: Optional[str] = None
     expires: Optional[int] = None  # Unix timestamp for DynamoDB TTL
     
+    # Persisted write counter, bumped by SessionManager on every save so a
+    # cached copy can tell whether another container advanced the session
+    version: int = 0
+    
+    # In-memory mutation counter, bumped by every mutator below. Not
+    # persisted; callers compare it to tell whether state changed since
+    # they last looked (see GameEngine.object_scope). It is the state's
+    # only clock between saves: mutators never read the wall clock, and
+    # SessionManager.save_session stamps last_accessed/expires once.
+    revision: int = _transient(0)
+    
+    # Snapshot of the persisted values, taken by mark_clean after each
+    # load or save. None until the state has been stored once.
+    _clean: Optional[Dict[str, Any]] = _transient()
+    
+    # World defaults (StateDefaults) that flag and object state reads fall
+    # back to; stored sessions omit entries equal to them. Not persisted.
+    defaults: Optional['StateDefaults'] = _transient()
+    
+    # Whether the stored item keeps PACKED_FIELDS in one packed attribute
+    # (see state_codec). Set by SessionManager; not persisted.
+    _packed: bool = _transient(False)
+    
+    # Where the state stands relative to its stored snapshot when
+    # SessionManager journals commands (command_journal.JournalCursor).
+    # Not persisted.
+    _journal: Optional[JournalCursor] = _transient()
+    
+    # Saves made by SAVE this turn (save_slots.PendingSave), written by the
+    # handler once the session save commits so a retried or replayed
+    # command writes nothing. Not persisted.
+    pending_saves: List[Any] = _transient(default_factory=list)
+    
+    # (command text, RNG seed) pairs executed since the last load or save,
+    # for the command journal. Not persisted.
+    command_log: List[Tuple[str, int]] = _transient(default_factory=list)
+    
+    # Map fields diffed entry by entry, so one changed flag is written as
+    # flags.<name> instead of rewriting the whole map
+    NESTED_FIELDS = ('flags', 'object_states', 'room_items_overlay', 'command_responses')
+    
+    # Command responses kept in command_responses
+    MAX_COMMAND_RESPONSES = 5
+    
+    # Session metadata refreshed on every save; changes to these alone do
+    # not make the state worth writing
+    VOLATILE_FIELDS = ('last_accessed', 'expires')
+    
     def __post_init__(self):
         """Initialize timestamps if not provided."""
         if self.created_at is None:
@@ -72,6 +164,10 @@ class GameState:
         if self.last_accessed is None:
             self.last_accessed = datetime.now(UTC).isoformat()
     
+    def _touch(self) -> None:
+        """Record a mutation by bumping the revision."""
+        self.revision += 1
+    
     def move_to_room(self, room_id: str) -> None:
         """
         Move player to a new room and track visited rooms.
@@ -81,7 +177,7 @@ class GameState:
         """
         self.current_room = room_id
         self.rooms_visited.add(room_id)
-        self.last_accessed = datetime.now(UTC).isoformat()
+        self._touch()
     
     def add_to_inventory(self, object_id: str) -> bool:
         """
@@ -96,7 +192,7 @@ class GameState:
         if object_id in self.inventory:
             return False
         self.inventory.append(object_id)
-        self.last_accessed = datetime.now(UTC).isoformat()
+        self._touch()
         return True
     
     def remove_from_inventory(self, object_id: str) -> bool:
@@ -112,7 +208,7 @@ class GameState:
         if object_id not in self.inventory:
             return False
         self.inventory.remove(object_id)
-        self.last_accessed = datetime.now(UTC).isoformat()
+        self._touch()
         return True
     
     def set_flag(self, flag_name: str, value: Union[bool, int]) -> None:
@@ -124,7 +220,7 @@ class GameState:
             value: The new flag value (boolean or integer)
         """
         self.flags[flag_name] = value
-        self.last_accessed = datetime.now(UTC).isoformat()
+        self._touch()
     
     def get_flag(self, flag_name: str, default: Union[bool, int] = False) -> Union[bool, int]:
         """
@@ -135,9 +231,13 @@ class GameState:
             default: Default value if flag doesn't exist
             
         Returns:
-            The flag value or default if not set
+            The flag value, else its world default, else default
         """
-        return self.flags.get(flag_name, default)
+        if flag_name in self.flags:
+            return self.flags[flag_name]
+        if self.defaults is not None and flag_name in self.defaults.flags:
+            return self.defaults.flags[flag_name]
+        return default
     
     def set_object_state(self, object_id: str, state_key: str, value: Any) -> None:
         """
@@ -151,7 +251,7 @@ class GameState:
         if object_id not in self.object_states:
             self.object_states[object_id] = {}
         self.object_states[object_id][state_key] = value
-        self.last_accessed = datetime.now(UTC).isoformat()
+        self._touch()
     
     def get_object_state(self, object_id: str, state_key: str, default: Any = None) -> Any:
         """
@@ -163,19 +263,112 @@ class GameState:
             default: Default value if not set
             
         Returns:
-            The state value or default
+            The state value, else its world default, else default
+        """
+        values = self.object_states.get(object_id)
+        if values and state_key in values:
+            return values[state_key]
+        if self.defaults is not None:
+            values = self.defaults.object_states.get(object_id)
+            if values and state_key in values:
+                return values[state_key]
+        return default
+    
+    def get_room_items(self, room_id: str, pristine_items: List[str]) -> List[str]:
+        """
+        Get a room's contents as seen by this session.
+        
+        Merges the room's pristine items with this session's overlay.
+        When the room has no overlay the pristine list itself is returned,
+        so callers must treat the result as read-only and use
+        add_room_item/remove_room_item to change it.
+        
+        Args:
+            room_id: The room identifier
+            pristine_items: The room's items from world data
+            
+        Returns:
+            List of object IDs currently in the room
+        """
+        delta = self.room_items_overlay.get(room_id)
+        if not delta:
+            return pristine_items
+        
+        removed = delta.get('removed')
+        items = [item for item in pristine_items if item not in removed] if removed else list(pristine_items)
+        items.extend(delta.get('added', ()))
+        return items
+    
+    def add_room_item(self, room_id: str, pristine_items: List[str], object_id: str) -> bool:
+        """
+        Place an object in a room for this session.
+        
+        Args:
+            room_id: The room identifier
+            pristine_items: The room's items from world data
+            object_id: The object identifier to add
+            
+        Returns:
+            True if added, False if the object was already in the room
+        """
+        if object_id in self.get_room_items(room_id, pristine_items):
+            return False
+        
+        delta = self.room_items_overlay.setdefault(room_id, {})
+        removed = delta.get('removed', [])
+        if object_id in removed:
+            # Returning a pristine item just cancels its removal
+            removed.remove(object_id)
+        else:
+            delta.setdefault('added', []).append(object_id)
+        self._prune_room_overlay(room_id)
+        self._touch()
+        return True
+    
+    def remove_room_item(self, room_id: str, pristine_items: List[str], object_id: str) -> bool:
         """
-        return self.object_states.get(object_id, {}).get(state_key, default)
+        Remove an object from a room for this session.
+        
+        Args:
+            room_id: The room identifier
+            pristine_items: The room's items from world data
+            object_id: The object identifier to remove
+            
+        Returns:
+            True if removed, False if the object was not in the room
+        """
+        if object_id not in self.get_room_items(room_id, pristine_items):
+            return False
+        
+        delta = self.room_items_overlay.setdefault(room_id, {})
+        added = delta.get('added', [])
+        if object_id in added:
+            added.remove(object_id)
+        else:
+            delta.setdefault('removed', []).append(object_id)
+        self._prune_room_overlay(room_id)
+        self._touch()
+        return True
+    
+    def _prune_room_overlay(self, room_id: str) -> None:
+        """Drop empty delta lists so unchanged rooms are not stored."""
+        delta = self.room_items_overlay.get(room_id)
+        if delta is None:
+            return
+        for key in [key for key, items in delta.items() if not items]:
+            del delta[key]
+        if not delta:
+            del self.room_items_overlay[room_id]
     
     def increment_turn(self) -> None:
         """
         Advance the turn counter and trigger turn-based effects.
         
-        Updates moves counter, turn count, and last accessed timestamp.
+        Updates the moves counter and turn count.
         """
         self.turn_count += 1
         self.moves += 1
-        self.last_accessed = datetime.now(UTC).isoformat()
+        self._touch()
     
     def calculate_score(self) -> int:
         """
@@ -195,7 +388,7 @@ class GameState:
         Returns:
             Dictionary representation of game state
         """
-        state_dict = asdict(self)
+        state_dict = {name: copy.deepcopy(getattr(self, name)) for name in PERSISTED_FIELDS}
         # Convert set to list for JSON serialization
         state_dict['rooms_visited'] = list(self.rooms_visited)
         return state_dict
@@ -221,6 +414,7 @@ class GameState:
             'currentRoom': 'current_room',
             'currentVehicle': 'current_vehicle',
             'roomsVisited': 'rooms_visited',
+            'roomItemsOverlay': 'room_items_overlay',
             'turnCount': 'turn_count',
             'bloodMoonActive': 'blood_moon_active',
             'soulsCollected': 'souls_collected',
@@ -249,6 +443,14 @@ class GameState:
         if 'rooms_visited' in mapped_data and isinstance(mapped_data['rooms_visited'], list):
             mapped_data['rooms_visited'] = set(mapped_data['rooms_visited'])
         
+        # Intern IDs so they share identity with the interned world IDs
+        # (WorldData._intern_ids) and compare without reading characters
+        if isinstance(mapped_data.get('current_room'), str):
+            mapped_data['current_room'] = sys.intern(mapped_data['current_room'])
+        for name, container in (('inventory', list), ('rooms_visited', set)):
+            if isinstance(mapped_data.get(name), container):
+                mapped_data[name] = container(sys.intern(item) for item in mapped_data[name])
+        
         return cls(**mapped_data)
     
     def to_json(self) -> str:
@@ -314,6 +516,134 @@ class GameState:
             expires=expires
         )
     
+    def mark_clean(self) -> None:
+        """
+        Record the current values as persisted.
+        
+        SessionManager calls this after loading or saving; get_changes then
+        reports everything modified since.
+        """
+        self._clean = {
+            name: copy.deepcopy(value) if isinstance(value, (dict, list, set)) else value
+            for name, value in self.__dict__.items()
+            if name in PERSISTED_FIELDS
+        }
+        self.command_log.clear()
+    
+    def record_command(self, command_text: str, seed: int) -> None:
+        """
+        Note a command executed since the last load or save.
+        
+        Args:
+            command_text: Raw command string
+            seed: Seed the global RNG was set to before executing it
+        """
+        self.command_log.append((command_text, seed))
+    
+    def get_command_response(self, command_id: str) -> Optional[str]:
+        """
+        Get the response remembered for a client command ID.
+        
+        Args:
+            command_id: Client-supplied command identifier
+            
+        Returns:
+            The serialized response record, or None if the command ID is
+            not one of the last MAX_COMMAND_RESPONSES remembered
+        """
+        entry = self.command_responses.get(command_id)
+        return entry['response'] if entry is not None else None
+    
+    def remember_command_response(self, command_id: str, response: str) -> None:
+        """
+        Remember the response to a client command ID.
+        
+        Only the newest MAX_COMMAND_RESPONSES are kept. Entries carry a
+        sequence number because stored maps do not keep insertion order.
+        
+        Args:
+            command_id: Client-supplied command identifier
+            response: Serialized response record; the handler stores only
+                what it cannot rebuild from the saved state
+        """
+        entries = self.command_responses
+        seq = max((entry['seq'] for entry in entries.values()), default=0) + 1
+        entries[command_id] = {'seq': seq, 'response': response}
+        while len(entries) > self.MAX_COMMAND_RESPONSES:
+            del entries[min(entries, key=lambda key: entries[key]['seq'])]
+        self._touch()
+    
+    def revert_changes(self) -> None:
+        """Restore the values recorded by the last mark_clean."""
+        for name, value in self._clean.items():
+            setattr(self, name, copy.deepcopy(value) if isinstance(value, (dict, list, set)) else value)
+        self._touch()
+    
+    def apply_changes(self, changes: Dict[Tuple[str, ...], Any]) -> None:
+        """
+        Apply changed field paths, as reported by get_changes.
+        
+        Args:
+            changes: Field paths mapped to their new values; None removes
+                a nested entry
+        """
+        for path, value in changes.items():
+            name = path[0]
+            if len(path) == 1:
+                if name == 'rooms_visited':
+                    value = set(value)
+                setattr(self, name, copy.deepcopy(value))
+            elif value is None:
+                getattr(self, name).pop(path[1], None)
+            else:
+                getattr(self, name)[path[1]] = copy.deepcopy(value)
+        self._touch()
+    
+    def get_changes(self) -> Optional[Dict[Tuple[str, ...], Any]]:
+        """
+        Get the persisted fields changed since the last mark_clean.
+        
+        Fields are compared whole, except the maps in NESTED_FIELDS, which
+        are compared entry by entry once they exist in storage.
+        
+        Returns:
+            Dict mapping attribute paths, e.g. ('sanity',) or
+            ('flags', 'lamp_on'), to their new values, where None means the
+            attribute is removed. None if the state has never been
+            persisted and must be written in full.
+        """
+        if self._clean is None:
+            return None
+        
+        changes = {}
+        for name in PERSISTED_FIELDS:
+            old = self._clean.get(name)
+            new = getattr(self, name)
+            if _same_value(old, new):
+                continue
+            if name in self.NESTED_FIELDS and old and isinstance(new, dict):
+                for key in list(old) + [key for key in new if key not in old]:
+                    if not _same_value(old.get(key), new.get(key)):
+                        changes[(name, key)] = new.get(key)
+            elif isinstance(new, set):
+                changes[(name,)] = list(new)
+            else:
+                changes[(name,)] = new
+        return changes
+    
+    def has_changes(self) -> bool:
+        """
+        Check whether game data changed since the last load or save.
+        
+        Returns:
+            True if any persisted field other than VOLATILE_FIELDS changed,
+            or if the state has never been persisted
+        """
+        changes = self.get_changes()
+        if changes is None:
+            return True
+        return any(path[0] not in self.VOLATILE_FIELDS for path in changes)
+    
     def update_ttl(self, hours: int = 1) -> None:
         """
         Update the TTL (Time To Live) for session expiration.
@@ -326,29 +656,271 @@ class GameState:
         self.last_accessed = now.isoformat()
 
 
+# Names of the GameState fields that are stored, in declaration order
+PERSISTED_FIELDS = tuple(f.name for f in fields(GameState) if is_persisted(f))
+
+
+def _same_value(old: Any, new: Any) -> bool:
+    """
+    Compare stored values, treating bool and int as different types.
+    
+    Plain == considers False equal to 0 (also inside containers), which
+    would hide a flag changing between the two from get_changes.
+    """
+    if type(old) is not type(new):
+        return False
+    if isinstance(old, dict):
+        return old.keys() == new.keys() and all(_same_value(value, new[key]) for key, value in old.items())
+    if isinstance(old, list):
+        return len(old) == len(new) and all(map(_same_value, old, new))
+    return old == new
+
+
+class StateDefaults:
+    """
+    World default values for game flags and object states.
+    
+    Stored sessions omit flags and object state entries equal to these,
+    and GameState reads fall back to them, so a session reads the same
+    before it is saved and after it is loaded.
+    """
+    
+    def __init__(self, flags: Dict[str, Any], object_states: Dict[str, Dict[str, Any]]):
+        """
+        Initialize from default values.
+        
+        Args:
+            flags: Default flag values (flags_haunted.json)
+            object_states: Default state per object ID (GameObject.state)
+        """
+        self.flags = copy.deepcopy(flags)
+        self.object_states = {
+            object_id: copy.deepcopy(values) for object_id, values in object_states.items() if values
+        }
+    
+    @classmethod
+    def from_world(cls, world_data) -> 'StateDefaults':
+        """
+        Build defaults from loaded world data.
+        
+        Args:
+            world_data: WorldData with flags and objects loaded
+            
+        Returns:
+            StateDefaults for the world
+        """
+        return cls(
+            world_data.initial_flags,
+            {object_id: obj.state for object_id, obj in world_data.objects.items()}
+        )
+    
+    def sparse_flags(self, flags: Dict[str, Any]) -> Dict[str, Any]:
+        """Drop flags equal to their world default."""
+        return {
+            name: value for name, value in flags.items()
+            if name not in self.flags or not _same_value(self.flags[name], value)
+        }
+    
+    def sparse_object_state(self, object_id: str, values: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Drop one object's state entries equal to their world default."""
+        if not values:
+            return {}
+        defaults = self.object_states.get(object_id)
+        if not defaults:
+            return values
+        return {
+            key: value for key, value in values.items()
+            if key not in defaults or not _same_value(defaults[key], value)
+        }
+    
+    def sparse_object_states(self, object_states: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Drop object state entries equal to their world default, and objects left empty."""
+        sparse = {}
+        for object_id, values in object_states.items():
+            values = self.sparse_object_state(object_id, values)
+            if values:
+                sparse[object_id] = values
+        return sparse
+
+
+class SessionCache:
+    """
+    LRU cache of deserialized game states kept in a warm Lambda container.
+    
+    Entries expire ttl_seconds after they were stored, and the least
+    recently used entry is evicted once max_size sessions are held. The
+    cache does not know whether an entry is still current; SessionManager
+    checks the stored version before trusting a hit.
+    """
+    
+    DEFAULT_MAX_SIZE = 256
+    DEFAULT_TTL_SECONDS = 300
+    
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            max_size: Maximum number of sessions held
+            ttl_seconds: Seconds an entry stays usable after it is stored
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, session_id: str) -> Optional[GameState]:
+        """
+        Get a cached state and mark it most recently used.
+        
+        Args:
+            session_id: The session identifier
+        
+        Returns:
+            The cached GameState, or None if absent or expired
+        """
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return None
+        state, stored_at = entry
+        if time.monotonic() - stored_at >= self.ttl_seconds:
+            del self._entries[session_id]
+            return None
+        self._entries.move_to_end(session_id)
+        return state
+    
+    def put(self, state: GameState) -> None:
+        """
+        Store a state that matches what is persisted.
+        
+        Args:
+            state: GameState just loaded or saved
+        """
+        if self.max_size <= 0:
+            return
+        self._entries[state.session_id] = (state, time.monotonic())
+        self._entries.move_to_end(state.session_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def invalidate(self, session_id: str) -> None:
+        """
+        Drop a session from the cache.
+        
+        Args:
+            session_id: The session identifier
+        """
+        self._entries.pop(session_id, None)
+    
+    def clear(self) -> None:
+        """Drop every cached session."""
+        self._entries.clear()
+
 
 class SessionManager:
     """
-    Manages game session persistence in DynamoDB.
+    Manages game session persistence.
     
     Provides operations for saving, loading, and deleting game sessions
-    with proper error handling and TTL management.
+    with proper error handling and TTL management. Items are kept in a
+    SessionStore (see session_store), DynamoDB unless another is given.
     """
     
-    def __init__(self, dynamodb_client, table_name: str):
+    # Sessions expire this long after their last refresh
+    TTL_HOURS = 1
+    
+    # Default minimum time between TTL refreshes for unchanged sessions
+    DEFAULT_TTL_REFRESH_SECONDS = 300
+    
+    def __init__(
+        self,
+        dynamodb_client=None,
+        table_name: str = 'GameSessions',
+        ttl_refresh_seconds: int = DEFAULT_TTL_REFRESH_SECONDS,
+        cache: Optional[SessionCache] = None,
+        compact_state: bool = False,
+        defaults: Optional[StateDefaults] = None,
+        store: Optional[SessionStore] = None,
+        journal=None
+    ):
         """
-        Initialize SessionManager with DynamoDB client.
+        Initialize SessionManager with a DynamoDB client or another store.
         
         Args:
-            dynamodb_client: boto3 DynamoDB client or resource
+            dynamodb_client: boto3 DynamoDB client, used when no store is
+                given
             table_name: Name of the DynamoDB table for sessions
+            ttl_refresh_seconds: Minimum seconds between saves that only
+                extend the TTL of an unchanged session
+            cache: Optional SessionCache reused across warm invocations;
+                without one every load reads the full item
+            compact_state: Write flags, object states, visited rooms and
+                inventory as one compressed attribute (see state_codec).
+                Items in either layout are always readable.
+            defaults: Optional StateDefaults; flags and object states
+                equal to them are not stored, and loaded states read them
+                back through GameState.get_flag/get_object_state
+            store: Optional SessionStore to keep items in instead of the
+                DynamoDB table
+            journal: Optional CommandJournal; saves then append a journal
+                item and rewrite the session item only as a periodic
+                snapshot (see command_journal)
+        """
+        if store is None:
+            store = DynamoDBSessionStore(dynamodb_client, table_name)
+        self.store = store
+        self.ttl_refresh_seconds = ttl_refresh_seconds
+        self.cache = cache
+        self.compact_state = compact_state
+        self.defaults = defaults
+        self.journal = journal
+    
+    def needs_save(self, state: GameState, read_only: bool = False) -> bool:
+        """
+        Check whether a session must be written after a command.
+        
+        Read-only commands (LOOK, EXAMINE, failed actions, ...) leave the
+        game data unchanged and are not written, except to extend the TTL
+        once ttl_refresh_seconds have passed since the last refresh.
+        
+        Args:
+            state: GameState after executing a command
+            read_only: Every command run since the state was loaded is
+                declared read-only (CommandSpec.mutates_state), so the
+                field-by-field change check is skipped; a state that was
+                never saved is still written
+            
+        Returns:
+            True if the game data changed or the TTL is due for a refresh
         """
-        self.dynamodb = dynamodb_client
-        self.table_name = table_name
+        skip_check = read_only and state._clean is not None
+        if not skip_check and state.has_changes():
+            return True
+        if state.expires is None:
+            return True
+        
+        # expires was set TTL_HOURS after the last refresh
+        last_refresh = state.expires - self.TTL_HOURS * 3600
+        return datetime.now(UTC).timestamp() - last_refresh >= self.ttl_refresh_seconds
+    
+    # Above this many changed paths, a full put is simpler and about as small
+    MAX_UPDATE_PATHS = 64
     
     def save_session(self, state: GameState) -> bool:
         """
-        Save game state to DynamoDB with TTL.
+        Save game state to the session store with TTL.
+        
+        States that were loaded or saved before are written with a single
+        update covering only the attributes that changed (an UpdateItem in
+        DynamoDB). New states, and updates touching more than
+        MAX_UPDATE_PATHS attributes, are written in full.
+        
+        Every write is conditional on the stored version still being the
+        one this state was loaded at (or, for new states, on no item
+        existing yet), so concurrent saves of one session never overwrite
+        each other's turns.
         
         Args:
             state: GameState instance to save
@@ -357,32 +929,212 @@ class SessionManager:
             True if save successful, False otherwise
             
         Raises:
-            Exception: If DynamoDB operation fails
+            SessionConflictError: If another writer saved the session since
+                this state was loaded; reload and retry
+            Exception: If the store operation fails
         """
+        expected_version = state.version
+        if self.defaults is not None:
+            state.defaults = self.defaults
         try:
             # Update last accessed timestamp and TTL
-            state.update_ttl(hours=1)
-            
-            # Convert state to dictionary
-            item = state.to_dict()
-            
-            # Ensure session_id is the partition key
-            item['sessionId'] = state.session_id
+            state.update_ttl(hours=self.TTL_HOURS)
+            state.version += 1
             
-            # Put item in DynamoDB
-            self.dynamodb.put_item(
-                TableName=self.table_name,
-                Item=self._serialize_item(item)
-            )
+            changes = state.get_changes()
+            if changes is None:
+                self.store.save_conditional(state.session_id, self._stored_item(state))
+                if self.journal is not None:
+                    state._journal = JournalCursor(state.version, state.expires)
+            elif self.journal is not None:
+                self._append_journal(state, changes, expected_version)
+            else:
+                self._save_changes(state, self._storage_changes(state, changes), expected_version)
             
+            state.mark_clean()
+            state._packed = self.compact_state
+            if self.cache is not None:
+                self.cache.put(state)
             return True
             
+        except SessionConflictError:
+            state.version = expected_version
+            if self.cache is not None:
+                self.cache.invalidate(state.session_id)
+            raise
         except Exception as e:
+            if self.cache is not None:
+                self.cache.invalidate(state.session_id)
             raise Exception(f"Failed to save session {state.session_id}: {str(e)}")
     
+    def _save_changes(
+        self,
+        state: GameState,
+        changes: Dict[Tuple[str, ...], Any],
+        expected_version: int
+    ) -> None:
+        """
+        Write a saved state's changed attributes to its session item.
+        
+        Args:
+            state: GameState being saved
+            changes: Changed attribute paths from _storage_changes
+            expected_version: Version the state was loaded at
+            
+        Raises:
+            SessionConflictError: If another writer saved the session since
+        """
+        if (len(changes) > self.MAX_UPDATE_PATHS
+                or not self.store.update(state.session_id, changes, expected_version)):
+            # Also recreates the item if it expired while the state was
+            # in memory
+            self.store.save_conditional(state.session_id, self._stored_item(state), expected_version)
+    
+    def _append_journal(
+        self,
+        state: GameState,
+        changes: Dict[Tuple[str, ...], Any],
+        expected_version: int
+    ) -> None:
+        """
+        Save a state as one journal item, plus a snapshot when one is due.
+        
+        The journal item for the new version is written only if it does
+        not exist yet, which is what detects concurrent saves. The
+        snapshot is written after it and only if the stored snapshot is
+        still the one this state was loaded from; losing that race is
+        harmless, as the winner's snapshot is newer.
+        
+        Args:
+            state: GameState being saved, with its new version and TTL
+            changes: Changed field paths from GameState.get_changes
+            expected_version: Version the state was loaded at
+            
+        Raises:
+            SessionConflictError: If another writer saved the session since
+        """
+        cursor = state._journal or JournalCursor(expected_version)
+        record = self.journal.make_record(state, changes)
+        self.store.save_conditional(journal_key(state.session_id, state.version), record)
+        cursor.journal_bytes += self.journal.record_size(record)
+        state._journal = cursor
+        
+        if self.journal.snapshot_due(state, cursor, self.ttl_refresh_seconds):
+            # The save is durable once the journal item is written; a
+            # missed snapshot is retried on the next save
+            try:
+                self.store.save_conditional(state.session_id, self._stored_item(state), cursor.snapshot_version)
+            except SessionConflictError:
+                return
+            except Exception as e:
+                logger.warning("Failed to snapshot session %s: %s", state.session_id, e)
+                return
+            state._journal = JournalCursor(state.version, state.expires)
+    
+    def _storage_changes(
+        self,
+        state: GameState,
+        changes: Dict[Tuple[str, ...], Any]
+    ) -> Dict[Tuple[str, ...], Any]:
+        """
+        Map changed field paths onto the stored item's attribute layout.
+        
+        With compact_state, changes under PACKED_FIELDS become one write of
+        the packed attribute. An item still in the other layout is
+        converted on its first save, so the two never coexist in one item.
+        
+        Args:
+            state: GameState being saved
+            changes: Changed field paths from GameState.get_changes
+            
+        Returns:
+            Changed attribute paths for SessionStore.update
+        """
+        if self.defaults is not None:
+            changes = {path: self._sparse_value(path, value) for path, value in changes.items()}
+        
+        touches_packed = any(path[0] in PACKED_FIELDS for path in changes)
+        if self.compact_state == state._packed and not (self.compact_state and touches_packed):
+            return changes
+        
+        storage = {path: value for path, value in changes.items() if path[0] not in PACKED_FIELDS}
+        if self.compact_state:
+            storage[(PACKED_STATE_ATTRIBUTE,)] = encode_state(self._stored_fields(state))
+            if not state._packed:
+                storage.update({(name,): None for name in PACKED_FIELDS})
+        else:
+            storage.update({(name,): value for name, value in self._stored_fields(state).items()})
+            storage[(PACKED_STATE_ATTRIBUTE,)] = None
+        return storage
+    
+    def _sparse_value(self, path: Tuple[str, ...], value: Any) -> Any:
+        """
+        Drop world defaults from one changed flags/object_states path.
+        
+        Returns None (remove the attribute) for a flag or object state
+        that went back to its default.
+        """
+        if path[0] == 'flags':
+            if len(path) == 1:
+                return self.defaults.sparse_flags(value)
+            if path[1] in self.defaults.flags and _same_value(self.defaults.flags[path[1]], value):
+                return None
+        elif path[0] == 'object_states':
+            if len(path) == 1:
+                return self.defaults.sparse_object_states(value)
+            return self.defaults.sparse_object_state(path[1], value) or None
+        return value
+    
+    def _stored_fields(self, state: GameState) -> Dict[str, Any]:
+        """Get PACKED_FIELDS as stored, without world defaults."""
+        flags, object_states = state.flags, state.object_states
+        if self.defaults is not None:
+            flags = self.defaults.sparse_flags(flags)
+            object_states = self.defaults.sparse_object_states(object_states)
+        return {
+            'flags': flags,
+            'object_states': object_states,
+            'rooms_visited': list(state.rooms_visited),
+            'inventory': state.inventory,
+        }
+    
+    def _stored_item(self, state: GameState) -> Dict[str, Any]:
+        """
+        Build the whole session item for a state.
+        
+        Args:
+            state: GameState being saved
+            
+        Returns:
+            Item in the configured attribute layout
+        """
+        # Convert state to dictionary
+        item = state.to_dict()
+        
+        # Ensure session_id is the partition key
+        item['sessionId'] = state.session_id
+        
+        stored_fields = self._stored_fields(state)
+        if self.compact_state:
+            for name in PACKED_FIELDS:
+                del item[name]
+            item[PACKED_STATE_ATTRIBUTE] = encode_state(stored_fields)
+        else:
+            item.update(stored_fields)
+        return item
+    
+    def _put_session(self, state: GameState) -> None:
+        """
+        Write the whole session item unconditionally.
+        
+        Args:
+            state: GameState to write
+        """
+        self.store.save(state.session_id, self._stored_item(state))
+    
     def load_session(self, session_id: str) -> Optional[GameState]:
         """
-        Load game state from DynamoDB.
+        Load game state from the session store.
         
         Args:
             session_id: The session identifier to load
@@ -391,36 +1143,85 @@ class SessionManager:
             GameState instance if found, None if not found
             
         Raises:
-            Exception: If DynamoDB operation fails
+            Exception: If the store operation fails
         """
         try:
-            # Get item from DynamoDB
-            response = self.dynamodb.get_item(
-                TableName=self.table_name,
-                Key={'sessionId': {'S': session_id}}
-            )
-            
-            # Check if item exists
-            if 'Item' not in response:
+            cached = self._load_cached_session(session_id)
+            if cached is not None:
+                return cached
+            
+            item = self.store.load(session_id)
+            if item is None:
                 return None
             
-            # Deserialize item
-            item = self._deserialize_item(response['Item'])
+            packed = item.pop(PACKED_STATE_ATTRIBUTE, None)
+            if packed is not None:
+                item.update(decode_state(packed))
             
             # Create GameState from dictionary
             state = GameState.from_dict(item)
-            
-            # Update last accessed timestamp
-            state.last_accessed = datetime.now(UTC).isoformat()
+            state.mark_clean()
+            state._packed = packed is not None
+            state.defaults = self.defaults
+            if self.journal is not None:
+                state._journal = JournalCursor(state.version, state.expires)
+                records = self.journal.load_tail(self.store, session_id, state.version)
+                if records:
+                    state._journal.journal_bytes = self.journal.replay(state, records)
+            if self.cache is not None:
+                self.cache.put(state)
             
             return state
             
         except Exception as e:
             raise Exception(f"Failed to load session {session_id}: {str(e)}")
     
+    def _load_cached_session(self, session_id: str) -> Optional[GameState]:
+        """
+        Get a session from the cache if it is still current.
+        
+        A hit costs one consistent read projected to the version
+        attribute. Entries are dropped when another container has saved
+        the session since (or deleted it), and when the cached state holds
+        changes that were never saved, e.g. after a failed invocation.
+        
+        Args:
+            session_id: The session identifier
+            
+        Returns:
+            The cached GameState, or None if the full item must be read
+        """
+        if self.cache is None:
+            return None
+        state = self.cache.get(session_id)
+        if state is None:
+            return None
+        if state.has_changes() or not self._is_current(state):
+            self.cache.invalidate(session_id)
+            return None
+        return state
+    
+    def _is_current(self, state: GameState) -> bool:
+        """
+        Check with a version-only read that nobody saved a state since.
+        
+        With a journal, that is the absence of the next journal item; the
+        snapshot's version lags behind the journal.
+        """
+        if self.journal is not None:
+            return self.store.load_version(journal_key(state.session_id, state.version + 1)) is None
+        return self.store.load_version(state.session_id) == state.version
+    
     def delete_session(self, session_id: str) -> bool:
         """
-        Delete a game session from DynamoDB.
+        Delete a game session from the session store.
+        
+        With a journal, every journal item up to the head is deleted too, so
+        a session recreated under the same ID does not replay them. The
+        snapshot goes last; if a delete fails, retrying finds the journal
+        again. Save slots are kept: they are meant to outlive the session,
+        so RESTORE works after it is recreated under the same ID, and they
+        expire with their own TTL.
         
         Args:
             session_id: The session identifier to delete
@@ -429,14 +1230,19 @@ class SessionManager:
             True if deletion successful, False otherwise
             
         Raises:
-            Exception: If DynamoDB operation fails
+            Exception: If the store operation fails
         """
         try:
-            # Delete item from DynamoDB
-            self.dynamodb.delete_item(
-                TableName=self.table_name,
-                Key={'sessionId': {'S': session_id}}
-            )
+            if self.cache is not None:
+                self.cache.invalidate(session_id)
+            
+            if self.journal is not None:
+                snapshot_version = self.store.load_version(session_id) or 0
+                head = snapshot_version + len(self.journal.load_tail(self.store, session_id, snapshot_version))
+                for version in range(1, head + 1):
+                    self.store.delete(journal_key(session_id, version))
+            
+            self.store.delete(session_id)
             
             return True
             
@@ -445,7 +1251,7 @@ class SessionManager:
     
     def session_exists(self, session_id: str) -> bool:
         """
-        Check if a session exists in DynamoDB.
+        Check if a session exists in the session store.
         
         Args:
             session_id: The session identifier to check
@@ -454,137 +1260,7 @@ class SessionManager:
             True if session exists, False otherwise
         """
         try:
-            response = self.dynamodb.get_item(
-                TableName=self.table_name,
-                Key={'sessionId': {'S': session_id}},
-                ProjectionExpression='sessionId'
-            )
-            
-            return 'Item' in response
+            return self.store.load_version(session_id) is not None
             
         except Exception:
             return False
-    
-    def _serialize_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Serialize Python dictionary to DynamoDB format.
-        
-        Args:
-            item: Python dictionary to serialize
-            
-        Returns:
-            DynamoDB-formatted dictionary
-        """
-        serialized = {}
-        
-        for key, value in item.items():
-            if value is None:
-                continue
-            elif isinstance(value, str):
-                serialized[key] = {'S': value}
-            elif isinstance(value, bool):
-                serialized[key] = {'BOOL': value}
-            elif isinstance(value, int):
-                serialized[key] = {'N': str(value)}
-            elif isinstance(value, float):
-                serialized[key] = {'N': str(value)}
-            elif isinstance(value, list):
-                if len(value) == 0:
-                    serialized[key] = {'L': []}
-                elif isinstance(value[0], str):
-                    serialized[key] = {'SS': value} if len(value) > 0 else {'L': []}
-                else:
-                    serialized[key] = {'L': [self._serialize_value(v) for v in value]}
-            elif isinstance(value, dict):
-                serialized[key] = {'M': self._serialize_item(value)}
-            else:
-                serialized[key] = {'S': str(value)}
-        
-        return serialized
-    
-    def _serialize_value(self, value: Any) -> Dict[str, Any]:
-        """
-        Serialize a single value to DynamoDB format.
-        
-        Args:
-            value: Value to serialize
-            
-        Returns:
-            DynamoDB-formatted value
-        """
-        if value is None:
-            return {'NULL': True}
-        elif isinstance(value, str):
-            return {'S': value}
-        elif isinstance(value, bool):
-            return {'BOOL': value}
-        elif isinstance(value, (int, float)):
-            return {'N': str(value)}
-        elif isinstance(value, list):
-            return {'L': [self._serialize_value(v) for v in value]}
-        elif isinstance(value, dict):
-            return {'M': self._serialize_item(value)}
-        else:
-            return {'S': str(value)}
-    
-    def _deserialize_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Deserialize DynamoDB item to Python dictionary.
-        
-        Args:
-            item: DynamoDB-formatted item
-            
-        Returns:
-            Python dictionary
-        """
-        deserialized = {}
-        
-        for key, value in item.items():
-            if 'S' in value:
-                deserialized[key] = value['S']
-            elif 'N' in value:
-                # Try to convert to int, fall back to float
-                try:
-                    deserialized[key] = int(value['N'])
-                except ValueError:
-                    deserialized[key] = float(value['N'])
-            elif 'BOOL' in value:
-                deserialized[key] = value['BOOL']
-            elif 'SS' in value:
-                deserialized[key] = value['SS']
-            elif 'L' in value:
-                deserialized[key] = [self._deserialize_value(v) for v in value['L']]
-            elif 'M' in value:
-                deserialized[key] = self._deserialize_item(value['M'])
-            elif 'NULL' in value:
-                deserialized[key] = None
-        
-        return deserialized
-    
-    def _deserialize_value(self, value: Dict[str, Any]) -> Any:
-        """
-        Deserialize a single DynamoDB value.
-        
-        Args:
-            value: DynamoDB-formatted value
-            
-        Returns:
-            Python value
-        """
-        if 'S' in value:
-            return value['S']
-        elif 'N' in value:
-            try:
-                return int(value['N'])
-            except ValueError:
-                return float(value['N'])
-        elif 'BOOL' in value:
-            return value['BOOL']
-        elif 'L' in value:
-            return [self._deserialize_value(v) for v in value['L']]
-        elif 'M' in value:
-            return self._deserialize_item(value['M'])
-        elif 'NULL' in value:
-            return None
-        else:
-            return None
@@ -0,0 +1,71 @@
+"""
+Response View Cache for West of Haunted House
+
+Memoizes the processCommand response fields derived from world data (room
+description, exits, visible objects, inventory display names) in a warm
+Lambda container. Keys name the field and the room and state values the
+field depends on, e.g. ('objects', room_id, room_items), so players in the
+same room with the same contents share one entry.
+
+Entries belong to one WorldData: the cache empties itself when asked about
+a different world, so values never outlive the data they were built from.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class ViewCache:
+    """LRU cache of response view fields built from one WorldData."""
+    
+    DEFAULT_MAX_SIZE = 2048
+    
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            max_size: Maximum number of entries held
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._world = None
+        self._entries = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, world: Any, key: Hashable, build: Callable[[], Any]) -> Any:
+        """
+        Get a field value, building and caching it on a miss.
+        
+        Args:
+            world: WorldData the value is derived from
+            key: Field name plus the room and state values it depends on
+            build: Function computing the value; it must not be mutated
+                afterwards, so tuples are preferred over lists
+        
+        Returns:
+            The cached or newly built value
+        """
+        if world is not self._world:
+            self._entries.clear()
+            self._world = world
+        entries = self._entries
+        if key in entries:
+            self.hits += 1
+            entries.move_to_end(key)
+            return entries[key]
+        self.misses += 1
+        value = build()
+        if self.max_size > 0:
+            entries[key] = value
+            while len(entries) > self.max_size:
+                entries.popitem(last=False)
+        return value
+    
+    def clear(self) -> None:
+        """Drop every cached value."""
+        self._entries.clear()
+        self._world = None
@@ -6,12 +6,29 @@ objects, and flags. It implements caching for Lambda warm starts to improve
 performance.
 """
 
+import hashlib
 import json
+import marshal
 import os
-from dataclasses import dataclass, field
+import sys
+from bisect import bisect_left
+from dataclasses import dataclass, field, fields
 from typing import Dict, List, Optional, Union, Any
 
 
+# Prebuilt binary snapshot of the world (see WorldData.build_snapshot)
+SNAPSHOT_FILENAME = 'world_haunted.snapshot'
+SNAPSHOT_MAGIC = b'WOHSNAP'
+SNAPSHOT_FORMAT_VERSION = 1
+
+# Source files folded into the snapshot fingerprint, in a fixed order
+SNAPSHOT_SOURCE_FILES = (
+    'rooms_haunted.json',
+    'objects_haunted.json',
+    'global_objects_haunted.json',
+    'flags_haunted.json',
+)
+
 @dataclass
 class Room:
     """Represents a room in the game world."""
@@ -60,6 +77,129 @@ class GameObject:
     soul_value: int = 0
 
 
+# Position of GameObject.interactions within a snapshot row
+_INTERACTIONS_INDEX = [f.name for f in fields(GameObject)].index('interactions')
+
+
+def _snapshot_schema() -> tuple:
+    """Field layout of the snapshotted dataclasses, used to detect stale snapshots."""
+    return tuple(
+        tuple(f.name for f in fields(cls))
+        for cls in (Room, Interaction, GameObject)
+    )
+
+
+def _astuple_shallow(instance) -> tuple:
+    """Return a dataclass's field values in declaration order without deep-copying."""
+    return tuple(getattr(instance, f.name) for f in fields(instance))
+
+
+def _object_name_keys(object_id: str, obj: 'GameObject') -> tuple:
+    """
+    Derive the lowercase match keys for an object.
+    
+    Args:
+        object_id: The object identifier
+        obj: The object's data
+        
+    Returns:
+        Tuple of (exact names, words, phrases) where exact names are the
+        full ID/display/spooky names, words are their individual words and
+        phrases are the whitespace-normalized display and spooky names used
+        for prefix/suffix matching
+    """
+    id_phrase = object_id.replace('_', ' ')
+    exact = {id_phrase}
+    words = set(id_phrase.lower().split())
+    phrases = []
+    for display_name in (obj.name, obj.name_spooky):
+        if display_name:
+            lowered = display_name.lower()
+            exact.add(lowered)
+            name_words = lowered.split()
+            words.update(name_words)
+            phrases.append(' '.join(name_words))
+    return frozenset(exact), frozenset(words), tuple(phrases)
+
+
+class ObjectNameIndex:
+    """
+    Inverted index from object names to object IDs.
+    
+    Built once per world load so name resolution is a dictionary or
+    bisect lookup instead of re-splitting every candidate's names on
+    every command. Covers exact names (ID with spaces, display name,
+    spooky name), individual words, and prefixes/suffixes of the
+    display and spooky names.
+    """
+    
+    def __init__(self, objects: Dict[str, 'GameObject']):
+        """
+        Build the index.
+        
+        Args:
+            objects: Mapping of object ID to GameObject
+        """
+        self.objects = objects
+        self._sources: Dict[str, GameObject] = {}
+        self._exact: Dict[str, set] = {}
+        self._words: Dict[str, set] = {}
+        prefixes = []
+        suffixes = []
+        
+        for object_id, obj in objects.items():
+            self._sources[object_id] = obj
+            exact, words, phrases = _object_name_keys(object_id, obj)
+            for key in exact:
+                self._exact.setdefault(key, set()).add(object_id)
+            for word in words:
+                self._words.setdefault(word, set()).add(object_id)
+            for phrase in phrases:
+                prefixes.append((phrase, object_id))
+                suffixes.append((phrase[::-1], object_id))
+        
+        prefixes.sort()
+        suffixes.sort()
+        self._prefixes = prefixes
+        self._suffixes = suffixes
+    
+    def is_current(self, object_id: str, obj: 'GameObject') -> bool:
+        """Check whether the index was built from this exact object."""
+        return self._sources.get(object_id) is obj
+    
+    def exact_matches(self, name: str) -> set:
+        """
+        Get IDs whose ID, display name or spooky name equals name.
+        
+        Args:
+            name: Lowercased, stripped name
+        """
+        return self._exact.get(name, set())
+    
+    def partial_matches(self, name: str) -> set:
+        """
+        Get IDs with a word equal to name, or a display/spooky name that
+        starts or ends with name.
+        
+        Args:
+            name: Lowercased, stripped name
+        """
+        matches = set(self._words.get(name, ()))
+        matches.update(self._affix_range(self._prefixes, name))
+        matches.update(self._affix_range(self._suffixes, name[::-1]))
+        return matches
+    
+    @staticmethod
+    def _affix_range(entries: List[tuple], key: str) -> List[str]:
+        """Return IDs of all sorted (phrase, id) entries whose phrase starts with key."""
+        ids = []
+        position = bisect_left(entries, (key,))
+        while position < len(entries) and entries[position][0].startswith(key):
+            ids.append(entries[position][1])
+            position += 1
+        return ids
+
+
 class WorldData:
     """
     Manages game world data including rooms, objects, and flags.
@@ -74,6 +214,7 @@ class WorldData:
         self.rooms: Dict[str, Room] = {}
         self.objects: Dict[str, GameObject] = {}
         self.initial_flags: Dict[str, Union[bool, int]] = {}
+        self._name_index: Optional[ObjectNameIndex] = None
         self._loaded = False
     
     def load_from_json(self, data_dir: str) -> None:
@@ -81,6 +222,8 @@ class WorldData:
         Load all game data from JSON files.
         
         Uses class-level caching to improve performance on Lambda warm starts.
+        On a cold start, a prebuilt snapshot in data_dir is used instead of
+        parsing JSON when its fingerprint matches the JSON sources.
         
         Args:
             data_dir: Directory containing JSON data files
@@ -95,6 +238,20 @@ class WorldData:
             self._load_from_cache()
             return
         
+        # Prefer the prebuilt snapshot; fall back to JSON if missing or stale
+        snapshot_path = os.path.join(data_dir, SNAPSHOT_FILENAME)
+        if os.path.exists(snapshot_path) and self.load_from_snapshot(snapshot_path, data_dir):
+            return
+        
+        self._load_json_files(data_dir)
+    
+    def _load_json_files(self, data_dir: str) -> None:
+        """
+        Parse and validate the JSON data files, then populate the cache.
+        
+        Args:
+            data_dir: Directory containing JSON data files
+        """
         # Load fresh data from files
         try:
             rooms_path = os.path.join(data_dir, 'rooms_haunted.json')
@@ -132,13 +289,7 @@ class WorldData:
                 self.initial_flags = json.load(f)
             
             # Cache the loaded data
-            WorldData._cache = {
-                'rooms': self.rooms,
-                'objects': self.objects,
-                'initial_flags': self.initial_flags
-            }
-            
-            self._loaded = True
+            self._store_cache()
             
         except json.JSONDecodeError as e:
             raise json.JSONDecodeError(
@@ -152,6 +303,158 @@ class WorldData:
         except Exception as e:
             raise ValueError(f"Error loading world data: {str(e)}")
     
+    def load_from_snapshot(self, snapshot_path: str, data_dir: Optional[str] = None) -> bool:
+        """
+        Load all game data from a prebuilt binary snapshot.
+        
+        The snapshot stores every room, object and interaction as a flat
+        tuple of dataclass field values, already validated at build time,
+        so loading is one marshal pass plus positional construction.
+        When data_dir is given, the snapshot's fingerprint is compared
+        against the JSON sources and a stale snapshot is rejected.
+        
+        Args:
+            snapshot_path: Path to the snapshot file
+            data_dir: Directory containing the JSON sources (optional)
+            
+        Returns:
+            True if the snapshot was loaded, False if it was missing,
+            stale or unreadable (callers should fall back to JSON)
+        """
+        try:
+            with open(snapshot_path, 'rb') as f:
+                blob = f.read()
+            
+            header_size = len(SNAPSHOT_MAGIC) + 1 + 32
+            if len(blob) < header_size or not blob.startswith(SNAPSHOT_MAGIC):
+                return False
+            
+            version = blob[len(SNAPSHOT_MAGIC)]
+            if version != SNAPSHOT_FORMAT_VERSION:
+                return False
+            
+            fingerprint = blob[len(SNAPSHOT_MAGIC) + 1:header_size]
+            if data_dir is not None and fingerprint != self.source_fingerprint(data_dir):
+                return False
+            
+            schema, room_rows, object_rows, initial_flags = marshal.loads(blob[header_size:])
+            if schema != _snapshot_schema():
+                # Dataclass layout changed since the snapshot was built
+                return False
+            
+            rooms = {row[0]: Room(*row) for row in room_rows}
+            objects = {}
+            for row in object_rows:
+                row = list(row)
+                row[_INTERACTIONS_INDEX] = [Interaction(*values) for values in row[_INTERACTIONS_INDEX]]
+                objects[row[0]] = GameObject(*row)
+        except Exception:
+            return False
+        
+        self.rooms = rooms
+        self.objects = objects
+        self.initial_flags = initial_flags
+        self._store_cache()
+        return True
+    
+    def build_snapshot(self, data_dir: str, snapshot_path: Optional[str] = None) -> str:
+        """
+        Compile the JSON data files into a binary snapshot.
+        
+        Data is always loaded through the validating JSON path, so a
+        snapshot can only be produced from well-formed sources.
+        
+        Args:
+            data_dir: Directory containing JSON data files
+            snapshot_path: Output path (default: data_dir/SNAPSHOT_FILENAME)
+            
+        Returns:
+            Path of the written snapshot
+        """
+        WorldData.clear_cache()
+        self._load_json_files(data_dir)
+        
+        if snapshot_path is None:
+            snapshot_path = os.path.join(data_dir, SNAPSHOT_FILENAME)
+        
+        room_rows = [_astuple_shallow(room) for room in self.rooms.values()]
+        object_rows = []
+        for obj in self.objects.values():
+            row = list(_astuple_shallow(obj))
+            row[_INTERACTIONS_INDEX] = [_astuple_shallow(i) for i in obj.interactions]
+            object_rows.append(tuple(row))
+        
+        payload = marshal.dumps((_snapshot_schema(), room_rows, object_rows, self.initial_flags))
+        header = SNAPSHOT_MAGIC + bytes([SNAPSHOT_FORMAT_VERSION]) + self.source_fingerprint(data_dir)
+        
+        # Write atomically so a concurrent reader never sees a partial file
+        tmp_path = snapshot_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(header + payload)
+        os.replace(tmp_path, snapshot_path)
+        
+        return snapshot_path
+    
+    @staticmethod
+    def source_fingerprint(data_dir: str) -> bytes:
+        """
+        Compute a SHA-256 digest over the JSON source files.
+        
+        Args:
+            data_dir: Directory containing JSON data files
+            
+        Returns:
+            32-byte digest (missing optional files contribute only their name)
+        """
+        digest = hashlib.sha256()
+        for filename in SNAPSHOT_SOURCE_FILES:
+            digest.update(filename.encode('utf-8'))
+            path = os.path.join(data_dir, filename)
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    digest.update(f.read())
+        return digest.digest()
+    
+    def _store_cache(self) -> None:
+        """Build derived indexes and publish loaded data to the class-level cache."""
+        self._intern_ids()
+        self._name_index = ObjectNameIndex(self.objects)
+        WorldData._cache = {
+            'rooms': self.rooms,
+            'objects': self.objects,
+            'initial_flags': self.initial_flags,
+            'name_index': self._name_index
+        }
+        self._loaded = True
+    
+    def _intern_ids(self) -> None:
+        """
+        Intern every room and object ID the world refers to.
+        
+        JSON decoding creates a separate string for each occurrence of an
+        ID (room keys, exit targets, item lists, contents). Interning
+        collapses them to one object per ID, so ID comparisons in the
+        engine, and against IDs from GameState (also interned, see
+        GameState.from_dict), succeed on the identity check without
+        comparing characters.
+        """
+        intern = sys.intern
+        rooms = {}
+        for room_id, room in self.rooms.items():
+            room.id = intern(room.id)
+            room.exits = {direction: intern(target) for direction, target in room.exits.items()}
+            room.items = [intern(item) for item in room.items]
+            room.global_items = [intern(item) for item in room.global_items]
+            rooms[room.id] = room
+        self.rooms = rooms
+        
+        objects = {}
+        for object_id, obj in self.objects.items():
+            obj.id = intern(obj.id)
+            obj.contents = [intern(item) for item in obj.contents]
+            objects[obj.id] = obj
+        self.objects = objects
+    
     def _load_from_cache(self) -> None:
         """Load data from class-level cache."""
         if WorldData._cache is None:
@@ -160,6 +463,7 @@ class WorldData:
         self.rooms = WorldData._cache['rooms']
         self.objects = WorldData._cache['objects']
         self.initial_flags = WorldData._cache['initial_flags']
+        self._name_index = WorldData._cache['name_index']
         self._loaded = True
     
     def _load_rooms(self, rooms_data: Dict[str, Any]) -> None:
@@ -292,6 +596,36 @@ class WorldData:
         
         return self.objects[object_id]
     
+    def snapshot_object_states(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Copy the state of every object.
+        
+        Some handlers change GameObject.state in place, and the world is
+        shared by every session in the process. The handler snapshots it
+        before a turn, so a turn run again after a lost save race starts
+        from the same world (see restore_object_states).
+        
+        Returns:
+            Object IDs mapped to copies of their state
+        """
+        return {
+            object_id: {key: list(value) if isinstance(value, list) else value for key, value in obj.state.items()}
+            for object_id, obj in self.objects.items()
+        }
+    
+    def restore_object_states(self, snapshot: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Put back object states taken with snapshot_object_states.
+        
+        Args:
+            snapshot: Object IDs mapped to their state
+        """
+        for object_id, state in snapshot.items():
+            obj = self.objects.get(object_id)
+            if obj is not None and obj.state != state:
+                obj.state.clear()
+                obj.state.update(state)
+
     def find_object_by_name(self, name: str, available_objects: List[str]) -> Optional[str]:
         """
         Find object ID by flexible name matching.
@@ -301,6 +635,10 @@ class WorldData:
         - Display name (exact or partial)
         - Spooky name (exact or partial)
         
+        Candidates come from the name index; the first available object
+        (in available_objects order) wins, with exact matches taking
+        priority over word/prefix/suffix matches.
+        
         Args:
             name: The name to search for (e.g., "parchment", "cursed", "leaflet")
             available_objects: List of object IDs to search within
@@ -317,63 +655,61 @@ class WorldData:
         if name_lower in available_objects:
             return name_lower
         
-        # Second pass: check if name matches object ID, display name, or spooky name
+        index = self.get_name_index()
+        
+        # Second pass: full ID, display name or spooky name
+        exact = index.exact_matches(name_lower)
         for obj_id in available_objects:
-            if obj_id not in self.objects:
+            obj = self.objects.get(obj_id)
+            if obj is None:
                 continue
-            
-            obj = self.objects[obj_id]
-            
-            # Check object ID (with underscores replaced by spaces)
-            if name_lower == obj_id.replace('_', ' '):
-                return obj_id
-            
-            # Check display name
-            if obj.name and name_lower == obj.name.lower():
-                return obj_id
-            
-            # Check spooky name
-            if obj.name_spooky and name_lower == obj.name_spooky.lower():
+            if index.is_current(obj_id, obj):
+                if obj_id in exact:
+                    return obj_id
+            elif name_lower in _object_name_keys(obj_id, obj)[0]:
                 return obj_id
         
-        # Third pass: partial matches (any word in the name)
+        # Third pass: partial matches (any word, or name prefix/suffix)
+        partial = index.partial_matches(name_lower)
         for obj_id in available_objects:
-            if obj_id not in self.objects:
+            obj = self.objects.get(obj_id)
+            if obj is None:
                 continue
-            
-            obj = self.objects[obj_id]
-            
-            # Check if name is a word in object ID
-            obj_id_words = obj_id.replace('_', ' ').lower().split()
-            if name_lower in obj_id_words:
-                return obj_id
-            
-            # Check if name is a word in display name or matches the full display name
-            if obj.name:
-                name_words = obj.name.lower().split()
-                if name_lower in name_words:
+            if index.is_current(obj_id, obj):
+                if obj_id in partial:
                     return obj_id
-                # Also check if the entered name matches a subset of the display name
-                if ' '.join(name_words).startswith(name_lower) or ' '.join(name_words).endswith(name_lower):
-                    return obj_id
-
-            # Check if name is a word in spooky name or matches the full spooky name
-            if obj.name_spooky:
-                spooky_words = obj.name_spooky.lower().split()
-                if name_lower in spooky_words:
-                    return obj_id
-                # Also check if the entered name matches a subset of the spooky name
-                if ' '.join(spooky_words).startswith(name_lower) or ' '.join(spooky_words).endswith(name_lower):
+            else:
+                _, words, phrases = _object_name_keys(obj_id, obj)
+                if name_lower in words or any(
+                    phrase.startswith(name_lower) or phrase.endswith(name_lower)
+                    for phrase in phrases
+                ):
                     return obj_id
         
         return None
+    
+    def get_name_index(self) -> ObjectNameIndex:
+        """
+        Get the object name index, rebuilding it if objects were replaced.
+        
+        Objects added or swapped after load (e.g. by tests) are not in the
+        index; find_object_by_name matches those directly.
+        
+        Returns:
+            ObjectNameIndex over the current objects
+        """
+        if self._name_index is None or self._name_index.objects is not self.objects:
+            self._name_index = ObjectNameIndex(self.objects)
+        return self._name_index
 
-    def get_visible_objects_in_room(self, room_id: str) -> List[str]:
+    def get_visible_objects_in_room(self, room_id: str, room_items: Optional[List[str]] = None) -> List[str]:
         """
         Get list of visible object names in a room.
 
         Args:
             room_id: The room identifier
+            room_items: The room's current contents (e.g. from
+                GameState.get_room_items); defaults to the pristine items
 
         Returns:
             List of visible object display names
@@ -385,7 +721,7 @@ class WorldData:
             room = self.get_room(room_id)
             visible_objects = []
 
-            for item_id in room.items:
+            for item_id in (room.items if room_items is None else room_items):
                 try:
                     obj = self.get_object(item_id)
                     # Check if object is visible
@@ -402,7 +738,13 @@ class WorldData:
         except Exception:
             return []
 
-    def get_room_description(self, room_id: str, sanity_level: int, include_objects: bool = False) -> str:
+    def get_room_description(
+        self,
+        room_id: str,
+        sanity_level: int,
+        include_objects: bool = False,
+        room_items: Optional[List[str]] = None
+    ) -> str:
         """
         Get appropriate room description based on sanity level.
 
@@ -412,6 +754,8 @@ class WorldData:
             room_id: The room identifier
             sanity_level: Current sanity level (0-100)
             include_objects: Whether to include visible objects in the description
+            room_items: The room's current contents when include_objects is set;
+                defaults to the pristine items
 
         Returns:
             Room description string
@@ -425,7 +769,7 @@ class WorldData:
 
         # Add visible objects to description if requested
         if include_objects:
-            visible_objects = self.get_visible_objects_in_room(room_id)
+            visible_objects = self.get_visible_objects_in_room(room_id, room_items)
             if visible_objects:
                 # Add object descriptions
                 object_descriptions = []
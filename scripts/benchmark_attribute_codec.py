@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Benchmark DynamoDB attribute value encoding and decoding of session items.
+
+Compares three serializers on a new game and on the end-game state of the
+commands in tests/integration/test_full_walkthrough.py:
+- legacy: the isinstance-chain walk DynamoDBSessionStore used before
+  attribute_codec (kept here verbatim as the baseline, string-set quirk
+  included)
+- dynamic: attribute_codec.encode_map/decode_map, which pick the type of
+  every value
+- compiled: attribute_codec.ItemCodec built from GameState's fields, what
+  DynamoDBSessionStore uses now
+
+Usage:
+    python scripts/benchmark_attribute_codec.py [--number N]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import timeit
+
+REPO_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+GAME_HANDLER_DIR = os.path.join(REPO_ROOT, 'amplify/functions/game-handler')
+WALKTHROUGH = os.path.join(REPO_ROOT, 'tests/integration/test_full_walkthrough.py')
+
+
+class LegacySerializer:
+    """The serializer DynamoDBSessionStore used before attribute_codec."""
+
+    def serialize_item(self, item):
+        serialized = {}
+        for key, value in item.items():
+            if value is None:
+                continue
+            elif isinstance(value, str):
+                serialized[key] = {'S': value}
+            elif isinstance(value, bytes):
+                serialized[key] = {'B': value}
+            elif isinstance(value, bool):
+                serialized[key] = {'BOOL': value}
+            elif isinstance(value, int):
+                serialized[key] = {'N': str(value)}
+            elif isinstance(value, float):
+                serialized[key] = {'N': str(value)}
+            elif isinstance(value, list):
+                if len(value) == 0:
+                    serialized[key] = {'L': []}
+                elif isinstance(value[0], str):
+                    serialized[key] = {'SS': value}
+                else:
+                    serialized[key] = {'L': [self.serialize_value(v) for v in value]}
+            elif isinstance(value, dict):
+                serialized[key] = {'M': self.serialize_item(value)}
+            else:
+                serialized[key] = {'S': str(value)}
+        return serialized
+
+    def serialize_value(self, value):
+        if value is None:
+            return {'NULL': True}
+        elif isinstance(value, str):
+            return {'S': value}
+        elif isinstance(value, bytes):
+            return {'B': value}
+        elif isinstance(value, bool):
+            return {'BOOL': value}
+        elif isinstance(value, (int, float)):
+            return {'N': str(value)}
+        elif isinstance(value, list):
+            return {'L': [self.serialize_value(v) for v in value]}
+        elif isinstance(value, dict):
+            return {'M': self.serialize_item(value)}
+        else:
+            return {'S': str(value)}
+
+    def deserialize_item(self, item):
+        deserialized = {}
+        for key, value in item.items():
+            if 'S' in value:
+                deserialized[key] = value['S']
+            elif 'N' in value:
+                try:
+                    deserialized[key] = int(value['N'])
+                except ValueError:
+                    deserialized[key] = float(value['N'])
+            elif 'BOOL' in value:
+                deserialized[key] = value['BOOL']
+            elif 'B' in value:
+                deserialized[key] = value['B']
+            elif 'SS' in value:
+                deserialized[key] = value['SS']
+            elif 'L' in value:
+                deserialized[key] = [self.deserialize_value(v) for v in value['L']]
+            elif 'M' in value:
+                deserialized[key] = self.deserialize_item(value['M'])
+            elif 'NULL' in value:
+                deserialized[key] = None
+        return deserialized
+
+    def deserialize_value(self, value):
+        if 'S' in value:
+            return value['S']
+        elif 'N' in value:
+            try:
+                return int(value['N'])
+            except ValueError:
+                return float(value['N'])
+        elif 'BOOL' in value:
+            return value['BOOL']
+        elif 'B' in value:
+            return value['B']
+        elif 'L' in value:
+            return [self.deserialize_value(v) for v in value['L']]
+        elif 'M' in value:
+            return self.deserialize_item(value['M'])
+        elif 'NULL' in value:
+            return None
+        return None
+
+
+def build_states(data_dir: str) -> dict:
+    """Return session items for a new game and for the end of the walkthrough."""
+    sys.path.insert(0, GAME_HANDLER_DIR)
+    from command_parser import CommandParser
+    from game_engine import GameEngine
+    from state_manager import GameState
+    from world_loader import WorldData
+
+    world = WorldData()
+    world.load_from_json(data_dir)
+    engine = GameEngine(world)
+    command_parser = CommandParser()
+    with open(WALKTHROUGH) as f:
+        commands = re.findall(r'self\.execute\("([^"]+)"', f.read())
+
+    state = GameState.create_new_game()
+    small = {**state.to_dict(), 'sessionId': state.session_id}
+    for index, text in enumerate(commands):
+        random.seed(index)
+        engine.execute_command(command_parser.parse(text), state)
+    late = {**state.to_dict(), 'sessionId': state.session_id}
+    return {'small': small, 'late-game': late}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Compare DynamoDB attribute value serializers.')
+    parser.add_argument('--number', type=int, default=2000, help='Conversions per timing')
+    parser.add_argument('--data-dir', default=os.path.join(GAME_HANDLER_DIR, 'data'))
+    args = parser.parse_args()
+
+    states = build_states(args.data_dir)
+    from attribute_codec import ItemCodec, decode_map, encode_map
+    from state_manager import GameState
+
+    legacy = LegacySerializer()
+    codec = ItemCodec(GameState)
+    serializers = {
+        'legacy': (legacy.serialize_item, legacy.deserialize_item),
+        'dynamic': (encode_map, decode_map),
+        'compiled': (codec.encode_item, codec.decode_item),
+    }
+
+    print(f"Attribute value conversion of session items, best of 5 x {args.number} (us per item)")
+    print(f"{'state':<10} {'serializer':<10} {'encode':>8} {'decode':>8} {'speedup':>8}")
+    for name, item in states.items():
+        baseline = None
+        for serializer, (encode, decode) in serializers.items():
+            encoded = encode(item)
+            encode_us = min(timeit.repeat(lambda: encode(item), number=args.number, repeat=5)) / args.number * 1e6
+            decode_us = min(timeit.repeat(lambda: decode(encoded), number=args.number, repeat=5)) / args.number * 1e6
+            total = encode_us + decode_us
+            if baseline is None:
+                baseline = total
+            print(f"{name:<10} {serializer:<10} {encode_us:>8.1f} {decode_us:>8.1f} {baseline / total:>7.2f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
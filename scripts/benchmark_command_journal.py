@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark session writes: partial updates vs. the command journal.
+
+Replays the commands from tests/integration/test_full_walkthrough.py one
+turn at a time (load, execute, save when needed) against an in-memory
+store, once with partial session updates and once with the command
+journal (SessionManager(journal=...)). Each mode runs in a fresh process,
+because the engine mutates the cached world data while playing.
+
+DynamoDB bills an UpdateItem by the size of the whole item after the
+update, so the script reports billed bytes and write capacity units per
+turn, using the item size rules from benchmark_state_codec.py. It also
+reports the latency of a cold load of the end-game session, which in
+journal mode includes applying the journal tail.
+
+Usage:
+    python scripts/benchmark_command_journal.py [--snapshot-every N]
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+GAME_HANDLER_DIR = os.path.join(REPO_ROOT, 'amplify/functions/game-handler')
+WALKTHROUGH = os.path.join(REPO_ROOT, 'tests/integration/test_full_walkthrough.py')
+
+
+def measure(mode: str, data_dir: str, snapshot_every: int, loads: int) -> dict:
+    """Replay the walkthrough in one mode and return write sizes and load time."""
+    sys.path.insert(0, GAME_HANDLER_DIR)
+    from benchmark_state_codec import item_size
+    from command_journal import CommandJournal, seed_command
+    from command_parser import CommandParser
+    from game_engine import GameEngine
+    from session_store import DynamoDBSessionStore, InMemorySessionStore
+    from state_manager import GameState, SessionManager, StateDefaults
+    from world_loader import WorldData
+
+    serializer = DynamoDBSessionStore(None, 'GameSessions')
+    billed = []
+
+    class BilledStore(InMemorySessionStore):
+        """In-memory store recording the billed size of every write."""
+
+        def bill(self, session_id):
+            billed.append(item_size(serializer._serialize_item(self.items[session_id])))
+
+        def save_conditional(self, session_id, item, expected_version=None):
+            super().save_conditional(session_id, item, expected_version)
+            self.bill(session_id)
+
+        def update(self, session_id, changes, expected_version):
+            updated = super().update(session_id, changes, expected_version)
+            if updated:
+                self.bill(session_id)
+            return updated
+
+    world = WorldData()
+    world.load_from_json(data_dir)
+    engine = GameEngine(world)
+    command_parser = CommandParser()
+    with open(WALKTHROUGH) as f:
+        commands = re.findall(r'self\.execute\("([^"]+)"', f.read())
+
+    journal = None
+    if mode == 'journal':
+        journal = CommandJournal(snapshot_every=snapshot_every)
+    store = BilledStore()
+    defaults = StateDefaults.from_world(world)
+    manager = SessionManager(defaults=defaults, store=store, journal=journal)
+
+    state = GameState.create_new_game()
+    state.defaults = defaults
+    manager.save_session(state)
+    for text in commands:
+        state = manager.load_session(state.session_id)
+        seed_command(state, text)
+        engine.execute_command(command_parser.parse(text), state)
+        if manager.needs_save(state):
+            manager.save_session(state)
+
+    durations = []
+    for _ in range(loads):
+        start = time.perf_counter()
+        SessionManager(defaults=defaults, store=store, journal=journal).load_session(state.session_id)
+        durations.append((time.perf_counter() - start) * 1e6)
+
+    return {
+        'writes': len(billed),
+        'bytes_per_write': statistics.mean(billed),
+        'wcu_per_write': statistics.mean(-(-size // 1024) for size in billed),
+        'bytes_total': sum(billed),
+        'cold_load_us': statistics.median(durations),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Compare partial session updates with the command journal.')
+    parser.add_argument('--snapshot-every', type=int, default=20)
+    parser.add_argument('--loads', type=int, default=50)
+    parser.add_argument('--data-dir', default=os.path.join(GAME_HANDLER_DIR, 'data'))
+    parser.add_argument('--measure', choices=('update', 'journal'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(args.measure, args.data_dir, args.snapshot_every, args.loads)))
+        return 0
+
+    results = {}
+    for mode in ('update', 'journal'):
+        output = subprocess.run(
+            [sys.executable, __file__, '--measure', mode, '--data-dir', args.data_dir,
+             '--snapshot-every', str(args.snapshot_every), '--loads', str(args.loads)],
+            check=True, capture_output=True, text=True
+        ).stdout
+        results[mode] = json.loads(output.strip().splitlines()[-1])
+
+    print(f"Session writes over the walkthrough (snapshot every {args.snapshot_every} saves)")
+    print(f"{'mode':<8} {'writes':>7} {'bytes/write':>12} {'WCU/write':>10} {'total KB':>9} {'cold load us':>13}")
+    for mode, result in results.items():
+        print(
+            f"{mode:<8} {result['writes']:>7} {result['bytes_per_write']:>12,.0f} "
+            f"{result['wcu_per_write']:>10.2f} {result['bytes_total'] / 1024:>9,.1f} {result['cold_load_us']:>13.1f}"
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark command dispatch cost across every registered verb.
+
+Handlers are replaced with a no-op so the timings cover only what
+GameEngine.execute_command does around them: the registry lookup and the
+pre-dispatch steps each verb's metadata enables. A linear scan over the
+dispatch table is timed alongside the dict lookup to show what an ordered
+if-chain costs for verbs near the end.
+
+Usage:
+    python scripts/benchmark_dispatch.py [--iterations N]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from dataclasses import replace
+from unittest.mock import patch
+
+GAME_HANDLER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../amplify/functions/game-handler')
+sys.path.insert(0, GAME_HANDLER_DIR)
+
+import game_engine
+from command_parser import ParsedCommand
+from game_engine import ActionResult, GameEngine, COMMAND_REGISTRY
+from state_manager import GameState
+from world_loader import WorldData
+
+NOOP_RESULT = ActionResult(success=True, message="")
+
+
+def build_command(verb: str) -> ParsedCommand:
+    """Build a command that satisfies the verb's routing conditions."""
+    spec = COMMAND_REGISTRY[verb]
+    return ParsedCommand(
+        verb=verb,
+        object='lamp' if spec.uses_object else None,
+        target='mailbox' if spec.uses_target else None,
+        direction='NORTH'
+    )
+
+
+def time_call(fn, iterations: int) -> float:
+    """Return the mean duration of fn() in microseconds."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) * 1e6 / iterations
+
+
+def chain_lookup(verb: str):
+    """Find a verb's spec by scanning the table in order, like an if-chain."""
+    for verbs, spec in game_engine._COMMAND_TABLE:
+        if verb in verbs:
+            return spec
+    return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Measure per-verb dispatch cost.')
+    parser.add_argument('--iterations', type=int, default=2000)
+    parser.add_argument('--data-dir', default=os.path.join(GAME_HANDLER_DIR, 'data'))
+    args = parser.parse_args()
+
+    world = WorldData()
+    world.load_from_json(args.data_dir)
+    engine = GameEngine(world)
+    state = GameState.create_new_game()
+    state.inventory.append('lamp')
+
+    verbs = sorted(COMMAND_REGISTRY)
+    noop_registry = {
+        verb: replace(spec, handler=lambda self, c, s: NOOP_RESULT)
+        for verb, spec in COMMAND_REGISTRY.items()
+    }
+
+    lookup_us = {v: time_call(lambda: COMMAND_REGISTRY.get(v), args.iterations) for v in verbs}
+    chain_us = {v: time_call(lambda: chain_lookup(v), args.iterations) for v in verbs}
+
+    dispatch_us = {}
+    with patch.dict(game_engine.COMMAND_REGISTRY, noop_registry):
+        for verb in verbs:
+            dispatch_us[verb] = time_call(
+                lambda: engine.execute_command(build_command(verb), state),
+                args.iterations
+            )
+
+    print(f"Dispatch cost over {len(verbs)} verbs, {args.iterations} iterations each (µs)")
+    for label, timings in (('lookup', lookup_us), ('chain', chain_us), ('dispatch', dispatch_us)):
+        values = list(timings.values())
+        print(
+            f"{label:<10} mean {statistics.mean(values):8.3f}   "
+            f"median {statistics.median(values):8.3f}   "
+            f"max {max(values):8.3f}"
+        )
+
+    print("\nSlowest verbs (full pre-dispatch with no-op handler):")
+    for verb in sorted(dispatch_us, key=dispatch_us.get, reverse=True)[:5]:
+        print(f"  {verb:<14} {dispatch_us[verb]:8.3f} µs")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Benchmark interned room/object IDs: memory and per-command CPU.
+
+Each measurement runs in a fresh process, because the engine mutates the
+cached world data while replaying the walkthrough. The "plain" mode turns
+sys.intern into a no-op, reproducing the string IDs from before interning.
+The "interned" mode runs the code as shipped.
+
+In each run, the script:
+- loads the world and records the retained memory and the number of
+  distinct ID string objects;
+- replays the commands from tests/integration/test_full_walkthrough.py,
+  timing each command;
+- saves the end-game session, loads it back, and records the memory the
+  loaded state retains.
+
+Usage:
+    python scripts/benchmark_id_interning.py [--runs N]
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+REPO_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+GAME_HANDLER_DIR = os.path.join(REPO_ROOT, 'amplify/functions/game-handler')
+WALKTHROUGH = os.path.join(REPO_ROOT, 'tests/integration/test_full_walkthrough.py')
+
+
+class InMemoryClient:
+    """Stand-in DynamoDB client holding one table in a dict."""
+
+    def __init__(self):
+        self.items = {}
+
+    def put_item(self, TableName, Item, **kwargs):
+        self.items[Item['sessionId']['S']] = Item
+
+    def get_item(self, TableName, Key, **kwargs):
+        item = self.items.get(Key['sessionId']['S'])
+        return {'Item': item} if item is not None else {}
+
+
+def distinct_id_strings(world) -> int:
+    """Count distinct string objects used for room and object IDs."""
+    strings = {}
+    for room in world.rooms.values():
+        for value in (room.id, *room.exits.values(), *room.items, *room.global_items):
+            strings[id(value)] = value
+    for obj in world.objects.values():
+        for value in (obj.id, *obj.contents):
+            strings[id(value)] = value
+    return len(strings)
+
+
+def measure(mode: str, data_dir: str) -> dict:
+    """Run one measurement in this process and return the results."""
+    if mode == 'plain':
+        sys.intern = lambda value: value
+    sys.path.insert(0, GAME_HANDLER_DIR)
+    from command_parser import CommandParser
+    from game_engine import GameEngine
+    from state_manager import GameState, SessionManager
+    from world_loader import WorldData
+
+    tracemalloc.start()
+    world = WorldData()
+    world._load_json_files(data_dir)
+    world_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    with open(WALKTHROUGH) as f:
+        commands = re.findall(r'self\.execute\("([^"]+)"', f.read())
+    engine = GameEngine(world)
+    command_parser = CommandParser()
+    state = GameState.create_new_game()
+    durations = []
+    for index, text in enumerate(commands):
+        random.seed(index)
+        start = time.perf_counter()
+        engine.execute_command(command_parser.parse(text), state)
+        durations.append((time.perf_counter() - start) * 1e6)
+
+    manager = SessionManager(InMemoryClient(), 'GameSessions')
+    manager._put_session(state)
+    tracemalloc.start()
+    loaded = manager.load_session(state.session_id)
+    session_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert loaded.current_room == state.current_room
+
+    return {
+        'world_bytes': world_bytes,
+        'id_strings': distinct_id_strings(world),
+        'command_us': statistics.mean(durations),
+        'session_bytes': session_bytes,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Compare plain and interned ID strings.')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--data-dir', default=os.path.join(GAME_HANDLER_DIR, 'data'))
+    parser.add_argument('--measure', choices=('plain', 'interned'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(args.measure, args.data_dir)))
+        return 0
+
+    results = {}
+    for mode in ('plain', 'interned'):
+        runs = []
+        for _ in range(args.runs):
+            output = subprocess.run(
+                [sys.executable, __file__, '--measure', mode, '--data-dir', args.data_dir],
+                check=True, capture_output=True, text=True
+            ).stdout
+            runs.append(json.loads(output.strip().splitlines()[-1]))
+        results[mode] = {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+
+    print(f"ID interning over {args.runs} fresh-process runs (medians)")
+    print(f"{'mode':<10} {'world KB':>9} {'ID strs':>8} {'us/cmd':>8} {'session KB':>11}")
+    for mode, result in results.items():
+        print(
+            f"{mode:<10} {result['world_bytes'] / 1024:>9.1f} {result['id_strings']:>8.0f} "
+            f"{result['command_us']:>8.1f} {result['session_bytes'] / 1024:>11.1f}"
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
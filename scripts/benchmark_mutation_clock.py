@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark GameState mutation cost: per-mutation wall clock vs. logical clock.
+
+GameState mutators used to stamp last_accessed with datetime.now() on every
+call. They now only bump the in-memory revision counter, and the wall
+clock is read once per save. This script restores the old _touch for the
+"wall clock" run and compares the two modes on:
+- a tight loop over the mutators (set_flag, set_object_state, inventory
+  and room moves);
+- mutation-heavy commands ("take all" / "drop all" in the parlor),
+  executed through the engine against a fresh session each time.
+
+Usage:
+    python scripts/benchmark_mutation_clock.py [--iterations N]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, UTC
+
+GAME_HANDLER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../amplify/functions/game-handler')
+sys.path.insert(0, GAME_HANDLER_DIR)
+
+from command_parser import CommandParser
+from game_engine import GameEngine
+from state_manager import GameState
+from world_loader import WorldData
+
+HEAVY_ROOM = 'living_room'
+HEAVY_COMMANDS = ('take all', 'drop all')
+
+
+def wall_clock_touch(self) -> None:
+    """The pre-change GameState._touch: one datetime.now() per mutation."""
+    self.revision += 1
+    self.last_accessed = datetime.now(UTC).isoformat()
+
+
+def mutate(state: GameState) -> None:
+    """Apply a fixed burst of mutations, like a busy puzzle handler."""
+    for index in range(10):
+        state.set_flag(f"flag_{index}", index)
+        state.set_object_state("mailbox", "is_open", index % 2 == 0)
+    state.add_to_inventory("lamp")
+    state.remove_from_inventory("lamp")
+    state.move_to_room("kitchen")
+    state.increment_turn()
+
+
+def time_mutators(iterations: int) -> float:
+    """Median microseconds for one burst of mutations on a fresh state."""
+    durations = []
+    for _ in range(iterations):
+        state = GameState.create_new_game()
+        start = time.perf_counter()
+        mutate(state)
+        durations.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(durations)
+
+
+def time_commands(engine, command_parser, iterations: int) -> tuple:
+    """Median microseconds per heavy command, and mutations per command."""
+    durations = []
+    mutations = []
+    for _ in range(iterations):
+        state = GameState.create_new_game()
+        state.move_to_room(HEAVY_ROOM)
+        for text in HEAVY_COMMANDS:
+            command = command_parser.parse(text)
+            revision = state.revision
+            start = time.perf_counter()
+            engine.execute_command(command, state)
+            durations.append((time.perf_counter() - start) * 1e6)
+            mutations.append(state.revision - revision)
+    return statistics.median(durations), statistics.mean(mutations)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Compare per-mutation wall clock and logical clock.')
+    parser.add_argument('--iterations', type=int, default=2000)
+    parser.add_argument('--data-dir', default=os.path.join(GAME_HANDLER_DIR, 'data'))
+    args = parser.parse_args()
+
+    world = WorldData()
+    world.load_from_json(args.data_dir)
+    engine = GameEngine(world)
+    command_parser = CommandParser()
+
+    logical_touch = GameState._touch
+    results = {}
+    for mode, touch in (('wall clock', wall_clock_touch), ('logical', logical_touch)):
+        GameState._touch = touch
+        mutator_us = time_mutators(args.iterations)
+        command_us, mutations = time_commands(engine, command_parser, args.iterations)
+        results[mode] = (mutator_us, command_us, mutations)
+    GameState._touch = logical_touch
+
+    print(f"Mutation cost over {args.iterations} iterations (medians)")
+    print(f"{'mode':<12} {'burst us':>9} {'heavy cmd us':>13} {'mutations/cmd':>14}")
+    for mode, (mutator_us, command_us, mutations) in results.items():
+        print(f"{mode:<12} {mutator_us:>9.1f} {command_us:>13.1f} {mutations:>14.1f}")
+    before, after = results['wall clock'], results['logical']
+    print(f"Saving: {1 - after[0] / before[0]:.0%} per mutation burst, "
+          f"{1 - after[1] / before[1]:.0%} per heavy command")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Benchmark session load/save latency across session storage backends.
+
+Replays the commands from tests/integration/test_full_walkthrough.py the
+way the handler runs a turn: load the session, execute the command and
+save it if needs_save. Each backend runs in a fresh process, because the
+engine mutates the cached world data while replaying the walkthrough.
+
+Backends:
+- memory: InMemorySessionStore
+- sqlite: SQLiteSessionStore on a temporary file (WAL mode)
+- dynamodb: DynamoDBSessionStore on a real table, only with --dynamodb-table
+  (needs AWS credentials; the test session is deleted afterwards)
+
+Usage:
+    python scripts/benchmark_session_stores.py [--runs N] [--dynamodb-table NAME]
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+GAME_HANDLER_DIR = os.path.join(REPO_ROOT, 'amplify/functions/game-handler')
+WALKTHROUGH = os.path.join(REPO_ROOT, 'tests/integration/test_full_walkthrough.py')
+
+
+def make_store(backend: str, workdir: str, table_name: str):
+    """Create the session store for one backend."""
+    from session_store import DynamoDBSessionStore, InMemorySessionStore, SQLiteSessionStore
+    if backend == 'memory':
+        return InMemorySessionStore()
+    if backend == 'sqlite':
+        return SQLiteSessionStore(os.path.join(workdir, 'sessions.db'))
+    import boto3
+    return DynamoDBSessionStore(boto3.client('dynamodb'), table_name)
+
+
+def measure(backend: str, data_dir: str, table_name: str) -> dict:
+    """Replay the walkthrough against one backend and return the timings."""
+    sys.path.insert(0, GAME_HANDLER_DIR)
+    from command_parser import CommandParser
+    from game_engine import GameEngine
+    from state_manager import GameState, SessionManager, StateDefaults
+    from world_loader import WorldData
+
+    world = WorldData()
+    world.load_from_json(data_dir)
+    engine = GameEngine(world)
+    command_parser = CommandParser()
+    with open(WALKTHROUGH) as f:
+        commands = re.findall(r'self\.execute\("([^"]+)"', f.read())
+
+    with tempfile.TemporaryDirectory() as workdir:
+        store = make_store(backend, workdir, table_name)
+        manager = SessionManager(defaults=StateDefaults.from_world(world), store=store)
+        state = GameState.create_new_game()
+        state.defaults = manager.defaults
+        manager.save_session(state)
+
+        loads, saves = [], []
+        try:
+            for index, text in enumerate(commands):
+                random.seed(index)
+                start = time.perf_counter()
+                state = manager.load_session(state.session_id)
+                loads.append((time.perf_counter() - start) * 1e6)
+                engine.execute_command(command_parser.parse(text), state)
+                if manager.needs_save(state):
+                    start = time.perf_counter()
+                    manager.save_session(state)
+                    saves.append((time.perf_counter() - start) * 1e6)
+        finally:
+            manager.delete_session(state.session_id)
+
+    return {
+        'load_median': statistics.median(loads),
+        'load_p95': statistics.quantiles(loads, n=20)[-1],
+        'save_median': statistics.median(saves),
+        'save_p95': statistics.quantiles(saves, n=20)[-1],
+        'saves': len(saves),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Compare session storage backend latency.')
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--dynamodb-table', help='Also measure this DynamoDB table')
+    parser.add_argument('--data-dir', default=os.path.join(GAME_HANDLER_DIR, 'data'))
+    parser.add_argument('--measure', choices=('memory', 'sqlite', 'dynamodb'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(args.measure, args.data_dir, args.dynamodb_table)))
+        return 0
+
+    backends = ['memory', 'sqlite']
+    if args.dynamodb_table:
+        backends.append('dynamodb')
+
+    results = {}
+    for backend in backends:
+        runs = []
+        for _ in range(args.runs):
+            command = [sys.executable, __file__, '--measure', backend, '--data-dir', args.data_dir]
+            if args.dynamodb_table:
+                command += ['--dynamodb-table', args.dynamodb_table]
+            output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+            runs.append(json.loads(output.strip().splitlines()[-1]))
+        results[backend] = {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+
+    print(f"Session store latency over the walkthrough, {args.runs} fresh-process runs (medians, us)")
+    print(f"{'backend':<10} {'load p50':>9} {'load p95':>9} {'save p50':>9} {'save p95':>9} {'saves':>6}")
+    for backend, result in results.items():
+        print(
+            f"{backend:<10} {result['load_median']:>9.1f} {result['load_p95']:>9.1f} "
+            f"{result['save_median']:>9.1f} {result['save_p95']:>9.1f} {result['saves']:>6.0f}"
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark DynamoDB bytes written per command: full PutItem vs. partial UpdateItem.
+
+Replays the commands from the full game walkthrough integration test
+against an in-memory session and records the request payload that
+SessionManager.save_session sends after each one, alongside the PutItem
+the previous full-item save would have sent.
+
+Usage:
+    python scripts/benchmark_session_writes.py [--walkthrough PATH]
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import sys
+
+REPO_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+GAME_HANDLER_DIR = os.path.join(REPO_ROOT, 'amplify/functions/game-handler')
+sys.path.insert(0, GAME_HANDLER_DIR)
+
+from command_parser import CommandParser
+from game_engine import GameEngine
+from state_manager import GameState, SessionManager
+from world_loader import WorldData
+
+
+class RecordingClient:
+    """Stand-in DynamoDB client that records request payload sizes."""
+
+    def __init__(self):
+        self.requests = []
+
+    def _record(self, operation, request):
+        self.requests.append((operation, len(json.dumps(request))))
+
+    def put_item(self, **request):
+        self._record('put_item', request)
+
+    def update_item(self, **request):
+        self._record('update_item', request)
+
+
+def load_commands(path: str) -> list:
+    """Extract the command strings from the walkthrough test."""
+    with open(path) as f:
+        return re.findall(r'self\.execute\("([^"]+)"', f.read())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Compare session write payloads per command.')
+    parser.add_argument(
+        '--walkthrough',
+        default=os.path.join(REPO_ROOT, 'tests/integration/test_full_walkthrough.py')
+    )
+    parser.add_argument('--data-dir', default=os.path.join(GAME_HANDLER_DIR, 'data'))
+    args = parser.parse_args()
+
+    world = WorldData()
+    world.load_from_json(args.data_dir)
+    engine = GameEngine(world)
+    command_parser = CommandParser()
+
+    full_client = RecordingClient()
+    partial_client = RecordingClient()
+    full_writer = SessionManager(full_client, 'GameSessions')
+    partial_writer = SessionManager(partial_client, 'GameSessions')
+
+    state = GameState.create_new_game()
+    partial_writer.save_session(state)
+
+    commands = load_commands(args.walkthrough)
+    for text in commands:
+        engine.execute_command(command_parser.parse(text), state)
+        state.update_ttl(hours=1)
+        full_writer._put_session(state)
+        partial_writer.save_session(state)
+
+    full_sizes = [size for _, size in full_client.requests]
+    partial_sizes = [size for _, size in partial_client.requests[1:]]
+    updates = sum(1 for operation, _ in partial_client.requests[1:] if operation == 'update_item')
+
+    print(f"Bytes written per command over {len(commands)} walkthrough commands")
+    for label, sizes in (('put_item', full_sizes), ('partial', partial_sizes)):
+        print(
+            f"{label:<10} mean {statistics.mean(sizes):8.0f}   "
+            f"median {statistics.median(sizes):8.0f}   "
+            f"max {max(sizes):8.0f}   total {sum(sizes):>10,}"
+        )
+    print(f"Partial saves sent as UpdateItem: {updates}/{len(partial_sizes)}")
+    print(f"Reduction (total bytes): {1 - sum(partial_sizes) / sum(full_sizes):.0%}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
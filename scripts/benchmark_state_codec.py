@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Benchmark session item size and save/load CPU: plain maps vs. the compact codec.
+
+Replays the commands from the full game walkthrough integration test and
+takes the game state at several checkpoints, ending with the end-game
+state. Each is written with a full PutItem and read back with GetItem
+through SessionManager, once with the plain attribute layout and once with
+compact_state, against an in-memory client.
+
+Item sizes follow DynamoDB's billing rules: attribute names plus values,
+with 1 byte per element and 3 bytes per map or list of overhead.
+
+Usage:
+    python scripts/benchmark_state_codec.py [--iterations N]
+"""
+
+import argparse
+import os
+import re
+import statistics
+import sys
+import time
+
+REPO_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+GAME_HANDLER_DIR = os.path.join(REPO_ROOT, 'amplify/functions/game-handler')
+sys.path.insert(0, GAME_HANDLER_DIR)
+
+from command_parser import CommandParser
+from game_engine import GameEngine
+from state_manager import GameState, SessionManager
+from world_loader import WorldData
+
+CHECKPOINTS = (0.25, 0.5, 0.75, 1.0)
+
+
+class InMemoryClient:
+    """Stand-in DynamoDB client holding one table in a dict."""
+
+    def __init__(self):
+        self.items = {}
+
+    def put_item(self, TableName, Item, **kwargs):
+        self.items[Item['sessionId']['S']] = Item
+
+    def get_item(self, TableName, Key, **kwargs):
+        item = self.items.get(Key['sessionId']['S'])
+        return {'Item': item} if item is not None else {}
+
+
+def attribute_size(value: dict) -> int:
+    """Approximate the billed size of one DynamoDB attribute value."""
+    (kind, data), = value.items()
+    if kind == 'S':
+        return len(data.encode('utf-8'))
+    if kind == 'N':
+        return len(data.lstrip('-').replace('.', '')) // 2 + 1
+    if kind == 'B':
+        return len(data)
+    if kind in ('BOOL', 'NULL'):
+        return 1
+    if kind == 'SS':
+        return sum(len(item.encode('utf-8')) for item in data)
+    if kind == 'L':
+        return 3 + sum(1 + attribute_size(item) for item in data)
+    return 3 + item_size(data) + len(data)
+
+
+def item_size(item: dict) -> int:
+    """Approximate the billed size of a DynamoDB item."""
+    return sum(len(name.encode('utf-8')) + attribute_size(value) for name, value in item.items())
+
+
+def load_commands(path: str) -> list:
+    """Extract the command strings from the walkthrough test."""
+    with open(path) as f:
+        return re.findall(r'self\.execute\("([^"]+)"', f.read())
+
+
+def collect_states(data_dir: str, commands: list) -> list:
+    """Replay the walkthrough and return (label, GameState) checkpoints."""
+    world = WorldData()
+    world.load_from_json(data_dir)
+    engine = GameEngine(world)
+    command_parser = CommandParser()
+
+    marks = {max(1, int(len(commands) * fraction)): fraction for fraction in CHECKPOINTS}
+    state = GameState.create_new_game()
+    states = []
+    for index, text in enumerate(commands, start=1):
+        engine.execute_command(command_parser.parse(text), state)
+        if index in marks:
+            snapshot = GameState.from_dict(state.to_dict())
+            snapshot.session_id = state.session_id
+            states.append((f"{marks[index]:.0%} ({index} cmds)", snapshot))
+    return states
+
+
+def time_call(function, iterations: int) -> float:
+    """Return the median duration of function() in microseconds."""
+    durations = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        function()
+        durations.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(durations)
+
+
+def measure(state: GameState, compact: bool, iterations: int) -> tuple:
+    """Return (item bytes, save us, load us) for one layout."""
+    client = InMemoryClient()
+    manager = SessionManager(client, 'GameSessions', compact_state=compact)
+    manager._put_session(state)
+    size = item_size(client.items[state.session_id])
+    save = time_call(lambda: manager._put_session(state), iterations)
+    load = time_call(lambda: manager.load_session(state.session_id), iterations)
+    return size, save, load
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Compare plain and compact session item encodings.')
+    parser.add_argument('--iterations', type=int, default=500)
+    parser.add_argument(
+        '--walkthrough',
+        default=os.path.join(REPO_ROOT, 'tests/integration/test_full_walkthrough.py')
+    )
+    parser.add_argument('--data-dir', default=os.path.join(GAME_HANDLER_DIR, 'data'))
+    args = parser.parse_args()
+
+    commands = load_commands(args.walkthrough)
+    print(f"Session item size and CPU over the {len(commands)}-command walkthrough "
+          f"(median of {args.iterations} runs)")
+    print(f"{'checkpoint':<18} {'layout':<8} {'bytes':>7} {'WCU':>4} {'save us':>9} {'load us':>9}")
+    for label, state in collect_states(args.data_dir, commands):
+        plain = measure(state, False, args.iterations)
+        compact = measure(state, True, args.iterations)
+        for layout, (size, save, load) in (('plain', plain), ('compact', compact)):
+            print(f"{label:<18} {layout:<8} {size:>7,} {-(-size // 1024):>4} {save:>9.1f} {load:>9.1f}")
+        print(f"{'':<18} {'saving':<8} {1 - compact[0] / plain[0]:>7.0%}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
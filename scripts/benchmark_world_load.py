@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark cold world loading: JSON parsing vs. the prebuilt binary snapshot.
+
+Each iteration clears the WorldData class-level cache so every load is a
+cold load, matching what a fresh Lambda container pays on its first request.
+
+Usage:
+    python scripts/benchmark_world_load.py [--iterations N]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+GAME_HANDLER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../amplify/functions/game-handler')
+sys.path.insert(0, GAME_HANDLER_DIR)
+
+from world_loader import WorldData
+
+
+def time_loads(load, iterations: int) -> list:
+    """Run a cold load `iterations` times and return durations in milliseconds."""
+    durations = []
+    for _ in range(iterations):
+        WorldData.clear_cache()
+        start = time.perf_counter()
+        load()
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def report(label: str, durations: list) -> None:
+    print(
+        f"{label:<10} mean {statistics.mean(durations):7.2f} ms   "
+        f"median {statistics.median(durations):7.2f} ms   "
+        f"min {min(durations):7.2f} ms"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Compare JSON and snapshot world load times.')
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument('--data-dir', default=os.path.join(GAME_HANDLER_DIR, 'data'))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot_path = WorldData().build_snapshot(args.data_dir, os.path.join(tmp, 'world.snapshot'))
+
+        def load_json():
+            WorldData()._load_json_files(args.data_dir)
+
+        def load_snapshot():
+            if not WorldData().load_from_snapshot(snapshot_path, args.data_dir):
+                raise RuntimeError("Snapshot rejected as stale")
+
+        json_times = time_loads(load_json, args.iterations)
+        snapshot_times = time_loads(load_snapshot, args.iterations)
+
+    print(f"Cold world load over {args.iterations} iterations")
+    report('json', json_times)
+    report('snapshot', snapshot_times)
+    print(f"Speedup (median): {statistics.median(json_times) / statistics.median(snapshot_times):.1f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
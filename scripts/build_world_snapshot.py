@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Build the prebuilt world snapshot for the game handler Lambda.
+
+Compiles rooms_haunted.json, objects_haunted.json, global_objects_haunted.json
+and flags_haunted.json into a single validated binary snapshot that
+WorldData.load_from_json picks up on cold start instead of parsing JSON.
+
+Usage:
+    python scripts/build_world_snapshot.py [--data-dir DIR] [--output PATH]
+"""
+
+import argparse
+import os
+import sys
+
+GAME_HANDLER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../amplify/functions/game-handler')
+sys.path.insert(0, GAME_HANDLER_DIR)
+
+from world_loader import WorldData, SNAPSHOT_FILENAME
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Build the binary world snapshot.')
+    parser.add_argument(
+        '--data-dir',
+        default=os.path.join(GAME_HANDLER_DIR, 'data'),
+        help='Directory containing the JSON data files'
+    )
+    parser.add_argument(
+        '--output',
+        default=None,
+        help=f'Snapshot output path (default: <data-dir>/{SNAPSHOT_FILENAME})'
+    )
+    args = parser.parse_args()
+
+    world = WorldData()
+    path = world.build_snapshot(args.data_dir, args.output)
+
+    size = os.path.getsize(path)
+    print(f"Wrote {path} ({size:,} bytes, {len(world.rooms)} rooms, {len(world.objects)} objects)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
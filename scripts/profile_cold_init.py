@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Profile Lambda cold initialization of the game handler, with a budget check.
+
+Stages the function bundle the way amplify/functions/game-handler/resource.ts
+does (*.py plus data/, a freshly built world snapshot and precompiled
+bytecode) and runs a new interpreter per measurement under `-X importtime`
+with bytecode writes off, so each run pays what a new container pays.
+--source-only leaves out the bytecode, to see what compiling the handler
+modules costs. Each run times, in order:
+- import boto3
+- import game_engine (and the modules it pulls in)
+- import index (the rest of the handler)
+- loading the world data
+- initialize_game_components() (engine, parser, DynamoDB client and session
+  manager)
+
+The report shows the median of each phase and the slowest imports from
+the `-X importtime` tree. It must run on the Lambda runtime's Python
+version (3.12) and exits 2 on any other. With --budget-ms the script exits 1 when the
+median total exceeds the budget, so CI can fail on cold-init regressions.
+
+Usage:
+    python scripts/profile_cold_init.py [--runs N] [--top N] [--budget-ms MS] [--source-only]
+"""
+
+import argparse
+import glob
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+GAME_HANDLER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../amplify/functions/game-handler')
+
+# Python version of the Lambda runtime (resource.ts); the handler modules
+# use its syntax, so other versions cannot import them
+LAMBDA_PYTHON = (3, 12)
+
+PHASES = ('import boto3', 'import game_engine', 'import index', 'load world data', 'initialize components')
+RESULT_PREFIX = 'COLD_INIT '
+
+# Runs in the staged bundle; handler log lines share stdout, so the
+# timings go on their own prefixed line
+CHILD = f"""
+import json, time
+start = time.perf_counter()
+marks = []
+import boto3
+marks.append(time.perf_counter())
+import game_engine
+marks.append(time.perf_counter())
+import index
+marks.append(time.perf_counter())
+from world_loader import WorldData
+WorldData().load_from_json('data')
+marks.append(time.perf_counter())
+index.initialize_game_components()
+marks.append(time.perf_counter())
+durations = [(mark - previous) * 1000 for previous, mark in zip([start] + marks, marks)]
+print({RESULT_PREFIX!r} + json.dumps(durations))
+"""
+
+
+def stage_bundle(target: str, precompile: bool) -> None:
+    """Copy the handler modules and data into target, as the Lambda bundler does."""
+    for path in glob.glob(os.path.join(GAME_HANDLER_DIR, '*.py')):
+        shutil.copy(path, target)
+    shutil.copytree(
+        os.path.join(GAME_HANDLER_DIR, 'data'), os.path.join(target, 'data'),
+        ignore=shutil.ignore_patterns('*.snapshot')
+    )
+    sys.path.insert(0, GAME_HANDLER_DIR)
+    from world_loader import WorldData
+    WorldData().build_snapshot(os.path.join(target, 'data'))
+    if precompile:
+        subprocess.run(
+            [sys.executable, '-m', 'compileall', '-q', '-l', '--invalidation-mode', 'unchecked-hash', target],
+            check=True
+        )
+
+
+def run_once(bundle: str) -> tuple:
+    """Run one cold init in a new interpreter; return (phase durations, importtime lines)."""
+    env = dict(os.environ)
+    env.update({
+        'EAGER_INIT': 'off',
+        'PYTHONDONTWRITEBYTECODE': '1',
+        'SESSION_STORE': env.get('SESSION_STORE', 'dynamodb'),
+        'AWS_DEFAULT_REGION': env.get('AWS_DEFAULT_REGION', 'us-east-1'),
+    })
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', CHILD],
+        cwd=bundle, env=env, capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Cold init failed:\n{completed.stderr[-2000:]}")
+    result = next(line for line in completed.stdout.splitlines() if line.startswith(RESULT_PREFIX))
+    return json.loads(result[len(RESULT_PREFIX):]), completed.stderr.splitlines()
+
+
+def slowest_imports(importtime_lines: list, top: int) -> list:
+    """Parse `-X importtime` output into the top (cumulative us, self us, module) rows."""
+    rows = []
+    for line in importtime_lines:
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append((int(cumulative_us), int(self_us), name.rstrip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Profile Lambda cold init of the game handler.')
+    parser.add_argument('--runs', type=int, default=5, help='Measured runs (after one warm-up)')
+    parser.add_argument('--top', type=int, default=15, help='Slowest imports to list')
+    parser.add_argument('--budget-ms', type=float, help='Fail if the median total exceeds this')
+    parser.add_argument('--source-only', action='store_true', help='Leave bytecode out of the staged bundle')
+    args = parser.parse_args()
+
+    if sys.version_info[:2] != LAMBDA_PYTHON:
+        print(
+            f"profile_cold_init.py needs Python {'.'.join(map(str, LAMBDA_PYTHON))} (the Lambda runtime), "
+            f"not {sys.version_info.major}.{sys.version_info.minor}",
+            file=sys.stderr
+        )
+        return 2
+
+    with tempfile.TemporaryDirectory() as bundle:
+        stage_bundle(bundle, precompile=not args.source_only)
+        # Warm the OS file cache so the first measured run is not an outlier
+        run_once(bundle)
+        runs = [run_once(bundle) for _ in range(args.runs)]
+
+    medians = [statistics.median(durations[i] for durations, _ in runs) for i in range(len(PHASES))]
+    totals = [sum(durations) for durations, _ in runs]
+    total = statistics.median(totals)
+
+    print(f"Cold init of the game handler, median of {args.runs} runs (ms)")
+    for phase, duration in zip(PHASES, medians):
+        print(f"  {phase:<22} {duration:8.1f}")
+    print(f"  {'total':<22} {total:8.1f}   (min {min(totals):.1f}, max {max(totals):.1f})")
+
+    print("\nSlowest imports, first run (ms, cumulative / self)")
+    for cumulative_us, self_us, name in slowest_imports(runs[0][1], args.top):
+        print(f"  {cumulative_us / 1000:8.1f} {self_us / 1000:8.1f}  {name}")
+
+    if args.budget_ms is not None:
+        if total > args.budget_ms:
+            print(f"\nFAIL: cold init {total:.1f} ms exceeds the {args.budget_ms:.0f} ms budget")
+            return 1
+        print(f"\nOK: cold init {total:.1f} ms within the {args.budget_ms:.0f} ms budget")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -12,6 +12,8 @@ import {
   GameResponse,
   SessionExpiredError,
   ApiError,
+  API_RETRY_ATTEMPTS,
+  RETRY_BASE_DELAY,
 } from '../types';
 
 /**
@@ -19,10 +21,64 @@ import {
  */
 const client = generateClient<Schema>();
 
+/**
+ * HTTP-style status for an AppSync error type
+ *
+ * Lambda:Unhandled is an exception raised by the game handler, such as a
+ * storage failure or a lost save race, and counts as a server error. Types
+ * not listed here are treated as client errors so they are not retried.
+ */
+function statusForErrorType(errorType: string | undefined): number {
+  switch (errorType) {
+    case 'ThrottlingException':
+    case 'TooManyRequestsException':
+    case 'Lambda:TooManyRequestsException':
+      return 429;
+    case 'Unauthorized':
+    case 'UnauthorizedException':
+      return 401;
+    case 'Lambda:Unhandled':
+    case 'Lambda:ServiceException':
+    case 'Lambda:AWSLambdaException':
+    case 'InternalFailure':
+      return 500;
+    case 'ServiceUnavailableException':
+      return 503;
+    default:
+      return 400;
+  }
+}
+
+/**
+ * Whether a failed command is worth another attempt: network errors
+ * (status 0), throttling and server errors
+ */
+function isRetryable(error: unknown): boolean {
+  return (
+    error instanceof ApiError &&
+    (error.status === 0 || error.status === 429 || error.status >= 500)
+  );
+}
+
+/**
+ * Last rendered view of a session, for processCommand delta mode
+ */
+interface RenderedView {
+  viewHash: string;
+  description_spooky: string;
+  inventory: string[];
+}
+
 /**
  * GraphQLApiClient class for managing GraphQL API communication
  */
 export class GraphQLApiClient {
+  /**
+   * Views by session ID; the backend only resends view fields that changed
+   * since the view whose hash is sent as lastViewHash
+   */
+  private views = new Map<string, RenderedView>();
+
   /**
    * Create a new game session
    * @returns Promise resolving to session ID and initial game state
@@ -85,6 +141,11 @@ export class GraphQLApiClient {
 
   /**
    * Send a command to the game
+   * 
+   * Network errors, throttling and server errors are retried with
+   * exponential backoff under the same command ID, so a command the backend
+   * already ran and saved is answered from the session instead of running
+   * twice. Other errors are thrown straight away.
    * @param sessionId - Current session ID
    * @param command - Command text to send
    * @returns Promise resolving to game response
@@ -92,28 +153,78 @@ export class GraphQLApiClient {
    * @throws ApiError if the request fails
    */
   async sendCommand(sessionId: string, command: string): Promise<GameResponse> {
+    // Generated once per command and sent with every attempt
+    const commandId = crypto.randomUUID();
+
+    for (let attempt = 0; ; attempt++) {
+      try {
+        return await this.sendCommandOnce(sessionId, command, commandId);
+      } catch (error) {
+        // Client errors and expired sessions fail the same way on retry
+        if (!isRetryable(error) || attempt === API_RETRY_ATTEMPTS - 1) {
+          throw error;
+        }
+
+        // Wait before retrying (exponential backoff)
+        const delay = RETRY_BASE_DELAY * Math.pow(2, attempt);
+        await new Promise(resolve => setTimeout(resolve, delay));
+      }
+    }
+  }
+
+  /**
+   * Send one attempt of a command to the game
+   * @param sessionId - Current session ID
+   * @param command - Command text to send
+   * @param commandId - ID shared by every attempt of the command
+   * @returns Promise resolving to game response
+   * @throws SessionExpiredError if session has expired
+   * @throws ApiError if the request fails
+   */
+  private async sendCommandOnce(
+    sessionId: string,
+    command: string,
+    commandId: string
+  ): Promise<GameResponse> {
+    const lastView = this.views.get(sessionId);
     try {
       // Call the custom GraphQL query that invokes the Lambda function
       const { data, errors } = await client.queries.processCommand({
         sessionId,
         command,
+        commandId,
+        lastViewHash: lastView?.viewHash ?? '',
       });
 
-      if (errors || !data) {
+      if (errors) {
         // Check if it's a session not found error
-        const errorMessage = errors?.[0]?.message || 'Failed to process command';
+        const errorMessage = errors[0]?.message || 'Failed to process command';
         if (errorMessage.includes('Session not found') || errorMessage.includes('expired')) {
           throw new SessionExpiredError();
         }
-        throw new ApiError(500, errorMessage);
+        throw new ApiError(statusForErrorType(errors[0]?.errorType), errorMessage);
       }
 
+      if (!data) {
+        throw new ApiError(500, 'Failed to process command');
+      }
+
+      // Null view fields are unchanged since the last view; patch it
+      const view: RenderedView = {
+        viewHash: data.viewHash ?? '',
+        description_spooky: data.description_spooky ?? lastView?.description_spooky ?? '',
+        inventory: data.inventory
+          ? data.inventory.filter((item): item is string => item !== null)
+          : lastView?.inventory ?? [],
+      };
+      this.views.set(sessionId, view);
+
       // Map the GraphQL response to GameResponse format
       return {
         room: data.room,
-        description_spooky: data.description_spooky,
+        description_spooky: view.description_spooky,
         response_spooky: data.message || '',
-        inventory: (data.inventory || []).filter((item): item is string => item !== null),
+        inventory: view.inventory,
         score: data.score,
       };
     } catch (error) {
@@ -125,8 +236,9 @@ export class GraphQLApiClient {
         throw error;
       }
       
+      // Anything else was thrown by the transport before a response arrived
       const message = error instanceof Error ? error.message : 'Failed to send command';
-      throw new ApiError(500, message);
+      throw new ApiError(0, `Network error: ${message}`);
     }
   }
 
@@ -22,6 +22,10 @@ class TestBoatMechanics(unittest.TestCase):
         self.engine = GameEngine(self.world_data)
         self.state = GameState("test_user", "west_of_house")
 
+    def room_items(self, room_id):
+        """Room contents as seen by this test's session."""
+        return self.engine.room_items(self.world_data.get_room(room_id), self.state)
+
     def test_inflate_boat(self):
         # Start at Dam Base
         self.state.current_room = "dam_base"
@@ -31,24 +35,22 @@ class TestBoatMechanics(unittest.TestCase):
         
         # Verify initial state
         room = self.world_data.get_room("dam_base")
-        if "inflatable_boat" not in room.items:
-             room.items.append("inflatable_boat") # Ensure it's there
+        self.engine.add_room_item(room, "inflatable_boat", self.state) # Ensure it's there
         
         # Action: INFLATE BOAT
         # Note: We call handle_inflate directly to test logic
         res = self.engine.handle_inflate("inflatable_boat", self.state)
         
         self.assertTrue(res.success, f"Inflate failed: {res.message}")
-        self.assertIn("inflated_boat", self.world_data.get_room("dam_base").items)
-        self.assertNotIn("inflatable_boat", self.world_data.get_room("dam_base").items)
+        self.assertIn("inflated_boat", self.room_items("dam_base"))
+        self.assertNotIn("inflatable_boat", self.room_items("dam_base"))
 
     def test_puncture_boat(self):
         self.state.current_room = "dam_base"
         room = self.world_data.get_room("dam_base")
         # Ensure inflated boat is there
-        if "inflated_boat" not in room.items:
-            room.items.append("inflated_boat")
-            if "inflatable_boat" in room.items: list(room.items).remove("inflatable_boat")
+        self.engine.add_room_item(room, "inflated_boat", self.state)
+        self.engine.remove_room_item(room, "inflatable_boat", self.state)
             
         # Give sharp item
         self.state.inventory.append("knife")
@@ -58,15 +60,14 @@ class TestBoatMechanics(unittest.TestCase):
         
         self.assertFalse(res.success)
         self.assertIn("punctured", res.message.lower())
-        self.assertIn("punctured_boat", room.items)
-        self.assertNotIn("inflated_boat", room.items)
+        self.assertIn("punctured_boat", self.room_items("dam_base"))
+        self.assertNotIn("inflated_boat", self.room_items("dam_base"))
 
     def test_repair_boat(self):
         self.state.current_room = "dam_base"
         room = self.world_data.get_room("dam_base")
         # Ensure punctured boat
-        if "punctured_boat" not in room.items:
-            room.items.append("punctured_boat")
+        self.engine.add_room_item(room, "punctured_boat", self.state)
             
         # Give repair kit (gunk)
         self.state.inventory.append("gunk")
@@ -75,14 +76,14 @@ class TestBoatMechanics(unittest.TestCase):
         res = self.engine.handle_fix("punctured_boat", self.state)
         
         self.assertTrue(res.success)
-        self.assertIn("inflated_boat", room.items)
-        self.assertNotIn("punctured_boat", room.items)
+        self.assertIn("inflated_boat", self.room_items("dam_base"))
+        self.assertNotIn("punctured_boat", self.room_items("dam_base"))
 
     def test_launch_boat(self):
         self.state.current_room = "dam_base"
         room = self.world_data.get_room("dam_base")
         # Ensure inflated boat
-        if "inflated_boat" not in room.items: room.items.append("inflated_boat")
+        self.engine.add_room_item(room, "inflated_boat", self.state)
         
         # Board safely
         self.state.inventory = [] # No sharp items
@@ -96,8 +97,8 @@ class TestBoatMechanics(unittest.TestCase):
         self.assertTrue(res_launch.success)
         self.assertEqual(self.state.current_room, "river_1")
         # Verify boat moved
-        self.assertIn("inflated_boat", self.world_data.get_room("river_1").items)
-        self.assertNotIn("inflated_boat", self.world_data.get_room("dam_base").items)
+        self.assertIn("inflated_boat", self.room_items("river_1"))
+        self.assertNotIn("inflated_boat", self.room_items("dam_base"))
 
 if __name__ == '__main__':
     unittest.main()
@@ -429,7 +429,7 @@ def test_throw_relocates_object(data):
         "Object should be removed from inventory after throw"
     
     # Object should be in current room
-    assert object_id in room.items, \
+    assert object_id in engine.room_items(room, state), \
         "Object should be in current room after throw"
     
     # Inventory should be marked as changed
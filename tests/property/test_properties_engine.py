@@ -380,7 +380,7 @@ def test_take_then_drop_returns_object_to_room(data):
         current_room.items.append(object_id)
     
     # Verify initial state
-    assert object_id in current_room.items, "Object should be in room initially"
+    assert object_id in engine.room_items(current_room, state), "Object should be in room initially"
     assert object_id not in state.inventory, "Object should not be in inventory initially"
     
     # Take the object
@@ -391,7 +391,7 @@ def test_take_then_drop_returns_object_to_room(data):
     
     # Object should now be in inventory and not in room
     assert object_id in state.inventory, "Object should be in inventory after taking"
-    assert object_id not in current_room.items, "Object should not be in room after taking"
+    assert object_id not in engine.room_items(current_room, state), "Object should not be in room after taking"
     
     # Drop the object
     drop_result = engine.handle_drop(object_id, state)
@@ -401,7 +401,7 @@ def test_take_then_drop_returns_object_to_room(data):
     
     # Object should be back in room and not in inventory (round trip complete)
     assert object_id not in state.inventory, "Object should not be in inventory after dropping"
-    assert object_id in current_room.items, "Object should be back in room after dropping"
+    assert object_id in engine.room_items(current_room, state), "Object should be back in room after dropping"
 
 
 # Feature: game-backend-api, Property 8: Inventory tracking
@@ -1411,7 +1411,7 @@ def test_push_pull_changes_object_state(data):
         assert game_object.state.get('is_pushed', False) is True
         
         # Verify object is still in room
-        assert object_id in current_room.items
+        assert object_id in engine.room_items(current_room, state)
     
     elif operation == 'pull':
         # Verify initial state
@@ -1427,7 +1427,7 @@ def test_push_pull_changes_object_state(data):
         assert game_object.state.get('is_pulled', False) is True
         
         # Verify object is still in room
-        assert object_id in current_room.items
+        assert object_id in engine.room_items(current_room, state)
 
 
 @settings(max_examples=100)
@@ -1544,7 +1544,7 @@ def test_push_pull_reveals_hidden_items(data):
         world.objects[hidden_item_id] = hidden_item
     
     # Verify hidden item is not in room initially
-    assert hidden_item_id not in current_room.items
+    assert hidden_item_id not in engine.room_items(current_room, state)
     
     # Decide whether to test push or pull
     operation = data.draw(st.sampled_from(['push', 'pull']))
@@ -1557,7 +1557,7 @@ def test_push_pull_reveals_hidden_items(data):
         # Success may vary based on conditions
         
         # Verify hidden item is now in room
-        assert hidden_item_id in current_room.items
+        assert hidden_item_id in engine.room_items(current_room, state)
         
         # Verify notification about revealed item
         assert len(result.notifications) > 0
@@ -1570,7 +1570,7 @@ def test_push_pull_reveals_hidden_items(data):
         # Success may vary based on conditions
         
         # Verify hidden item is now in room
-        assert hidden_item_id in current_room.items
+        assert hidden_item_id in engine.room_items(current_room, state)
         
         # Verify notification about revealed item
         assert len(result.notifications) > 0
@@ -165,20 +165,20 @@ def test_save_restore_round_trip(data):
     assert restore_result.success is True, \
         f"Restoring game with save ID {save_id} should succeed"
     
-    # Note: The current implementation of handle_restore doesn't actually
-    # restore the state from DynamoDB (that happens in the Lambda handler).
-    # It only validates the save ID exists. So we can't test full round-trip
-    # at this level without mocking DynamoDB.
-    
-    # What we CAN test is that:
-    # 1. Save creates a save ID
-    # 2. Restore recognizes that save ID
-    # 3. Both operations return success
-    
-    # Verify save ID was created
-    save_key = f"save_{save_id}"
-    assert original_state.get_flag(save_key, False) is True, \
-        f"Save key {save_key} should exist in flags"
+    # Every saved field should be back
+    assert original_state.current_room == original_room
+    assert original_state.inventory == original_inventory
+    assert original_state.score == original_score
+    assert original_state.moves == original_moves
+    assert original_state.turn_count == original_turn_count
+    assert original_state.sanity == original_sanity
+    assert original_state.souls_collected == original_souls
+    assert original_state.lamp_battery == original_lamp
+    assert original_state.cursed == original_cursed
+    assert original_state.blood_moon_active == original_blood_moon
+    assert original_state.lucky == original_lucky
+    assert original_state.thief_here == original_thief
+    assert original_state.flags == {**original_flags, 'last_save_id': save_id}
     
     # Verify both operations returned messages
     assert save_result.message is not None and len(save_result.message) > 0, \
@@ -242,11 +242,13 @@ def test_save_creates_unique_save_ids(data):
     assert len(save_ids) == len(set(save_ids)), \
         f"All save IDs should be unique, got: {save_ids}"
     
-    # All save keys should exist in flags
-    for save_id in save_ids:
-        save_key = f"save_{save_id}"
-        assert state.get_flag(save_key, False) is True, \
-            f"Save key {save_key} should exist in flags"
+    # Saves are listed as slots, not accumulated as flags, once written
+    engine.save_slots.write_pending(state)
+    listed = [save['save_id'] for save in engine.save_slots.list_saves(state.session_id)]
+    assert listed == list(reversed(save_ids)), \
+        f"All saves should be listed newest first, got: {listed}"
+    assert not any(name.startswith('save_') for name in state.flags), \
+        "Saves should not add save_<id> flags"
 
 
 @settings(max_examples=100)
@@ -279,10 +281,6 @@ def test_restore_fails_with_invalid_save_id(data):
         max_size=8
     ))
     
-    # Ensure this save ID doesn't exist
-    save_key = f"save_{invalid_save_id}"
-    state.set_flag(save_key, False)
-    
     # Attempt to restore with invalid save ID
     restore_result = engine.handle_restore(invalid_save_id, state)
     
@@ -225,14 +225,14 @@ def test_search_reveals_hidden_items(data):
         f"SEARCH {object_id} should succeed"
     
     # The hidden item should now be in the room
-    assert test_item_id in current_room.items, \
+    assert test_item_id in engine.room_items(current_room, state), \
         "Hidden item should be revealed and added to room"
     
     # Search again - item should not be revealed twice
     result2 = engine.handle_search(object_id, state)
     
     # Count how many times the item appears in the room
-    item_count = current_room.items.count(test_item_id)
+    item_count = engine.room_items(current_room, state).count(test_item_id)
     assert item_count == 1, \
         "Hidden item should only be revealed once, not duplicated"
 
@@ -14,7 +14,11 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../amplify/functi
 
 import pytest
 from hypothesis import given, strategies as st, settings
-from state_manager import GameState
+from botocore.exceptions import ClientError
+from state_manager import GameState, SessionManager, SessionCache, SessionConflictError, StateDefaults
+from state_codec import PACKED_STATE_ATTRIBUTE, pack, unpack, decode_state
+from session_store import DynamoDBSessionStore, InMemorySessionStore, SQLiteSessionStore
+from attribute_codec import ItemCodec, encode_map
 import json
 import time
 
@@ -158,6 +162,37 @@ def test_json_round_trip(state):
     assert restored_state.lamp_battery == state.lamp_battery
 
 
+# Additional property: In-memory bookkeeping is per instance and never stored
+@settings(max_examples=50)
+@given(state=game_state_strategy(), sanity=st.integers(min_value=0, max_value=100))
+def test_transient_attributes_are_not_stored_or_compared(state, sanity):
+    """
+    For any game state, the attributes SessionManager keeps in memory
+    (revision, clean snapshot, defaults, layout, journal cursor, pending
+    saves, command log) stay out of the stored dict and equality, and
+    belong to each instance.
+    """
+    other = GameState.from_dict(state.to_dict())
+    state.mark_clean()
+    state.defaults = StateDefaults({}, {})
+    state._packed = True
+    state._touch()
+    state.record_command("look", 7)
+    state.sanity = sanity
+    other.sanity = sanity
+    
+    stored = state.to_dict()
+    for name in ('revision', '_clean', 'defaults', '_packed', '_journal', 'pending_saves', 'command_log'):
+        assert name not in stored
+    assert state == other
+    assert other._clean is None and other.defaults is None and other._packed is False
+    assert state.revision == 1 and other.revision == 0
+    assert state.command_log == [("look", 7)] and other.command_log == []
+    
+    state.mark_clean()
+    assert state.command_log == []
+
+
 # Additional property: Serialization preserves data types
 @settings(max_examples=100)
 @given(state=game_state_strategy())
@@ -367,3 +402,636 @@ def test_session_ttl_preserved_in_serialization(state):
     
     assert restored_from_json.expires == original_expires, \
         "expires field should be preserved through JSON serialization"
+
+
+# Feature: game-backend-api, Property 17: Room overlay isolation
+@settings(max_examples=100)
+@given(
+    pristine=st.lists(st.sampled_from(["lamp", "sword", "rope", "mailbox", "leaflet"]), unique=True, max_size=5),
+    operations=st.lists(
+        st.tuples(st.booleans(), st.sampled_from(["lamp", "sword", "rope", "mailbox", "leaflet", "egg"])),
+        max_size=20
+    )
+)
+def test_room_overlay_matches_list_semantics_without_mutating_world(pristine, operations):
+    """
+    For any sequence of room item additions and removals, the merged view should
+    contain the same items as applying them to a copy of the room's list, the
+    pristine list should never change, and a room restored to its pristine
+    contents should not be stored in the overlay.
+    
+    **Validates: Requirements 1.2**
+    
+    This ensures shared world data cached across warm invocations is never
+    modified by one session.
+    """
+    state = GameState.create_new_game()
+    original = list(pristine)
+    expected = list(pristine)
+    
+    for is_add, item in operations:
+        if is_add:
+            added = state.add_room_item("kitchen", pristine, item)
+            assert added == (item not in expected)
+            if added:
+                expected.append(item)
+        else:
+            removed = state.remove_room_item("kitchen", pristine, item)
+            assert removed == (item in expected)
+            if removed:
+                expected.remove(item)
+    
+    assert pristine == original
+    assert sorted(state.get_room_items("kitchen", pristine)) == sorted(expected)
+    
+    if sorted(expected) == sorted(original):
+        assert "kitchen" not in state.room_items_overlay
+    
+    restored = GameState.from_dict(state.to_dict())
+    assert sorted(restored.get_room_items("kitchen", pristine)) == sorted(expected)
+
+
+def condition_holds(item, expression, names, values):
+    """Evaluate the ConditionExpressions SessionManager writes against an item."""
+    if ' OR ' in expression:
+        return any(condition_holds(item, part, names, values) for part in expression.split(' OR '))
+    if ' AND ' in expression:
+        return all(condition_holds(item, part, names, values) for part in expression.split(' AND '))
+    function, _, argument = expression.partition('(')
+    if argument:
+        exists = item is not None and names.get(argument[:-1], argument[:-1]) in item
+        return exists if function == 'attribute_exists' else not exists
+    name, _, placeholder = expression.partition(' = ')
+    return item is not None and item.get(names.get(name, name)) == values[placeholder]
+
+
+def conditional_check_failed():
+    return ClientError({'Error': {'Code': 'ConditionalCheckFailedException'}}, 'PutItem')
+
+
+class RecordingDynamoDB:
+    """Minimal in-memory DynamoDB client that applies conditional SET/REMOVE updates."""
+    
+    def __init__(self):
+        self.items = {}
+        self.calls = []
+        self.reads = []
+    
+    def put_item(self, TableName, Item, ConditionExpression=None,
+                 ExpressionAttributeNames=None, ExpressionAttributeValues=None):
+        self.calls.append('put_item')
+        stored = self.items.get(Item['sessionId']['S'])
+        if ConditionExpression and not condition_holds(stored, ConditionExpression,
+                                                       ExpressionAttributeNames or {}, ExpressionAttributeValues or {}):
+            raise conditional_check_failed()
+        self.items[Item['sessionId']['S']] = Item
+    
+    def get_item(self, TableName, Key, ProjectionExpression=None, ExpressionAttributeNames=None, **kwargs):
+        item = self.items.get(Key['sessionId']['S'])
+        self.reads.append(ProjectionExpression or 'full')
+        if item is None:
+            return {}
+        if ProjectionExpression:
+            names = [(ExpressionAttributeNames or {}).get(name, name) for name in ProjectionExpression.split(', ')]
+            item = {name: item[name] for name in names if name in item}
+        return {'Item': item}
+    
+    def update_item(self, TableName, Key, UpdateExpression, ExpressionAttributeNames,
+                    ConditionExpression=None, ExpressionAttributeValues=None):
+        self.calls.append('update_item')
+        item = self.items.get(Key['sessionId']['S'])
+        values = ExpressionAttributeValues or {}
+        if ConditionExpression and not condition_holds(item, ConditionExpression, ExpressionAttributeNames, values):
+            raise conditional_check_failed()
+        for clause in UpdateExpression.replace(' REMOVE ', '\nREMOVE ').split('\n'):
+            action, _, body = clause.partition(' ')
+            for part in body.split(', '):
+                path, _, placeholder = part.partition(' = ')
+                names = [ExpressionAttributeNames[alias] for alias in path.split('.')]
+                parent = item
+                for name in names[:-1]:
+                    parent = parent[name]['M']
+                if action == 'SET':
+                    parent[names[-1]] = values[placeholder]
+                else:
+                    parent.pop(names[-1], None)
+    
+    def delete_item(self, TableName, Key):
+        self.items.pop(Key['sessionId']['S'], None)
+    
+    def batch_get_item(self, RequestItems):
+        (table_name, request), = RequestItems.items()
+        found = [self.items[key['sessionId']['S']] for key in request['Keys'] if key['sessionId']['S'] in self.items]
+        return {'Responses': {table_name: found}, 'UnprocessedKeys': {}}
+    
+    def scan(self, TableName, ExclusiveStartKey=None):
+        return {'Items': list(self.items.values())}
+
+
+def normalize_item(value):
+    """Compare DynamoDB string sets without regard to order."""
+    if isinstance(value, dict):
+        return {key: sorted(inner) if key == 'SS' else normalize_item(inner) for key, inner in value.items()}
+    if isinstance(value, list):
+        return [normalize_item(inner) for inner in value]
+    return value
+
+
+# Feature: game-backend-api, Property 18: Partial update equivalence
+@settings(max_examples=100)
+@given(
+    state=game_state_strategy(),
+    flag_changes=st.dictionaries(
+        st.sampled_from(["rug_moved", "trap_door_open", "window_open", "lamp_on"]),
+        st.none() | st.booleans() | st.integers(min_value=0, max_value=100)
+    ),
+    taken=st.sampled_from(["lamp", "sword", "garlic"]),
+    sanity=st.integers(min_value=0, max_value=100)
+)
+def test_partial_update_matches_full_put(state, flag_changes, taken, sanity):
+    """
+    For any loaded game state and any set of changes, saving with a partial
+    UpdateItem should leave the stored item identical to a full put of the
+    same state.
+    
+    **Validates: Requirements 1.2**
+    
+    This ensures dirty tracking never drops a change when only the changed
+    attributes are written.
+    """
+    client = RecordingDynamoDB()
+    manager = SessionManager(client, 'GameSessions')
+    manager.save_session(state)
+    loaded = manager.load_session(state.session_id)
+    
+    for flag, value in flag_changes.items():
+        if value is None:
+            loaded.flags.pop(flag, None)
+        else:
+            loaded.set_flag(flag, value)
+    loaded.add_to_inventory(taken)
+    loaded.set_object_state("mailbox", "is_open", True)
+    loaded.add_room_item("kitchen", ["table"], taken)
+    loaded.sanity = sanity
+    manager.save_session(loaded)
+    
+    assert client.calls == ['put_item', 'update_item']
+    
+    expected = RecordingDynamoDB()
+    SessionManager(expected, 'GameSessions')._put_session(loaded)
+    assert normalize_item(client.items[state.session_id]) == normalize_item(expected.items[state.session_id])
+
+
+def test_partial_update_keeps_flags_switching_between_bool_and_int():
+    """
+    A flag changing from True to 1 or from 0 to False is a change, although
+    Python compares the two as equal, and must reach the UpdateItem with its
+    new type.
+    """
+    client = RecordingDynamoDB()
+    manager = SessionManager(client, 'GameSessions')
+    state = GameState.create_new_game()
+    state.set_flag('lamp_on', True)
+    state.set_flag('rug_moved', 0)
+    manager.save_session(state)
+    loaded = manager.load_session(state.session_id)
+    
+    loaded.set_flag('lamp_on', 1)
+    loaded.set_flag('rug_moved', False)
+    changes = loaded.get_changes()
+    
+    assert type(changes[('flags', 'lamp_on')]) is int
+    assert type(changes[('flags', 'rug_moved')]) is bool
+    
+    manager.save_session(loaded)
+    
+    assert client.calls == ['put_item', 'update_item']
+    stored = client.items[state.session_id]['flags']['M']
+    assert stored['lamp_on'] == {'N': '1'}
+    assert stored['rug_moved'] == {'BOOL': False}
+
+# Feature: game-backend-api, Property 19: Cached sessions stay current
+@settings(max_examples=100)
+@given(
+    state=game_state_strategy(),
+    other_container_saves=st.booleans(),
+    sanity=st.integers(min_value=0, max_value=100)
+)
+def test_cached_session_matches_stored_session(state, other_container_saves, sanity):
+    """
+    For any saved game state, loading through a warm session cache should
+    return the same game data as a full read, and should skip the full read
+    unless another container saved the session in between.
+    
+    **Validates: Requirements 1.2**
+    
+    This ensures a warm container never resumes a session from a copy that
+    another container has already advanced.
+    """
+    client = RecordingDynamoDB()
+    manager = SessionManager(client, 'GameSessions', cache=SessionCache())
+    manager.save_session(state)
+    
+    if other_container_saves:
+        other = SessionManager(client, 'GameSessions').load_session(state.session_id)
+        other.sanity = sanity
+        other.set_flag('lamp_on', True)
+        SessionManager(client, 'GameSessions').save_session(other)
+    
+    client.reads.clear()
+    loaded = manager.load_session(state.session_id)
+    fresh = SessionManager(RecordingDynamoDB(), 'GameSessions')
+    stored = fresh.store._deserialize_item(client.items[state.session_id])
+    
+    expected = GameState.from_dict(stored)
+    expected.last_accessed = loaded.last_accessed
+    
+    assert loaded.version == stored['version']
+    assert normalize_item(fresh.store._serialize_item(loaded.to_dict())) == normalize_item(
+        fresh.store._serialize_item(expected.to_dict())
+    )
+    if other_container_saves:
+        assert client.reads == ['#v', 'full']
+    else:
+        assert loaded is state
+        assert client.reads == ['#v']
+
+
+# Feature: game-backend-api, Property 19: Cached sessions stay current (LRU bound)
+@settings(max_examples=100)
+@given(
+    max_size=st.integers(min_value=1, max_value=5),
+    accesses=st.lists(st.integers(min_value=0, max_value=9), min_size=1, max_size=30)
+)
+def test_session_cache_keeps_most_recently_used(max_size, accesses):
+    """
+    For any access sequence, the session cache should hold at most max_size
+    sessions, and they should be the most recently used ones.
+    
+    **Validates: Requirements 1.2**
+    """
+    cache = SessionCache(max_size=max_size)
+    states = {}
+    for index in accesses:
+        session_id = f"session-{index}"
+        if cache.get(session_id) is None:
+            states[session_id] = GameState(session_id=session_id, current_room="west_of_house")
+            cache.put(states[session_id])
+    
+    recent = list(dict.fromkeys(f"session-{index}" for index in reversed(accesses)))[:max_size]
+    assert len(cache) == len(recent)
+    for session_id in recent:
+        assert cache.get(session_id) is states[session_id]
+
+
+# Feature: game-backend-api, Property 20: Concurrent saves never lose a turn
+@settings(max_examples=100)
+@given(
+    state=game_state_strategy(),
+    first_sanity=st.integers(min_value=0, max_value=100),
+    second_sanity=st.integers(min_value=0, max_value=100),
+    expire_first=st.booleans()
+)
+def test_concurrent_saves_conflict_instead_of_overwriting(state, first_sanity, second_sanity, expire_first):
+    """
+    For any session loaded by two writers, only the first save should
+    succeed; the second should raise SessionConflictError and leave the
+    first writer's turn stored. A session whose item expired meanwhile is
+    written again in full.
+    
+    **Validates: Requirements 1.2**
+    
+    This ensures two tabs or a retried request never silently overwrite
+    each other's turns.
+    """
+    client = RecordingDynamoDB()
+    SessionManager(client, 'GameSessions').save_session(state)
+    first = SessionManager(client, 'GameSessions').load_session(state.session_id)
+    second = SessionManager(client, 'GameSessions').load_session(state.session_id)
+    
+    if expire_first:
+        del client.items[state.session_id]
+        second.sanity = second_sanity
+        second.set_flag('lamp_on', True)
+        SessionManager(client, 'GameSessions').save_session(second)
+        assert client.items[state.session_id]['version'] == {'N': str(state.version + 1)}
+        return
+    
+    first.sanity = first_sanity
+    first.set_flag('lamp_on', True)
+    SessionManager(client, 'GameSessions').save_session(first)
+    
+    second.sanity = second_sanity
+    second.set_flag('troll_flag', True)
+    with pytest.raises(SessionConflictError):
+        SessionManager(client, 'GameSessions').save_session(second)
+    
+    stored = client.items[state.session_id]
+    assert stored['sanity'] == {'N': str(first_sanity)}
+    assert 'troll_flag' not in stored['flags']['M']
+    assert second.version == first.version - 1
+
+
+packable_values = st.recursive(
+    st.none() | st.booleans() | st.integers(min_value=-2**63, max_value=2**63 - 1)
+    | st.floats(allow_nan=False) | st.text(),
+    lambda children: st.lists(children, max_size=20) | st.dictionaries(st.text(), children, max_size=20),
+    max_leaves=50
+)
+
+
+# Feature: game-backend-api, Property 21: Compact state codec round trip
+@settings(max_examples=100)
+@given(value=packable_values)
+def test_pack_unpack_round_trip(value):
+    """
+    For any value built from the types session state uses, unpacking the
+    packed bytes should return an equal value.
+    
+    **Validates: Requirements 1.2**
+    """
+    assert unpack(pack(value)) == value
+
+
+# Feature: game-backend-api, Property 21: Compact state codec round trip (mixed layouts)
+@settings(max_examples=100)
+@given(
+    state=game_state_strategy(),
+    layouts=st.lists(st.booleans(), min_size=1, max_size=4),
+    sanity=st.integers(min_value=0, max_value=100),
+    taken=st.sampled_from(["lamp", "sword", "egg"])
+)
+def test_compact_state_loads_alongside_plain_items(state, layouts, sanity, taken):
+    """
+    For any game state written and then updated by session managers with
+    any mix of compact and plain storage, every load should see the last
+    saved game data, and the stored item should use only the layout of the
+    manager that wrote it last.
+    
+    **Validates: Requirements 1.2**
+    
+    This ensures packed and plain items can be read side by side while the
+    compact codec is rolled out or rolled back.
+    """
+    client = RecordingDynamoDB()
+    SessionManager(client, 'GameSessions').save_session(state)
+    expected = state
+    
+    for step, compact in enumerate(layouts):
+        manager = SessionManager(client, 'GameSessions', compact_state=compact)
+        loaded = manager.load_session(state.session_id)
+        assert loaded.flags == expected.flags
+        assert loaded.object_states == expected.object_states
+        assert loaded.rooms_visited == expected.rooms_visited
+        assert loaded.inventory == expected.inventory
+        
+        loaded.sanity = sanity
+        loaded.set_flag(f"step_{step}", step)
+        if step % 2:
+            loaded.add_to_inventory(taken)
+            loaded.set_object_state(taken, "is_lit", True)
+        manager.save_session(loaded)
+        expected = loaded
+        
+        stored = client.items[state.session_id]
+        assert (PACKED_STATE_ATTRIBUTE in stored) == compact
+        assert ('flags' in stored) == (not compact)
+        if compact:
+            assert decode_state(stored[PACKED_STATE_ATTRIBUTE]['B'])['inventory'] == loaded.inventory
+
+
+STATE_DEFAULTS = StateDefaults(
+    flags={"rug_moved": False, "buoy_flag": True, "cursed_lantern_battery": 200},
+    object_states={
+        "mailbox": {"is_open": False, "contents": ["leaflet"]},
+        "trap_door": {"is_open": False, "is_visible": False},
+    }
+)
+
+
+# Feature: game-backend-api, Property 22: Sparse state storage
+@settings(max_examples=100)
+@given(
+    flags=st.dictionaries(
+        st.sampled_from(["rug_moved", "buoy_flag", "cursed_lantern_battery", "lamp_on"]),
+        st.booleans() | st.sampled_from([0, 200])
+    ),
+    object_states=st.dictionaries(
+        st.sampled_from(["mailbox", "trap_door", "lamp"]),
+        st.dictionaries(
+            st.sampled_from(["is_open", "is_visible", "contents"]),
+            st.booleans() | st.sampled_from([[], ["leaflet"]])
+        )
+    ),
+    compact=st.booleans(),
+    updated_flag=st.sampled_from(["rug_moved", "buoy_flag", "lamp_on"]),
+    updated_value=st.booleans()
+)
+def test_sparse_state_reads_back_identically(flags, object_states, compact, updated_flag, updated_value):
+    """
+    For any flags and object states, a session saved without its world
+    default entries should read every flag and object state back with the
+    same value after loading, and the stored item should hold no entry
+    equal to its default, including after a partial update.
+    
+    **Validates: Requirements 1.2**
+    """
+    state = GameState.create_new_game()
+    state.flags = dict(flags)
+    state.object_states = {object_id: dict(values) for object_id, values in object_states.items()}
+    state.defaults = STATE_DEFAULTS
+    
+    def reads(game_state):
+        return (
+            {name: game_state.get_flag(name, None) for name in ["rug_moved", "buoy_flag", "cursed_lantern_battery", "lamp_on"]},
+            {(object_id, key): game_state.get_object_state(object_id, key)
+             for object_id in ["mailbox", "trap_door", "lamp"] for key in ["is_open", "is_visible", "contents"]}
+        )
+    
+    def stored_fields():
+        item = client.items[state.session_id]
+        if compact:
+            return decode_state(item[PACKED_STATE_ATTRIBUTE]['B'])
+        return manager.store._deserialize_item(item)
+    
+    def assert_sparse(fields):
+        for name, value in fields['flags'].items():
+            assert STATE_DEFAULTS.sparse_flags({name: value})
+        for object_id, values in fields['object_states'].items():
+            assert values == STATE_DEFAULTS.sparse_object_state(object_id, values)
+    
+    client = RecordingDynamoDB()
+    manager = SessionManager(client, 'GameSessions', compact_state=compact, defaults=STATE_DEFAULTS)
+    manager.save_session(state)
+    assert_sparse(stored_fields())
+    
+    loaded = SessionManager(client, 'GameSessions', compact_state=compact, defaults=STATE_DEFAULTS).load_session(state.session_id)
+    assert reads(loaded) == reads(state)
+    
+    loaded.set_flag(updated_flag, updated_value)
+    loaded.set_object_state("mailbox", "is_open", updated_value)
+    manager.save_session(loaded)
+    assert_sparse(stored_fields())
+    
+    reloaded = SessionManager(client, 'GameSessions', compact_state=compact, defaults=STATE_DEFAULTS).load_session(state.session_id)
+    assert reads(reloaded) == reads(loaded)
+
+
+# Feature: game-backend-api, Property 29: Session expiration cleanup (save-time timestamps)
+@settings(max_examples=100)
+@given(state=game_state_strategy(), flag_values=st.lists(st.booleans(), min_size=1, max_size=20))
+def test_mutations_leave_timestamps_to_save(state, flag_values):
+    """
+    For any sequence of mutations, the game state should only advance its
+    logical revision; last_accessed and expires are stamped once, when the
+    session is saved.
+    
+    **Validates: Requirements 22.2, 22.4**
+    """
+    last_accessed, expires, revision = state.last_accessed, state.expires, state.revision
+    
+    for index, value in enumerate(flag_values):
+        state.set_flag(f"flag_{index}", value)
+        state.move_to_room("kitchen")
+        state.increment_turn()
+    
+    assert state.revision == revision + 3 * len(flag_values)
+    assert (state.last_accessed, state.expires) == (last_accessed, expires)
+    
+    SessionManager(RecordingDynamoDB(), 'GameSessions').save_session(state)
+    assert state.expires is not None and state.expires > time.time()
+    assert state.last_accessed != last_accessed
+
+
+SESSION_STORES = {
+    'dynamodb': lambda: DynamoDBSessionStore(RecordingDynamoDB(), 'GameSessions'),
+    'memory': InMemorySessionStore,
+    'sqlite': SQLiteSessionStore,
+}
+
+
+# Feature: game-backend-api, Property 23: Session storage backends are interchangeable
+@settings(max_examples=100)
+@given(
+    state=game_state_strategy(),
+    updated_flag=st.sampled_from(["lamp_on", "trap_door_open", "troll_defeated"]),
+    updated_value=st.one_of(st.booleans(), st.integers(min_value=0, max_value=5)),
+    compact=st.booleans()
+)
+def test_session_stores_are_interchangeable(state, updated_flag, updated_value, compact):
+    """
+    For any game state, saving, partially updating and reloading it should
+    give the same game data whichever storage backend holds the session,
+    and every backend should reject a save that lost a race.
+    
+    **Validates: Requirements 22.2, 22.4**
+    """
+    state.version = 0
+    loaded_states = {}
+    for name, make_store in SESSION_STORES.items():
+        store = make_store()
+        manager = SessionManager(compact_state=compact, defaults=STATE_DEFAULTS, store=store)
+        saved = GameState.from_dict(state.to_dict())
+        manager.save_session(saved)
+        
+        loaded = SessionManager(compact_state=compact, defaults=STATE_DEFAULTS, store=store).load_session(state.session_id)
+        stale = SessionManager(compact_state=compact, defaults=STATE_DEFAULTS, store=store).load_session(state.session_id)
+        loaded.set_flag(updated_flag, updated_value)
+        loaded.increment_turn()
+        manager.save_session(loaded)
+        
+        stale.increment_turn()
+        with pytest.raises(SessionConflictError):
+            manager.save_session(stale)
+        
+        reloaded = SessionManager(compact_state=compact, defaults=STATE_DEFAULTS, store=store).load_session(state.session_id)
+        assert reloaded.version == 2
+        assert set(store.batch_get([state.session_id, 'missing', state.session_id])) == {state.session_id}
+        assert [item['sessionId'] for item in store.scan()] == [state.session_id]
+        
+        data = reloaded.to_dict()
+        data.pop('last_accessed')
+        data.pop('expires')
+        data['rooms_visited'] = sorted(data['rooms_visited'])
+        loaded_states[name] = data
+        
+        store.delete(state.session_id)
+        assert store.load(state.session_id) is None
+    
+    assert loaded_states['memory'] == loaded_states['dynamodb']
+    assert loaded_states['sqlite'] == loaded_states['dynamodb']
+
+
+def attribute_types(value):
+    """Collect the DynamoDB type tags used anywhere in an encoded value."""
+    if isinstance(value, dict):
+        tags = set()
+        for key, inner in value.items():
+            if key in ('S', 'N', 'B', 'BOOL', 'NULL', 'SS', 'L', 'M'):
+                tags.add(key)
+            tags |= attribute_types(inner)
+        return tags
+    if isinstance(value, list):
+        return set().union(*(attribute_types(inner) for inner in value))
+    return set()
+
+
+def without_none(value):
+    """Drop None map entries at every depth, as DynamoDB items do."""
+    if isinstance(value, dict):
+        return {key: without_none(inner) for key, inner in value.items() if inner is not None}
+    if isinstance(value, list):
+        return [without_none(inner) for inner in value]
+    return value
+
+
+free_form_values = st.recursive(
+    st.none() | st.booleans() | st.integers(min_value=-2**53, max_value=2**53) | st.text(max_size=10),
+    lambda children: st.lists(children, max_size=3) | st.dictionaries(st.text(max_size=5), children, max_size=3),
+    max_leaves=8
+)
+
+
+# Feature: game-backend-api, Property 24: Attribute value codec round trip
+@settings(max_examples=100)
+@given(
+    state=game_state_strategy(),
+    inventory=st.lists(st.text(max_size=8), max_size=6),
+    object_states=st.dictionaries(
+        st.text(min_size=1, max_size=8),
+        st.dictionaries(st.text(min_size=1, max_size=8), free_form_values, max_size=3),
+        max_size=4
+    ),
+    overlay=st.dictionaries(
+        st.text(min_size=1, max_size=8),
+        st.fixed_dictionaries({'added': st.lists(st.text(max_size=8), max_size=3),
+                               'removed': st.lists(st.text(max_size=8), max_size=3)}),
+        max_size=3
+    )
+)
+def test_attribute_codec_round_trip(state, inventory, object_states, overlay):
+    """
+    For any game state, encoding it with the schema-compiled codec and
+    decoding the result should give back the same item, with list order
+    and duplicates kept and no string sets written. The encoding should
+    match the dynamic per-value encoding, and items written with string
+    sets by older versions should still decode.
+    
+    **Validates: Requirements 1.2, 1.5**
+    """
+    state.inventory = inventory
+    state.object_states = object_states
+    state.room_items_overlay = overlay
+    item = {**state.to_dict(), 'sessionId': state.session_id}
+    item['rooms_visited'] = sorted(item['rooms_visited'])
+    codec = ItemCodec(GameState)
+    
+    encoded = codec.encode_item(item)
+    
+    assert codec.decode_item(encoded) == without_none(item)
+    assert 'SS' not in attribute_types(encoded)
+    assert encoded == encode_map(item)
+    
+    if inventory:
+        legacy = {**encoded, 'inventory': {'SS': inventory}}
+        assert codec.decode_item(legacy)['inventory'] == inventory
@@ -89,15 +89,15 @@ def test_burn_destroys_flammable_objects(data):
     state.current_room = room_id
     
     room = world.get_room(room_id)
-    room.items.append(object_id)
+    engine.add_room_item(room, object_id, state)
     state.add_to_inventory(fire_source_id)
     
-    assert object_id in room.items
+    assert object_id in engine.room_items(room, state)
     
     result = engine.handle_burn(object_id, fire_source_id, state)
     
     assert result.success is True
-    assert object_id not in room.items
+    assert object_id not in engine.room_items(room, state)
     
     game_object = world.get_object(object_id)
     assert game_object.state.get('is_burned', False) is True
@@ -12,15 +12,20 @@ Requirements: 16.1, 16.3, 16.5
 
 import sys
 import os
+import copy
 import json
+import subprocess
 from unittest.mock import Mock, patch, MagicMock
 import pytest
 
 # Add src directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../amplify/functions/game-handler'))
 
-from index import handler, initialize_game_components
-from state_manager import GameState
+from index import handler, initialize_game_components, is_warmup_event, WARMUP_COMMANDS
+from view_cache import ViewCache
+from state_manager import GameState, SessionManager, SessionConflictError
+from session_store import InMemorySessionStore
+from save_slots import SaveSlots
 from game_engine import ActionResult
 from command_parser import ParsedCommand
 
@@ -125,6 +130,231 @@ class TestAppSyncHandler:
                         saved_state = mock_session_manager.save_session.call_args[0][0]
                         assert saved_state.session_id == "new-session-123"
 
+    def test_read_only_command_skips_save(self, mock_context, mock_world_data):
+        """Test that commands leaving state unchanged are not written back."""
+        state = GameState.create_new_game()
+        state.session_id = "test-session-123"
+        client = Mock()
+        manager = SessionManager(client, "GameSessions")
+        manager.save_session(state)
+        client.get_item.return_value = {'Item': client.put_item.call_args.kwargs['Item']}
+        client.reset_mock()
+        
+        event = {
+            "arguments": {
+                "sessionId": "test-session-123",
+                "command": "look"
+            }
+        }
+        
+        with patch('index.session_manager', manager):
+            with patch('index.world_data', mock_world_data):
+                with patch('index.game_engine') as mock_engine:
+                    with patch('index.command_parser') as mock_parser:
+                        mock_parser.parse.return_value = ParsedCommand("LOOK")
+                        mock_engine.execute_command.return_value = ActionResult(True, "You look around.")
+                        
+                        handler(event, mock_context)
+                        
+                        client.put_item.assert_not_called()
+                        client.update_item.assert_not_called()
+                        
+                        # Once the TTL refresh interval has passed, the session is written again
+                        manager.ttl_refresh_seconds = 0
+                        handler(event, mock_context)
+                        
+                        client.update_item.assert_called_once()
+
+    @pytest.mark.parametrize("on_failure, expected_messages", [
+        ("stop", ["You go north.", "You can't go that way."]),
+        ("continue", ["You go north.", "You can't go that way.", "Taken."]),
+    ])
+    def test_batch_commands_share_one_load_and_save(self, mock_context, mock_session_manager,
+                                                    mock_world_data, on_failure, expected_messages):
+        """Test that a command batch runs in order against one loaded session."""
+        state = GameState.create_new_game()
+        state.session_id = "test-session-123"
+        mock_session_manager.load_session.return_value = state
+        
+        event = {
+            "arguments": {
+                "sessionId": "test-session-123",
+                "commands": ["north", "north", "take egg"],
+                "onFailure": on_failure
+            }
+        }
+        results = [
+            ActionResult(True, "You go north."),
+            ActionResult(False, "You can't go that way."),
+            ActionResult(True, "Taken."),
+        ]
+        
+        with patch('index.session_manager', mock_session_manager):
+            with patch('index.world_data', mock_world_data):
+                with patch('index.game_engine') as mock_engine:
+                    with patch('index.command_parser') as mock_parser:
+                        mock_engine.execute_command.side_effect = results
+                        
+                        response = handler(event, mock_context)
+                        
+                        assert [call.args[0] for call in mock_parser.parse.call_args_list] == \
+                            ["north", "north", "take egg"][:len(expected_messages)]
+                        assert response["messages"] == expected_messages
+                        assert response["message"] == expected_messages[-1]
+                        mock_session_manager.load_session.assert_called_once()
+                        mock_session_manager.save_session.assert_called_once()
+
+    def test_save_conflict_reloads_and_reexecutes(self, mock_context, mock_session_manager, mock_world_data, capsys):
+        """Test that a lost save race reloads the session and runs the command again."""
+        mock_session_manager.load_session.side_effect = lambda session_id: GameState.create_new_game()
+        mock_session_manager.save_session.side_effect = [SessionConflictError("test-session-123"), True]
+        
+        event = {"arguments": {"sessionId": "test-session-123", "command": "take lamp"}}
+        
+        with patch('index.session_manager', mock_session_manager):
+            with patch('index.world_data', mock_world_data):
+                with patch('index.game_engine') as mock_engine:
+                    with patch('index.command_parser'):
+                        with patch('index.time.sleep') as mock_sleep:
+                            mock_engine.execute_command.return_value = ActionResult(True, "Taken.")
+                            
+                            response = handler(event, mock_context)
+                            
+                            assert response["message"] == "Taken."
+                            assert mock_session_manager.load_session.call_count == 2
+                            assert mock_engine.execute_command.call_count == 2
+                            mock_sleep.assert_called_once()
+        
+        metrics = [json.loads(line) for line in capsys.readouterr().out.splitlines() if line.startswith('{"_aws"')]
+        assert metrics[0]["SessionWriteConflicts"] == 1
+        assert metrics[0]["SessionWriteRetries"] == 1
+
+    def test_save_slots_are_written_once_after_a_conflict(self, mock_context, mock_session_manager, mock_world_data):
+        """Test that a SAVE re-run after a lost race writes one slot, after the session save."""
+        slots = SaveSlots(InMemorySessionStore())
+        mock_session_manager.load_session.side_effect = lambda session_id: GameState.create_new_game()
+        mock_session_manager.save_session.side_effect = [SessionConflictError("test-session-123"), True]
+        
+        attempts = []
+        
+        def save(command, state):
+            # A new save ID per attempt, so a slot written early would stay behind
+            attempts.append(command)
+            state.pending_saves.append(slots.prepare(state, f"save{len(attempts)}"))
+            return ActionResult(True, "Game saved.")
+        
+        event = {"arguments": {"sessionId": "test-session-123", "command": "save"}}
+        
+        with patch('index.session_manager', mock_session_manager):
+            with patch('index.world_data', mock_world_data):
+                with patch('index.game_engine') as mock_engine:
+                    with patch('index.command_parser'):
+                        with patch('index.time.sleep'):
+                            mock_engine.save_slots = slots
+                            mock_engine.execute_command.side_effect = save
+                            
+                            handler(event, mock_context)
+        
+        manifests = [key for key in slots.store.items if '#save#' in key]
+        assert len(attempts) == 2
+        assert manifests == [manifests[0].split('#')[0] + "#save#save2"]
+
+    def test_save_conflict_retries_are_bounded(self, mock_context, mock_session_manager, mock_world_data):
+        """Test that persistent save conflicts give up after MAX_CONFLICT_RETRIES."""
+        import index
+        mock_session_manager.load_session.side_effect = lambda session_id: GameState.create_new_game()
+        mock_session_manager.save_session.side_effect = SessionConflictError("test-session-123")
+        
+        event = {"arguments": {"sessionId": "test-session-123", "command": "take lamp"}}
+        
+        with patch('index.session_manager', mock_session_manager):
+            with patch('index.world_data', mock_world_data):
+                with patch('index.game_engine') as mock_engine:
+                    with patch('index.command_parser'):
+                        with patch('index.time.sleep'):
+                            mock_engine.execute_command.return_value = ActionResult(True, "Taken.")
+                            
+                            with pytest.raises(SessionConflictError):
+                                handler(event, mock_context)
+                            
+                            assert mock_session_manager.save_session.call_count == index.MAX_CONFLICT_RETRIES + 1
+
+    def test_save_conflict_retry_starts_from_the_same_world(self, mock_context, mock_session_manager):
+        """Test that a retried turn does not see world object changes from the lost attempt."""
+        from world_loader import WorldData
+        from command_parser import CommandParser
+        world = WorldData()
+        world.load_from_json(os.path.join(os.path.dirname(__file__), '../../amplify/functions/game-handler/data'))
+        mailbox = world.get_object('mailbox')
+        mailbox.state['is_open'] = False
+        mock_session_manager.load_session.side_effect = lambda session_id: GameState.create_new_game()
+        mock_session_manager.save_session.side_effect = [SessionConflictError("test-session-123"), True]
+        
+        def open_mailbox(command, state):
+            # Keeps the mailbox's state on the shared world object, as the
+            # take and tie handlers do for theirs
+            if mailbox.state['is_open']:
+                return ActionResult(True, "It is already open.")
+            mailbox.state['is_open'] = True
+            state.set_flag('mailbox_opened', True)
+            return ActionResult(True, "The mailbox creaks open.")
+        
+        event = {"arguments": {"sessionId": "test-session-123", "command": "open mailbox"}}
+        
+        with patch('index.session_manager', mock_session_manager):
+            with patch('index.world_data', world):
+                with patch('index.game_engine') as mock_engine:
+                    with patch('index.command_parser', CommandParser()):
+                        with patch('index.time.sleep'):
+                            mock_engine.execute_command.side_effect = open_mailbox
+                            
+                            response = handler(event, mock_context)
+        
+        assert mock_engine.execute_command.call_count == 2
+        assert response["message"] == "The mailbox creaks open."
+        assert mailbox.state['is_open'] is True
+
+    def test_read_only_turn_skips_change_check(self, mock_context):
+        """Test that a turn of read-only commands is not diffed, unless the session is new."""
+        from world_loader import WorldData
+        from game_engine import GameEngine
+        from command_parser import CommandParser
+        world = WorldData()
+        world.load_from_json(os.path.join(os.path.dirname(__file__), '../../amplify/functions/game-handler/data'))
+        manager = SessionManager(store=InMemorySessionStore())
+        
+        def run(commands):
+            event = {"arguments": {"sessionId": "test-session-123", "commands": commands}}
+            with patch('index.session_manager', manager), patch('index.world_data', world):
+                with patch('index.game_engine', GameEngine(world)), patch('index.command_parser', CommandParser()):
+                    with patch.object(GameState, 'has_changes', autospec=True, side_effect=GameState.has_changes) as check:
+                        handler(event, mock_context)
+                        return check.call_count
+        
+        assert run(["look"]) == 1
+        assert manager.store.load_version("test-session-123") == 1
+        assert run(["look", "inventory", "score"]) == 0
+        assert manager.store.load_version("test-session-123") == 1
+        assert run(["look", "open mailbox"]) == 1
+        assert manager.store.load_version("test-session-123") == 2
+
+    def test_invalid_failure_policy_raises_error(self, mock_context):
+        """Test that an unknown onFailure policy is rejected."""
+        event = {"arguments": {"sessionId": "s", "commands": ["look"], "onFailure": "retry"}}
+        
+        with pytest.raises(ValueError, match="Invalid onFailure policy"):
+            handler(event, mock_context)
+
+    @pytest.mark.parametrize("commands", ["look", ["look", 3], {"0": "look"}])
+    def test_commands_must_be_a_list_of_strings(self, mock_context, commands):
+        """Test that a string or mixed commands argument is rejected instead of run letter by letter."""
+        event = {"arguments": {"sessionId": "s", "commands": commands}}
+        
+        with patch('index.run_session_commands') as run:
+            with pytest.raises(ValueError, match="commands must be a list of strings"):
+                handler(event, mock_context)
+        run.assert_not_called()
+
     def test_missing_arguments_raises_error(self, mock_context):
         """Test that missing arguments raise ValueError."""
         event = {"arguments": {}}
@@ -147,3 +377,304 @@ class TestAppSyncHandler:
             with patch('index.initialize_game_components'):
                 with pytest.raises(Exception, match="DynamoDB Error"):
                     handler(event, mock_context)
+
+
+class TestIdempotentCommands:
+    """Test that retried commands with a client command ID run once."""
+    
+    def run(self, manager, mock_context, mock_world_data, engine, command_id, command="put egg in case"):
+        event = {"arguments": {"sessionId": "test-session-123", "command": command, "commandId": command_id}}
+        with patch('index.session_manager', manager):
+            with patch('index.world_data', mock_world_data):
+                with patch('index.game_engine', engine):
+                    with patch('index.command_parser'):
+                        return handler(event, mock_context)
+    
+    @pytest.fixture
+    def manager(self):
+        manager = SessionManager(store=InMemorySessionStore())
+        state = GameState.create_new_game()
+        state.session_id = "test-session-123"
+        manager.save_session(state)
+        return manager
+    
+    @pytest.fixture
+    def scoring_engine(self):
+        """Engine mock that scores 10 points per command."""
+        def score(command, state):
+            state.score += 10
+            return ActionResult(True, f"Score is now {state.score}.")
+        engine = Mock()
+        engine.execute_command.side_effect = score
+        return engine
+    
+    def test_duplicate_command_id_returns_cached_response(self, mock_context, mock_world_data, manager, scoring_engine):
+        first = self.run(manager, mock_context, mock_world_data, scoring_engine, "cmd-1")
+        saved_version = manager.store.load_version("test-session-123")
+        
+        retried = self.run(manager, mock_context, mock_world_data, scoring_engine, "cmd-1")
+        
+        assert retried == first
+        assert scoring_engine.execute_command.call_count == 1
+        assert manager.store.load_version("test-session-123") == saved_version
+        assert manager.load_session("test-session-123").score == 10
+    
+    def test_only_messages_are_stored(self, mock_context, mock_world_data, manager, scoring_engine):
+        self.run(manager, mock_context, mock_world_data, scoring_engine, "cmd-1")
+        
+        stored = manager.load_session("test-session-123").get_command_response("cmd-1")
+        assert json.loads(stored) == ["Score is now 10."]
+    
+    def test_full_stored_response_is_still_replayed(self, mock_context, mock_world_data, manager, scoring_engine):
+        state = manager.load_session("test-session-123")
+        state.remember_command_response("cmd-1", json.dumps({"message": "Old.", "messages": ["Old."]}))
+        manager.save_session(state)
+        
+        retried = self.run(manager, mock_context, mock_world_data, scoring_engine, "cmd-1")
+        
+        assert retried["messages"] == ["Old."]
+        assert scoring_engine.execute_command.call_count == 0
+    
+    def test_new_command_id_executes_again(self, mock_context, mock_world_data, manager, scoring_engine):
+        self.run(manager, mock_context, mock_world_data, scoring_engine, "cmd-1")
+        second = self.run(manager, mock_context, mock_world_data, scoring_engine, "cmd-2")
+        
+        assert second["score"] == 20
+        assert scoring_engine.execute_command.call_count == 2
+    
+    def test_only_recent_command_ids_are_kept(self, mock_context, mock_world_data, manager, scoring_engine):
+        for number in range(GameState.MAX_COMMAND_RESPONSES + 1):
+            self.run(manager, mock_context, mock_world_data, scoring_engine, f"cmd-{number}")
+        
+        state = manager.load_session("test-session-123")
+        assert len(state.command_responses) == GameState.MAX_COMMAND_RESPONSES
+        assert state.get_command_response("cmd-0") is None
+        assert state.get_command_response(f"cmd-{GameState.MAX_COMMAND_RESPONSES}") is not None
+    
+    def test_read_only_command_is_not_cached(self, mock_context, mock_world_data, manager):
+        engine = Mock()
+        engine.execute_command.return_value = ActionResult(True, "You look around.")
+        
+        self.run(manager, mock_context, mock_world_data, engine, "cmd-1", command="look")
+        
+        assert manager.load_session("test-session-123").command_responses == {}
+    
+    def test_overlong_command_id_is_rejected(self, mock_context):
+        event = {"arguments": {"sessionId": "s", "command": "look", "commandId": "x" * 200}}
+        
+        with pytest.raises(ValueError, match="commandId too long"):
+            handler(event, mock_context)
+
+
+class TestEagerInit:
+    """Test components are initialized at import inside Lambda."""
+    
+    HANDLER_DIR = os.path.join(os.path.dirname(__file__), '../../amplify/functions/game-handler')
+    
+    def import_handler(self, **env):
+        code = "import index; print(index.world_data is not None, index.session_manager is not None)"
+        environment = {**os.environ, 'SESSION_STORE': 'memory'}
+        environment.pop('AWS_LAMBDA_FUNCTION_NAME', None)
+        environment.update(env)
+        completed = subprocess.run(
+            [sys.executable, '-c', code], cwd=self.HANDLER_DIR, env=environment,
+            capture_output=True, text=True, check=True
+        )
+        return completed.stdout.splitlines()[-1]
+    
+    def test_lambda_import_initializes_components(self):
+        assert self.import_handler(AWS_LAMBDA_FUNCTION_NAME='gameHandler') == "True True"
+    
+    def test_initialization_deferred_outside_lambda_or_when_off(self):
+        assert self.import_handler() == "False False"
+        assert self.import_handler(AWS_LAMBDA_FUNCTION_NAME='gameHandler', EAGER_INIT='off') == "False False"
+
+
+class TestWarmUp:
+    """Test warm-up pings run the game in memory only."""
+    
+    @pytest.fixture
+    def real_game(self):
+        from world_loader import WorldData
+        from game_engine import GameEngine
+        from command_parser import CommandParser
+        world = WorldData()
+        world.load_from_json(os.path.join(os.path.dirname(__file__), '../../amplify/functions/game-handler/data'))
+        store = Mock(wraps=InMemorySessionStore())
+        manager = SessionManager(store=store)
+        with patch('index.world_data', world), patch('index.game_engine', GameEngine(world)):
+            with patch('index.command_parser', CommandParser()), patch('index.session_manager', manager):
+                yield store, manager, world
+    
+    @pytest.mark.parametrize("event", [
+        {"warmup": True},
+        {"source": "aws.events", "detail-type": "Scheduled Event", "detail": {}},
+    ])
+    def test_warmup_touches_no_session(self, real_game, event, mock_context):
+        store, manager, world = real_game
+        
+        response = handler(event, mock_context)
+        
+        assert response == {"warmup": True, "commands": len(WARMUP_COMMANDS)}
+        assert [name for name, _, _ in store.method_calls] == ['warm_up']
+    
+    def test_game_after_warmup_starts_fresh(self, real_game, mock_context):
+        commands = ["open mailbox", "take leaflet"]
+        before = handler({"arguments": {"sessionId": "player-1", "commands": commands}}, mock_context)
+        handler({"warmup": True}, mock_context)
+        
+        after = handler({"arguments": {"sessionId": "player-2", "commands": commands}}, mock_context)
+        
+        assert after["messages"] == before["messages"]
+        assert after["room"] == "west_of_house" and after["inventory"] == before["inventory"]
+    
+    def test_warmup_leaves_world_data_unchanged(self, real_game, mock_context):
+        store, manager, world = real_game
+        
+        def snapshot():
+            return (
+                copy.deepcopy({object_id: obj.state for object_id, obj in world.objects.items()}),
+                {room_id: list(room.items) for room_id, room in world.rooms.items()},
+            )
+        
+        before = snapshot()
+        handler({"warmup": True}, mock_context)
+        
+        assert snapshot() == before
+    
+    def test_resolver_events_are_not_warmups(self):
+        assert not is_warmup_event({"arguments": {"sessionId": "s", "command": "look"}, "identity": {}})
+        assert not is_warmup_event({"arguments": {"warmup": True}})
+
+
+class TestSelectionSet:
+    """Test only selected world-derived fields are built, and memoized."""
+    
+    @pytest.fixture
+    def manager(self):
+        return SessionManager(store=InMemorySessionStore())
+    
+    def run(self, manager, world, selection=None, command_id=None, command="take egg"):
+        event = {"arguments": {"sessionId": "selection-session", "command": command, "commandId": command_id}}
+        if selection is not None:
+            event["info"] = {"fieldName": "processCommand", "selectionSetList": selection}
+        engine = Mock()
+        engine.execute_command.side_effect = lambda parsed, state: (
+            state.inventory.append("egg"), ActionResult(True, "Taken.")
+        )[1]
+        with patch('index.session_manager', manager), patch('index.world_data', world):
+            with patch('index.game_engine', engine), patch('index.command_parser'):
+                with patch('index.view_cache', self.cache):
+                    return handler(event, None)
+    
+    @pytest.fixture(autouse=True)
+    def cache(self):
+        self.cache = ViewCache()
+    
+    def test_unselected_view_fields_are_not_built(self, manager, mock_world_data):
+        response = self.run(manager, mock_world_data, ["message", "score"])
+        
+        assert response["message"] == "Taken." and response["score"] == 0
+        assert not {"description_spooky", "exits", "objects", "inventory"} & response.keys()
+        mock_world_data.get_room_description.assert_not_called()
+        mock_world_data.get_room.assert_not_called()
+        mock_world_data.get_object.assert_not_called()
+    
+    def test_no_selection_set_builds_every_field(self, manager, mock_world_data):
+        mock_world_data.get_object.return_value = Mock(name_spooky="Cursed Egg")
+        
+        response = self.run(manager, mock_world_data)
+        
+        assert response["description_spooky"] == "A spooky room."
+        assert response["exits"] == ["NORTH"] and response["objects"] == []
+        assert response["inventory"] == ["Cursed Egg"]
+    
+    def test_view_fields_are_memoized_per_room_and_state(self, manager, mock_world_data):
+        selection = ["room", "description_spooky", "exits", "inventory"]
+        mock_world_data.get_object.return_value = Mock(name_spooky="Cursed Egg")
+        
+        self.run(manager, mock_world_data, selection, command="look")
+        second = self.run(manager, mock_world_data, selection, command="look")
+        
+        assert mock_world_data.get_room_description.call_count == 1
+        # Each turn adds an egg, so the inventory is built again: one name
+        # lookup for the first turn, two for the second
+        assert mock_world_data.get_object.call_count == 3
+        assert second["inventory"] == ["Cursed Egg", "Cursed Egg"]
+    
+    def test_retried_command_builds_newly_selected_fields(self, manager, mock_world_data):
+        first = self.run(manager, mock_world_data, ["message"], command_id="cmd-1")
+        
+        retried = self.run(manager, mock_world_data, ["message", "exits"], command_id="cmd-1")
+        
+        assert "exits" not in first
+        assert retried["message"] == "Taken." and retried["exits"] == ["NORTH"]
+
+
+class TestViewDelta:
+    """Test delta responses against the client's last view hash."""
+    
+    VIEW_FIELDS = {"description_spooky", "exits", "objects", "inventory"}
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, mock_world_data):
+        self.manager = SessionManager(store=InMemorySessionStore())
+        self.world = mock_world_data
+        self.world.get_object.side_effect = lambda item_id: Mock(name_spooky=item_id.title())
+    
+    def run(self, command="score", last_view_hash=None, command_id=None):
+        arguments = {"sessionId": "delta-session", "command": command, "commandId": command_id}
+        if last_view_hash is not None:
+            arguments["lastViewHash"] = last_view_hash
+        
+        def execute(parsed, state):
+            if command.startswith("take "):
+                state.inventory.append(command[5:])
+            return ActionResult(True, f"Did {command}.")
+        engine = Mock()
+        engine.execute_command.side_effect = execute
+        with patch('index.session_manager', self.manager), patch('index.world_data', self.world):
+            with patch('index.game_engine', engine), patch('index.command_parser'):
+                with patch('index.view_cache', ViewCache()):
+                    return handler({"arguments": arguments}, None)
+    
+    def test_first_delta_request_gets_full_view_and_hash(self):
+        response = self.run(last_view_hash="")
+        
+        assert self.VIEW_FIELDS <= response.keys()
+        assert response["viewHash"].startswith("v1.")
+    
+    def test_unchanged_view_is_not_resent(self):
+        first = self.run(last_view_hash="")
+        
+        second = self.run("score", last_view_hash=first["viewHash"])
+        
+        assert not self.VIEW_FIELDS & second.keys()
+        assert second["message"] == "Did score." and second["viewHash"] == first["viewHash"]
+    
+    def test_only_changed_fields_are_sent(self):
+        first = self.run(last_view_hash="")
+        
+        second = self.run("take lamp", last_view_hash=first["viewHash"])
+        
+        assert second["inventory"] == ["Lamp"]
+        assert not {"description_spooky", "exits", "objects"} & second.keys()
+        assert second["viewHash"] != first["viewHash"]
+    
+    @pytest.mark.parametrize("last_view_hash", ["garbage", "v0.a.b.c.d", "v1.a.b"])
+    def test_unknown_hash_gets_full_view(self, last_view_hash):
+        assert self.VIEW_FIELDS <= self.run(last_view_hash=last_view_hash).keys()
+    
+    def test_without_last_view_hash_responses_are_full(self):
+        response = self.run()
+        
+        assert self.VIEW_FIELDS <= response.keys() and "viewHash" not in response
+    
+    def test_retried_delta_request_returns_the_same_delta(self):
+        first = self.run(last_view_hash="")
+        delta = self.run("take lamp", last_view_hash=first["viewHash"], command_id="cmd-1")
+        
+        retried = self.run("take lamp", last_view_hash=first["viewHash"], command_id="cmd-1")
+        
+        assert retried == delta
+        assert self.manager.load_session("delta-session").inventory == ["lamp"]
@@ -0,0 +1,210 @@
+"""
+Unit tests for command_journal.py
+
+Tests journaled saves, snapshot scheduling and loading sessions by
+applying the journal's recorded changes.
+"""
+
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../amplify/functions/game-handler'))
+
+import pytest
+from command_journal import CommandJournal, journal_key, seed_command, encode_changes, decode_changes
+from command_parser import CommandParser
+from game_engine import GameEngine
+from save_slots import SaveSlots
+from session_store import InMemorySessionStore, SessionConflictError
+from state_manager import GameState, SessionManager, StateDefaults
+from world_loader import WorldData
+
+
+COMMANDS = [
+    "open mailbox", "take leaflet", "read leaflet", "north", "east",
+    "open window", "enter window", "take lamp", "west", "take sword",
+]
+
+
+@pytest.fixture(scope="module")
+def world_data():
+    """Load world data once for all tests."""
+    world = WorldData()
+    data_dir = os.path.join(os.path.dirname(__file__), '../../amplify/functions/game-handler/data')
+    world.load_from_json(data_dir)
+    return world
+
+
+@pytest.fixture
+def engine(world_data):
+    return GameEngine(world_data)
+
+
+@pytest.fixture
+def journal():
+    """Journal snapshotting every 4 saves."""
+    return CommandJournal(snapshot_every=4)
+
+
+@pytest.fixture
+def store():
+    return InMemorySessionStore()
+
+
+def make_manager(store, journal, world_data):
+    return SessionManager(store=store, journal=journal, defaults=StateDefaults.from_world(world_data))
+
+
+def play(manager, engine, state, commands):
+    """Run each command as its own turn and save after it."""
+    parser = CommandParser()
+    for text in commands:
+        seed_command(state, text)
+        engine.execute_command(parser.parse(text), state)
+        manager.save_session(state)
+
+
+def comparable(state):
+    data = state.to_dict()
+    data['rooms_visited'] = sorted(data['rooms_visited'])
+    return data
+
+
+class TestJournaledSaves:
+    """Test what a journaled save writes."""
+    
+    def test_saves_append_journal_items_between_snapshots(self, engine, store, journal, world_data):
+        manager = make_manager(store, journal, world_data)
+        state = GameState.create_new_game()
+        manager.save_session(state)
+        
+        play(manager, engine, state, COMMANDS[:6])
+        
+        assert state.version == 7
+        assert store.load(state.session_id)['version'] == 5
+        assert [store.load_version(journal_key(state.session_id, version)) for version in range(2, 8)] == [
+            2, 3, 4, 5, 6, 7
+        ]
+        record = store.load(journal_key(state.session_id, 7))
+        assert [command['text'] for command in record['commands']] == [COMMANDS[5]]
+        assert decode_changes(record['changes'])
+    
+    def test_size_budget_forces_snapshot(self, engine, store, world_data):
+        journal = CommandJournal(snapshot_every=100, max_bytes=1)
+        manager = make_manager(store, journal, world_data)
+        state = GameState.create_new_game()
+        manager.save_session(state)
+        
+        play(manager, engine, state, COMMANDS[:2])
+        
+        assert store.load(state.session_id)['version'] == state.version
+    
+    def test_concurrent_save_conflicts(self, engine, store, journal, world_data):
+        manager = make_manager(store, journal, world_data)
+        state = GameState.create_new_game()
+        manager.save_session(state)
+        stale = make_manager(store, journal, world_data).load_session(state.session_id)
+        
+        play(manager, engine, state, COMMANDS[:1])
+        stale.increment_turn()
+        
+        with pytest.raises(SessionConflictError):
+            manager.save_session(stale)
+        assert stale.version == 1
+
+
+class TestJournalReplay:
+    """Test loading journaled sessions."""
+    
+    def test_load_replays_journal_tail(self, engine, store, journal, world_data):
+        manager = make_manager(store, journal, world_data)
+        state = GameState.create_new_game()
+        manager.save_session(state)
+        play(manager, engine, state, COMMANDS)
+        
+        loaded = make_manager(store, journal, world_data).load_session(state.session_id)
+        
+        assert loaded.version == state.version
+        assert comparable(loaded) == comparable(state)
+        assert not loaded.has_changes()
+    
+    def test_replayed_save_writes_no_slots(self, engine, store, journal, world_data):
+        manager = make_manager(store, journal, world_data)
+        slot_store = InMemorySessionStore()
+        engine.save_slots = SaveSlots(slot_store)
+        state = GameState.create_new_game()
+        manager.save_session(state)
+        play(manager, engine, state, COMMANDS[:2] + ["save"])
+        engine.save_slots.write_pending(state)
+        written = dict(slot_store.items)
+        
+        loaded = make_manager(store, journal, world_data).load_session(state.session_id)
+        
+        assert loaded.get_flag('last_save_id') == state.get_flag('last_save_id')
+        assert loaded.pending_saves == []
+        assert slot_store.items == written
+    
+    def test_cached_command_responses_replay(self, engine, store, journal, world_data):
+        manager = make_manager(store, journal, world_data)
+        parser = CommandParser()
+        state = GameState.create_new_game()
+        manager.save_session(state)
+        for number, text in enumerate(COMMANDS[:3]):
+            seed_command(state, text)
+            engine.execute_command(parser.parse(text), state)
+            state.remember_command_response(f"cmd-{number}", '{"message": "ok"}')
+            manager.save_session(state)
+        
+        loaded = make_manager(store, journal, world_data).load_session(state.session_id)
+        
+        assert loaded.command_responses == state.command_responses
+    
+    def test_interleaved_sessions_replay_without_touching_the_world(self, engine, store, journal, world_data):
+        def world_states():
+            return {object_id: dict(obj.state) for object_id, obj in world_data.objects.items()}
+        
+        pristine = world_states()
+        manager = make_manager(store, journal, world_data)
+        first = GameState.create_new_game()
+        second = GameState.create_new_game()
+        manager.save_session(first)
+        manager.save_session(second)
+        for text in COMMANDS[:4]:
+            play(manager, engine, first, [text])
+            play(manager, engine, second, ["look"])
+        # Load in a fresh process, whose world nobody has played in yet
+        for object_id, states in pristine.items():
+            world_data.objects[object_id].state = dict(states)
+        
+        loaded_first = make_manager(store, journal, world_data).load_session(first.session_id)
+        loaded_second = make_manager(store, journal, world_data).load_session(second.session_id)
+        
+        assert world_states() == pristine
+        assert comparable(loaded_first) == comparable(first)
+        assert comparable(loaded_second) == comparable(second)
+    
+    def test_deleted_session_recreated_loads_without_stale_journal(self, engine, store, journal, world_data):
+        manager = make_manager(store, journal, world_data)
+        state = GameState.create_new_game()
+        manager.save_session(state)
+        play(manager, engine, state, COMMANDS[:6])
+        
+        assert manager.delete_session(state.session_id)
+        assert [key for key in store.items if key.startswith(state.session_id)] == []
+        
+        fresh = GameState.create_new_game()
+        fresh.session_id = state.session_id
+        manager.save_session(fresh)
+        loaded = make_manager(store, journal, world_data).load_session(state.session_id)
+        
+        assert loaded.version == 1
+        assert comparable(loaded) == comparable(fresh)
+
+
+def test_encode_changes_is_canonical():
+    first = encode_changes({('rooms_visited',): ['b', 'a'], ('flags', 'x'): True, ('version',): 3}, skip=('version',))
+    second = encode_changes({('flags', 'x'): True, ('rooms_visited',): ['a', 'b']})
+    
+    assert first == second
+    assert decode_changes(first) == {('flags', 'x'): True, ('rooms_visited',): ['a', 'b']}
@@ -12,7 +12,9 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../amplify/functions/game-handler'))
 
 import pytest
-from game_engine import GameEngine, ActionResult
+from unittest.mock import patch
+from dataclasses import replace
+from game_engine import GameEngine, ActionResult, CommandSpec, COMMAND_REGISTRY, UNREGISTERED_COMMAND
 from state_manager import GameState
 from world_loader import WorldData
 from command_parser import CommandParser, ParsedCommand
@@ -337,8 +339,7 @@ class TestObjectExamine:
         """
         # Place mailbox in current room
         current_room = world_data.get_room(fresh_state.current_room)
-        if "mailbox" not in current_room.items:
-            current_room.items.append("mailbox")
+        game_engine.add_room_item(current_room, "mailbox", fresh_state)
         
         # Examine the mailbox
         result = game_engine.handle_examine("mailbox", fresh_state)
@@ -385,8 +386,7 @@ class TestObjectExamine:
         """
         # Place mailbox in room
         current_room = world_data.get_room(fresh_state.current_room)
-        if "mailbox" not in current_room.items:
-            current_room.items.append("mailbox")
+        game_engine.add_room_item(current_room, "mailbox", fresh_state)
         
         # Examine mailbox
         result = game_engine.handle_examine("mailbox", fresh_state)
@@ -408,8 +408,7 @@ class TestObjectTakeDrop:
         """
         # Place leaflet in room and mark as takeable
         current_room = world_data.get_room(fresh_state.current_room)
-        if "leaflet" not in current_room.items:
-            current_room.items.append("leaflet")
+        game_engine.add_room_item(current_room, "leaflet", fresh_state)
         
         leaflet = world_data.get_object("leaflet")
         leaflet.is_takeable = True
@@ -421,7 +420,7 @@ class TestObjectTakeDrop:
         assert result.success is True
         assert result.inventory_changed is True
         assert "leaflet" in fresh_state.inventory
-        assert "leaflet" not in current_room.items
+        assert "leaflet" not in game_engine.room_items(current_room, fresh_state)
     
     def test_take_non_takeable_object(self, game_engine, world_data, fresh_state):
         """
@@ -431,8 +430,7 @@ class TestObjectTakeDrop:
         """
         # Place mailbox in room (not takeable)
         current_room = world_data.get_room(fresh_state.current_room)
-        if "mailbox" not in current_room.items:
-            current_room.items.append("mailbox")
+        game_engine.add_room_item(current_room, "mailbox", fresh_state)
         
         mailbox = world_data.get_object("mailbox")
         mailbox.is_takeable = False
@@ -492,7 +490,7 @@ class TestObjectTakeDrop:
         
         # Verify object is now in room
         current_room = world_data.get_room(fresh_state.current_room)
-        assert "leaflet" in current_room.items
+        assert "leaflet" in game_engine.room_items(current_room, fresh_state)
     
     def test_drop_object_not_in_inventory(self, game_engine, fresh_state):
         """
@@ -519,8 +517,7 @@ class TestObjectInteractions:
         """
         # Place mailbox in room
         current_room = world_data.get_room(fresh_state.current_room)
-        if "mailbox" not in current_room.items:
-            current_room.items.append("mailbox")
+        game_engine.add_room_item(current_room, "mailbox", fresh_state)
         
         # Get mailbox and ensure it's closed
         mailbox = world_data.get_object("mailbox")
@@ -541,8 +538,7 @@ class TestObjectInteractions:
         """
         # Place mailbox in room
         current_room = world_data.get_room(fresh_state.current_room)
-        if "mailbox" not in current_room.items:
-            current_room.items.append("mailbox")
+        game_engine.add_room_item(current_room, "mailbox", fresh_state)
         
         # Get mailbox and ensure it's open
         mailbox = world_data.get_object("mailbox")
@@ -563,8 +559,7 @@ class TestObjectInteractions:
         """
         # Place leaflet in room
         current_room = world_data.get_room(fresh_state.current_room)
-        if "leaflet" not in current_room.items:
-            current_room.items.append("leaflet")
+        game_engine.add_room_item(current_room, "leaflet", fresh_state)
         
         # Read the leaflet
         result = game_engine.handle_object_interaction("READ", "leaflet", fresh_state)
@@ -591,8 +586,7 @@ class TestObjectInteractions:
         
         # Place rug in room
         current_room = world_data.get_room(fresh_state.current_room)
-        if "rug" not in current_room.items:
-            current_room.items.append("rug")
+        game_engine.add_room_item(current_room, "rug", fresh_state)
         
         # Move the rug
         result = game_engine.handle_object_interaction("MOVE", "rug", fresh_state)
@@ -608,8 +602,7 @@ class TestObjectInteractions:
         """
         # Place mailbox in room
         current_room = world_data.get_room(fresh_state.current_room)
-        if "mailbox" not in current_room.items:
-            current_room.items.append("mailbox")
+        game_engine.add_room_item(current_room, "mailbox", fresh_state)
         
         # Get mailbox and ensure it's closed
         mailbox = world_data.get_object("mailbox")
@@ -636,8 +629,7 @@ class TestObjectInteractions:
         
         # Perform an interaction
         current_room = world_data.get_room(fresh_state.current_room)
-        if "mailbox" not in current_room.items:
-            current_room.items.append("mailbox")
+        game_engine.add_room_item(current_room, "mailbox", fresh_state)
         
         mailbox = world_data.get_object("mailbox")
         mailbox.state["is_open"] = False
@@ -668,8 +660,7 @@ class TestObjectInteractions:
         """
         # Place white_house (scenery) in room
         current_room = world_data.get_room(fresh_state.current_room)
-        if "white_house" not in current_room.items:
-            current_room.items.append("white_house")
+        game_engine.add_room_item(current_room, "white_house", fresh_state)
         
         # Try to open the house (should not have OPEN interaction)
         result = game_engine.handle_object_interaction("OPEN", "white_house", fresh_state)
@@ -690,8 +681,7 @@ class TestCommandExecutionWithObjects:
         """
         # Place mailbox in room
         current_room = world_data.get_room(fresh_state.current_room)
-        if "mailbox" not in current_room.items:
-            current_room.items.append("mailbox")
+        game_engine.add_room_item(current_room, "mailbox", fresh_state)
         
         # Create examine command
         command = ParsedCommand(verb="EXAMINE", object="mailbox")
@@ -710,8 +700,7 @@ class TestCommandExecutionWithObjects:
         """
         # Place leaflet in room and mark as takeable
         current_room = world_data.get_room(fresh_state.current_room)
-        if "leaflet" not in current_room.items:
-            current_room.items.append("leaflet")
+        game_engine.add_room_item(current_room, "leaflet", fresh_state)
         
         leaflet = world_data.get_object("leaflet")
         leaflet.is_takeable = True
@@ -753,8 +742,7 @@ class TestCommandExecutionWithObjects:
         """
         # Place mailbox in room
         current_room = world_data.get_room(fresh_state.current_room)
-        if "mailbox" not in current_room.items:
-            current_room.items.append("mailbox")
+        game_engine.add_room_item(current_room, "mailbox", fresh_state)
         
         mailbox = world_data.get_object("mailbox")
         mailbox.state["is_open"] = False
@@ -776,8 +764,7 @@ class TestCommandExecutionWithObjects:
         """
         # Place leaflet in room
         current_room = world_data.get_room(fresh_state.current_room)
-        if "leaflet" not in current_room.items:
-            current_room.items.append("leaflet")
+        game_engine.add_room_item(current_room, "leaflet", fresh_state)
         
         # Create read command
         command = ParsedCommand(verb="READ", object="leaflet")
@@ -801,8 +788,7 @@ class TestContainers:
         """
         # Set up: place mailbox in current room
         current_room = world_data.get_room(fresh_state.current_room)
-        if 'mailbox' not in current_room.items:
-            current_room.items.append('mailbox')
+        game_engine.add_room_item(current_room, 'mailbox', fresh_state)
         
         # Get mailbox and ensure it's closed
         mailbox = world_data.get_object('mailbox')
@@ -824,8 +810,7 @@ class TestContainers:
         """
         # Set up: place mailbox in current room and open it
         current_room = world_data.get_room(fresh_state.current_room)
-        if 'mailbox' not in current_room.items:
-            current_room.items.append('mailbox')
+        game_engine.add_room_item(current_room, 'mailbox', fresh_state)
         
         mailbox = world_data.get_object('mailbox')
         mailbox.state['is_open'] = True
@@ -846,8 +831,7 @@ class TestContainers:
         """
         # Set up: place mailbox in room and leaflet in inventory
         current_room = world_data.get_room(fresh_state.current_room)
-        if 'mailbox' not in current_room.items:
-            current_room.items.append('mailbox')
+        game_engine.add_room_item(current_room, 'mailbox', fresh_state)
         
         mailbox = world_data.get_object('mailbox')
         mailbox.state['is_open'] = True
@@ -873,8 +857,7 @@ class TestContainers:
         """
         # Set up: place mailbox in room with leaflet inside
         current_room = world_data.get_room(fresh_state.current_room)
-        if 'mailbox' not in current_room.items:
-            current_room.items.append('mailbox')
+        game_engine.add_room_item(current_room, 'mailbox', fresh_state)
         
         mailbox = world_data.get_object('mailbox')
         mailbox.state['is_open'] = True
@@ -899,8 +882,7 @@ class TestContainers:
         """
         # Set up: place mailbox (capacity 5) in room
         current_room = world_data.get_room(fresh_state.current_room)
-        if 'mailbox' not in current_room.items:
-            current_room.items.append('mailbox')
+        game_engine.add_room_item(current_room, 'mailbox', fresh_state)
         
         mailbox = world_data.get_object('mailbox')
         mailbox.state['is_open'] = True
@@ -938,8 +920,7 @@ class TestContainers:
         """
         # Set up: place mailbox in room with items inside
         current_room = world_data.get_room(fresh_state.current_room)
-        if 'mailbox' not in current_room.items:
-            current_room.items.append('mailbox')
+        game_engine.add_room_item(current_room, 'mailbox', fresh_state)
         
         mailbox = world_data.get_object('mailbox')
         mailbox.state['is_open'] = True
@@ -961,8 +942,7 @@ class TestContainers:
         """
         # Set up: place trophy case in room
         current_room = world_data.get_room(fresh_state.current_room)
-        if 'trophy_case' not in current_room.items:
-            current_room.items.append('trophy_case')
+        game_engine.add_room_item(current_room, 'trophy_case', fresh_state)
         
         trophy_case = world_data.get_object('trophy_case')
         trophy_case.state['is_open'] = True  # Trophy case is always open/transparent
@@ -989,8 +969,7 @@ class TestContainers:
         """
         # Set up: place closed mailbox in room
         current_room = world_data.get_room(fresh_state.current_room)
-        if 'mailbox' not in current_room.items:
-            current_room.items.append('mailbox')
+        game_engine.add_room_item(current_room, 'mailbox', fresh_state)
         
         mailbox = world_data.get_object('mailbox')
         mailbox.state['is_open'] = False
@@ -1018,8 +997,7 @@ class TestContainers:
         """
         # Set up: place closed mailbox with item inside
         current_room = world_data.get_room(fresh_state.current_room)
-        if 'mailbox' not in current_room.items:
-            current_room.items.append('mailbox')
+        game_engine.add_room_item(current_room, 'mailbox', fresh_state)
         
         mailbox = world_data.get_object('mailbox')
         mailbox.state['is_open'] = False
@@ -1053,10 +1031,8 @@ class TestPuzzles:
         # Set up: place rug in living room
         fresh_state.current_room = "living_room"
         current_room = world_data.get_room(fresh_state.current_room)
-        if 'rug' not in current_room.items:
-            current_room.items.append('rug')
-        if 'trap_door' not in current_room.items:
-            current_room.items.append('trap_door')
+        game_engine.add_room_item(current_room, 'rug', fresh_state)
+        game_engine.add_room_item(current_room, 'trap_door', fresh_state)
         
         # Get objects
         rug = world_data.get_object('rug')
@@ -1106,8 +1082,7 @@ class TestPuzzles:
         # Set up: start at east_of_house
         fresh_state.current_room = "east_of_house"
         current_room = world_data.get_room(fresh_state.current_room)
-        if 'kitchen_window' not in current_room.items:
-            current_room.items.append('kitchen_window')
+        game_engine.add_room_item(current_room, 'kitchen_window', fresh_state)
         
         # Get window object
         kitchen_window = world_data.get_object('kitchen_window')
@@ -1160,8 +1135,7 @@ class TestPuzzles:
         # Set up: place rug in living room
         fresh_state.current_room = "living_room"
         current_room = world_data.get_room(fresh_state.current_room)
-        if 'rug' not in current_room.items:
-            current_room.items.append('rug')
+        game_engine.add_room_item(current_room, 'rug', fresh_state)
         
         # Get rug object
         rug = world_data.get_object('rug')
@@ -1188,8 +1162,7 @@ class TestPuzzles:
         # Set up: place rug in living room
         fresh_state.current_room = "living_room"
         current_room = world_data.get_room(fresh_state.current_room)
-        if 'rug' not in current_room.items:
-            current_room.items.append('rug')
+        game_engine.add_room_item(current_room, 'rug', fresh_state)
         
         # Get rug object
         rug = world_data.get_object('rug')
@@ -1218,8 +1191,7 @@ class TestPuzzles:
         # Set up: start at east_of_house
         fresh_state.current_room = "east_of_house"
         current_room = world_data.get_room(fresh_state.current_room)
-        if 'kitchen_window' not in current_room.items:
-            current_room.items.append('kitchen_window')
+        game_engine.add_room_item(current_room, 'kitchen_window', fresh_state)
         
         # Get window object
         kitchen_window = world_data.get_object('kitchen_window')
@@ -1248,8 +1220,7 @@ class TestPuzzles:
         # Set up: place trap door in living room and make it visible
         fresh_state.current_room = "living_room"
         current_room = world_data.get_room(fresh_state.current_room)
-        if 'trap_door' not in current_room.items:
-            current_room.items.append('trap_door')
+        game_engine.add_room_item(current_room, 'trap_door', fresh_state)
         
         # Get trap door object
         trap_door = world_data.get_object('trap_door')
@@ -1268,3 +1239,214 @@ class TestPuzzles:
         result2 = game_engine.handle_object_interaction('CLOSE', 'trap_door', fresh_state)
         assert result2.success is True
         assert fresh_state.get_object_state('trap_door', 'is_open') is False
+
+
+class TestRoomContentsIsolation:
+    """Test that room changes stay in the session that made them."""
+    
+    def test_take_does_not_leak_into_other_sessions(self, game_engine, world_data):
+        """
+        Taking an object changes only the taking session's view of the room.
+        """
+        first = GameState.create_new_game()
+        second = GameState.create_new_game()
+        current_room = world_data.get_room(first.current_room)
+        game_engine.add_room_item(current_room, "leaflet", first)
+        game_engine.add_room_item(current_room, "leaflet", second)
+        
+        result = game_engine.handle_take("leaflet", first)
+        
+        assert result.success is True
+        assert "leaflet" not in game_engine.room_items(current_room, first)
+        assert "leaflet" in game_engine.room_items(current_room, second)
+        assert "leaflet" not in current_room.items
+    
+    def test_drop_is_stored_as_overlay(self, game_engine, world_data, fresh_state):
+        """
+        Dropping an object records a delta instead of mutating the world room.
+        """
+        fresh_state.inventory.append("leaflet")
+        current_room = world_data.get_room(fresh_state.current_room)
+        
+        game_engine.handle_drop("leaflet", fresh_state)
+        
+        assert fresh_state.room_items_overlay == {
+            fresh_state.current_room: {'added': ['leaflet']}
+        }
+        assert "leaflet" not in current_room.items
+
+
+class TestCommandRegistry:
+    """Test suite for table-driven command dispatch."""
+    
+    def test_registry_entries_are_callable(self):
+        """
+        Every registered verb has a handler and consistent metadata.
+        """
+        for verb, spec in COMMAND_REGISTRY.items():
+            assert callable(spec.handler), verb
+            if spec.target_prompt:
+                assert spec.needs_target, verb
+    
+    def test_unregistered_verb_uses_catch_all(self, game_engine):
+        """
+        Verbs without a handler fall back to the unimplemented response.
+        """
+        assert game_engine.command_spec("QUIT") is UNREGISTERED_COMMAND
+        result = game_engine.execute_command(ParsedCommand(verb="QUIT"), GameState.create_new_game())
+        assert result.success is False
+        assert "not yet implemented" in result.message
+    
+    def test_object_free_verb_skips_object_resolution(self, game_engine, fresh_state):
+        """
+        Verbs that ignore objects do not resolve them before dispatch.
+        """
+        with patch.object(game_engine, 'resolve_object_name') as resolve:
+            result = game_engine.execute_command(ParsedCommand(verb="SCORE", object="lamp"), fresh_state)
+        
+        resolve.assert_not_called()
+        assert "score" in result.message.lower()
+    
+    def test_object_verb_resolves_before_dispatch(self, game_engine, fresh_state):
+        """
+        Verbs that use an object still report missing objects first.
+        """
+        result = game_engine.execute_command(ParsedCommand(verb="TAKE", object="nonexistent"), fresh_state)
+        assert result.success is False
+        assert "nonexistent" in result.message
+    
+    def test_missing_target_prompt(self, game_engine, fresh_state):
+        """
+        Verbs that need a target ask for it when it is missing.
+        """
+        fresh_state.inventory.append("lamp")
+        result = game_engine.execute_command(ParsedCommand(verb="THROW", object="lamp"), fresh_state)
+        assert result.success is False
+        assert "throw" in result.message and "at?" in result.message
+    
+    def test_routing_condition_falls_back(self, game_engine, fresh_state):
+        """
+        A verb whose routing condition fails gets the unimplemented response.
+        """
+        result = game_engine.execute_command(ParsedCommand(verb="LIGHT", object="mailbox"), fresh_state)
+        assert result.success is False
+        assert "not yet implemented" in result.message
+
+    
+    def test_read_only_verbs_leave_state_unchanged(self, game_engine):
+        """
+        Verbs declared read-only change nothing, wherever the player is.
+        """
+        parser = CommandParser()
+        state = GameState.create_new_game()
+        read_only = sorted(verb for verb, spec in COMMAND_REGISTRY.items() if not spec.mutates_state)
+        assert {"LOOK", "INVENTORY", "SCORE"} <= set(read_only)
+        
+        for text in [None, "open mailbox", "take leaflet", "north", "east", "open window", "enter window",
+                     "take lamp", "turn on lamp", "west", "move rug"]:
+            if text:
+                game_engine.execute_command(parser.parse(text), state)
+            for verb in read_only:
+                state.mark_clean()
+                try:
+                    game_engine.execute_command(ParsedCommand(verb=verb), state)
+                except AttributeError:
+                    # A few handlers read room state that rooms do not have;
+                    # a command that raises is not saved either
+                    pass
+                assert not state.has_changes(), (text, verb, state.get_changes())
+    
+    def test_read_only_spec_cannot_use_objects(self):
+        """
+        Object resolution can write to the state, so read-only verbs take no object.
+        """
+        with pytest.raises(ValueError):
+            CommandSpec(lambda self, c, s: None, takes_object=True, mutates_state=False)
+    
+    def test_turn_advances_only_for_turn_taking_verbs(self, game_engine, fresh_state):
+        """
+        A handler reached through a verb that does not take a turn leaves the counter alone.
+        """
+        game_engine.execute_command(ParsedCommand(verb="GO", direction="NORTH"), fresh_state)
+        assert (fresh_state.current_room, fresh_state.turn_count) == ("north_of_house", 1)
+        
+        with patch.dict(COMMAND_REGISTRY, {"GO": replace(COMMAND_REGISTRY["GO"], takes_turn=False)}):
+            game_engine.execute_command(ParsedCommand(verb="GO", direction="WEST"), fresh_state)
+        assert (fresh_state.current_room, fresh_state.turn_count) == ("west_of_house", 1)
+        
+        game_engine.handle_wait(fresh_state)
+        assert fresh_state.turn_count == 2
+
+
+class TestObjectScope:
+    """Test suite for the per-command object scope cache."""
+    
+    def test_scope_reused_until_state_changes(self, game_engine, fresh_state):
+        """
+        Repeated lookups share one scope until a mutator runs.
+        """
+        game_engine.invalidate_object_scope()
+        scope = game_engine.object_scope(fresh_state)
+        
+        assert game_engine.object_scope(fresh_state) is scope
+        
+        fresh_state.add_to_inventory("leaflet")
+        assert game_engine.object_scope(fresh_state) is not scope
+    
+    def test_scope_detects_direct_inventory_edits(self, game_engine, fresh_state):
+        """
+        Inventory lists edited in place still invalidate the scope.
+        """
+        scope = game_engine.object_scope(fresh_state)
+        fresh_state.inventory.append("leaflet")
+        
+        rebuilt = game_engine.object_scope(fresh_state)
+        assert rebuilt is not scope
+        assert rebuilt.is_accessible("leaflet")
+    
+    def test_scope_not_shared_between_states(self, game_engine):
+        """
+        A scope built for one session is never returned for another.
+        """
+        first = GameState.create_new_game()
+        second = GameState.create_new_game()
+        
+        assert game_engine.object_scope(first) is not game_engine.object_scope(second)
+    
+    def test_scope_includes_open_container_contents(self, game_engine, fresh_state):
+        """
+        Contents of open containers are in scope, closed ones are not.
+        """
+        fresh_state.set_object_state("mailbox", "contents", ["garlic"])
+        fresh_state.set_object_state("mailbox", "is_open", False)
+        
+        assert not game_engine.object_scope(fresh_state).is_accessible("garlic")
+        
+        fresh_state.set_object_state("mailbox", "is_open", True)
+        scope = game_engine.object_scope(fresh_state)
+        assert scope.is_accessible("garlic")
+        assert scope.find_container("garlic") == "mailbox"
+    
+    def test_execute_command_builds_scope_once(self, game_engine, world_data, fresh_state):
+        """
+        Resolution, disambiguation and the handler share one scope.
+        """
+        current_room = world_data.get_room(fresh_state.current_room)
+        game_engine.add_room_item(current_room, "leaflet", fresh_state)
+        game_engine.invalidate_object_scope()
+        
+        original = game_engine.object_scope
+        builds = []
+        
+        def counting_scope(state):
+            scope = original(state)
+            if scope not in builds:
+                builds.append(scope)
+            return scope
+        
+        with patch.object(game_engine, 'object_scope', side_effect=counting_scope):
+            result = game_engine.execute_command(ParsedCommand(verb="EXAMINE", object="leaflet"), fresh_state)
+        
+        assert result.success is True
+        assert len(builds) == 1
+        assert game_engine._scope is None
@@ -71,12 +71,15 @@ class TestHandlerIdReplacement(unittest.TestCase):
         self.state.inventory = []
         self.state.current_room = "start_room"
         self.state.sanity = 100
+        # No session overlay: rooms show their pristine items
+        self.state.get_room_items.side_effect = lambda room_id, items: items
         
         # Mock _get_object_names to return a predictable name
         self.engine._get_object_names = MagicMock(return_value="Display Name")
         
         # Setup common objects
         self.room = MagicMock(spec=Room)
+        self.room.id = "start_room"
         self.room.items = []
         self.room.global_items = []
         self.world.get_room.return_value = self.room
@@ -0,0 +1,135 @@
+"""
+Unit tests for request_log.py
+
+Tests levels, sampling, lazy formatting, redaction and the single
+buffered write per invocation.
+"""
+
+import sys
+import os
+import json
+from unittest.mock import Mock, patch
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../amplify/functions/game-handler'))
+
+import pytest
+import request_log
+from request_log import RequestLogger, redact, DEBUG, INFO, WARNING, REDACTED
+from game_engine import ActionResult
+from command_parser import ParsedCommand
+from session_store import InMemorySessionStore
+from state_manager import SessionManager
+import index
+
+
+def log_lines(output):
+    return [json.loads(line) for line in output.splitlines() if line.startswith('{"level"')]
+
+
+class TestRequestLogger:
+    """Test levels, formatting and buffering."""
+    
+    def test_lines_below_level_are_dropped(self, capsys):
+        logger = RequestLogger(level=WARNING)
+        logger.debug("debug")
+        logger.info("info")
+        logger.warning("careful %s", "now")
+        
+        line, = log_lines(capsys.readouterr().out)
+        assert line == {'level': 'WARNING', 'message': 'careful now'}
+    
+    def test_arguments_are_formatted_only_when_written(self):
+        logger = RequestLogger(level=INFO)
+        argument = Mock()
+        argument.__str__ = Mock(return_value='formatted')
+        
+        logger.debug("value %s", argument)
+        
+        argument.__str__.assert_not_called()
+    
+    def test_request_lines_are_written_once_at_flush(self, capsys):
+        logger = RequestLogger(level=INFO)
+        logger.start('r1')
+        logger.info("first")
+        logger.metric({"_aws": {}, "Count": 1})
+        logger.error("failed", exc_info=False)
+        
+        assert capsys.readouterr().out == ''
+        with patch('sys.stdout') as stdout:
+            logger.flush()
+        stdout.write.assert_called_once()
+        
+        first, metric, error = stdout.write.call_args[0][0].splitlines()
+        assert json.loads(first) == {'level': 'INFO', 'message': 'first', 'requestId': 'r1'}
+        assert json.loads(metric) == {"_aws": {}, "Count": 1}
+        assert json.loads(error)['level'] == 'ERROR'
+        assert logger.request_id is None
+    
+    def test_error_logs_traceback(self, capsys):
+        logger = RequestLogger(level=WARNING)
+        try:
+            raise ValueError("boom")
+        except ValueError as e:
+            logger.error("Request failed: %s", e, exc_info=True)
+        
+        line, = log_lines(capsys.readouterr().out)
+        assert line['message'] == 'Request failed: boom'
+        assert 'ValueError: boom' in line['traceback']
+    
+    @pytest.mark.parametrize("draw, expected", [(0.05, DEBUG), (0.5, INFO)])
+    def test_sampled_requests_log_debug(self, draw, expected):
+        logger = RequestLogger(level=INFO, sample_rate=0.1)
+        with patch.object(request_log._sampler, 'random', return_value=draw):
+            logger.start('r1')
+        
+        assert logger.level == expected
+        logger.flush()
+        assert logger.level == INFO
+    
+    def test_from_env(self):
+        with patch.dict(os.environ, {'LOG_LEVEL': 'debug', 'LOG_SAMPLE_RATE': '0.25'}):
+            logger = RequestLogger.from_env()
+        
+        assert (logger.base_level, logger.sample_rate) == (DEBUG, 0.25)
+
+
+class TestRedaction:
+    """Test identity and header fields are scrubbed."""
+    
+    def test_redact_nested_identity_and_headers(self):
+        event = {
+            "arguments": {"sessionId": "s1", "command": "look"},
+            "identity": {"sub": "user-1", "sourceIp": ["1.2.3.4"]},
+            "request": {"headers": {"Authorization": "secret"}},
+            "prev": [{"Cookie": "c"}],
+        }
+        
+        assert redact(event) == {
+            "arguments": {"sessionId": "s1", "command": "look"},
+            "identity": REDACTED,
+            "request": {"headers": REDACTED},
+            "prev": [{"Cookie": REDACTED}],
+        }
+        assert event["identity"]["sub"] == "user-1"
+    
+    def test_handler_never_logs_identity(self, capsys):
+        manager = SessionManager(store=InMemorySessionStore())
+        world = Mock()
+        world.get_room.return_value = Mock(exits={}, items=[])
+        event = {
+            "arguments": {"sessionId": "log-session", "command": "look"},
+            "identity": {"sub": "user-1", "claims": {"email": "player@example.com"}},
+            "request": {"headers": {"authorization": "token-1"}},
+        }
+        with patch('index.session_manager', manager), patch('index.world_data', world):
+            with patch('index.game_engine') as engine, patch('index.command_parser') as parser:
+                parser.parse.return_value = ParsedCommand("LOOK")
+                engine.execute_command.return_value = ActionResult(True, "Dark.")
+                with patch.object(index.logger, 'base_level', DEBUG):
+                    index.handler(event, None)
+        
+        output = capsys.readouterr().out
+        lines = log_lines(output)
+        assert any(line['message'] == 'AppSync event' for line in lines)
+        assert 'user-1' not in output and 'player@example.com' not in output and 'token-1' not in output
@@ -0,0 +1,119 @@
+"""
+Unit tests for request_metrics.py
+
+Tests phase timing and the CloudWatch Embedded Metric Format records the
+handler emits once per invocation.
+"""
+
+import sys
+import os
+import json
+from unittest.mock import Mock, patch
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../amplify/functions/game-handler'))
+
+import pytest
+from request_metrics import PhaseTimer
+from game_engine import ActionResult
+from command_parser import ParsedCommand
+from session_store import InMemorySessionStore
+from state_manager import SessionManager
+import index
+
+
+def emf_records(output):
+    return [json.loads(line) for line in output.splitlines() if line.startswith('{"_aws"')]
+
+
+class TestPhaseTimer:
+    """Test timing phases and building the EMF record."""
+
+    def test_repeated_phases_add_up(self):
+        timer = PhaseTimer()
+        timer.durations['Parse'] = 0.001
+        with timer.phase('Parse'):
+            pass
+        with timer.phase('Execute'):
+            pass
+
+        record = timer.record('Test', cold_start=True, success=True, request_id='r1')
+
+        assert record['ParseMs'] >= 1.0
+        assert 'ExecuteMs' in record and 'SaveSessionMs' not in record
+        assert record['TotalMs'] >= 0
+
+    def test_record_has_dimensions_and_verb_directive(self):
+        timer = PhaseTimer()
+        with timer.phase('Execute'):
+            timer.record_verb('TAKE')
+
+        record = timer.record('Test', cold_start=False, success=True, request_id='r1')
+        directives = record['_aws']['CloudWatchMetrics']
+
+        assert directives[0]['Dimensions'] == [['ColdStart', 'Success']]
+        assert {metric['Name'] for metric in directives[0]['Metrics']} == {'ExecuteMs', 'TotalMs'}
+        assert directives[1] == {
+            'Namespace': 'Test',
+            'Dimensions': [['Verb']],
+            'Metrics': [{'Name': 'ExecuteMs', 'Unit': 'Milliseconds'}],
+        }
+        assert (record['ColdStart'], record['Success'], record['Verb']) == ('false', 'true', 'TAKE')
+
+    @pytest.mark.parametrize("verbs, expected", [([], 'NONE'), (['GO', None], 'BATCH')])
+    def test_verb_dimension_for_batches(self, verbs, expected):
+        timer = PhaseTimer()
+        for verb in verbs:
+            timer.record_verb(verb)
+
+        assert timer.record('Test', True, True, 'r1')['Verb'] == expected
+
+    def test_disabled_timer_records_nothing(self, capsys):
+        timer = PhaseTimer(enabled=False)
+        with timer.phase('Execute'):
+            timer.record_verb('TAKE')
+        timer.emit('Test', True, True, 'r1')
+
+        assert timer.durations == {} and timer.verbs == []
+        assert timer.phase('Parse') is timer.phase('Execute')
+        assert capsys.readouterr().out == ''
+
+
+class TestHandlerMetrics:
+    """Test the record the handler emits per invocation."""
+
+    def invoke(self, command="take lamp"):
+        manager = SessionManager(store=InMemorySessionStore())
+        world = Mock()
+        room = Mock(exits={}, items=[])
+        world.get_room.return_value = room
+        event = {"arguments": {"sessionId": "metrics-session", "command": command}}
+        with patch('index.session_manager', manager), patch('index.world_data', world):
+            with patch('index.game_engine') as engine, patch('index.command_parser') as parser:
+                parser.parse.return_value = ParsedCommand("TAKE", "lamp")
+                engine.execute_command.return_value = ActionResult(True, "Taken.")
+                return index.handler(event, None)
+
+    def test_one_record_per_invocation(self, capsys):
+        with patch('index.cold_start', True):
+            self.invoke()
+            self.invoke()
+
+        first, second = emf_records(capsys.readouterr().out)
+        assert first['ColdStart'] == 'true' and second['ColdStart'] == 'false'
+        assert first['Success'] == 'true' and first['Verb'] == 'TAKE'
+        for name in ('InitMs', 'LoadSessionMs', 'ParseMs', 'ExecuteMs', 'BuildResponseMs', 'SaveSessionMs', 'TotalMs'):
+            assert name in first
+
+    def test_failed_invocation_is_recorded(self, capsys):
+        with pytest.raises(ValueError):
+            index.handler({"arguments": {}}, None)
+
+        record, = emf_records(capsys.readouterr().out)
+        assert record['Success'] == 'false'
+
+    def test_switch_turns_metrics_off(self, capsys):
+        with patch('index.PHASE_METRICS_ENABLED', False):
+            self.invoke()
+
+        assert emf_records(capsys.readouterr().out) == []
@@ -0,0 +1,301 @@
+"""
+Unit tests for save_slots.py
+
+Tests content-addressed save snapshots, restoring them over a live game
+state and listing saves from slot metadata.
+"""
+
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../amplify/functions/game-handler'))
+
+import pytest
+from command_parser import CommandParser
+from game_engine import GameEngine
+from save_slots import SaveSlots
+from session_store import InMemorySessionStore
+from state_codec import unpack
+from state_manager import GameState
+from world_loader import WorldData
+
+
+class RecordingStore(InMemorySessionStore):
+    """In-memory store recording the keys read and written."""
+    
+    def __init__(self):
+        super().__init__()
+        self.reads = []
+        self.writes = []
+    
+    def load(self, session_id):
+        self.reads.append(session_id)
+        return super().load(session_id)
+    
+    def batch_get(self, session_ids):
+        self.reads.extend(session_ids)
+        return super().batch_get(session_ids)
+    
+    def save(self, session_id, item):
+        self.writes.append(session_id)
+        super().save(session_id, item)
+
+
+@pytest.fixture
+def store():
+    return RecordingStore()
+
+
+@pytest.fixture
+def slots(store):
+    return SaveSlots(store)
+
+
+def make_state():
+    state = GameState.create_new_game()
+    state.set_flag('lamp_on', True)
+    state.set_object_state('mailbox', 'is_open', True)
+    state.set_object_state('window', 'is_open', False)
+    return state
+
+
+def unpack_blob(store, key):
+    return unpack(store.items[key]['data'])
+
+
+def blob_writes(store):
+    return [key for key in store.writes if '#blob#' in key]
+
+
+class TestContentAddressing:
+    """Test that unchanged sub-structures are shared across saves."""
+    
+    def test_unchanged_state_writes_no_new_blobs(self, store, slots):
+        state = make_state()
+        slots.save(state, 'first')
+        first_blobs = blob_writes(store)
+        
+        state.score += 5
+        slots.save(state, 'second')
+        
+        assert first_blobs
+        assert blob_writes(store) == first_blobs
+    
+    def test_changed_object_writes_only_its_blob(self, store, slots):
+        state = make_state()
+        slots.save(state, 'first')
+        written = len(blob_writes(store))
+        
+        state.set_object_state('window', 'is_locked', True)
+        slots.save(state, 'second')
+        
+        assert len(blob_writes(store)) == written + 1
+    
+    def test_equal_maps_share_a_blob_regardless_of_key_order(self, store, slots):
+        state = make_state()
+        slots.save(state, 'first')
+        written = len(blob_writes(store))
+        
+        state.flags = dict(reversed(list({'a': 1, 'b': 2, **state.flags}.items())))
+        slots.save(state, 'second')
+        state.flags = {'b': 2, 'a': 1, **state.flags}
+        slots.save(state, 'third')
+        
+        assert len(blob_writes(store)) == written + 1
+
+
+class TestRestore:
+    """Test restoring saves over a live state."""
+    
+    def test_restore_replaces_live_state(self, slots):
+        state = make_state()
+        state.inventory = ['lamp']
+        state.move_to_room('living_room')
+        slots.save(state, 'abc')
+        saved = state.to_dict()
+        
+        state.inventory = []
+        state.current_room = 'cellar'
+        state.set_flag('lamp_on', False)
+        state.set_object_state('window', 'is_open', True)
+        state.room_items_overlay['cellar'] = {'added': ['lamp'], 'removed': []}
+        state.version = 7
+        
+        assert slots.restore(state, 'abc') is True
+        restored = state.to_dict()
+        for name in ('version', 'last_accessed', 'expires'):
+            saved.pop(name)
+            restored.pop(name)
+        assert sorted(restored.pop('rooms_visited')) == sorted(saved.pop('rooms_visited'))
+        assert restored == saved
+        assert state.version == 7
+    
+    def test_restore_marks_state_changed(self, slots):
+        state = make_state()
+        slots.save(state, 'abc')
+        state.mark_clean()
+        state.score = 40
+        state.mark_clean()
+        revision = state.revision
+        
+        slots.restore(state, 'abc')
+        
+        assert state.revision > revision
+        assert state.get_changes() == {('score',): 0}
+    
+    def test_missing_save_is_not_restored(self, slots):
+        state = make_state()
+        
+        assert slots.restore(state, 'nosuchid') is False
+    
+    def test_saves_are_per_session(self, slots):
+        state = make_state()
+        slots.save(state, 'abc')
+        
+        assert slots.restore(make_state(), 'abc') is False
+
+
+class TestListSaves:
+    """Test listing saves from the index item."""
+    
+    def test_list_reads_only_the_index(self, store, slots):
+        state = make_state()
+        slots.save(state, 'first')
+        state.score = 10
+        slots.save(state, 'second')
+        store.reads.clear()
+        
+        saves = slots.list_saves(state.session_id)
+        
+        assert [save['save_id'] for save in saves] == ['second', 'first']
+        assert saves[0]['score'] == 10
+        assert store.reads == [f"{state.session_id}#saves"]
+    
+    def test_index_keeps_newest_saves(self, slots):
+        slots.MAX_SAVES = 3
+        state = make_state()
+        for number in range(5):
+            slots.save(state, f"save{number}")
+        
+        assert [save['save_id'] for save in slots.list_saves(state.session_id)] == ['save4', 'save3', 'save2']
+    
+    def test_resaving_an_id_lists_it_once(self, slots):
+        state = make_state()
+        slots.save(state, 'abc')
+        slots.save(state, 'abc')
+        
+        assert len(slots.list_saves(state.session_id)) == 1
+
+
+def test_restore_command_without_id_lists_saves():
+    world = WorldData()
+    world.load_from_json(os.path.join(os.path.dirname(__file__), '../../amplify/functions/game-handler/data'))
+    engine = GameEngine(world)
+    parser = CommandParser()
+    state = GameState.create_new_game()
+    
+    empty = engine.execute_command(parser.parse("restore"), state)
+    engine.execute_command(parser.parse("save"), state)
+    listing = engine.execute_command(parser.parse("restore"), state)
+    
+    assert "specify a save ID" in empty.message
+    assert state.get_flag('last_save_id') in listing.message
+
+
+@pytest.fixture(scope="module")
+def world():
+    world = WorldData()
+    world.load_from_json(os.path.join(os.path.dirname(__file__), '../../amplify/functions/game-handler/data'))
+    return world
+
+
+class TestBlobExpiry:
+    """Test that blobs live as long as the saves that reference them."""
+    
+    @pytest.mark.parametrize("age_fraction", [0.25, 0.6])
+    def test_shared_blob_outlives_the_newest_save(self, store, slots, age_fraction):
+        state = make_state()
+        slots.save(state, 'first')
+        flags_key = next(key for key in store.items if '#blob#' in key and unpack_blob(store, key) == state.flags)
+        # Age the shared blob, within and past half its TTL
+        store.items[flags_key]['expires'] -= int(slots.ttl_seconds * age_fraction)
+        
+        state.score += 5
+        slots.save(state, 'second')
+        
+        second_expires = store.items[f"{state.session_id}#save#second"]['expires']
+        assert store.items[flags_key]['expires'] >= second_expires
+        restored = GameState.create_new_game()
+        restored.session_id = state.session_id
+        assert slots.restore(restored, 'first')
+        assert restored.score == 0 and restored.flags == state.flags
+    
+    def test_expiry_is_never_lowered(self, store, slots):
+        state = make_state()
+        slots.save(state, 'first')
+        blob_keys = [key for key in store.items if '#blob#' in key]
+        for key in blob_keys:
+            store.items[key]['expires'] += 10 ** 6
+        later = {key: store.items[key]['expires'] for key in blob_keys}
+        
+        slots.save(state, 'second')
+        
+        assert {key: store.items[key]['expires'] for key in blob_keys} == later
+    
+    def test_missing_blob_reports_unavailable_save(self, world, store, slots):
+        engine = GameEngine(world)
+        engine.save_slots = slots
+        state = make_state()
+        slots.save(state, 'first')
+        del store.items[next(key for key in store.items if '#blob#' in key)]
+        
+        result = engine.handle_restore('first', state)
+        
+        assert not result.success
+        assert "no longer available" in result.message
+
+
+class TestDeferredWrites:
+    """Test that SAVE writes its slot only when the handler flushes it."""
+    
+    def test_save_command_queues_the_slot(self, world, store, slots):
+        engine = GameEngine(world)
+        engine.save_slots = slots
+        state = GameState.create_new_game()
+        
+        engine.execute_command(CommandParser().parse("save"), state)
+        
+        assert store.writes == []
+        assert [save.save_id for save in state.pending_saves] == [state.get_flag('last_save_id')]
+        
+        slots.write_pending(state)
+        
+        assert state.pending_saves == []
+        assert [save['save_id'] for save in slots.list_saves(state.session_id)] == [state.get_flag('last_save_id')]
+    
+    def test_pending_save_can_be_restored(self, world, slots):
+        engine = GameEngine(world)
+        engine.save_slots = slots
+        parser = CommandParser()
+        state = GameState.create_new_game()
+        engine.execute_command(parser.parse("save"), state)
+        save_id = state.get_flag('last_save_id')
+        state.score += 10
+        
+        result = engine.handle_restore(save_id, state)
+        
+        assert result.success
+        assert state.score == 0
+        assert state.get_flag('last_save_id') == save_id
+    
+    def test_save_id_is_derived_from_content(self, slots):
+        state = make_state()
+        first = slots.prepare(state)
+        same = slots.prepare(state)
+        state.score += 1
+        changed = slots.prepare(state)
+        
+        assert first.save_id == same.save_id
+        assert changed.save_id != first.save_id
+
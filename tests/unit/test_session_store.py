@@ -0,0 +1,180 @@
+"""
+Unit tests for session_store.py
+
+Tests the conditional-write rules shared by the session stores and the
+SQLite store's on-disk behavior.
+"""
+
+import pytest
+import os
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../amplify/functions/game-handler'))
+
+from unittest.mock import Mock
+
+from session_store import (
+    DynamoDBSessionStore, InMemorySessionStore, SQLiteSessionStore, SessionConflictError, apply_changes
+)
+
+
+def make_item(session_id, version, **fields):
+    return {'sessionId': session_id, 'version': version, **fields}
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def store(request, tmp_path):
+    """Fixture providing each local store, SQLite on a real file."""
+    if request.param == 'memory':
+        yield InMemorySessionStore()
+    else:
+        store = SQLiteSessionStore(str(tmp_path / 'sessions.db'))
+        yield store
+        store.close()
+
+
+class TestConditionalWrites:
+    """Test the version rules every store enforces."""
+    
+    def test_new_session_must_not_exist(self, store):
+        store.save_conditional('s1', make_item('s1', 1))
+        
+        with pytest.raises(SessionConflictError):
+            store.save_conditional('s1', make_item('s1', 1))
+        assert store.load_version('s1') == 1
+    
+    def test_save_requires_expected_version(self, store):
+        store.save_conditional('s1', make_item('s1', 1))
+        store.save_conditional('s1', make_item('s1', 2), expected_version=1)
+        
+        with pytest.raises(SessionConflictError):
+            store.save_conditional('s1', make_item('s1', 2), expected_version=1)
+        assert store.load('s1')['version'] == 2
+    
+    def test_save_recreates_expired_session(self, store):
+        store.save_conditional('s1', make_item('s1', 5), expected_version=4)
+        
+        assert store.load_version('s1') == 5
+    
+    def test_update_applies_changes_at_expected_version(self, store):
+        store.save('s1', make_item('s1', 1, flags={'lamp_on': True, 'troll_defeated': False}))
+        
+        assert store.update('s1', {('version',): 2, ('flags', 'lamp_on'): None, ('flags', 'gate_open'): 3}, 1)
+        assert store.load('s1')['flags'] == {'troll_defeated': False, 'gate_open': 3}
+        assert not store.update('s1', {('version',): 3}, 1)
+        assert not store.update('missing', {('version',): 1}, 0)
+        assert store.load_version('s1') == 2
+    
+    def test_legacy_item_matches_version_zero(self, store):
+        store.save('s1', {'sessionId': 's1', 'current_room': 'kitchen'})
+        
+        assert store.load_version('s1') == 0
+        assert store.update('s1', {('version',): 1}, 0)
+        assert store.load_version('s1') == 1
+    
+    def test_batch_get_scan_and_delete(self, store):
+        for session_id in ('s1', 's2', 's3'):
+            store.save(session_id, make_item(session_id, 1, inventory=['lamp'], packedState=b'\x01\x02'))
+        store.delete('s2')
+        store.delete('missing')
+        
+        items = store.batch_get(['s1', 's2', 's3', 's1'])
+        assert sorted(items) == ['s1', 's3']
+        assert items['s1']['packedState'] == b'\x01\x02'
+        assert sorted(item['sessionId'] for item in store.scan()) == ['s1', 's3']
+    
+    def test_scan_skips_journal_and_save_items(self, store):
+        store.save('s1', make_item('s1', 1))
+        store.save('s1#journal#0000000002', {'sessionId': 's1#journal#0000000002', 'version': 2})
+        store.save('s1#saves', {'sessionId': 's1#saves', 'saves': []})
+        
+        assert [item['sessionId'] for item in store.scan()] == ['s1']
+
+
+    def test_raise_expiry_never_lowers(self, store):
+        store.save('blob', {'data': b'x', 'expires': 100})
+        
+        assert store.raise_expiry('blob', 200)
+        assert store.raise_expiry('blob', 150)
+        assert store.load('blob') == {'data': b'x', 'expires': 200}
+        assert not store.raise_expiry('missing', 200)
+        assert store.load('missing') is None
+
+
+class TestSQLiteSessionStore:
+    """Test SQLite-specific behavior."""
+    
+    def test_uses_wal_journal(self, tmp_path):
+        store = SQLiteSessionStore(str(tmp_path / 'sessions.db'))
+        
+        assert store._connection.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+        store.close()
+    
+    def test_sessions_persist_across_connections(self, tmp_path):
+        path = str(tmp_path / 'sessions.db')
+        writer = SQLiteSessionStore(path)
+        writer.save('s1', make_item('s1', 3, flags={'lamp_on': True}, score=1.5))
+        
+        reader = SQLiteSessionStore(path)
+        assert reader.load('s1') == make_item('s1', 3, flags={'lamp_on': True}, score=1.5)
+        writer.close()
+        reader.close()
+    
+    def test_none_values_are_not_stored(self):
+        store = SQLiteSessionStore()
+        store.save('s1', make_item('s1', 1, expires=None, flags={'lamp_on': None}))
+        
+        assert store.load('s1') == make_item('s1', 1, flags={})
+
+
+def test_apply_changes_creates_missing_maps():
+    item = {'sessionId': 's1'}
+    
+    apply_changes(item, {('object_states', 'mailbox'): {'is_open': True}, ('turn_count',): 4})
+    
+    assert item == {'sessionId': 's1', 'object_states': {'mailbox': {'is_open': True}}, 'turn_count': 4}
+
+
+def test_dynamodb_warm_up_reads_only_the_reserved_key():
+    client = Mock()
+    client.get_item.return_value = {}
+    
+    DynamoDBSessionStore(client, 'GameSessions').warm_up()
+    
+    client.get_item.assert_called_once_with(
+        TableName='GameSessions',
+        Key={'sessionId': {'S': DynamoDBSessionStore.WARMUP_KEY}},
+        ProjectionExpression='sessionId'
+    )
+    assert len(client.method_calls) == 1
+
+
+def test_dynamodb_raise_expiry_checks_existence_after_a_failed_condition():
+    failed = Exception("condition failed")
+    failed.response = {'Error': {'Code': 'ConditionalCheckFailedException'}}
+    client = Mock()
+    client.update_item.side_effect = failed
+    store = DynamoDBSessionStore(client, 'GameSessions')
+    
+    client.get_item.return_value = {'Item': {'sessionId': {'S': 'blob'}}}
+    assert store.raise_expiry('blob', 200)
+    client.get_item.return_value = {}
+    assert not store.raise_expiry('blob', 200)
+    
+    request = client.update_item.call_args.kwargs
+    assert request['ConditionExpression'].startswith('attribute_exists(sessionId)')
+    assert request['ExpressionAttributeValues'] == {':expires': {'N': '200'}}
+
+
+def test_dynamodb_scan_skips_journal_and_save_items():
+    client = Mock()
+    client.scan.return_value = {'Items': [
+        {'sessionId': {'S': 's1'}, 'version': {'N': '1'}},
+        {'sessionId': {'S': 's1#journal#0000000002'}, 'version': {'N': '2'}},
+        {'sessionId': {'S': 's1#blob#abc'}, 'expires': {'N': '200'}},
+    ]}
+    
+    items = list(DynamoDBSessionStore(client, 'GameSessions').scan())
+    
+    assert [item['sessionId'] for item in items] == ['s1']
@@ -0,0 +1,48 @@
+"""
+Unit tests for view_cache.py
+
+Tests memoization, LRU eviction and invalidation when the world changes.
+"""
+
+import sys
+import os
+from unittest.mock import Mock
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../amplify/functions/game-handler'))
+
+from view_cache import ViewCache
+
+
+class TestViewCache:
+    """Test the response view field cache."""
+    
+    def test_builds_once_per_key(self):
+        cache = ViewCache()
+        world = object()
+        build = Mock(return_value=("NORTH",))
+        
+        assert cache.get(world, ('exits', 'kitchen'), build) == ("NORTH",)
+        assert cache.get(world, ('exits', 'kitchen'), build) == ("NORTH",)
+        
+        build.assert_called_once()
+        assert (cache.hits, cache.misses) == (1, 1)
+    
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = ViewCache(max_size=2)
+        world = object()
+        cache.get(world, 'a', lambda: 1)
+        cache.get(world, 'b', lambda: 2)
+        cache.get(world, 'a', lambda: 1)
+        cache.get(world, 'c', lambda: 3)
+        
+        assert len(cache) == 2
+        assert cache.get(world, 'a', lambda: 'rebuilt') == 1
+        assert cache.get(world, 'b', lambda: 'rebuilt') == 'rebuilt'
+    
+    def test_other_world_empties_the_cache(self):
+        cache = ViewCache()
+        cache.get(object(), ('description', 'kitchen', 100), lambda: "old")
+        
+        assert cache.get(object(), ('description', 'kitchen', 100), lambda: "new") == "new"
+        assert len(cache) == 1
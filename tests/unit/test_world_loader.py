@@ -10,12 +10,14 @@ import os
 import tempfile
 import shutil
 from pathlib import Path
+from unittest.mock import patch
 
 # Add src to path for imports
 import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../amplify/functions/game-handler'))
 
-from world_loader import WorldData, Room, GameObject, Interaction
+from world_loader import WorldData, Room, GameObject, Interaction, SNAPSHOT_FILENAME
+from state_manager import GameState
 
 
 class TestWorldDataLoading:
@@ -92,6 +94,25 @@ class TestWorldDataLoading:
         assert 'blood_moon_active' in world_data.initial_flags
         assert 'score' in world_data.initial_flags
         assert 'moves' in world_data.initial_flags
+    
+    def test_ids_are_interned(self, world_data, data_dir):
+        """Test that every reference to a room or object ID is the same string object."""
+        world_data.load_from_json(data_dir)
+        
+        for room_id, room in world_data.rooms.items():
+            assert room.id is room_id
+            for reference in list(room.exits.values()) + room.items:
+                assert reference is sys.intern(reference)
+        
+        state = GameState.from_dict({
+            'session_id': 's',
+            'current_room': ''.join(['west_', 'of_house']),
+            'inventory': [''.join(['la', 'mp'])],
+            'rooms_visited': [''.join(['kitch', 'en'])],
+        })
+        assert state.current_room is world_data.get_room('west_of_house').id
+        assert state.inventory[0] is world_data.get_object('lamp').id
+        assert next(iter(state.rooms_visited)) is world_data.get_room('kitchen').id
 
 
 class TestWorldDataErrorHandling:
@@ -359,3 +380,132 @@ class TestWorldDataCaching:
         # Clear cache
         WorldData.clear_cache()
         assert WorldData._cache is None
+
+
+class TestWorldDataSnapshot:
+    """Test the prebuilt binary snapshot load path."""
+    
+    @pytest.fixture
+    def snapshot_dir(self):
+        """Copy the real game data into a temp dir and build a snapshot there."""
+        source_dir = os.path.join(
+            os.path.dirname(__file__),
+            '../../amplify/functions/game-handler/data'
+        )
+        temp_dir = tempfile.mkdtemp()
+        for filename in os.listdir(source_dir):
+            if filename.endswith('.json'):
+                shutil.copy(os.path.join(source_dir, filename), temp_dir)
+        WorldData().build_snapshot(temp_dir)
+        WorldData.clear_cache()
+        yield temp_dir
+        shutil.rmtree(temp_dir)
+    
+    def test_snapshot_matches_json(self, snapshot_dir):
+        """Test that the snapshot reproduces the JSON-loaded world exactly."""
+        from_json = WorldData()
+        from_json._load_json_files(snapshot_dir)
+        WorldData.clear_cache()
+        
+        from_snapshot = WorldData()
+        assert from_snapshot.load_from_snapshot(
+            os.path.join(snapshot_dir, SNAPSHOT_FILENAME), snapshot_dir
+        ) is True
+        
+        assert from_snapshot.rooms == from_json.rooms
+        assert from_snapshot.objects == from_json.objects
+        assert from_snapshot.initial_flags == from_json.initial_flags
+        assert WorldData._cache is not None
+    
+    def test_load_from_json_prefers_snapshot(self, snapshot_dir):
+        """Test that load_from_json uses a fresh snapshot when present."""
+        world_data = WorldData()
+        with patch.object(WorldData, '_load_json_files') as load_json:
+            world_data.load_from_json(snapshot_dir)
+        
+        load_json.assert_not_called()
+        assert world_data.get_room('west_of_house').id == 'west_of_house'
+    
+    def test_stale_snapshot_falls_back_to_json(self, snapshot_dir):
+        """Test that editing a JSON source invalidates the snapshot."""
+        flags_path = os.path.join(snapshot_dir, 'flags_haunted.json')
+        with open(flags_path) as f:
+            flags = json.load(f)
+        flags['snapshot_test_flag'] = True
+        with open(flags_path, 'w') as f:
+            json.dump(flags, f)
+        
+        world_data = WorldData()
+        world_data.load_from_json(snapshot_dir)
+        
+        assert world_data.initial_flags['snapshot_test_flag'] is True
+    
+    def test_corrupt_snapshot_falls_back_to_json(self, snapshot_dir):
+        """Test that an unreadable snapshot is ignored."""
+        with open(os.path.join(snapshot_dir, SNAPSHOT_FILENAME), 'wb') as f:
+            f.write(b'not a snapshot')
+        
+        world_data = WorldData()
+        world_data.load_from_json(snapshot_dir)
+        
+        assert len(world_data.rooms) > 0
+
+
+class TestObjectNameIndex:
+    """Test index-backed object name resolution."""
+    
+    @pytest.fixture
+    def loaded_world_data(self):
+        """Fixture providing a loaded WorldData instance."""
+        WorldData.clear_cache()
+        world_data = WorldData()
+        world_data.load_from_json(os.path.join(
+            os.path.dirname(__file__),
+            '../../amplify/functions/game-handler/data'
+        ))
+        return world_data
+    
+    def test_index_is_cached_with_world(self, loaded_world_data):
+        """Test that warm loads reuse the index built on the cold load."""
+        warm = WorldData()
+        warm.load_from_json('unused-on-warm-start')
+        assert warm.get_name_index() is loaded_world_data.get_name_index()
+    
+    def test_exact_name_resolution(self, loaded_world_data):
+        """Test matching by ID, ID with spaces and full display name."""
+        available = ['mailbox', 'leaflet', 'trap_door']
+        assert loaded_world_data.find_object_by_name('trap door', available) == 'trap_door'
+        assert loaded_world_data.find_object_by_name('Cursed Parchment', available) == 'leaflet'
+    
+    def test_partial_name_resolution(self, loaded_world_data):
+        """Test matching by word, prefix and suffix of the display name."""
+        available = ['mailbox', 'leaflet']
+        assert loaded_world_data.find_object_by_name('parchment', available) == 'leaflet'
+        assert loaded_world_data.find_object_by_name('rusted mail', available) == 'mailbox'
+        assert loaded_world_data.find_object_by_name('ted mailbox', available) == 'mailbox'
+    
+    def test_resolution_is_limited_to_scope(self, loaded_world_data):
+        """Test that objects outside available_objects are never returned."""
+        assert loaded_world_data.find_object_by_name('parchment', ['mailbox']) is None
+    
+    def test_exact_match_beats_earlier_partial_match(self, loaded_world_data):
+        """Test that an exact match wins even if a partial match comes first."""
+        # 'cursed' is a word in both names, but 'cursed lantern' is exact for lamp
+        available = ['leaflet', 'lamp']
+        assert loaded_world_data.find_object_by_name('cursed', available) == 'leaflet'
+        assert loaded_world_data.find_object_by_name('cursed lantern', available) == 'lamp'
+    
+    def test_objects_added_after_load_are_matched(self, loaded_world_data):
+        """Test that objects missing from the index still resolve."""
+        loaded_world_data.objects['test_widget'] = GameObject(
+            id='test_widget',
+            name='shiny widget',
+            name_spooky='ghostly gizmo',
+            type='item',
+            state={},
+            interactions=[]
+        )
+        available = ['mailbox', 'test_widget']
+        assert loaded_world_data.find_object_by_name('gizmo', available) == 'test_widget'
+        assert loaded_world_data.find_object_by_name('shiny widget', available) == 'test_widget'
+        del loaded_world_data.objects['test_widget']